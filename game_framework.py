@@ -8,15 +8,42 @@ delta_time = 0.0
 frame_time = 0.01  # 기본 프레임 시간
 paused = False  # 시뮬레이션 일시정지 플래그
 
+# 누적 시계 (Animator 등 시간 기반 재생용)
+game_time = 0.0  # 일시정지 중에는 멈추는 게임 시간
+ui_time = 0.0  # 일시정지와 무관하게 흐르는 UI 시간
+
+# 특정 객체 update 동안만 쓰는 dt (ai_scheduler가 건너뛴 프레임의 누적 dt를 넘길 때)
+_delta_override = None
+
 
 def set_delta_time(dt):
-    global delta_time
+    global delta_time, game_time, ui_time
     delta_time = dt
+    ui_time += dt
+    if not paused:
+        game_time += dt
 
 
 def get_delta_time():
     # 시뮬레이션이 일시정지 되어 있으면 dt는 0으로 반환하여 업데이트가 멈추게 함
-    return 0.0 if paused else delta_time
+    if paused:
+        return 0.0
+    return delta_time if _delta_override is None else _delta_override
+
+
+def set_delta_override(dt):
+    # None이면 해제 (game_time/ui_time은 바꾸지 않음)
+    global _delta_override
+    _delta_override = dt
+
+
+def get_game_time():
+    # 일시정지 중에는 증가하지 않음 (get_delta_time 누적과 같은 값)
+    return game_time
+
+
+def get_ui_time():
+    return ui_time
 
 
 def set_paused(flag: bool):
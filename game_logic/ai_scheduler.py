@@ -0,0 +1,219 @@
+"""
+AI 틱 스케줄러 (거리/화면 기준 LOD)
+
+play_mode.update는 모든 몬스터의 상태 머신을 매 프레임 실행합니다.
+화면 밖에서 대기 중인 몬스터까지 매 프레임 돌리면 스테이지의 몬스터 수만큼 프레임 시간이 늘어나므로,
+에이전트마다 틱 주기를 정해 필요한 만큼만 update()를 호출합니다.
+
+틱 주기 (LOD):
+    FULL     - 화면 안(SCREEN_MARGIN 여유 포함): 매 프레임
+    REDUCED  - 화면 밖이지만 플레이어에서 ai_dormant_range 이내: REDUCED_INTERVAL 프레임마다
+    DORMANT  - 그보다 멀면: update 하지 않음 (시간도 흐르지 않음, 가까워지면 다시 깨어남)
+
+    피격(HIT)/사망(DEATH) 상태이거나 is_dead가 설정된 에이전트는 위치와 관계없이 FULL로 틱합니다.
+    넉백, 사망 처리와 제거 표시(mark_for_removal)가 멈추거나 늦어지지 않게 하기 위해서입니다.
+
+건너뛴 프레임의 delta time은 누적해 두었다가 다음 틱에서 한 번에 넘깁니다
+(game_framework.set_delta_override로 그 에이전트의 update 동안만 get_delta_time()이 누적값을 반환).
+누적값은 MAX_ACCUMULATED_DT로 잘라서 벽을 뚫을 만큼 크게 움직이지 않게 합니다.
+
+시간 예산:
+    REDUCED 에이전트는 첫 틱 시각을 흩어 놓고, 한 프레임에 틱할 에이전트들의 예상 비용(최근 update 시간의 지수 평균)
+    합이 TIME_BUDGET을 넘으면 나머지는 다음 프레임으로 미룹니다. 오래 기다린 에이전트부터 처리합니다.
+    FULL 에이전트는 예산과 무관하게 항상 틱합니다.
+
+대상 에이전트:
+    클래스 속성 ai_lod = True인 객체만 스케줄합니다 (그 밖의 객체는 기존처럼 매 프레임 update).
+    ai_dormant_range 속성이 있으면 그 거리를, 없으면 DORMANT_RANGE를 사용합니다.
+
+사용법 (play_mode.update):
+    ai_scheduler.begin_frame(world['entities'], world.get('player'), camera)
+    for o in world['entities']:
+        alive = ai_scheduler.update_agent(o) if ai_scheduler.is_agent(o) else o.update()
+    print(ai_scheduler.stats())
+"""
+import time
+
+import game_framework as framework
+
+# LOD 단계
+FULL, REDUCED, DORMANT = 0, 1, 2
+
+# 화면 밖 에이전트의 틱 간격(프레임)
+REDUCED_INTERVAL = 4
+
+# 화면 판정 여유 (픽셀) - 화면 가장자리 바로 밖의 몬스터가 끊겨 들어오지 않도록
+SCREEN_MARGIN = 96
+
+# ai_dormant_range가 없는 에이전트의 휴면 거리
+DORMANT_RANGE = 1200
+
+# 한 번에 넘기는 누적 delta time 상한(초)
+MAX_ACCUMULATED_DT = 0.25
+
+# REDUCED 에이전트 틱에 쓰는 프레임당 시간 예산(초)
+TIME_BUDGET = 0.004
+
+# 비용 추정 지수 평균 가중치
+_COST_SMOOTHING = 0.2
+
+
+class _AgentState:
+    __slots__ = ('level', 'waited', 'accumulated', 'cost', 'planned')
+
+    def __init__(self, phase):
+        self.level = FULL
+        self.waited = phase  # 마지막 틱 이후 지난 프레임 수 (처음에는 흩어 놓음)
+        self.accumulated = 0.0
+        self.cost = 0.0
+        self.planned = True
+
+
+_states = {}  # id(agent) -> _AgentState
+_next_phase = 0
+
+# 통계 (마지막 프레임 / 이번 실행 누적)
+_frame_stats = {'agents': 0, 'full': 0, 'reduced': 0, 'dormant': 0, 'ticked': 0, 'deferred': 0}
+_totals = {'frames': 0, 'ticks': 0, 'skipped': 0, 'deferred': 0}
+
+
+def is_agent(obj):
+    """스케줄 대상인지 (클래스 속성 ai_lod)"""
+    return getattr(obj, 'ai_lod', False)
+
+
+def _must_tick(agent):
+    """피격/사망 처리 중이라 매 프레임 틱해야 하는지"""
+    if getattr(agent, 'is_dead', False) is True:
+        return True
+    state_machine = getattr(agent, 'state_machine', None)
+    if state_machine is None:
+        return False
+    state = state_machine.cur_state
+    return state is getattr(agent, 'HIT', None) or state is getattr(agent, 'DEATH', None)
+
+
+def _on_screen(agent, camera):
+    half_w = camera.screen_width / 2 + SCREEN_MARGIN
+    half_h = camera.screen_height / 2 + SCREEN_MARGIN
+    return abs(agent.x - camera.x) <= half_w and abs(agent.y - camera.y) <= half_h
+
+
+def begin_frame(entities, player=None, camera=None):
+    """
+    이번 프레임의 LOD 결정과 틱 계획 (play_mode.update에서 엔티티 업데이트 전에 1회)
+
+    Args:
+        entities: 엔티티 리스트 (ai_lod가 아닌 객체는 무시)
+        player: 거리 기준 객체 (None이면 모두 FULL)
+        camera: screen_width, screen_height, x, y를 가진 카메라 (None이면 화면 판정 생략)
+    """
+    global _states, _next_phase
+    dt = framework.get_delta_time()
+    states = {}
+    due = []
+    counts = {FULL: 0, REDUCED: 0, DORMANT: 0}
+
+    for agent in entities:
+        if not is_agent(agent):
+            continue
+        key = id(agent)
+        state = _states.get(key)
+        if state is None:
+            state = _AgentState(_next_phase % REDUCED_INTERVAL)
+            _next_phase += 1
+        states[key] = state
+
+        if player is None or _must_tick(agent) or (camera is not None and _on_screen(agent, camera)):
+            level = FULL
+        else:
+            dx, dy = agent.x - player.x, agent.y - player.y
+            dormant_range = getattr(agent, 'ai_dormant_range', DORMANT_RANGE)
+            level = DORMANT if dx * dx + dy * dy > dormant_range * dormant_range else REDUCED
+        state.level = level
+        counts[level] += 1
+
+        if level == DORMANT:
+            # 휴면 중에는 시간이 흐르지 않음
+            state.accumulated = 0.0
+            state.planned = False
+            continue
+
+        state.accumulated = min(MAX_ACCUMULATED_DT, state.accumulated + dt)
+        state.waited += 1
+        if level == FULL:
+            state.planned = True
+        else:
+            state.planned = False
+            if state.waited >= REDUCED_INTERVAL:
+                due.append(state)
+
+    # 오래 기다린 에이전트부터 예산 안에서 계획 (최소 1개는 항상 틱)
+    due.sort(key=lambda s: s.waited, reverse=True)
+    spent = 0.0
+    deferred = 0
+    for index, state in enumerate(due):
+        if index > 0 and spent + state.cost > TIME_BUDGET:
+            deferred += 1
+            continue
+        state.planned = True
+        spent += state.cost
+
+    _states = states
+    _frame_stats.update(agents=len(states), full=counts[FULL], reduced=counts[REDUCED],
+                        dormant=counts[DORMANT], ticked=0, deferred=deferred)
+    _totals['frames'] += 1
+    _totals['deferred'] += deferred
+
+
+def update_agent(agent):
+    """
+    계획된 에이전트면 누적 delta time으로 update(), 아니면 건너뜀
+
+    Returns:
+        agent.update()의 반환값 (건너뛰면 True)
+    """
+    state = _states.get(id(agent))
+    if state is None:
+        # begin_frame 이후 생성된 에이전트는 이번 프레임 그대로 실행
+        return agent.update()
+    if not state.planned:
+        _totals['skipped'] += 1
+        return True
+
+    framework.set_delta_override(state.accumulated)
+    start = time.perf_counter()
+    try:
+        alive = agent.update()
+    finally:
+        framework.set_delta_override(None)
+    elapsed = time.perf_counter() - start
+
+    state.cost += (elapsed - state.cost) * _COST_SMOOTHING if state.cost else elapsed
+    state.accumulated = 0.0
+    state.waited = 0
+    state.planned = False
+    _frame_stats['ticked'] += 1
+    _totals['ticks'] += 1
+    return alive
+
+
+def clear():
+    """스테이지 전환 시 에이전트 상태 초기화"""
+    global _next_phase
+    _states.clear()
+    _next_phase = 0
+
+
+def stats():
+    """
+    통계
+
+    Returns:
+        dict: 마지막 프레임 {'agents', 'full', 'reduced', 'dormant', 'ticked', 'deferred'}
+              + 누적 {'frames', 'ticks', 'skipped', 'total_deferred'}
+    """
+    result = dict(_frame_stats)
+    result.update(frames=_totals['frames'], ticks=_totals['ticks'], skipped=_totals['skipped'],
+                  total_deferred=_totals['deferred'])
+    return result
@@ -0,0 +1,422 @@
+"""
+데이터 기반 애니메이션 클립
+
+캐릭터별 애니메이션 매니페스트(resources/Animations/<캐릭터>.json)를 읽어
+공유되는 불변 AnimationClip 객체를 만듭니다. 프레임 이미지는 캐릭터(매니페스트)당 한 번만 로드되며,
+프레임을 추가하거나 타이밍을 바꿀 때 Python 코드를 고치지 않고 매니페스트만 수정하면 됩니다.
+
+매니페스트 사용: CatAssassin, CatThief, PantherAssassin 패턴 1~2
+(PantherAssassin 본체/투사체와 패턴 3~6은 아직 코드에서 직접 로드)
+
+매니페스트 형식:
+    {
+        "character": "cat_assassin",
+        "base_path": "resources/Texture_organize/Entity/...",
+        "defaults": {"frame_duration": 0.1},
+        "clips": {
+            "idle":   {"file": "Cat_Assassin_Idle{i}.png", "range": [0, 6]},
+            "attack": {"file": "Cat_Assassin_Attack{i}.png", "range": [0, 7]},
+            "swing":  {"file": "Blade{i:02d}.png", "frames": [8, 9, 10], "durations": [0.05, 0.05, 0.1]}
+        }
+    }
+
+    - file: 프레임 파일 이름 (base_path 기준), {i}에 프레임 번호가 들어감 (format 지정자 사용 가능)
+    - range: [시작, 끝) 프레임 번호 (Python range와 동일) / frames: 프레임 번호 리스트 (둘 중 하나)
+    - frame_duration: 프레임당 시간(초) / durations: 프레임별 시간 리스트 (durations가 우선)
+
+    재생 방식(종료 판정, 반복)은 각 상태 코드가 정하므로 매니페스트 클립은 항상 'loop'로 만들어집니다.
+    loop 모드가 필요한 코드 클립은 make_clip(..., loop)으로 만듭니다.
+
+검증: python tools/validate_animations.py
+
+재생: Animator(clip)은 시작 시각과 속도만 저장하고 현재 프레임은 게임 시계로 계산합니다.
+"""
+import os
+import json
+
+import pico2d as p2
+
+import game_framework as framework
+from . import image_asset_manager as iam
+from . import asset_pack
+
+MANIFEST_DIR = os.path.join('resources', 'Animations')
+
+LOOP_MODES = ('loop', 'once', 'pingpong')
+
+_DEFAULTS = {'frame_duration': 0.1}
+
+# 로드된 클립 라이브러리 {캐릭터 이름: {클립 이름: AnimationClip}}
+_library = {}
+
+
+class AnimationClip:
+    """
+    불변 애니메이션 클립 (같은 캐릭터의 모든 인스턴스가 공유)
+
+    Attributes:
+        character: 캐릭터(매니페스트) 이름
+        name: 클립 이름
+        frames: pico2d Image 튜플
+        durations: 프레임별 재생 시간(초) 튜플
+        loop: 'loop' | 'once' | 'pingpong'
+        paths: 프레임 이미지 경로 튜플
+    """
+    __slots__ = ('character', 'name', 'frames', 'durations', 'loop', 'paths',
+                 'total_duration', '_end_times')
+
+    def __init__(self, character, name, frames, durations, loop='loop', paths=()):
+        if loop not in LOOP_MODES:
+            raise ValueError(f"알 수 없는 loop 모드: {loop}")
+        if len(frames) != len(durations):
+            raise ValueError(f"frames({len(frames)})와 durations({len(durations)}) 길이가 다릅니다")
+
+        end_times = []
+        acc = 0.0
+        for d in durations:
+            acc += d
+            end_times.append(acc)
+
+        setter = object.__setattr__
+        setter(self, 'character', character)
+        setter(self, 'name', name)
+        setter(self, 'frames', tuple(frames))
+        setter(self, 'durations', tuple(float(d) for d in durations))
+        setter(self, 'loop', loop)
+        setter(self, 'paths', tuple(paths))
+        setter(self, 'total_duration', acc)
+        setter(self, '_end_times', tuple(end_times))
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"AnimationClip은 불변 객체입니다 ({key} 변경 불가)")
+
+    def __repr__(self):
+        return f"AnimationClip({self.character}/{self.name}, {len(self.frames)} frames, {self.loop})"
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __getitem__(self, index):
+        return self.frames[index]
+
+    @property
+    def frame_count(self):
+        return len(self.frames)
+
+    @property
+    def frame_duration(self):
+        """첫 프레임 재생 시간 (모든 프레임 시간이 같은 클립에서 사용)"""
+        return self.durations[0] if self.durations else 0.0
+
+    @property
+    def fps(self):
+        """초당 프레임 수 (첫 프레임 시간 기준)"""
+        return 1.0 / self.frame_duration if self.frame_duration > 0 else 0.0
+
+    def frame_index_at(self, elapsed):
+        """
+        재생 시작 후 elapsed초가 지났을 때의 프레임 번호
+
+        Args:
+            elapsed: 재생 경과 시간(초)
+
+        Returns:
+            int: 프레임 인덱스 (0 ~ frame_count-1)
+        """
+        count = len(self.frames)
+        if count <= 1 or self.total_duration <= 0:
+            return 0
+
+        if self.loop == 'once':
+            if elapsed >= self.total_duration:
+                return count - 1
+            t = max(0.0, elapsed)
+        elif self.loop == 'pingpong':
+            # 왕복: 0..n-1..1 (끝 프레임은 한 번씩만)
+            t = max(0.0, elapsed) % (self.total_duration * 2)
+            if t >= self.total_duration:
+                index = self._index_for(t - self.total_duration)
+                return count - 1 - index
+        else:
+            t = max(0.0, elapsed) % self.total_duration
+
+        return self._index_for(t)
+
+    def _index_for(self, t):
+        # 선형 탐색 (클립 프레임 수가 작아 이분 탐색보다 빠름)
+        for i, end in enumerate(self._end_times):
+            if t < end:
+                return i
+        return len(self._end_times) - 1
+
+    def is_finished(self, elapsed):
+        """'once' 클립이 끝났는지 (반복 클립은 항상 False)"""
+        return self.loop == 'once' and elapsed >= self.total_duration
+
+
+def make_clip(name, frames, frame_duration, loop='loop', character=''):
+    """
+    코드에서 로드한 프레임 리스트로 클립 만들기 (모든 프레임 시간이 같은 경우)
+
+    Args:
+        name: 클립 이름
+        frames: pico2d Image 리스트
+        frame_duration: 프레임당 시간(초)
+        loop: 'loop' | 'once' | 'pingpong'
+        character: 캐릭터 이름 (표시용)
+
+    Returns:
+        AnimationClip
+    """
+    return AnimationClip(character, name, frames, [frame_duration] * len(frames), loop)
+
+
+class Animator:
+    """
+    시간 기반 애니메이션 재생기
+
+    인스턴스마다 재생 시작 시각과 속도만 저장하고, 현재 프레임은
+    (시계 - 시작 시각) * 속도를 공유 AnimationClip에 넣어 그릴 때 계산합니다.
+    프레임 누적용 update()가 필요 없습니다.
+
+    Args:
+        clip: AnimationClip
+        speed: 재생 속도 배율
+        clock: 현재 시각(초)을 반환하는 함수
+               (기본: framework.get_game_time - 일시정지 중 멈춤, UI는 framework.get_ui_time)
+    """
+    __slots__ = ('clip', 'start_time', 'speed', 'clock')
+
+    def __init__(self, clip, speed=1.0, clock=None):
+        self.clip = clip
+        self.speed = speed
+        self.clock = clock or framework.get_game_time
+        self.start_time = self.clock()
+
+    def play(self, clip=None, speed=None, restart=True):
+        """
+        재생 시작
+
+        Args:
+            clip: 바꿀 클립 (None이면 현재 클립)
+            speed: 바꿀 속도 (None이면 유지)
+            restart: False면 같은 클립을 재생 중일 때 처음부터 다시 시작하지 않음
+        """
+        if speed is not None:
+            self.speed = speed
+        if clip is not None and clip is not self.clip:
+            self.clip = clip
+        elif not restart:
+            return
+        self.start_time = self.clock()
+
+    @property
+    def elapsed(self):
+        """재생 경과 시간(초, 속도 반영)"""
+        return (self.clock() - self.start_time) * self.speed
+
+    @property
+    def frame_index(self):
+        return self.clip.frame_index_at(self.elapsed)
+
+    @property
+    def image(self):
+        """현재 프레임 이미지 (프레임이 없으면 None)"""
+        if not self.clip.frames:
+            return None
+        return self.clip.frames[self.frame_index]
+
+    def is_finished(self):
+        return self.clip.is_finished(self.elapsed)
+
+
+# ==================== 매니페스트 ====================
+
+def manifest_path(character):
+    return os.path.join(MANIFEST_DIR, f'{character}.json')
+
+
+def load_manifest(character):
+    """
+    매니페스트 JSON 읽기
+
+    Args:
+        character: 캐릭터 이름 (resources/Animations/<character>.json)
+
+    Returns:
+        dict: 매니페스트 원본 데이터
+    """
+    with open(manifest_path(character), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _clip_settings(data, clip_data):
+    settings = dict(_DEFAULTS)
+    settings.update(data.get('defaults', {}))
+    settings.update(clip_data)
+    return settings
+
+
+def _frame_numbers(settings):
+    if 'frames' in settings:
+        return list(settings['frames'])
+    start, end = settings['range']
+    return list(range(start, end))
+
+
+def _frame_paths(data, settings):
+    base_path = data.get('base_path', '')
+    return [os.path.join(base_path, settings['file'].format(i=i)).replace('\\', '/')
+            for i in _frame_numbers(settings)]
+
+
+def _frame_durations(settings, count):
+    if 'durations' in settings:
+        return [float(d) for d in settings['durations']]
+    return [float(settings['frame_duration'])] * count
+
+
+def validate_manifest(data, check_files=True):
+    """
+    매니페스트 구조와 프레임 파일 존재 여부 검사
+
+    Args:
+        data: load_manifest()로 읽은 dict
+        check_files: True면 프레임 이미지 파일 존재 여부도 검사
+
+    Returns:
+        list: 오류 메시지 리스트 (비어있으면 정상)
+    """
+    errors = []
+    if not isinstance(data, dict):
+        return ['매니페스트 최상위는 객체여야 합니다']
+
+    clips = data.get('clips')
+    if not isinstance(clips, dict) or not clips:
+        return ["'clips' 항목이 없거나 비어있습니다"]
+
+    for clip_name, clip_data in clips.items():
+        prefix = f"clip '{clip_name}'"
+        if not isinstance(clip_data, dict):
+            errors.append(f'{prefix}: 객체여야 합니다')
+            continue
+
+        settings = _clip_settings(data, clip_data)
+
+        if 'file' not in settings or '{i' not in settings['file']:
+            errors.append(f"{prefix}: 'file'이 없거나 프레임 번호 자리({{i}})가 없습니다")
+            continue
+
+        has_range = 'range' in clip_data
+        has_frames = 'frames' in clip_data
+        if has_range == has_frames:
+            errors.append(f"{prefix}: 'range'와 'frames' 중 정확히 하나만 지정해야 합니다")
+            continue
+        if has_range:
+            r = clip_data['range']
+            if (not isinstance(r, list) or len(r) != 2 or not all(isinstance(v, int) for v in r)
+                    or r[0] >= r[1]):
+                errors.append(f"{prefix}: 'range'는 [시작, 끝) 정수 쌍이어야 합니다 (시작 < 끝)")
+                continue
+        elif not clip_data['frames'] or not all(isinstance(v, int) for v in clip_data['frames']):
+            errors.append(f"{prefix}: 'frames'는 비어있지 않은 정수 리스트여야 합니다")
+            continue
+
+        count = len(_frame_numbers(settings))
+
+        if 'durations' in settings:
+            durations = settings['durations']
+            if not isinstance(durations, list) or len(durations) != count:
+                errors.append(f"{prefix}: 'durations' 길이({len(durations) if isinstance(durations, list) else '?'})가 프레임 수({count})와 다릅니다")
+            elif any((not isinstance(d, (int, float))) or d <= 0 for d in durations):
+                errors.append(f"{prefix}: 'durations' 값은 모두 양수여야 합니다")
+        elif not isinstance(settings['frame_duration'], (int, float)) or settings['frame_duration'] <= 0:
+            errors.append(f"{prefix}: 'frame_duration'은 양수여야 합니다")
+
+        for key in ('loop', 'pivot'):
+            if key in settings:
+                errors.append(f"{prefix}: '{key}'는 지원하지 않는 항목입니다 (재생 방식은 상태 코드가 결정)")
+
+        if check_files:
+            for path in _frame_paths(data, settings):
+                if not asset_pack.exists(path):
+                    errors.append(f'{prefix}: 프레임 파일 없음 {path}')
+
+    return errors
+
+
+def _build_clips(character, data):
+    clips = {}
+    for clip_name, clip_data in data['clips'].items():
+        settings = _clip_settings(data, clip_data)
+        paths = _frame_paths(data, settings)
+        durations = _frame_durations(settings, len(paths))
+
+        frames = []
+        loaded_durations = []
+        loaded_paths = []
+        for path, duration in zip(paths, durations):
+            try:
+                img = p2.load_image(path)
+            except Exception as e:
+                print(f'\033[91m[AnimationClips] {character}/{clip_name}: 프레임 로드 실패 ({path}): {e}\033[0m')
+                continue
+            # 색상 변형(make_dark 등)에 쓸 수 있도록 경로 등록
+            iam.register_image_path(img, path)
+            frames.append(img)
+            loaded_durations.append(duration)
+            loaded_paths.append(path)
+
+        clips[clip_name] = AnimationClip(character, clip_name, frames, loaded_durations,
+                                         paths=loaded_paths)
+    return clips
+
+
+def get_clips(character):
+    """
+    캐릭터의 모든 클립 가져오기 (최초 호출 시에만 매니페스트를 읽고 이미지를 로드)
+
+    Args:
+        character: 캐릭터 이름
+
+    Returns:
+        dict: {클립 이름: AnimationClip} (실패 시 빈 dict)
+    """
+    clips = _library.get(character)
+    if clips is not None:
+        return clips
+
+    try:
+        data = load_manifest(character)
+    except Exception as e:
+        print(f'\033[91m[AnimationClips] 매니페스트 로드 실패 ({character}): {e}\033[0m')
+        return {}
+
+    errors = validate_manifest(data, check_files=False)
+    if errors:
+        for err in errors:
+            print(f'\033[91m[AnimationClips] {character}: {err}\033[0m')
+        return {}
+
+    clips = _build_clips(character, data)
+    _library[character] = clips
+    print(f"[AnimationClips] {character}: 클립 {len(clips)}개, 프레임 {sum(len(c) for c in clips.values())}개 로드")
+    return clips
+
+
+def get_clip(character, clip_name):
+    """
+    클립 하나 가져오기
+
+    Returns:
+        AnimationClip 또는 None
+    """
+    clip = get_clips(character).get(clip_name)
+    if clip is None:
+        print(f'\033[91m[AnimationClips] 클립 없음: {character}/{clip_name}\033[0m')
+    return clip
+
+
+def clear_library():
+    """로드된 모든 클립 해제 (이미지 텍스처도 참조가 없어지면 해제됨)"""
+    _library.clear()
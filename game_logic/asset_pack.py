@@ -0,0 +1,430 @@
+"""
+패킹된 에셋 아카이브 (resources/assets.pack)
+
+resources/Texture_organize 아래의 수천 개 PNG를 하나의 파일로 묶어
+실행 시 수천 번의 open() 대신 파일 하나를 mmap으로 열어 필요한 항목만 디코딩합니다.
+항목은 경로 순으로 저장되므로 같은 폴더(한 캐릭터/스테이지)의 이미지는 파일 안에서 연속된 구간이 되고,
+스테이지 로드는 그 구간을 순차적으로 읽는 것과 같습니다.
+
+파일 형식 (리틀 엔디언):
+    헤더 24바이트: 매직 b'APK1' + version(uint16) + flags(uint16) + entry_count(uint32) + index_offset(uint64) + 예약(uint32)
+    본문: 항목 데이터(blob)를 이어 붙인 영역
+    인덱스 (index_offset부터, entry_count개):
+        path_len(uint16) + codec(uint8) + 예약(uint8) + offset(uint64) + stored_size(uint32) + raw_size(uint32) + path(UTF-8)
+
+    codec: 0 = 원본 그대로 (PNG는 이미 압축되어 있음), 1 = zlib
+
+사용법:
+    from game_logic import asset_pack
+    asset_pack.install()            # 팩이 있으면 열고 pico2d 이미지 로드를 팩 우선으로 연결
+    data = asset_pack.read_bytes('resources/Texture_organize/.../a.png')
+
+생성: python tools/build_asset_pack.py
+"""
+import io
+import os
+import mmap
+import zlib
+import struct
+
+import pico2d as p2
+import sdl2
+import sdl2.sdlimage as sdlimage
+
+PACK_PATH = os.path.join('resources', 'assets.pack')
+SOURCE_DIR = os.path.join('resources', 'Texture_organize')
+
+CODEC_RAW = 0
+CODEC_ZLIB = 1
+
+_MAGIC = b'APK1'
+_VERSION = 1
+_HEADER = struct.Struct('<4sHHIQI')
+_ENTRY = struct.Struct('<HBxQII')
+
+# 현재 열린 팩 (install() 또는 open_pack()으로 설정)
+_pack = None
+
+# pico2d 원래 텍스처 로더 (install() 시 보관)
+_original_load_texture = None
+
+# 통계 (이번 실행 기준)
+_stats = {'pack_hits': 0, 'fallbacks': 0, 'bytes_read': 0}
+
+
+def normalize_path(path):
+    """
+    팩 인덱스 키 형식으로 경로 정규화 (프로젝트 루트 기준 상대 경로, '/' 구분자)
+
+    Args:
+        path: 파일 경로 (상대 또는 절대)
+
+    Returns:
+        정규화된 경로 문자열
+    """
+    if isinstance(path, bytes):
+        path = path.decode('utf-8')
+    if os.path.isabs(path):
+        path = os.path.relpath(path)
+    return os.path.normpath(path).replace('\\', '/')
+
+
+class AssetPack:
+    """
+    mmap으로 연 읽기 전용 에셋 팩
+
+    인덱스만 메모리에 올리고, 항목 데이터는 read_bytes() 시점에 mmap에서 잘라 읽습니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+        try:
+            self._index = self._read_index()
+        except Exception:
+            self.close()
+            raise
+
+    def _read_index(self):
+        if len(self._map) < _HEADER.size:
+            raise ValueError(f'에셋 팩이 너무 작습니다: {self.path}')
+
+        magic, version, _, entry_count, index_offset, _ = _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC:
+            raise ValueError(f'에셋 팩 형식이 아닙니다: {self.path}')
+        if version != _VERSION:
+            raise ValueError(f'지원하지 않는 에셋 팩 버전: {version}')
+
+        index = {}
+        pos = index_offset
+        for _ in range(entry_count):
+            path_len, codec, offset, stored_size, raw_size = _ENTRY.unpack_from(self._map, pos)
+            pos += _ENTRY.size
+            name = self._map[pos:pos + path_len].decode('utf-8')
+            pos += path_len
+            index[name] = (offset, stored_size, raw_size, codec)
+        return index
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, path):
+        return normalize_path(path) in self._index
+
+    def names(self):
+        """저장된 모든 경로 (저장 순서)"""
+        return list(self._index.keys())
+
+    def read_bytes(self, path):
+        """
+        항목 원본 데이터 읽기
+
+        Args:
+            path: 파일 경로 (normalize_path로 정규화됨)
+
+        Returns:
+            bytes 또는 None (팩에 없는 경우)
+        """
+        entry = self._index.get(normalize_path(path))
+        if entry is None:
+            return None
+
+        offset, stored_size, raw_size, codec = entry
+        data = self._map[offset:offset + stored_size]
+        if codec == CODEC_ZLIB:
+            data = zlib.decompress(data)
+        _stats['bytes_read'] += stored_size
+        return data
+
+    def listdir(self, directory):
+        """
+        팩 안에서 directory 바로 아래의 파일 이름 목록 (os.listdir 대체)
+
+        Returns:
+            list: 파일 이름 리스트 (하위 폴더 제외)
+        """
+        prefix = normalize_path(directory) + '/'
+        return [name[len(prefix):] for name in self._index
+                if name.startswith(prefix) and '/' not in name[len(prefix):]]
+
+    def prefetch(self, directory=None):
+        """
+        팩 전체(또는 directory 구간)를 순차적으로 미리 읽어 OS 페이지 캐시에 올림
+
+        항목이 경로 순으로 연속 저장되므로 폴더 하나는 하나의 연속 구간입니다.
+
+        Args:
+            directory: 미리 읽을 폴더 (None이면 팩 전체)
+
+        Returns:
+            int: 미리 읽은 바이트 수
+        """
+        if directory is None:
+            start, end = 0, len(self._map)
+        else:
+            prefix = normalize_path(directory) + '/'
+            spans = [(offset, offset + size) for name, (offset, size, _, _) in self._index.items()
+                     if name.startswith(prefix)]
+            if not spans:
+                return 0
+            start = min(s for s, _ in spans)
+            end = max(e for _, e in spans)
+
+        if hasattr(self._map, 'madvise') and hasattr(mmap, 'MADV_WILLNEED'):
+            page = mmap.PAGESIZE
+            aligned = start - (start % page)
+            self._map.madvise(mmap.MADV_WILLNEED, aligned, end - aligned)
+        else:
+            # madvise를 지원하지 않는 플랫폼(Windows)에서는 직접 순차 읽기
+            chunk = 1 << 20
+            for pos in range(start, end, chunk):
+                self._map[pos:min(pos + chunk, end)]
+        return end - start
+
+    def close(self):
+        if getattr(self, '_map', None) is not None:
+            self._map.close()
+            self._map = None
+        if getattr(self, '_file', None) is not None:
+            self._file.close()
+            self._file = None
+
+
+# ==================== 팩 생성 ====================
+
+def collect_files(source_dir=SOURCE_DIR, extensions=('.png',)):
+    """
+    팩에 넣을 파일 목록 (정규화된 경로, 정렬됨)
+
+    Args:
+        source_dir: 수집할 폴더
+        extensions: 포함할 확장자 (소문자)
+
+    Returns:
+        list: 정규화된 파일 경로 리스트
+    """
+    paths = []
+    for root, dirs, files in os.walk(source_dir):
+        dirs.sort()
+        for name in files:
+            if name.lower().endswith(extensions):
+                paths.append(normalize_path(os.path.join(root, name)))
+    paths.sort()
+    return paths
+
+
+def write_pack(paths, out_path=PACK_PATH, compress=False, min_saving=0.05):
+    """
+    파일 목록으로 에셋 팩 생성 (임시 파일에 쓴 뒤 교체)
+
+    Args:
+        paths: 포함할 파일 경로 리스트 (저장 순서 = 리스트 순서)
+        out_path: 출력 팩 경로
+        compress: True면 zlib 압축을 시도하여 min_saving 이상 줄어드는 항목만 압축 저장
+        min_saving: 압축 저장 기준 (0.05 = 5% 이상 줄어들 때)
+
+    Returns:
+        dict: {'entries', 'raw_bytes', 'stored_bytes', 'compressed'}
+    """
+    entries = []
+    raw_total = 0
+    stored_total = 0
+    compressed = 0
+
+    temp_path = f'{out_path}.{os.getpid()}.tmp'
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(b'\0' * _HEADER.size)
+
+            for path in paths:
+                with open(path, 'rb') as src:
+                    raw = src.read()
+
+                codec = CODEC_RAW
+                stored = raw
+                if compress:
+                    packed = zlib.compress(raw, 9)
+                    if len(packed) <= len(raw) * (1.0 - min_saving):
+                        codec = CODEC_ZLIB
+                        stored = packed
+                        compressed += 1
+
+                offset = f.tell()
+                f.write(stored)
+                entries.append((normalize_path(path), codec, offset, len(stored), len(raw)))
+                raw_total += len(raw)
+                stored_total += len(stored)
+
+            index_offset = f.tell()
+            for name, codec, offset, stored_size, raw_size in entries:
+                encoded = name.encode('utf-8')
+                f.write(_ENTRY.pack(len(encoded), codec, offset, stored_size, raw_size))
+                f.write(encoded)
+
+            f.seek(0)
+            f.write(_HEADER.pack(_MAGIC, _VERSION, 0, len(entries), index_offset, 0))
+        os.replace(temp_path, out_path)
+    except Exception:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+    return {'entries': len(entries), 'raw_bytes': raw_total,
+            'stored_bytes': stored_total, 'compressed': compressed}
+
+
+# ==================== 런타임 ====================
+
+def open_pack(path=PACK_PATH):
+    """
+    팩 열기 (이미 열린 팩은 닫고 교체)
+
+    Returns:
+        AssetPack 또는 None (파일이 없거나 손상된 경우)
+    """
+    global _pack
+    close_pack()
+    if not os.path.exists(path):
+        return None
+    try:
+        _pack = AssetPack(path)
+    except Exception as e:
+        print(f'\033[91m[AssetPack] 팩 열기 실패 ({path}): {e}\033[0m')
+        _pack = None
+    return _pack
+
+
+def close_pack():
+    global _pack
+    if _pack is not None:
+        _pack.close()
+        _pack = None
+
+
+def get_pack():
+    return _pack
+
+
+def read_bytes(path):
+    """
+    파일 데이터 읽기 (팩 우선, 없으면 디스크)
+
+    Args:
+        path: 파일 경로
+
+    Returns:
+        bytes
+    """
+    if _pack is not None:
+        data = _pack.read_bytes(path)
+        if data is not None:
+            return data
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def open_binary(path):
+    """
+    PIL Image.open 등에 넘길 수 있는 바이너리 파일 객체 (팩 우선)
+
+    Returns:
+        파일 객체 (팩 항목이면 BytesIO)
+    """
+    if _pack is not None:
+        data = _pack.read_bytes(path)
+        if data is not None:
+            return io.BytesIO(data)
+    return open(path, 'rb')
+
+
+def exists(path):
+    """팩 또는 디스크에 파일이 있는지"""
+    return (_pack is not None and path in _pack) or os.path.exists(path)
+
+
+def listdir(directory):
+    """
+    폴더의 파일 이름 목록 (디스크에 폴더가 없으면 팩 인덱스 사용)
+
+    Returns:
+        list: 파일 이름 리스트
+    """
+    if os.path.isdir(directory):
+        return os.listdir(directory)
+    if _pack is not None:
+        return _pack.listdir(directory)
+    raise FileNotFoundError(directory)
+
+
+def _load_texture(renderer, name):
+    """pico2d.load_image가 사용하는 IMG_LoadTexture 대체 (팩에 있으면 메모리에서 디코딩)"""
+    if _pack is not None:
+        data = _pack.read_bytes(name)
+        if data is not None:
+            rw = sdl2.SDL_RWFromConstMem(data, len(data))
+            # freesrc=1: SDL이 RWops를 닫음 (data는 이 호출 동안 살아있음)
+            texture = sdlimage.IMG_LoadTexture_RW(renderer, rw, 1)
+            if texture:
+                _stats['pack_hits'] += 1
+                return texture
+    _stats['fallbacks'] += 1
+    return _original_load_texture(renderer, name)
+
+
+def install(path=PACK_PATH, prefetch=False):
+    """
+    팩을 열고 pico2d 이미지 로드를 팩 우선으로 연결
+
+    pico2d.load_image는 호출 시점에 모듈 전역 IMG_LoadTexture를 찾으므로 이를 교체하면
+    `from pico2d import load_image`로 미리 가져간 함수까지 모두 팩을 사용합니다.
+    팩에 없는 경로는 원래대로 디스크에서 로드합니다.
+
+    Args:
+        path: 팩 경로
+        prefetch: True면 팩 전체를 미리 순차 읽기
+
+    Returns:
+        bool: 팩이 열렸는지 여부 (False면 기존 파일 로드 그대로 사용)
+    """
+    global _original_load_texture
+    pack = open_pack(path)
+    if pack is None:
+        return False
+
+    if _original_load_texture is None:
+        _original_load_texture = p2.pico2d.IMG_LoadTexture
+        p2.pico2d.IMG_LoadTexture = _load_texture
+
+    if prefetch:
+        pack.prefetch()
+    print(f'[AssetPack] {path}: 항목 {len(pack)}개 연결')
+    return True
+
+
+def uninstall():
+    """install() 되돌리기 (팩 닫기 + pico2d 로더 복원)"""
+    global _original_load_texture
+    if _original_load_texture is not None:
+        p2.pico2d.IMG_LoadTexture = _original_load_texture
+        _original_load_texture = None
+    close_pack()
+
+
+def stats():
+    """
+    통계
+
+    Returns:
+        dict: {'entries', 'pack_hits', 'fallbacks', 'bytes_read'}
+    """
+    result = {'entries': len(_pack) if _pack is not None else 0}
+    result.update(_stats)
+    return result
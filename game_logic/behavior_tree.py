@@ -1,3 +1,4 @@
+import math
 import random
 
 # 행동 트리 디버깅용 들여쓰기 레벨 전역 변수
@@ -27,23 +28,40 @@ class BehaviorTree:
     # 노드 실행 결과 상수
     FAIL, RUNNING, SUCCESS, UNDEF = 'FAIL', 'RUNNING', 'SUCCESS', 'UNDEF'
 
-    def __init__(self, root_node):
+    def __init__(self, root_node, compiled=True, trace=False, blackboard=None):
         """
         행동 트리 초기화
         :param root_node: 트리의 루트 노드
+        :param compiled: True면 평탄화한 명령 배열로 실행 (CompiledTree), False면 노드 재귀 실행
+        :param trace: True면 노드마다 실행 결과를 출력하는 추적 버전으로 컴파일 (디버깅용)
+        :param blackboard: 틱마다 begin_tick()을 호출할 Blackboard (None이면 소유자가 직접 관리)
         """
         self.root = root_node
         self.root.tag_condition()
+        self.program = CompiledTree(root_node, trace) if compiled else None
+        self.blackboard = blackboard
 
     def run(self):
         """
         행동 트리 실행 (매 프레임 호출)
         루트 노드가 SUCCESS를 반환하면 트리를 리셋
         """
+        if self.blackboard is not None:
+            self.blackboard.begin_tick()
+        if self.program is not None:
+            if self.program.tick() == BehaviorTree.SUCCESS:
+                self.program.reset()
+            return
         self.root.run()
         if self.root.value == BehaviorTree.SUCCESS:
             self.root.reset()
 
+    def reset(self):
+        """트리 전체 상태 초기화"""
+        if self.program is not None:
+            self.program.reset()
+        self.root.reset()
+
 
 class Node:
     """
@@ -74,11 +92,12 @@ class Node:
     def show_result(f):
         """
         데코레이터: 노드 실행 결과를 출력 (디버깅용)
+        매 틱 함수 호출이 하나 더 늘어나므로 기본 노드에는 붙이지 않습니다.
+        트리 전체를 추적하려면 BehaviorTree(root, trace=True)를 사용하세요.
         """
         def inner(self):
             result = f(self)
-            # 디버깅이 필요할 때 주석 해제
-            # print(f'[{self.__class__.__name__:10s}] {self.name:40s} ==> ({result})')
+            print(f'[{self.__class__.__name__:10s}] {self.name:40s} ==> ({result})')
             return result
         return inner
 
@@ -117,7 +136,6 @@ class Selector(Node):
             if child_node.has_condition:
                 self.has_condition = True
 
-    @Node.show_result
     def run(self):
         """
         Selector 실행: 자식 노드들을 순서대로 실행
@@ -184,7 +202,6 @@ class RandomSelector(Node):
             if child_node.has_condition:
                 self.has_condition = True
 
-    @Node.show_result
     def run(self):
         """
         RandomSelector 실행: 자식 노드들을 랜덤한 순서로 실행
@@ -269,7 +286,6 @@ class Sequence(Node):
             if child_node.has_condition:
                 self.has_condition = True
 
-    @Node.show_result
     def run(self):
         """
         Sequence 실행: 자식 노드들을 순서대로 실행
@@ -338,7 +354,6 @@ class Action(Node):
         """Leaf 노드에는 자식을 추가할 수 없음"""
         print("ERROR: you cannot add children node to leaf node")
 
-    @Node.show_result
     def run(self):
         """
         Action 실행: 지정된 함수를 호출하고 결과 반환
@@ -382,7 +397,6 @@ class Condition(Node):
         """Leaf 노드에는 자식을 추가할 수 없음"""
         print("ERROR: you cannot add children node to leaf node")
 
-    @Node.show_result
     def run(self):
         """
         Condition 실행: 조건을 검사하고 SUCCESS 또는 FAIL 반환
@@ -401,3 +415,453 @@ class Condition(Node):
             raise ValueError("Condition node returned RUNNING")
 
         return self.value
+
+
+# ==================== 블랙보드 ====================
+
+class Blackboard:
+    """
+    행동 트리 공용 값 저장소
+    - 키마다 타입을 정해 두고(define) 잘못된 타입의 값은 거부합니다 (None은 항상 허용).
+    - provider를 준 키는 그 틱에서 처음 읽을 때 한 번만 계산하고, 같은 틱 안에서는 캐시된 값을 돌려줍니다.
+      조건/액션/패턴이 플레이어까지의 거리나 각도를 각자 다시 계산하지 않고 같은 값을 읽게 하려는 용도입니다.
+    - begin_tick()에서 캐시를 비웁니다. BehaviorTree(root, blackboard=...)로 만들면 run()마다 자동으로 호출되고,
+      트리 밖(소유자의 update)에서도 값을 읽는다면 소유자가 update 시작에서 직접 호출합니다.
+    - 틱 도중 위치가 순간 이동처럼 크게 바뀌면 invalidate()로 캐시를 비웁니다.
+
+    사용법:
+        board = Blackboard()
+        board.define('attack_range', float, default=800.0)
+        add_perception(board, 'target', boss, lambda: boss.target, sight=boss.sight)
+        board.begin_tick()
+        if board.get('target_distance') <= board.get('attack_range'): ...
+    """
+
+    def __init__(self):
+        self._types = {}
+        self._providers = {}
+        self._values = {}
+        self._cache = {}
+        self.tick = 0
+        self._stats = {'computed': 0, 'hits': 0}
+
+    def define(self, key, value_type, provider=None, default=None):
+        """
+        키 등록
+        :param key: 키 이름
+        :param value_type: 값 타입 (타입 또는 타입 튜플)
+        :param provider: 틱마다 값을 계산할 함수 provider(blackboard) (None이면 set()으로 저장하는 값)
+        :param default: provider가 없는 키의 초기값
+        """
+        self._types[key] = value_type
+        if provider is not None:
+            self._providers[key] = provider
+            self._values.pop(key, None)
+        else:
+            self._providers.pop(key, None)
+            self._check(key, default)
+            self._values[key] = default
+        self._cache.pop(key, None)
+
+    def _check(self, key, value):
+        value_type = self._types.get(key)
+        if value_type is None:
+            raise KeyError(f'정의되지 않은 블랙보드 키: {key}')
+        if value is not None and not isinstance(value, value_type):
+            print(f'\033[91m[Blackboard] {key}: {value_type} 타입이 아닌 값 {value!r}\033[0m')
+            raise TypeError(f'Blackboard key {key} expects {value_type}, got {type(value).__name__}')
+
+    def set(self, key, value):
+        """provider가 없는 키의 값 저장"""
+        if key in self._providers:
+            raise KeyError(f'계산되는 블랙보드 키는 set()할 수 없습니다: {key}')
+        self._check(key, value)
+        self._values[key] = value
+
+    def get(self, key):
+        """
+        값 읽기 (provider가 있는 키는 이번 틱에 처음 읽을 때만 계산)
+        """
+        cache = self._cache
+        if key in cache:
+            self._stats['hits'] += 1
+            return cache[key]
+        provider = self._providers.get(key)
+        if provider is None:
+            if key not in self._values:
+                raise KeyError(f'정의되지 않은 블랙보드 키: {key}')
+            return self._values[key]
+        value = provider(self)
+        self._check(key, value)
+        cache[key] = value
+        self._stats['computed'] += 1
+        return value
+
+    __getitem__ = get
+
+    def begin_tick(self):
+        """새 틱 시작: 계산된 값 캐시를 모두 비움"""
+        self._cache.clear()
+        self.tick += 1
+
+    def invalidate(self, *keys):
+        """
+        계산된 값 캐시 비우기 (틱 도중 위치가 크게 바뀌었을 때)
+        :param keys: 비울 키들 (없으면 전부)
+        """
+        if not keys:
+            self._cache.clear()
+            return
+        for key in keys:
+            self._cache.pop(key, None)
+
+    def stats(self):
+        """
+        통계
+        :return: {'computed', 'hits', 'tick'}
+        """
+        result = dict(self._stats)
+        result['tick'] = self.tick
+        return result
+
+
+def add_perception(blackboard, prefix, owner, subject, sight=None):
+    """
+    owner에서 subject()까지의 기하 값을 틱마다 지연 계산하는 키들을 등록
+    (subject가 None이면 모두 None, visible은 False)
+
+        {prefix}: 대상 객체 (subject() 결과)
+        {prefix}_delta: (dx, dy) 튜플
+        {prefix}_dx, {prefix}_dy: 대상 - owner 좌표 차
+        {prefix}_distance: 거리
+        {prefix}_angle: owner에서 대상을 향한 각도 (라디안, math.atan2(dy, dx))
+        {prefix}_direction: owner에서 대상을 향한 단위 벡터 (ux, uy) (거리 0이면 (1.0, 0.0))
+        {prefix}_visible: sight.sees()로 판정한 시야 (sight가 None이면 대상이 있으면 True)
+
+    :param blackboard: Blackboard
+    :param prefix: 키 앞부분 (예: 'target')
+    :param owner: x, y 속성을 가진 기준 객체
+    :param subject: 대상 객체를 반환하는 함수 (x, y 속성)
+    :param sight: line_of_sight.SightLine 같은 sees(x0, y0, x1, y1)를 제공하는 객체
+    """
+    delta_key = prefix + '_delta'
+
+    def delta(board):
+        other = board.get(prefix)
+        if other is None:
+            return None
+        return (other.x - owner.x, other.y - owner.y)
+
+    def component(index):
+        def provider(board):
+            d = board.get(delta_key)
+            return d[index] if d is not None else None
+        return provider
+
+    def distance(board):
+        d = board.get(delta_key)
+        return math.hypot(d[0], d[1]) if d is not None else None
+
+    def angle(board):
+        d = board.get(delta_key)
+        return math.atan2(d[1], d[0]) if d is not None else None
+
+    def direction(board):
+        d = board.get(delta_key)
+        if d is None:
+            return None
+        length = board.get(prefix + '_distance')
+        return (d[0] / length, d[1] / length) if length > 0 else (1.0, 0.0)
+
+    def visible(board):
+        other = board.get(prefix)
+        if other is None:
+            return False
+        if sight is None:
+            return True
+        return bool(sight.sees(owner.x, owner.y, other.x, other.y))
+
+    blackboard.define(prefix, object, lambda board: subject())
+    blackboard.define(delta_key, tuple, delta)
+    blackboard.define(prefix + '_dx', (int, float), component(0))
+    blackboard.define(prefix + '_dy', (int, float), component(1))
+    blackboard.define(prefix + '_distance', float, distance)
+    blackboard.define(prefix + '_angle', float, angle)
+    blackboard.define(prefix + '_direction', tuple, direction)
+    blackboard.define(prefix + '_visible', bool, visible)
+
+
+# ==================== 컴파일된 행동 트리 ====================
+
+# 명령 종류
+_OP_CALL = 0        # Action/그 밖의 Leaf 호출: a=함수, b=인자, 결과에 따라 on_success/on_fail/on_other로 이동
+_OP_CONDITION = 1   # Condition 호출: a=함수, b=인자 (True/SUCCESS면 on_success, 아니면 on_fail)
+_OP_ROLL = 2        # 자식 실행 확률 검사: a=확률, b=복합 노드 번호, c=건너뛸 위치 (재개 중인 노드는 검사 안 함)
+_OP_SHUFFLE = 3     # RandomSelector 진입: b=노드 번호, 자식 순서를 섞고 다음 명령(_OP_PICK)으로
+_OP_PICK = 4        # RandomSelector 다음 자식 선택: a=자식 시작 위치들, b=노드 번호, c=모두 실패 시 위치
+_OP_RETURN = 5      # 틱 종료: a=결과 (None이면 마지막 Leaf 결과 그대로)
+_OP_JUMP = 6        # c로 이동 (자식이 없는 복합 노드)
+_OP_TRACE = 7       # 추적 버전 전용: b=노드 번호, a=결과를 출력하고 c로 이동
+
+
+class CompiledTree:
+    """
+    노드 객체 트리를 평탄한 명령 배열로 바꿔 반복문 하나로 실행하는 행동 트리
+
+    - Sequence/Selector는 "자식 확률 검사 -> 자식 실행 -> 결과에 따라 다음 자식 또는 부모의 다음 위치로 이동"
+      명령 열로 풀어서, 실행 중에는 복합 노드 객체도 호출 스택도 거치지 않습니다.
+    - 재개 위치(running_child_index)는 RUNNING을 반환한 Leaf 명령의 위치 하나로 저장합니다.
+      RUNNING은 루트까지 그대로 올라가므로 경로 위의 모든 복합 노드가 그 Leaf 쪽 자식을 가리키기 때문입니다.
+      다음 틱은 그 Leaf부터 시작하고, 경로 위의 복합 노드는 재개 상태(확률 검사 없음,
+      RandomSelector는 자식이 실패하면 바로 실패)로 표시합니다.
+    - 노드별 run() 호출과 데코레이터 호출이 없습니다.
+
+    Selector/RandomSelector/Sequence/Action/Condition은 노드 클래스의 run()과 같은 결과를 내고
+    난수도 같은 순서로 뽑습니다 (같은 시드면 재귀 실행과 결과가 같음).
+    run()을 재정의한 Action 파생 클래스(BTActionWrapper 등)나 그 밖의 노드는 그 노드의 run()을 Leaf로 호출합니다.
+    컴파일 후에는 노드 객체의 value/running_child_index를 갱신하지 않습니다.
+
+    Args:
+        root_node: 트리의 루트 노드
+        trace: True면 노드가 끝날 때마다 결과를 출력하는 명령을 함께 생성 (Node.show_result와 같은 형식)
+    """
+
+    def __init__(self, root_node, trace=False):
+        self.trace = trace
+
+        # 노드 정보 (전위 순서 번호)
+        self.nodes = []
+        self.depths = []
+        self.probabilities = []
+
+        # 명령 배열
+        self.ops = []
+        self.a = []
+        self.b = []
+        self.c = []
+        self.on_success = []
+        self.on_fail = []
+        self.on_other = []
+        self.paths = []  # Leaf 명령별 조상 복합 노드 번호 (재개 시 표시)
+
+        # 이동 위치는 먼저 라벨로 기록하고 컴파일이 끝나면 명령 위치로 바꿈
+        self._labels = []
+        success, fail, other = self._label(), self._label(), self._label()
+        self._compile(root_node, 0, (), success, fail, other)
+        self._bind(success)
+        self._emit(_OP_RETURN, a=BehaviorTree.SUCCESS)
+        self._bind(fail)
+        self._emit(_OP_RETURN, a=BehaviorTree.FAIL)
+        self._bind(other)
+        self._emit(_OP_RETURN, a=None)
+        self._resolve()
+
+        # 노드별 실행 상태
+        count = len(self.nodes)
+        self.resumed = [False] * count
+        self.orders = [list(range(len(getattr(node, 'children', ())))) for node in self.nodes]
+        self.positions = [0] * count
+        self.running = -1  # RUNNING을 반환한 Leaf 명령 위치 (-1이면 루트부터)
+
+    # ==================== 컴파일 ====================
+
+    def _label(self):
+        self._labels.append(-1)
+        return len(self._labels) - 1
+
+    def _bind(self, label):
+        self._labels[label] = len(self.ops)
+
+    def _emit(self, op, a=None, b=None, c=None, on_success=None, on_fail=None, on_other=None, path=()):
+        self.ops.append(op)
+        self.a.append(a)
+        self.b.append(b)
+        self.c.append(c)
+        self.on_success.append(on_success)
+        self.on_fail.append(on_fail)
+        self.on_other.append(on_other)
+        self.paths.append(path)
+        return len(self.ops) - 1
+
+    def _resolve(self):
+        labels = self._labels
+        for column in (self.on_success, self.on_fail, self.on_other):
+            for pc, label in enumerate(column):
+                if label is not None:
+                    column[pc] = labels[label]
+        for pc, op in enumerate(self.ops):
+            if op in (_OP_ROLL, _OP_PICK, _OP_JUMP, _OP_TRACE):
+                self.c[pc] = labels[self.c[pc]]
+            if op == _OP_PICK:
+                self.a[pc] = tuple(labels[label] for label in self.a[pc])
+
+    def _traced(self, index, success, fail):
+        """
+        추적 버전이면 복합 노드 결과를 출력한 뒤 원래 위치로 가는 라벨로 바꿈
+
+        Returns:
+            (success, fail, stubs) - stubs는 노드 명령 뒤에 생성할 (라벨, 결과, 원래 라벨) 목록
+        """
+        if not self.trace:
+            return success, fail, ()
+        stubs = [(self._label(), BehaviorTree.SUCCESS, success), (self._label(), BehaviorTree.FAIL, fail)]
+        return stubs[0][0], stubs[1][0], stubs
+
+    def _compile(self, node, depth, path, success, fail, other):
+        """
+        node를 명령 열로 생성 (결과별 이동 라벨: success, fail, 그 밖의 Leaf 반환값은 other)
+        """
+        index = len(self.nodes)
+        self.nodes.append(node)
+        self.depths.append(depth)
+        node_type = type(node)
+
+        if node_type is Sequence or node_type is Selector or node_type is RandomSelector:
+            children = node.children
+            self.probabilities.append(tuple(probability for _, probability in children))
+            success, fail, stubs = self._traced(index, success, fail)
+            inner_path = path + (index,)
+            if node_type is RandomSelector:
+                # 섞은 순서대로 자식을 고르고, 자식이 실패하면 다시 _OP_PICK으로
+                pick = self._label()
+                entries = [self._label() for _ in children]
+                self._emit(_OP_SHUFFLE, b=index)
+                self._bind(pick)
+                self._emit(_OP_PICK, a=entries, b=index, c=fail)
+                for (child, _), entry in zip(children, entries):
+                    self._bind(entry)
+                    self._compile(child, depth + 1, inner_path, success, pick, pick)
+            else:
+                # Sequence: 자식 성공/건너뜀 -> 다음 자식, 실패 -> 부모로 / Selector는 반대
+                is_sequence = node_type is Sequence
+                for i, (child, probability) in enumerate(children):
+                    after = self._label() if i < len(children) - 1 else (success if is_sequence else fail)
+                    self._emit(_OP_ROLL, a=probability, b=index, c=after)
+                    if is_sequence:
+                        self._compile(child, depth + 1, inner_path, after, fail, after)
+                    else:
+                        self._compile(child, depth + 1, inner_path, success, after, after)
+                    if i < len(children) - 1:
+                        self._bind(after)
+                if not children:
+                    # 자식이 없으면 Sequence는 성공, Selector는 실패
+                    self._emit(_OP_JUMP, c=success if is_sequence else fail)
+            for label, result, target in stubs:
+                self._bind(label)
+                self._emit(_OP_TRACE, a=result, b=index, c=target)
+            return
+
+        self.probabilities.append(())
+
+        if isinstance(node, Condition) and node_type.run is Condition.run:
+            op, func, args = _OP_CONDITION, node.func, tuple(node.args)
+        elif isinstance(node, Action) and node_type.run is Action.run:
+            op, func, args = _OP_CALL, node.func, tuple(node.args)
+        else:
+            op, func, args = _OP_CALL, node.run, ()
+        self._emit(op, a=func, b=args, c=index, on_success=success, on_fail=fail, on_other=other, path=path)
+
+    # ==================== 실행 ====================
+
+    def reset(self):
+        """실행 재개 위치 초기화 (다음 틱은 루트부터)"""
+        self.running = -1
+
+    def _trace(self, index, result):
+        node = self.nodes[index]
+        print('    ' * self.depths[index], end='')
+        print(f'[{node.__class__.__name__:10s}] {getattr(node, "name", ""):40s} ==> ({result})')
+
+    def tick(self):
+        """
+        트리 한 틱 실행
+
+        Returns:
+            루트 결과 (BehaviorTree.SUCCESS / RUNNING / FAIL)
+        """
+        SUCCESS, RUNNING, FAIL = BehaviorTree.SUCCESS, BehaviorTree.RUNNING, BehaviorTree.FAIL
+        ops, a, b, c = self.ops, self.a, self.b, self.c
+        on_success, on_fail, on_other = self.on_success, self.on_fail, self.on_other
+        resumed, trace = self.resumed, self.trace
+        rand = random.random
+
+        # 실행 중이던 Leaf부터 재개 (경로 위 복합 노드는 재개 상태로)
+        pc = self.running
+        path = ()
+        if pc == -1:
+            pc = 0
+        else:
+            path = self.paths[pc]
+            for index in path:
+                resumed[index] = True
+            self.running = -1
+
+        result = None
+        while True:
+            op = ops[pc]
+            if op == _OP_CALL:
+                result = a[pc](*b[pc])
+                if trace:
+                    self._trace(c[pc], result)
+                if result == SUCCESS:
+                    pc = on_success[pc]
+                elif result == FAIL:
+                    pc = on_fail[pc]
+                elif result == RUNNING:
+                    self.running = pc
+                    if trace:
+                        for index in reversed(self.paths[pc]):
+                            self._trace(index, RUNNING)
+                    break
+                else:
+                    pc = on_other[pc]
+            elif op == _OP_ROLL:
+                # 재개 중인 노드는 확률 검사 없이 다음 자식 실행
+                if not resumed[b[pc]] and rand() > a[pc]:
+                    pc = c[pc]
+                else:
+                    pc += 1
+            elif op == _OP_CONDITION:
+                value = a[pc](*b[pc])
+                result = SUCCESS if value is True or value == SUCCESS else FAIL
+                if trace:
+                    self._trace(c[pc], result)
+                pc = on_success[pc] if result == SUCCESS else on_fail[pc]
+            elif op == _OP_PICK:
+                index = b[pc]
+                if resumed[index]:
+                    # 재개한 자식이 실패하면 RandomSelector도 실패
+                    pc = c[pc]
+                    continue
+                order, position, entries = self.orders[index], self.positions[index], a[pc]
+                probabilities = self.probabilities[index]
+                pc = c[pc]
+                while position < len(order):
+                    slot = order[position]
+                    position += 1
+                    if rand() > probabilities[slot]:
+                        continue
+                    pc = entries[slot]
+                    break
+                self.positions[index] = position
+            elif op == _OP_SHUFFLE:
+                # 재귀 실행과 같은 난수로 같은 순서가 나오도록 원래 순서에서 섞음
+                index = b[pc]
+                order = self.orders[index]
+                order[:] = range(len(order))
+                random.shuffle(order)
+                self.positions[index] = 0
+                pc += 1
+            elif op == _OP_RETURN:
+                if a[pc] is not None:
+                    result = a[pc]
+                break
+            elif op == _OP_JUMP:
+                pc = c[pc]
+            else:  # _OP_TRACE
+                self._trace(b[pc], a[pc])
+                pc = c[pc]
+
+        for index in path:
+            resumed[index] = False
+        return result
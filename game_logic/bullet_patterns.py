@@ -0,0 +1,199 @@
+"""
+탄막(투사체 패턴) 정의와 일괄 발사
+
+패턴 코드마다 반복문 안에서 cos/sin으로 방향을 구하고, 멀리 떨어진 목표 지점을 만들어
+Projectile.__init__이 다시 정규화하게 하던 부분을 데이터로 옮깁니다.
+패턴은 dict로 기술하고 모듈 로드 시 compile_pattern()으로 단위 벡터 테이블로 변환해 둡니다.
+발사할 때는 테이블을 (조준 방향으로 회전만 해서) 그대로 투사체에 넘기므로 탄 하나당 삼각함수가 없습니다.
+
+패턴 기술 형식:
+    {
+        'aimed': True,                  # True: 조준 방향 기준 각도, False: 월드 기준 각도 (0도 = +x, 반시계)
+        'speed': 350,                   # 탄속 (숫자, 또는 (시작, 끝) - 모양 안에서 탄 순서대로 선형 보간하는 속도 곡선)
+        'shapes': [                     # 모양 목록 (순서대로 이어 붙임)
+            {'arc': 120, 'count': 7},                     # 가운데(0도) 기준 120도 부채꼴에 7발 (양 끝 포함)
+            {'ring': 8, 'start': 0},                      # 원형 8발 (start도에서 시작)
+            {'ring_excluding': [0, 90, 180, 270],         # 원형에서 각 중심 ±margin도를 비우고
+             'margin': 20, 'per_gap': 7},                 # 사이 구간마다 per_gap발 (양 끝 포함)
+            {'angles': [0, 22.5, -22.5]},                 # 각도 직접 지정
+        ],
+        'waves': [{}, {'speed': 325, 'rotate': 10}],      # 웨이브별 덮어쓰기 (speed, rotate도). 생략하면 웨이브 1개
+    }
+
+사용법:
+    FAN = bullet_patterns.compile_pattern({'aimed': True, 'speed': 350, 'shapes': [{'arc': 120, 'count': 7}]})
+    aim = bullet_patterns.aim_at(boss.x, boss.y, target.x, target.y)
+    bullet_patterns.emit(FAN, boss.x, boss.y, PantherThrowingStar, world['effects_front'], aim=aim, damage=20)
+"""
+import math
+
+
+class Wave:
+    """
+    웨이브 하나의 컴파일 결과
+
+    Attributes:
+        directions: [(ux, uy)] 단위 벡터 (aimed면 +x 방향 조준 기준)
+        headings: [라디안] directions와 같은 각도 (회전 이미지를 쓰는 투사체용)
+        speeds: [탄속]
+    """
+    __slots__ = ('directions', 'headings', 'speeds')
+
+    def __init__(self, directions, headings, speeds):
+        self.directions = directions
+        self.headings = headings
+        self.speeds = speeds
+
+    def __len__(self):
+        return len(self.directions)
+
+
+class BulletPattern:
+    """
+    compile_pattern()의 결과
+
+    Attributes:
+        name: 패턴 이름 (로그용)
+        aimed: 조준 방향 기준인지
+        waves: [Wave]
+    """
+
+    def __init__(self, name, aimed, waves):
+        self.name = name
+        self.aimed = aimed
+        self.waves = waves
+
+    def count(self, wave=0):
+        """웨이브 하나의 탄 수"""
+        return len(self.waves[wave])
+
+
+def _shape_angles(shape):
+    """모양 하나의 각도 목록(도)"""
+    if 'arc' in shape:
+        count = shape['count']
+        spread = shape['arc']
+        if count == 1:
+            return [0.0]
+        step = spread / (count - 1)
+        return [-spread / 2 + step * i for i in range(count)]
+
+    if 'ring' in shape:
+        count = shape['ring']
+        start = shape.get('start', 0.0)
+        return [start + 360.0 / count * i for i in range(count)]
+
+    if 'ring_excluding' in shape:
+        centers = sorted(shape['ring_excluding'])
+        margin = shape.get('margin', 0.0)
+        per_gap = shape['per_gap']
+        angles = []
+        for index, center in enumerate(centers):
+            next_center = centers[index + 1] if index + 1 < len(centers) else centers[0] + 360.0
+            low, high = center + margin, next_center - margin
+            step = (high - low) / (per_gap - 1) if per_gap > 1 else 0.0
+            angles.extend(low + step * i for i in range(per_gap))
+        return angles
+
+    if 'angles' in shape:
+        return [float(angle) for angle in shape['angles']]
+
+    raise ValueError(f'알 수 없는 탄막 모양: {shape}')
+
+
+def _speed_curve(speed, count):
+    """탄속 (숫자 또는 (시작, 끝))을 count개 목록으로"""
+    if isinstance(speed, (int, float)):
+        return [speed] * count
+    start, end = speed
+    if count == 1:
+        return [start]
+    return [start + (end - start) * i / (count - 1) for i in range(count)]
+
+
+def compile_pattern(description, name=None):
+    """
+    패턴 기술(dict)을 단위 벡터 테이블로 변환 (모듈 로드 시 1회)
+
+    Args:
+        description: 모듈 docstring의 형식
+        name: 로그용 이름
+
+    Returns:
+        BulletPattern
+    """
+    aimed = description.get('aimed', False)
+    base_speed = description.get('speed', 400)
+    shapes = description['shapes']
+    waves = []
+    for wave in description.get('waves', [{}]):
+        speed = wave.get('speed', base_speed)
+        rotate = wave.get('rotate', 0.0)
+        directions, headings, speeds = [], [], []
+        for shape in shapes:
+            angles = _shape_angles(shape)
+            speeds.extend(_speed_curve(shape.get('speed', speed), len(angles)))
+            for angle in angles:
+                rad = math.radians(angle + rotate)
+                directions.append((math.cos(rad), math.sin(rad)))
+                headings.append(rad)
+        waves.append(Wave(directions, headings, speeds))
+    return BulletPattern(name or description.get('name', 'pattern'), aimed, waves)
+
+
+def aim_at(x, y, target_x, target_y):
+    """
+    (x, y)에서 목표를 향하는 단위 벡터
+
+    Returns:
+        (ux, uy) - 같은 위치면 (1.0, 0.0)
+    """
+    dx, dy = target_x - x, target_y - y
+    distance = math.hypot(dx, dy)
+    if distance <= 0:
+        return 1.0, 0.0
+    return dx / distance, dy / distance
+
+
+def emit(pattern, x, y, projectile_class, layer=None, aim=None, wave=0, **kwargs):
+    """
+    웨이브 하나를 한 번에 생성
+
+    투사체는 projectile_class(x, y, None, None, speed=..., direction=(ux, uy), **kwargs)로 만듭니다.
+    클래스에 uses_heading = True가 있으면 heading=(라디안)도 넘깁니다 (회전 이미지용, atan2 생략).
+
+    Args:
+        pattern: BulletPattern
+        x, y: 발사 위치
+        projectile_class: 투사체 클래스 (direction 인자를 받는 Projectile 하위 클래스)
+        layer: 생성한 투사체를 한 번에 extend할 리스트 (None이면 추가하지 않음)
+        aim: aimed 패턴의 조준 단위 벡터 (aim_at 결과)
+        wave: 웨이브 인덱스
+        **kwargs: 투사체 생성자에 그대로 넘길 값 (damage, scale 등)
+
+    Returns:
+        list: 생성한 투사체
+    """
+    table = pattern.waves[wave]
+    uses_heading = getattr(projectile_class, 'uses_heading', False)
+
+    if pattern.aimed:
+        ax, ay = aim if aim is not None else (1.0, 0.0)
+        directions = [(ux * ax - uy * ay, ux * ay + uy * ax) for ux, uy in table.directions]
+        if uses_heading:
+            aim_heading = math.atan2(ay, ax)
+            headings = [aim_heading + heading for heading in table.headings]
+    else:
+        directions = table.directions
+        headings = table.headings
+
+    if uses_heading:
+        bullets = [projectile_class(x, y, None, None, speed=speed, direction=direction, heading=heading, **kwargs)
+                   for direction, heading, speed in zip(directions, headings, table.speeds)]
+    else:
+        bullets = [projectile_class(x, y, None, None, speed=speed, direction=direction, **kwargs)
+                   for direction, speed in zip(directions, table.speeds)]
+
+    if layer is not None:
+        layer.extend(bullets)
+    return bullets
@@ -0,0 +1,233 @@
+"""
+제너레이터 코루틴 런타임 (보스 패턴 등 시간 순서가 긴 로직용)
+
+패턴 로직을 phase 변수와 타이머를 매 프레임 분기하는 대신 제너레이터 하나로 위에서 아래로 작성합니다.
+제너레이터는 아래 명령을 yield 해서 멈추고, Scheduler가 조건이 되면 이어서 실행합니다.
+
+    yield wait(0.5)            # 0.5초 뒤 재개 (타이머 힙에 들어가 깨어날 때까지 비용 없음)
+    yield wait_until(cond)     # 매 프레임 cond()를 검사해 참이 되면 재개
+    task = yield spawn(gen)    # 자식 코루틴을 시작하고 바로 재개 (Task 반환)
+    yield join(task)           # 자식 코루틴이 끝나면 재개
+    yield                      # 다음 프레임에 재개 (None)
+
+시간:
+    Scheduler.update(dt)가 자기 시계를 dt만큼 진행합니다.
+    get_delta_time()을 넘기면 일시정지(dt=0)와 ai_scheduler의 누적 dt가 그대로 반영됩니다.
+    한 프레임 안에서 여러 번 깨어나도 코루틴마다 프레임당 한 번만 재개합니다 (기존 phase 방식과 같은 속도).
+
+사용법:
+    from game_logic import coroutine
+    from game_logic.coroutine import wait, wait_until, spawn
+
+    def pattern(self):
+        self.phase = 1
+        yield wait(0.25)
+        ...
+        return 'done'          # Task.result
+
+    self.runner = coroutine.Scheduler()
+    task = self.runner.start(self.pattern())
+    self.runner.update(framework.get_delta_time())   # 매 프레임
+    if task.done: ...
+"""
+import heapq
+import itertools
+
+# 깨어날 시각 비교 허용 오차 (dt 누적 반올림 때문에 한 프레임 늦게 깨어나지 않도록)
+TIME_EPSILON = 1e-6
+
+
+class _Command:
+    __slots__ = ('kind', 'value')
+
+    def __init__(self, kind, value):
+        self.kind = kind
+        self.value = value
+
+
+def wait(seconds):
+    """seconds초 뒤 재개"""
+    return _Command('wait', seconds)
+
+
+def wait_until(condition):
+    """condition()이 참이 되는 프레임에 재개"""
+    return _Command('until', condition)
+
+
+def spawn(generator):
+    """자식 코루틴을 시작하고 같은 프레임에 재개 (yield 결과로 Task를 받음)"""
+    return _Command('spawn', generator)
+
+
+def join(task):
+    """task가 끝나면 재개"""
+    return _Command('join', task)
+
+
+class Task:
+    """
+    실행 중인 코루틴 하나
+
+    Attributes:
+        done: 끝났는지 (정상 종료, 취소, 예외 모두)
+        result: 제너레이터의 return 값
+        error: 실행 중 발생한 예외 (없으면 None)
+    """
+    __slots__ = ('generator', 'done', 'result', 'error', 'name', '_send')
+
+    def __init__(self, generator, name=None):
+        self.generator = generator
+        self.done = False
+        self.result = None
+        self.error = None
+        self.name = name or getattr(generator, '__name__', 'coroutine')
+        self._send = None
+
+    def cancel(self):
+        """더 이상 재개하지 않음 (제너레이터의 finally 블록은 실행됨)"""
+        if not self.done:
+            self.done = True
+            self.generator.close()
+
+
+class Scheduler:
+    """
+    코루틴 실행기 (소유 객체마다 하나)
+
+    대기 중인 코루틴은 종류별로 나뉘어 보관됩니다.
+        wait      - (깨어날 시각, 순번, Task) 최소 힙. 깨어날 시각이 지난 것만 꺼냄
+        wait_until - 조건 목록. 매 프레임 조건만 호출
+        다음 프레임 - 리스트
+    """
+
+    def __init__(self):
+        self.clock = 0.0
+        self._timers = []
+        self._conditions = []
+        self._next_frame = []
+        self._sequence = itertools.count()
+        self.tasks = []
+
+    def start(self, generator, name=None):
+        """
+        코루틴 시작 (다음 update에서 첫 실행)
+
+        Returns:
+            Task
+        """
+        task = Task(generator, name)
+        self.tasks.append(task)
+        self._next_frame.append(task)
+        return task
+
+    def update(self, dt):
+        """시계를 dt만큼 진행하고 깨어날 코루틴을 재개"""
+        self.clock += dt
+
+        ready = self._next_frame
+        self._next_frame = []
+
+        timers = self._timers
+        deadline = self.clock + TIME_EPSILON
+        while timers and timers[0][0] <= deadline:
+            ready.append(heapq.heappop(timers)[2])
+
+        if self._conditions:
+            waiting = []
+            for entry in self._conditions:
+                condition, task, joined = entry
+                if task.done:
+                    continue
+                if condition():
+                    if joined is not None:
+                        task._send = joined.result
+                    ready.append(task)
+                else:
+                    waiting.append(entry)
+            self._conditions = waiting
+
+        for task in ready:
+            if not task.done:
+                self._resume(task)
+
+        if ready:
+            self.tasks = [task for task in self.tasks if not task.done]
+
+    def _resume(self, task):
+        """task를 다음 대기 명령까지 실행"""
+        while True:
+            send, task._send = task._send, None
+            try:
+                command = task.generator.send(send)
+            except StopIteration as stop:
+                task.done = True
+                task.result = stop.value
+                return
+            except Exception as ex:
+                # 한 코루틴의 예외가 같은 프레임에 깨어난 다른 코루틴을 잃게 하지 않도록 기록만 하고 계속
+                task.done = True
+                task.error = ex
+                print(f'\033[91m[Scheduler] {task.name} 실행 중 예외: {ex!r}\033[0m')
+                return
+
+            if command is None:
+                self._next_frame.append(task)
+                return
+            kind = command.kind
+            if kind == 'wait':
+                if command.value <= 0:
+                    self._next_frame.append(task)
+                else:
+                    heapq.heappush(self._timers, (self.clock + command.value, next(self._sequence), task))
+                return
+            if kind == 'until':
+                if command.value():
+                    # 이미 참이면 같은 프레임에 계속 실행
+                    continue
+                self._conditions.append((command.value, task, None))
+                return
+            if kind == 'spawn':
+                child = Task(command.value)
+                self.tasks.append(child)
+                self._resume(child)
+                task._send = child
+                continue
+            if kind == 'join':
+                child = command.value
+                if child.done:
+                    task._send = child.result
+                    continue
+                self._conditions.append((lambda: child.done, task, child))
+                return
+            print(f'\033[91m[Scheduler] {task.name}: 알 수 없는 명령 {command!r}\033[0m')
+            task.cancel()
+            return
+
+    def cancel_all(self):
+        """모든 코루틴 취소 (패턴 중단, 보스 사망 등)"""
+        for task in self.tasks:
+            task.cancel()
+        self.tasks = []
+        self._timers = []
+        self._conditions = []
+        self._next_frame = []
+
+    def is_idle(self):
+        """실행 중인 코루틴이 없는지"""
+        return not any(not task.done for task in self.tasks)
+
+    def stats(self):
+        """
+        통계
+
+        Returns:
+            dict: {'clock', 'tasks', 'timers', 'conditions', 'next_frame'}
+        """
+        return {
+            'clock': self.clock,
+            'tasks': sum(1 for task in self.tasks if not task.done),
+            'timers': len(self._timers),
+            'conditions': len(self._conditions),
+            'next_frame': len(self._next_frame),
+        }
@@ -5,6 +5,25 @@ import pico2d as p2
 from pico2d import load_image, get_canvas_height, get_canvas_width
 from sdl2 import SDL_GetMouseState, SDL_ShowCursor, SDL_DISABLE, SDL_MOUSEBUTTONDOWN, SDL_MOUSEBUTTONUP, SDL_BUTTON_LEFT, SDL_BUTTON_RIGHT
 import game_framework as framework
+from .animation_clips import Animator, make_clip
+
+# 클릭 애니메이션 프레임 간격(초)
+CLICK_FRAME_DURATION = 0.06
+
+
+def _make_click_clips(frames):
+    """
+    마우스 화살표 7프레임을 클릭 애니메이션 클립으로 나누기
+
+    Returns:
+        dict: {'down': 0 -> 1 (1 유지), 'up': 2 -> 6 (6 유지), 'idle_up': 6}
+    """
+    return {
+        'down': make_clip('cursor_down', frames[0:2], CLICK_FRAME_DURATION, 'once'),
+        'up': make_clip('cursor_up', frames[2:7], CLICK_FRAME_DURATION, 'once'),
+        'idle_up': make_clip('cursor_idle_up', frames[6:7], CLICK_FRAME_DURATION, 'once'),
+    }
+
 
 class Cursor:
     def __init__(self, player=None):
@@ -46,11 +65,10 @@ class Cursor:
             self.shield_range_image = None
         self.shield_range_scale = 4.0
 
-        # 애니메이션 상태
-        self.anim_state = 'idle_up'  # 'down', 'up', 'idle_up'
-        self.frame_idx = 6            # idle은 마지막 프레임(6) 유지
-        self.frame_timer = 0.0
-        self.frame_duration = 0.06    # 프레임당 시간
+        # 애니메이션 상태 ('down', 'up', 'idle_up' - 'up'은 끝나면 마지막 프레임(6) 유지)
+        self.anim_state = 'idle_up'
+        self.clips = _make_click_clips(self.inv_frames) if self.inv_frames else {}
+        self.animator = Animator(self.clips['idle_up'], clock=framework.get_ui_time) if self.clips else None
         self.mouse_down = False
 
     def update(self):
@@ -72,42 +90,15 @@ class Cursor:
 
         # 인벤토리 토글 시 애니메이션 상태 초기화
         if inv_open != self.last_inventory_open:
-            self.anim_state = 'idle_up'
-            self.frame_idx = 6
-            self.frame_timer = 0.0
+            self._play('idle_up')
             self.mouse_down = False
             self.last_inventory_open = inv_open
 
-        # 인벤토리 열렸을 때만 애니메이션 적용
-        if inv_open and self.inv_frames:
-            dt = framework.get_delta_time()
-            self.frame_timer += dt
-            if self.anim_state == 'down':
-                # 0 -> 1 재생 후, 눌려있는 동안 1 유지
-                if self.frame_timer >= self.frame_duration:
-                    self.frame_timer -= self.frame_duration
-                    if self.frame_idx < 1:
-                        self.frame_idx += 1
-                # 눌린 상태 유지 시 frame 1 고정
-                if self.mouse_down:
-                    self.frame_idx = max(self.frame_idx, 1)
-                else:
-                    # 버튼 해제되었다면 업 애니메이션으로 전환
-                    self.anim_state = 'up'
-                    self.frame_idx = 2
-                    self.frame_timer = 0.0
-            elif self.anim_state == 'up':
-                # 2 -> 6까지 재생 후 idle_up로 전환
-                if self.frame_timer >= self.frame_duration:
-                    self.frame_timer -= self.frame_duration
-                    if self.frame_idx < 6:
-                        self.frame_idx += 1
-                    if self.frame_idx >= 6:
-                        self.anim_state = 'idle_up'
-                        self.frame_idx = 6
-            else:
-                # idle_up: 프레임 6 유지
-                self.frame_idx = 6
+    def _play(self, state):
+        # 클릭 애니메이션 전환 (프레임은 draw에서 Animator가 계산)
+        self.anim_state = state
+        if self.animator:
+            self.animator.play(self.clips[state])
 
     def draw(self, draw_x=None, draw_y=None):
         if draw_x is None:
@@ -209,7 +200,7 @@ class Cursor:
 
         # 인벤토리 열림 + 프레임 로드 성공 시 전용 커서 사용 (팁 위치를 마우스 좌표에 정렬)
         if self.player and getattr(self.player, 'inventory_open', False) and self.inv_frames:
-            img = self.inv_frames[self.frame_idx]
+            img = self.animator.image
             w = img.w * self.scale_factor
             h = img.h * self.scale_factor
             ax, ay = self.inv_anchor
@@ -229,15 +220,11 @@ class Cursor:
         # 마우스 좌클릭 이벤트 처리
         if event.type == SDL_MOUSEBUTTONDOWN and event.button == SDL_BUTTON_LEFT:
             self.mouse_down = True
-            self.anim_state = 'down'
-            self.frame_idx = 0
-            self.frame_timer = 0.0
+            self._play('down')
         elif event.type == SDL_MOUSEBUTTONUP and event.button == SDL_BUTTON_LEFT:
             self.mouse_down = False
             # 업 애니메이션 시작 (2부터)
-            self.anim_state = 'up'
-            self.frame_idx = 2
-            self.frame_timer = 0.0
+            self._play('up')
 
 
 # 타이틀 화면 전용 커서
@@ -262,11 +249,10 @@ class TitleCursor:
                 self.frames = []
                 break
 
-        # 애니메이션 상태
-        self.frame_idx = 6  # idle 상태 (마지막 프레임)
-        self.frame_timer = 0.0
-        self.frame_duration = 0.06
-        self.anim_state = 'idle_up'  # 'down', 'up', 'idle_up'
+        # 애니메이션 상태 ('down', 'up', 'idle_up')
+        self.anim_state = 'idle_up'
+        self.clips = _make_click_clips(self.frames) if self.frames else {}
+        self.animator = Animator(self.clips['idle_up'], clock=framework.get_ui_time) if self.clips else None
         self.mouse_down = False
 
         # 커서 핫스팟 (팁 위치)
@@ -275,7 +261,7 @@ class TitleCursor:
         print(f"[TitleCursor] 커서 프레임 {len(self.frames)}개 로드 완료")
 
     def update(self):
-        """마우스 위치 업데이트 및 애니메이션"""
+        """마우스 위치 업데이트 (애니메이션 프레임은 draw에서 Animator가 계산)"""
         # 마우스 위치 갱신
         mx_ptr = ctypes.c_int(0)
         my_ptr = ctypes.c_int(0)
@@ -283,46 +269,12 @@ class TitleCursor:
         self.x = mx_ptr.value
         self.y = p2.get_canvas_height() - my_ptr.value
 
-        # 애니메이션 업데이트
-        if self.frames:
-            dt = framework.delta_time if hasattr(framework, 'delta_time') else 0.016
-            self.frame_timer += dt
-
-            if self.anim_state == 'down':
-                # 0 -> 1 재생
-                if self.frame_timer >= self.frame_duration:
-                    self.frame_timer -= self.frame_duration
-                    if self.frame_idx < 1:
-                        self.frame_idx += 1
-
-                if self.mouse_down:
-                    self.frame_idx = max(self.frame_idx, 1)
-                else:
-                    # 버튼 해제되면 up 애니메이션으로
-                    self.anim_state = 'up'
-                    self.frame_idx = 2
-                    self.frame_timer = 0.0
-
-            elif self.anim_state == 'up':
-                # 2 -> 6 재생
-                if self.frame_timer >= self.frame_duration:
-                    self.frame_timer -= self.frame_duration
-                    if self.frame_idx < 6:
-                        self.frame_idx += 1
-                    if self.frame_idx >= 6:
-                        self.anim_state = 'idle_up'
-                        self.frame_idx = 6
-
-            else:
-                # idle_up: 프레임 6 유지
-                self.frame_idx = 6
-
         return True
 
     def draw(self):
         """커서 그리기"""
-        if self.frames and 0 <= self.frame_idx < len(self.frames):
-            img = self.frames[self.frame_idx]
+        if self.animator:
+            img = self.animator.image
             w = img.w * self.scale_factor
             h = img.h * self.scale_factor
 
@@ -338,9 +290,14 @@ class TitleCursor:
         if e.type == SDL_MOUSEBUTTONDOWN:
             if e.button == SDL_BUTTON_LEFT:
                 self.mouse_down = True
-                self.anim_state = 'down'
-                self.frame_idx = 0
-                self.frame_timer = 0.0
+                self._play('down')
         elif e.type == SDL_MOUSEBUTTONUP:
             if e.button == SDL_BUTTON_LEFT:
                 self.mouse_down = False
+                # 버튼 해제되면 up 애니메이션 (2 -> 6, 끝나면 6 유지)
+                self._play('up')
+
+    def _play(self, state):
+        self.anim_state = state
+        if self.animator:
+            self.animator.play(self.clips[state])
@@ -1,16 +1,116 @@
-import pico2d as p2
+import math
+
 from PIL import Image, ImageDraw, ImageFont
-import io
 
 import game_framework as framework
+from . import image_asset_manager as iam
+
+FONT_PATH = 'resources/Fonts/pixelroborobo.otf'
+DAMAGE_COLOR = (255, 0, 0)
+GLYPHS = '0123456789-'
+
+# 풀에 보관할 최대 인디케이터 수
+MAX_POOL_SIZE = 64
+
+
+class DigitAtlas:
+    """
+    데미지 숫자용 글리프 아틀라스 (폰트 크기/색상별로 한 번만 생성해 공유)
+
+    0~9와 '-' 글리프를 한 장의 텍스처에 나란히 그려 두고,
+    숫자는 글리프 사각형(clip_draw)을 이어 붙여 그립니다.
+    페이드는 텍스처 알파 모듈레이션(opacify)으로 처리하므로 알파별 이미지를 만들지 않습니다.
+    """
+
+    _atlases = {}  # {(font_size, color): DigitAtlas}
+
+    def __init__(self, font_size, color=DAMAGE_COLOR):
+        try:
+            pil_font = ImageFont.truetype(FONT_PATH, font_size)
+        except Exception as e:
+            print(f"[DamageIndicator] PIL 폰트 로드 실패: {e}, 기본 폰트 사용")
+            pil_font = ImageFont.load_default()
+
+        # 모든 글리프가 공유하는 세로 범위 (기준선 정렬 유지)
+        boxes = {ch: pil_font.getbbox(ch) for ch in GLYPHS}
+        top = min(box[1] for box in boxes.values())
+        bottom = max(box[3] for box in boxes.values())
+        self.height = bottom - top
+
+        # 글리프별 (아틀라스 x, 셀 너비, 진행 폭)
+        self.glyphs = {}
+        x = 0
+        for ch in GLYPHS:
+            advance = int(math.ceil(pil_font.getlength(ch)))
+            cell_width = max(boxes[ch][2], advance)
+            self.glyphs[ch] = (x, cell_width, advance)
+            x += cell_width + 1  # 1px 간격 (선형 필터링 시 번짐 방지)
+
+        atlas_width = max(1, x)
+        pil_image = Image.new('RGBA', (atlas_width, self.height), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(pil_image)
+        fill = (color[0], color[1], color[2], 255)
+        for ch, (gx, _, _) in self.glyphs.items():
+            draw.text((gx, -top), ch, font=pil_font, fill=fill)
+
+        self.image = iam.create_image_from_rgba(pil_image.tobytes(), atlas_width, self.height)
+
+    @classmethod
+    def get(cls, font_size, color=DAMAGE_COLOR):
+        """
+        공유 아틀라스 가져오기 (최초 호출 시에만 생성)
+
+        Returns:
+            DigitAtlas 또는 None (생성 실패 시)
+        """
+        key = (font_size, tuple(color))
+        atlas = cls._atlases.get(key)
+        if atlas is None and key not in cls._atlases:
+            try:
+                atlas = cls(font_size, color)
+            except Exception as e:
+                print(f"\033[91m[DamageIndicator] 글리프 아틀라스 생성 실패: {e}\033[0m")
+                atlas = None
+            cls._atlases[key] = atlas
+        return atlas
+
+    def text_width(self, text):
+        return sum(self.glyphs[ch][2] for ch in text if ch in self.glyphs)
+
+    def draw_text(self, text, center_x, center_y, alpha=1.0):
+        """
+        문자열을 글리프 사각형으로 그리기 (가운데 정렬)
+
+        Args:
+            text: 숫자 문자열
+            center_x, center_y: 화면 좌표 (문자열 중앙)
+            alpha: 투명도 (0.0 ~ 1.0)
+        """
+        image = self.image
+        # 아틀라스는 공유되므로 그리기 직전에 알파 설정
+        image.opacify(alpha)
+
+        x = center_x - self.text_width(text) / 2
+        for ch in text:
+            glyph = self.glyphs.get(ch)
+            if glyph is None:
+                continue
+            gx, cell_width, advance = glyph
+            image.clip_draw(gx, 0, cell_width, self.height, x + cell_width / 2, center_y)
+            x += advance
+
+        image.opacify(1.0)
+
 
 class DamageIndicator:
     """
     데미지를 화면에 표시하는 인디케이터 클래스
     지정된 시간 동안 위로 올라가면서 페이드아웃 효과를 보여줍니다.
-    텍스트를 이미지로 렌더링하여 알파값(투명도)이 제대로 적용되도록 합니다.
+    숫자는 공유 글리프 아틀라스(DigitAtlas)로 그리고, 만료된 인디케이터는 풀에 반납되어 재사용됩니다.
     """
 
+    _pool = []  # 재사용 대기 중인 인디케이터
+
     def __init__(self, x, y, damage, duration=1.0, font_size=20):
         """
         데미지 인디케이터 초기화
@@ -22,6 +122,9 @@ class DamageIndicator:
             duration: 인디케이터가 표시될 시간 (초)
             font_size: 폰트 크기
         """
+        self._reset(x, y, damage, duration, font_size)
+
+    def _reset(self, x, y, damage, duration, font_size):
         self.x = x
         self.y = y
         self.damage = damage
@@ -29,96 +132,36 @@ class DamageIndicator:
         self.elapsed = 0.0
         self.font_size = font_size
         self.mark_for_removal = False  # 제거 플래그
-
-        # PIL 폰트 로드 (텍스트를 이미지로 렌더링하기 위함)
-        self.pil_font_path = 'resources/Fonts/pixelroborobo.otf'
-        try:
-            self.pil_font = ImageFont.truetype(self.pil_font_path, font_size)
-        except Exception as e:
-            print(f"[DamageIndicator] PIL 폰트 로드 실패: {e}, 기본 폰트 사용")
-            self.pil_font = ImageFont.load_default()
+        self._released = False
 
         # 텍스트 내용
         self.text = f"{int(damage)}"
+        self.atlas = DigitAtlas.get(font_size)
 
-        # 텍스트 이미지를 미리 생성 (알파값만 나중에 변경)
-        self.text_images = {}  # 알파값별로 캐싱 (성능 최적화)
-        self.current_image = None
-        self.image_width = 0
-        self.image_height = 0
-
-    def _create_text_image(self, alpha):
+    @classmethod
+    def spawn(cls, x, y, damage, duration=1.0, font_size=20):
         """
-        텍스트를 이미지로 렌더링 (알파값 적용)
+        풀에서 인디케이터를 꺼내 초기화 (풀이 비어 있으면 새로 생성)
 
         Args:
-            alpha: 투명도 (0.0 ~ 1.0)
+            DamageIndicator()와 동일
 
         Returns:
-            pico2d Image 객체
+            DamageIndicator
         """
-        # 알파값을 10단계로 양자화하여 캐싱 (성능 최적화)
-        alpha_key = int(alpha * 10) / 10.0
-
-        if alpha_key in self.text_images:
-            return self.text_images[alpha_key]
-
-        # PIL로 텍스트 이미지 생성
-        # 먼저 텍스트 크기를 측정
-        bbox = self.pil_font.getbbox(self.text)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-
-        # 여유 공간을 두고 이미지 생성
-        img_width = text_width + 10
-        img_height = text_height + 10
-
-        # RGBA 모드로 투명 배경 이미지 생성
-        pil_image = Image.new('RGBA', (img_width, img_height), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(pil_image)
-
-        # 텍스트 색상 + 알파값 적용
-        r, g, b = 255, 0, 0
-        text_color = (r, g, b, int(alpha * 255))
-
-        # 텍스트 그리기 (중앙 정렬)
-        draw.text((5, 5), self.text, font=self.pil_font, fill=text_color)
-
-        # PIL 이미지를 pico2d 이미지로 변환
-        # 임시 파일로 저장 후 로드하는 방식
-        try:
-            # 메모리 버퍼를 사용하여 임시 파일 생성
-            buffer = io.BytesIO()
-            pil_image.save(buffer, format='PNG')
-            buffer.seek(0)
-
-            # 임시 파일명 생성 (알파값 포함)
-            temp_filename = f'temp_damage_{id(self)}_{alpha_key}.png'
-            with open(temp_filename, 'wb') as f:
-                f.write(buffer.getvalue())
-
-            # pico2d로 이미지 로드
-            p2d_image = p2.load_image(temp_filename)
-
-            # 임시 파일 삭제
-            import os
-            try:
-                os.remove(temp_filename)
-            except:
-                pass
-
-            # 이미지 크기 저장
-            self.image_width = img_width
-            self.image_height = img_height
-
-            # 캐싱
-            self.text_images[alpha_key] = p2d_image
-
-            return p2d_image
-
-        except Exception as e:
-            print(f"[DamageIndicator] 이미지 변환 실패: {e}")
-            return None
+        if cls._pool:
+            indicator = cls._pool.pop()
+            indicator._reset(x, y, damage, duration, font_size)
+            return indicator
+        return cls(x, y, damage, duration, font_size)
+
+    def release(self):
+        """풀에 반납 (월드 레이어에서 제거된 뒤에만 호출)"""
+        if self._released:
+            return
+        self._released = True
+        if len(DamageIndicator._pool) < MAX_POOL_SIZE:
+            DamageIndicator._pool.append(self)
 
     def update(self):
         """
@@ -131,9 +174,10 @@ class DamageIndicator:
         self.elapsed += delta_time
         self.y += 30 * delta_time  # 시간에 따라 위로 이동
 
-        # duration 이후에는 제거 표시
+        # duration 이후에는 제거 표시 (False를 반환하면 월드 레이어에서 빠지므로 풀에 반납)
         if self.elapsed >= self.duration:
             self.mark_for_removal = True
+            self.release()
             return False  # 제거되어야 함을 반환
 
         return True  # 계속 유지
@@ -141,26 +185,17 @@ class DamageIndicator:
     def draw(self, draw_x, draw_y):
         """
         데미지 인디케이터 그리기 (페이드아웃 효과 포함)
-        텍스트 이미지를 사용하여 알파값이 제대로 적용되도록 합니다.
 
         Args:
             draw_x: 카메라가 적용된 화면 x 좌표
             draw_y: 카메라가 적용된 화면 y 좌표
         """
+        if self.atlas is None:
+            return
+
         # 알파 값 계산 (시간이 지남에 따라 투명해짐)
         alpha = max(0.0, 1.0 - (self.elapsed / self.duration))
-
-        # 알파값에 맞는 텍스트 이미지 생성/로드
-        text_image = self._create_text_image(alpha)
-
-        if text_image:
-            # 이미지 그리기 (중앙 정렬)
-            text_image.draw(
-                draw_x,
-                draw_y,
-                self.image_width,
-                self.image_height
-            )
+        self.atlas.draw_text(self.text, draw_x, draw_y, alpha)
 
     def is_expired(self):
         """
@@ -171,15 +206,8 @@ class DamageIndicator:
         """
         return self.elapsed >= self.duration
 
-    def __del__(self):
-        """
-        소멸자 - 캐싱된 이미지 리소스 정리
-        """
-        # 캐싱된 이미지들을 정리
-        self.text_images.clear()
-
 
 # Example usage:
 # 데미지 인디케이터를 월드에 추가하는 방법:
-# damage_indicator = DamageIndicator(monster.x, monster.y + 20, final_damage, duration=1.0, font_size=30)
+# damage_indicator = DamageIndicator.spawn(monster.x, monster.y + 20, final_damage, duration=1.0, font_size=30)
 # world['effects_front'].append(damage_indicator)
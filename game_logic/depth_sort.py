@@ -0,0 +1,126 @@
+"""
+Y 기준 깊이 정렬 (entities 레이어)
+
+탑다운 시점에서 발 위치(foot Y)가 위쪽(큰 Y)인 객체가 뒤에 있으므로 먼저 그려야 합니다.
+매 프레임 전체 정렬 대신 리스트를 제자리 삽입 정렬로 유지합니다.
+프레임 사이에 순서가 거의 바뀌지 않으므로 비용은 O(n)에 가깝습니다.
+
+발 위치 = obj.y + 앵커 오프셋
+    앵커 오프셋 결정 순서:
+        1. register_anchor(클래스, 오프셋)로 등록한 값 (상위 클래스 포함)
+        2. 객체의 depth_anchor_y 속성
+        3. -collision_height / 2 (충돌 박스 아래쪽)
+        4. 0 (중심)
+
+사용법:
+    from game_logic import depth_sort
+    depth_sort.register_anchor(WorldItem, lambda obj: -obj.icon.h * obj.scale / 2)   # 클래스 정의 모듈에서 등록
+    depth_sort.sort_by_depth(world['entities'])   # 그리기 직전에 호출
+"""
+
+# 클래스별 앵커 오프셋 {클래스: y 오프셋 또는 callable(obj) -> y 오프셋}
+_anchors = {}
+
+# 클래스 -> 앵커 함수 캐시 (MRO 탐색 결과)
+_resolved = {}
+
+# 통계 (마지막 정렬 기준)
+_stats = {'count': 0, 'moves': 0, 'comparisons': 0}
+
+
+def register_anchor(cls, offset):
+    """
+    클래스별 발 위치 앵커 등록
+
+    Args:
+        cls: 클래스 (하위 클래스에도 적용)
+        offset: y 오프셋 (숫자) 또는 obj를 받아 오프셋을 반환하는 함수
+    """
+    _anchors[cls] = offset
+    _resolved.clear()
+
+
+def _default_anchor(obj):
+    anchor = getattr(obj, 'depth_anchor_y', None)
+    if anchor is not None:
+        return anchor
+    height = getattr(obj, 'collision_height', None)
+    if height:
+        return -height / 2
+    return 0.0
+
+
+def _anchor_func(cls):
+    func = _resolved.get(cls)
+    if func is None:
+        func = _default_anchor
+        for base in cls.__mro__:
+            if base in _anchors:
+                offset = _anchors[base]
+                func = offset if callable(offset) else (lambda obj, offset=offset: offset)
+                break
+        _resolved[cls] = func
+    return func
+
+
+def foot_y(obj):
+    """
+    객체의 발 위치 Y (깊이 정렬 기준)
+
+    Returns:
+        float (y 속성이 없으면 무한대 - 가장 먼저 그림)
+    """
+    y = getattr(obj, 'y', None)
+    if y is None:
+        return float('inf')
+    return y + _anchor_func(type(obj))(obj)
+
+
+def sort_by_depth(objects):
+    """
+    발 위치 Y 내림차순(뒤 -> 앞)으로 리스트를 제자리 삽입 정렬
+
+    같은 깊이의 객체는 기존 순서를 유지합니다(안정 정렬).
+
+    Args:
+        objects: 정렬할 리스트 (world['entities'])
+
+    Returns:
+        int: 자리를 옮긴 횟수 (0이면 이미 정렬되어 있었음)
+    """
+    n = len(objects)
+    keys = [foot_y(o) for o in objects]
+    moves = 0
+    comparisons = 0
+
+    for i in range(1, n):
+        key = keys[i]
+        j = i - 1
+        comparisons += 1
+        if keys[j] >= key:
+            continue  # 이미 제자리 (대부분의 프레임에서 여기서 끝남)
+
+        obj = objects[i]
+        while j >= 0 and keys[j] < key:
+            keys[j + 1] = keys[j]
+            objects[j + 1] = objects[j]
+            j -= 1
+            comparisons += 1
+            moves += 1
+        keys[j + 1] = key
+        objects[j + 1] = obj
+
+    _stats['count'] = n
+    _stats['moves'] = moves
+    _stats['comparisons'] = comparisons
+    return moves
+
+
+def stats():
+    """
+    마지막 정렬 통계
+
+    Returns:
+        dict: {'count', 'moves', 'comparisons'}
+    """
+    return dict(_stats)
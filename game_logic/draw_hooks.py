@@ -0,0 +1,86 @@
+"""
+pico2d 그리기 호출 가로채기 (render_queue, static_layers 공용)
+
+pico2d의 Image/Font 메서드는 호출 시점에 pico2d 모듈 전역 SDL_RenderCopy/SDL_RenderCopyEx 등을 찾으므로
+그 이름을 잠시 기록 함수로 바꿔 끼우면 객체의 draw() 코드를 고치지 않고 그리기 명령을 모을 수 있습니다.
+
+install()은 바꾸기 직전의 함수를 돌려주고 restore()가 그 함수로 되돌립니다.
+바깥에서 이미 기록 중이어도(render_queue 기록 중 static_layers 재합성 등) 바깥 기록 함수가 그대로 복원됩니다.
+기록한 명령을 실제로 그릴 때는 pico2d 모듈이 아닌 sdl2 모듈의 함수를 직접 호출해야 합니다.
+
+사용법:
+    # 기록 함수를 직접 지정
+    originals = draw_hooks.install({'SDL_RenderCopy': record_copy, 'SDL_RenderCopyEx': record_copy_ex})
+    try:
+        obj.draw(x, y)
+    finally:
+        draw_hooks.restore(originals)
+
+    # 텍스처 복사 명령만 모으기
+    commands = draw_hooks.record_copies(lambda: obj.draw(x, y))
+"""
+import ctypes
+
+import pico2d as p2
+import sdl2
+
+
+def texture_alpha(texture):
+    """텍스처의 현재 알파 모듈레이션 값 (0~255)"""
+    alpha = ctypes.c_uint8()
+    sdl2.SDL_GetTextureAlphaMod(texture, ctypes.byref(alpha))
+    return alpha.value
+
+
+def install(recorders):
+    """
+    pico2d 모듈 전역 함수를 기록 함수로 교체
+
+    Args:
+        recorders: {pico2d 전역 함수 이름: 대신 호출할 함수}
+
+    Returns:
+        dict: 교체 전 함수 {이름: 함수} (restore()에 넘김)
+    """
+    module = p2.pico2d
+    originals = {name: getattr(module, name) for name in recorders}
+    for name, recorder in recorders.items():
+        setattr(module, name, recorder)
+    return originals
+
+
+def restore(originals):
+    """install()이 돌려준 함수로 되돌림"""
+    module = p2.pico2d
+    for name, func in originals.items():
+        setattr(module, name, func)
+
+
+def record_copies(draw):
+    """
+    draw()를 호출하는 동안의 텍스처 복사를 그리지 않고 기록
+
+    Args:
+        draw: 인자 없는 그리기 함수
+
+    Returns:
+        list: [(texture, src, (x, y, w, h), angle, flip, alpha)] 호출 순서대로
+              (대상 사각형은 pico2d가 매번 새로 만드는 SDL_Rect를 튜플로 복사한 값)
+    """
+    commands = []
+
+    def record_copy(renderer, texture, src, dst):
+        commands.append((texture, src, (dst.x, dst.y, dst.w, dst.h), 0.0, sdl2.SDL_FLIP_NONE,
+                         texture_alpha(texture)))
+        return 0
+
+    def record_copy_ex(renderer, texture, src, dst, angle, center, flip):
+        commands.append((texture, src, (dst.x, dst.y, dst.w, dst.h), angle, flip, texture_alpha(texture)))
+        return 0
+
+    originals = install({'SDL_RenderCopy': record_copy, 'SDL_RenderCopyEx': record_copy_ex})
+    try:
+        draw()
+    finally:
+        restore(originals)
+    return commands
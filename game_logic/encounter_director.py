@@ -0,0 +1,187 @@
+"""
+전투 연출 관리자 (동시 공격자 수 / 투사체 예산)
+
+몬스터마다 독립된 쿨타임으로 공격하면 쿨타임이 겹치는 순간 모든 몬스터가 한꺼번에 공격하고,
+CatAssassin은 공격마다 수리검 5발을 던지므로 투사체 수와 충돌 검사 비용이 같이 튀어 오릅니다.
+몬스터의 공격 상태는 발사 전에 공격 토큰을 요청하고, 토큰이 있어야만 공격합니다.
+
+토큰 규칙 (스테이지별 ENCOUNTER_LIMITS로 조정):
+    max_attackers      - 동시에 공격 중인 몬스터 수 상한
+    projectile_budget  - 살아 있는 몬스터 투사체 + 예약된 투사체 수 상한 (보스 패턴 투사체도 셈)
+    대기열             - 거절된 몬스터는 요청 순서대로 줄을 서고, 자리가 나면 앞에서부터 받음
+                        (한동안 다시 요청하지 않은 몬스터는 줄에서 빠짐)
+                        자리는 있는데 맨 앞 대기자가 투사체 예산 때문에 막혀 있을 때만
+                        투사체를 쓰지 않는 근접 공격자가 먼저 받을 수 있음
+
+토큰은 공격이 끝나거나(Attack.exit) 몬스터가 제거되면 돌려받고,
+반납을 놓친 토큰은 TOKEN_TIMEOUT 뒤 자동 회수합니다.
+보스(PantherAssassin) 패턴은 토큰을 요청하지 않습니다 (패턴 자체가 연출 단위).
+
+사용법:
+    # play_mode
+    encounter_director.reset(getattr(stage_module, 'ENCOUNTER_LIMITS', None))   # 스테이지 로드 시
+    encounter_director.begin_frame(world)                                        # 매 프레임 엔티티 업데이트 전
+
+    # 몬스터 공격 상태
+    if self.can_attack and encounter_director.request_token(self.cat, projectiles=5): ...
+    encounter_director.report_fired(self.cat)                                    # 발사 직후
+    encounter_director.release_token(self.cat)                                   # 공격 종료
+"""
+import game_framework as framework
+from .projectile import Projectile
+
+# 기본 한도 (스테이지 모듈에 ENCOUNTER_LIMITS가 없을 때)
+DEFAULT_LIMITS = {
+    'max_attackers': 2,
+    'projectile_budget': 30,
+}
+
+# 반납되지 않은 토큰 자동 회수 시간(초)
+TOKEN_TIMEOUT = 4.0
+
+# 이 시간(초) 동안 다시 요청하지 않은 대기자는 대기열에서 제외
+QUEUE_STALE_TIME = 0.5
+
+_limits = dict(DEFAULT_LIMITS)
+_holders = {}       # id(agent) -> [agent, 발급 시각, 예약 투사체 수]
+_queue = []         # [[agent, 마지막 요청 시각, 요청 투사체 수]] (요청 순서)
+_live_projectiles = 0
+
+# 통계 (이번 스테이지 기준)
+_stats = {'granted': 0, 'denied': 0, 'expired': 0, 'peak_attackers': 0, 'peak_projectiles': 0}
+
+
+def reset(limits=None):
+    """
+    스테이지 전환 시 토큰/대기열 초기화와 한도 설정
+
+    Args:
+        limits: {'max_attackers', 'projectile_budget'} (일부만 줘도 됨, None이면 기본값)
+    """
+    global _live_projectiles
+    _limits.clear()
+    _limits.update(DEFAULT_LIMITS)
+    if limits:
+        _limits.update(limits)
+    _holders.clear()
+    _queue.clear()
+    _live_projectiles = 0
+    for key in _stats:
+        _stats[key] = 0
+
+
+def _is_gone(agent):
+    return getattr(agent, 'mark_for_removal', False) or getattr(agent, 'is_dead', False)
+
+
+def begin_frame(world):
+    """
+    살아 있는 몬스터 투사체 수를 세고, 제거된 몬스터/오래된 토큰/대기자 정리 (프레임당 1회)
+
+    Args:
+        world: play_mode.world
+    """
+    global _live_projectiles
+    count = 0
+    for layer_name in ('effects_front', 'effects_back'):
+        for obj in world.get(layer_name, ()):
+            if isinstance(obj, Projectile) and not obj.from_player:
+                count += 1
+    _live_projectiles = count
+    _stats['peak_projectiles'] = max(_stats['peak_projectiles'], count)
+
+    now = framework.get_game_time()
+    for key, (agent, granted_at, _) in list(_holders.items()):
+        if _is_gone(agent):
+            del _holders[key]
+        elif now - granted_at > TOKEN_TIMEOUT:
+            del _holders[key]
+            _stats['expired'] += 1
+            print(f'\033[91m[encounter_director] {agent.__class__.__name__} 공격 토큰 반납 누락 - 자동 회수\033[0m')
+
+    _queue[:] = [entry for entry in _queue
+                 if not _is_gone(entry[0]) and now - entry[1] <= QUEUE_STALE_TIME]
+
+
+def _reserved_projectiles():
+    return sum(holder[2] for holder in _holders.values())
+
+
+def request_token(agent, projectiles=0):
+    """
+    공격 토큰 요청 (이미 들고 있으면 True)
+
+    거절되면 대기열에 들어가고, 매 프레임 다시 요청하면 자리가 났을 때 순서대로 받습니다.
+
+    Args:
+        agent: 요청하는 몬스터
+        projectiles: 이번 공격으로 만들 투사체 수 (근접 공격은 0)
+
+    Returns:
+        bool: 공격해도 되는지
+    """
+    key = id(agent)
+    if key in _holders:
+        return True
+
+    now = framework.get_game_time()
+    position = None
+    for index, entry in enumerate(_queue):
+        if entry[0] is agent:
+            entry[1] = now
+            entry[2] = projectiles
+            position = index
+            break
+
+    has_slot = len(_holders) < _limits['max_attackers']
+    projectiles_in_use = _live_projectiles + _reserved_projectiles()
+    within_budget = projectiles_in_use + projectiles <= _limits['projectile_budget']
+    # 앞선 대기자가 있으면 양보
+    # (자리가 있는데 맨 앞 대기자가 예산 때문에 막혀 있으면 투사체를 쓰지 않는 근접 공격자는 먼저 받음)
+    first_in_line = position == 0 or (position is None and not _queue)
+    head_blocked_by_budget = bool(_queue) and projectiles_in_use + _queue[0][2] > _limits['projectile_budget']
+    may_pass = projectiles == 0 and head_blocked_by_budget
+    if has_slot and within_budget and (first_in_line or may_pass):
+        if position is not None:
+            del _queue[position]
+        _holders[key] = [agent, now, projectiles]
+        _stats['granted'] += 1
+        _stats['peak_attackers'] = max(_stats['peak_attackers'], len(_holders))
+        return True
+
+    if position is None:
+        _queue.append([agent, now, projectiles])
+    _stats['denied'] += 1
+    return False
+
+
+def report_fired(agent):
+    """예약한 투사체를 실제로 만들었음 (이번 프레임 투사체 수에 바로 반영하고 예약은 해제)"""
+    global _live_projectiles
+    holder = _holders.get(id(agent))
+    if holder is not None:
+        _live_projectiles += holder[2]
+        holder[2] = 0
+
+
+def release_token(agent):
+    """공격 종료 - 토큰 반납 (들고 있지 않으면 무시)"""
+    _holders.pop(id(agent), None)
+
+
+def holds_token(agent):
+    return id(agent) in _holders
+
+
+def stats():
+    """
+    통계
+
+    Returns:
+        dict: {'attackers', 'queued', 'live_projectiles', 'reserved_projectiles', 'max_attackers',
+               'projectile_budget', 'granted', 'denied', 'expired', 'peak_attackers', 'peak_projectiles'}
+    """
+    result = dict(_stats)
+    result.update(attackers=len(_holders), queued=len(_queue), live_projectiles=_live_projectiles,
+                  reserved_projectiles=_reserved_projectiles(), **_limits)
+    return result
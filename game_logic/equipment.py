@@ -4,6 +4,7 @@ import os
 from pico2d import load_image, get_canvas_height, get_canvas_width
 from sdl2 import SDL_GetMouseState, SDL_MOUSEBUTTONDOWN, SDL_MOUSEBUTTONUP, SDL_BUTTON_LEFT, SDL_BUTTON_RIGHT
 import game_framework as framework
+from . import sound_bank
 
 
 def get_mouse_world_position(player):
@@ -713,9 +714,7 @@ class Sword(Weapon):
             print(f"{self.weapon_type} 공격! (stage 1)")
 
             # 콤보 1 사운드 재생
-            if hasattr(self.player, 'attack1_sound') and self.player.attack1_sound:
-                self.player.attack1_sound.play()
-                print("[Sword] 콤보 1 사운드 재생 (Sword_Attack_1.wav)")
+            sound_bank.play('sword_attack_1')
 
             # 공격 이펙트 생성
             from .player import VFX_Tier1_Sword_Swing
@@ -758,9 +757,7 @@ class Sword(Weapon):
                 print(f"{self.weapon_type} 콤보! (stage 2)")
 
                 # 콤보 2 사운드 재생
-                if hasattr(self.player, 'attack2_sound') and self.player.attack2_sound:
-                    self.player.attack2_sound.play()
-                    print("[Sword] 콤보 2 사운드 재생 (Sword_Attack_2.wav)")
+                sound_bank.play('sword_attack_2')
 
                 # 콤보용 이펙트 생성
                 from .player import VFX_Tier1_Sword_Swing
@@ -796,9 +793,7 @@ class Sword(Weapon):
                 print(f"{self.weapon_type} 헤비 스윙! (stage 3)")
 
                 # 콤보 3 사운드 재생
-                if hasattr(self.player, 'attack3_sound') and self.player.attack3_sound:
-                    self.player.attack3_sound.play()
-                    print("[Sword] 콤보 3 사운드 재생 (Sword_Attack_3.wav)")
+                sound_bank.play('sword_attack_3')
 
                 # 3스테이지 전용 이펙트 생성 (variant=3)
                 from .player import VFX_Tier1_Sword_Swing
@@ -1,3 +1,6 @@
+_key_names = {}  # {키 코드: 키 이름}
+
+
 def event_to_string(state_event):
     """이벤트의 모든 상세 정보를 문자열로 반환 (모든 키 자동 처리)"""
     from pico2d import SDL_KEYDOWN, SDL_KEYUP, SDL_MOUSEMOTION, SDL_MOUSEBUTTONDOWN, SDL_MOUSEBUTTONUP
@@ -16,13 +19,14 @@ def event_to_string(state_event):
     if state_event_type != 'INPUT':
         return f"{state_event}"
 
-    # pico2d 모듈에서 모든 SDLK_ 상수 자동 수집
-    key_names = {}
-    for name in dir(pico2d):
-        if name.startswith('SDLK_'):
-            key_code = getattr(pico2d, name)
-            key_name = name.replace('SDLK_', '')
-            key_names[key_code] = key_name
+    # pico2d 모듈에서 모든 SDLK_ 상수 자동 수집 (처음 한 번만)
+    key_names = _key_names
+    if not key_names:
+        for name in dir(pico2d):
+            if name.startswith('SDLK_'):
+                key_code = getattr(pico2d, name)
+                key_name = name.replace('SDLK_', '')
+                key_names[key_code] = key_name
 
     event_type = event_names.get(event.type, f'Unknown({event.type})')
     key_name = key_names.get(event.key, f'key({event.key})')
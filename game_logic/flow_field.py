@@ -0,0 +1,231 @@
+"""
+플로우 필드 길찾기 (플레이어를 쫓는 몬스터 공용)
+
+걷기 가능 셀 인덱스(walkable_grid) 위에서 목표(플레이어) 셀부터 다익스트라를 한 번 돌려
+각 셀에 "목표 쪽으로 가려면 다음에 밟을 셀"을 기록합니다.
+추적 중인 몬스터는 자기 셀의 다음 셀 방향만 읽으면 되므로 몬스터 수와 무관하게 질의는 O(1)이고,
+모퉁이에 걸려 멈추지 않고 벽을 돌아서 옵니다.
+
+갱신 규칙:
+    - 목표가 다른 셀로 옮겼을 때만 필드를 초기화합니다 (같은 셀 안에서 움직이면 그대로 재사용).
+    - 다익스트라는 한 번에 끝까지 돌지 않고, 질의한 셀이 확정될 때까지만 진행했다가 다음 질의에서 이어갑니다.
+      몬스터는 대개 플레이어 근처에 있으므로 맵 전체를 탐색하는 일은 드뭅니다.
+
+이동 비용:
+    상하좌우 1, 대각선 √2 (양옆 셀이 모두 비어 있을 때만 - 모서리 가로지르기 금지)
+    벽에 붙은 셀(거리 1)로 들어가는 비용에는 WALL_PENALTY를 더해 통로 가운데로 다니게 합니다.
+
+사용법:
+    from game_logic import flow_field
+    dx, dy = flow_field.direction_toward(player.x, player.y, cat.x, cat.y)   # 단위 벡터
+    print(flow_field.stats())
+"""
+import heapq
+import math
+
+from . import walkable_grid
+
+# 벽에 붙은 셀로 들어가는 추가 비용
+WALL_PENALTY = 0.5
+
+_SQRT2 = math.sqrt(2.0)
+_INF = float('inf')
+
+# 현재 스테이지 필드 (walkable_grid 격자가 바뀌면 다시 생성)
+_field = None
+
+# 통계 (이번 실행 기준)
+_stats = {'resets': 0, 'settled': 0, 'queries': 0}
+
+
+class FlowField:
+    """
+    목표 셀을 향한 다음 셀 테이블 (지연 다익스트라)
+
+    Args:
+        grid: walkable_grid.WalkableGrid
+    """
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.cols = grid.cols
+        self.size = grid.rows * grid.cols
+        distance = grid.distance.ravel().tolist()
+        self._free = bytearray(1 if d > 0 else 0 for d in distance)
+        self._neighbors = self._build_neighbors(distance)
+
+        self.target = -1
+        self._cost = []
+        self._next = []
+        self._settled = bytearray()
+        self._heap = []
+
+    def _build_neighbors(self, distance):
+        cols, rows = self.cols, self.grid.rows
+        free = self._free
+        neighbors = [()] * self.size
+        for index in range(self.size):
+            if not free[index]:
+                continue
+            row, col = divmod(index, cols)
+            result = []
+            for dr in (-1, 0, 1):
+                for dc in (-1, 0, 1):
+                    if not dr and not dc:
+                        continue
+                    r, c = row + dr, col + dc
+                    if not (0 <= r < rows and 0 <= c < cols):
+                        continue
+                    other = r * cols + c
+                    if not free[other]:
+                        continue
+                    if dr and dc:
+                        # 대각선은 양옆 셀이 모두 비어 있어야 함
+                        if not free[row * cols + c] or not free[r * cols + col]:
+                            continue
+                        cost = _SQRT2
+                    else:
+                        cost = 1.0
+                    if distance[other] == 1:
+                        cost += WALL_PENALTY
+                    result.append((other, cost))
+            neighbors[index] = tuple(result)
+        return neighbors
+
+    def _index_of(self, x, y):
+        col, row = self.grid.cell_of(x, y)
+        if not self.grid.in_bounds(col, row):
+            return -1
+        return row * self.cols + col
+
+    def set_target(self, x, y):
+        """
+        목표 위치 설정 (목표 셀이 바뀌었을 때만 필드 초기화)
+
+        Returns:
+            bool: 필드를 초기화했으면 True
+        """
+        index = self._index_of(x, y)
+        if index < 0 or not self._free[index]:
+            # 벽에 붙어 선 플레이어처럼 목표 셀이 막혀 있으면 가장 가까운 빈 셀을 목표로
+            point = self.grid.nearest_walkable_point(x, y, 0.0, max_radius=self.grid.cell_size * 3)
+            if point is None:
+                return False
+            index = self._index_of(*point)
+        if index == self.target:
+            return False
+
+        self.target = index
+        self._cost = [_INF] * self.size
+        self._next = [-1] * self.size
+        self._settled = bytearray(self.size)
+        self._cost[index] = 0.0
+        self._next[index] = index
+        self._heap = [(0.0, index)]
+        _stats['resets'] += 1
+        return True
+
+    def _settle_until(self, index):
+        # 목표에서 거꾸로 퍼져 나가므로 이웃의 다음 셀 = 지금 확정한 셀
+        heap, cost, nxt, settled, neighbors = self._heap, self._cost, self._next, self._settled, self._neighbors
+        pop, push = heapq.heappop, heapq.heappush
+        count = 0
+        while heap and not settled[index]:
+            c, current = pop(heap)
+            if settled[current]:
+                continue
+            settled[current] = 1
+            count += 1
+            for other, step in neighbors[current]:
+                nc = c + step
+                if nc < cost[other]:
+                    cost[other] = nc
+                    nxt[other] = current
+                    push(heap, (nc, other))
+        _stats['settled'] += count
+
+    def next_cell_center(self, x, y):
+        """
+        (x, y)에서 목표 쪽으로 다음에 밟을 셀 중심
+
+        Returns:
+            (x, y), 이미 목표 셀이면 'target', 갈 수 없으면 None
+        """
+        _stats['queries'] += 1
+        if self.target < 0:
+            return None
+        index = self._index_of(x, y)
+        if index < 0 or not self._free[index]:
+            return None
+        if index == self.target:
+            return 'target'
+        if not self._settled[index]:
+            self._settle_until(index)
+            if not self._settled[index]:
+                return None
+        nxt = self._next[index]
+        if nxt == self.target:
+            return 'target'
+        row, col = divmod(nxt, self.cols)
+        return self.grid.cell_center(col, row)
+
+    def path_cost(self, x, y):
+        """목표까지의 경로 비용 (셀 단위, 갈 수 없으면 inf)"""
+        index = self._index_of(x, y)
+        if self.target < 0 or index < 0 or not self._free[index]:
+            return _INF
+        self._settle_until(index)
+        return self._cost[index]
+
+
+def get_field():
+    """
+    현재 스테이지 필드 (walkable_grid 격자가 없으면 None)
+
+    Returns:
+        FlowField 또는 None
+    """
+    global _field
+    grid = walkable_grid.get_current()
+    if grid is None:
+        _field = None
+        return None
+    if _field is None or _field.grid is not grid:
+        _field = FlowField(grid)
+    return _field
+
+
+def direction_toward(target_x, target_y, x, y):
+    """
+    (x, y)에서 목표를 향해 벽을 돌아가는 이동 방향
+
+    격자가 없거나 같은 셀/바로 옆 셀이거나 갈 수 없는 위치면 목표를 향한 직선 방향을 반환합니다.
+
+    Returns:
+        (dx, dy) 단위 벡터 (목표와 같은 위치면 (0, 0))
+    """
+    field = get_field()
+    goal = None
+    if field is not None:
+        field.set_target(target_x, target_y)
+        goal = field.next_cell_center(x, y)
+    if goal is None or goal == 'target':
+        goal = (target_x, target_y)
+
+    dx, dy = goal[0] - x, goal[1] - y
+    length = math.hypot(dx, dy)
+    if length <= 1e-6:
+        return 0.0, 0.0
+    return dx / length, dy / length
+
+
+def stats():
+    """
+    통계
+
+    Returns:
+        dict: {'resets', 'settled', 'queries', 'cells'}
+    """
+    result = dict(_stats)
+    result['cells'] = _field.size if _field is not None else 0
+    return result
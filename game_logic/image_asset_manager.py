@@ -1,10 +1,13 @@
 import pico2d as p2
 from PIL import Image
-import os
-import tempfile
+import numpy as np
 import hashlib
+import sdl2
 from functools import lru_cache
 
+from . import sprite_variant_cache as variant_cache
+from . import asset_pack
+
 # ==================== 이미지 경로 매핑 시스템 ====================
 
 # pico2d Image 객체와 원본 파일 경로를 매핑하는 딕셔너리
@@ -73,6 +76,65 @@ def load_image_with_path(path):
         return None
 
 
+# ==================== 텍스처 직접 업로드 ====================
+
+def _get_renderer():
+    """pico2d가 open_canvas()에서 생성한 SDL 렌더러를 반환 (캔버스가 없으면 None)"""
+    # pico2d 패키지는 `from .pico2d import *`로 재노출하므로 모듈 전역값은 내부 모듈에서 읽어야 최신값이다
+    core = getattr(p2, 'pico2d', None)
+    renderer = getattr(core, 'renderer', None) if core is not None else None
+    if renderer is None:
+        renderer = getattr(p2, 'renderer', None)
+    return renderer
+
+
+def create_image_from_rgba(rgba_bytes, width, height):
+    """
+    RGBA 픽셀 버퍼를 디스크를 거치지 않고 바로 pico2d Image로 업로드합니다.
+    PNG 인코딩/디코딩과 임시 파일 없이 SDL 텍스처를 생성하므로
+    색상 변환 결과나 텍스트 렌더링 결과를 즉시 화면에 쓸 수 있습니다.
+
+    Args:
+        rgba_bytes: 행 우선(row-major) RGBA8888 바이트 버퍼 (길이 = width * height * 4)
+        width: 이미지 너비 (픽셀)
+        height: 이미지 높이 (픽셀)
+
+    Returns:
+        새로운 pico2d Image 객체
+
+    Raises:
+        RuntimeError: 캔버스가 열려있지 않거나 텍스처 생성에 실패한 경우
+        ValueError: 버퍼 크기가 width * height * 4와 다른 경우
+
+    Example:
+        >>> pil_image = Image.open('sprite.png').convert('RGBA')
+        >>> img = create_image_from_rgba(pil_image.tobytes(), pil_image.width, pil_image.height)
+        >>> img.draw(400, 300)
+    """
+    renderer = _get_renderer()
+    if not renderer:
+        raise RuntimeError('pico2d 캔버스가 열려있지 않습니다. open_canvas() 이후에 호출하세요.')
+
+    width, height = int(width), int(height)
+    if len(rgba_bytes) != width * height * 4:
+        raise ValueError(f'RGBA 버퍼 크기 불일치: {len(rgba_bytes)} != {width}x{height}x4')
+
+    texture = sdl2.SDL_CreateTexture(renderer, sdl2.SDL_PIXELFORMAT_RGBA32,
+                                     sdl2.SDL_TEXTUREACCESS_STATIC, width, height)
+    if not texture:
+        raise RuntimeError(f'SDL_CreateTexture 실패: {sdl2.SDL_GetError()}')
+
+    if sdl2.SDL_UpdateTexture(texture, None, bytes(rgba_bytes), width * 4) != 0:
+        sdl2.SDL_DestroyTexture(texture)
+        raise RuntimeError(f'SDL_UpdateTexture 실패: {sdl2.SDL_GetError()}')
+
+    # 알파 블렌딩 활성화 (IMG_LoadTexture로 읽은 PNG와 동일하게 동작하도록)
+    sdl2.SDL_SetTextureBlendMode(texture, sdl2.SDL_BLENDMODE_BLEND)
+
+    # pico2d Image가 텍스처 소유권을 가짐 (__del__에서 SDL_DestroyTexture)
+    return p2.Image(texture)
+
+
 # ==================== 캐시 시스템 ====================
 
 # 변환된 이미지 캐시 (메모리 절약)
@@ -137,195 +199,171 @@ def _check_cache_limit():
             _image_cache.pop(next(iter(_image_cache)))
 
 
-# ==================== 기본 색상 조작 함수 (캐싱 적용) ====================
+# ==================== 배열 기반 색상 연산 ====================
+# 모든 색상 연산은 (..., H, W, 4) 형태의 uint8 RGBA 배열에 대해 동작합니다.
+# 앞쪽 차원은 자유롭기 때문에 (H, W, 4) 한 장과 (N, H, W, 4) 애니메이션 묶음을 같은 함수로 처리합니다.
+# 결과 바이트가 바뀌는 수정을 하면 디스크 캐시가 이전 결과를 읽지 않도록 sprite_variant_cache.ALGORITHM_VERSION을 올립니다.
 
-def apply_color_bias(image, r_bias, g_bias, b_bias):
+def load_rgba_array(path):
     """
-    이미지에 RGB 색상 편이를 적용하여 새로운 이미지를 생성합니다.
+    이미지 파일을 (H, W, 4) uint8 RGBA 배열로 읽어옵니다.
 
     Args:
-        image: pico2d Image 객체
-        r_bias: Red 채널 편이 값 (-255 ~ 255)
-        g_bias: Green 채널 편이 값 (-255 ~ 255)
-        b_bias: Blue 채널 편이 값 (-255 ~ 255)
+        path: 이미지 파일 경로
 
     Returns:
-        색상이 조정된 새로운 pico2d Image 객체
+        numpy.ndarray (H, W, 4), dtype=uint8
+    """
+    # 에셋 팩(resources/assets.pack)이 열려 있으면 팩에서 읽음
+    with Image.open(asset_pack.open_binary(path)) as pil_image:
+        return np.array(pil_image.convert('RGBA'), dtype=np.uint8)
 
-    Example:
-        >>> original_img = load_image_with_path('player.png')
-        >>> red_tinted_img = apply_color_bias(original_img, 50, -20, -20)
-        >>> red_tinted_img.draw(400, 300)
+
+def create_image_from_array(rgba_array):
     """
-    try:
-        # 이미지 경로 가져오기
-        original_path = _get_image_path(image)
+    (H, W, 4) uint8 RGBA 배열을 pico2d Image로 업로드합니다.
 
-        if not original_path:
-            print('\033[91m[ImageAssetManager] apply_color_bias: 이미지 경로를 찾을 수 없습니다. load_image_with_path()를 사용하거나 register_image_path()로 경로를 등록하세요.\033[0m')
-            return image
+    Args:
+        rgba_array: numpy.ndarray (H, W, 4), dtype=uint8
 
-        # 캐시 확인
-        if _cache_enabled:
-            cache_key = _get_cache_key(original_path, 'bias', r_bias, g_bias, b_bias)
-            if cache_key in _image_cache:
-                return _image_cache[cache_key]
+    Returns:
+        새로운 pico2d Image 객체
+    """
+    height, width = rgba_array.shape[:2]
+    return create_image_from_rgba(np.ascontiguousarray(rgba_array, dtype=np.uint8).tobytes(), width, height)
 
-        # PIL로 이미지 열기
-        try:
-            pil_image = Image.open(original_path).convert('RGBA')
-        except FileNotFoundError:
-            print(f'\033[91m[ImageAssetManager] apply_color_bias: 파일을 찾을 수 없습니다: {original_path}\033[0m')
-            return image
-        except Exception as e:
-            print(f'\033[91m[ImageAssetManager] apply_color_bias: 이미지 로드 실패: {e}\033[0m')
-            return image
 
-        pixels = pil_image.load()
-        width, height = pil_image.size
+def color_bias_array(rgba, r_bias, g_bias, b_bias):
+    """RGB 채널에 편이 값을 더하고 0~255로 클램핑 (알파 채널 유지)"""
+    out = rgba.copy()
+    bias = np.array([r_bias, g_bias, b_bias], dtype=np.int16)
+    out[..., :3] = np.clip(rgba[..., :3].astype(np.int16) + bias, 0, 255)
+    return out
 
-        # 각 픽셀의 RGB 값 조정
-        for y in range(height):
-            for x in range(width):
-                r, g, b, a = pixels[x, y]
 
-                # 색상 편이 적용 (0-255 범위로 클램핑)
-                new_r = max(0, min(255, r + r_bias))
-                new_g = max(0, min(255, g + g_bias))
-                new_b = max(0, min(255, b + b_bias))
+def color_multiply_array(rgba, r_mult, g_mult, b_mult):
+    """RGB 채널에 곱셈 값을 적용하고 0~255로 클램핑 (알파 채널 유지)"""
+    out = rgba.copy()
+    # 기존 int(r * mult)와 같은 결과가 나오도록 float64(파이썬 float)로 곱하고 소수점 이하는 버림
+    mult = np.array([r_mult, g_mult, b_mult], dtype=np.float64)
+    out[..., :3] = np.clip(rgba[..., :3] * mult, 0, 255).astype(np.uint8)
+    return out
 
-                pixels[x, y] = (new_r, new_g, new_b, a)
 
-        # 임시 파일로 저장
-        temp_path = None
-        try:
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-                temp_path = temp_file.name
-                pil_image.save(temp_path, 'PNG')
-        except Exception as e:
-            print(f'\033[91m[ImageAssetManager] apply_color_bias: 임시 파일 저장 실패: {e}\033[0m')
-            return image
+def brightness_array(rgba, brightness):
+    """RGB 채널 전체에 같은 배율을 곱하는 밝기 조정"""
+    return color_multiply_array(rgba, brightness, brightness, brightness)
 
-        # pico2d로 다시 로드
-        try:
-            new_image = p2.load_image(temp_path)
-            # 새로 생성된 이미지도 경로 등록 (임시 파일이지만 캐시 키로 사용)
-            register_image_path(new_image, original_path)
-        except Exception as e:
-            print(f'\033[91m[ImageAssetManager] apply_color_bias: pico2d 이미지 로드 실패: {e}\033[0m')
-            if temp_path:
-                try:
-                    os.remove(temp_path)
-                except:
-                    pass
-            return image
 
-        # 임시 파일 삭제
-        if temp_path:
-            try:
-                os.remove(temp_path)
-            except Exception as e:
-                print(f'\033[91m[ImageAssetManager] apply_color_bias: 임시 파일 삭제 실패: {e}\033[0m')
+def hue_shift_array(rgba, hue_shift):
+    """
+    색조(Hue)를 hue_shift 도(0~360)만큼 회전합니다. (알파 채널 유지)
+    기존 구현과 같은 결과가 나오도록 PIL의 8비트 HSV 변환을 그대로 쓰고, 픽셀 루프였던 색조 이동만 배열 연산으로 바꿉니다.
+    """
+    shape = rgba.shape
+    width = shape[-2]
+    # 앞쪽 차원을 세로로 이어 붙여 한 장으로 변환 (HSV 변환은 픽셀 단위라 결과가 같음)
+    rgb = np.ascontiguousarray(rgba[..., :3]).reshape(-1, width, 3)
+    size = (width, rgb.shape[0])
+    hsv = np.frombuffer(Image.frombytes('RGB', size, rgb.tobytes()).convert('HSV').tobytes(),
+                        dtype=np.uint8).reshape(rgb.shape).copy()
 
-        # 캐시에 저장
-        if _cache_enabled:
-            _image_cache[cache_key] = new_image
-            _check_cache_limit()
+    # 색조 이동 (0~255 범위에서 순환 - uint8 덧셈의 자리 넘김이 % 256과 같음)
+    hsv[..., 0] += np.uint8(int(hue_shift * 255 / 360) % 256)
 
-        return new_image
+    new_rgb = np.frombuffer(Image.frombytes('HSV', size, hsv.tobytes()).convert('RGB').tobytes(), dtype=np.uint8)
+    out = rgba.copy()
+    out[..., :3] = new_rgb.reshape(shape[:-1] + (3,))
+    return out
 
-    except Exception as e:
-        print(f'\033[91m[ImageAssetManager] apply_color_bias: 예기치 않은 오류 발생: {e}\033[0m')
-        return image
 
+# 연산 이름 -> (배열 연산 함수, 캐시 키에 쓰는 연산 이름)
+# brightness는 multiply와 동일한 결과이므로 같은 캐시 키를 공유한다
+_ARRAY_OPERATIONS = {
+    'bias': (color_bias_array, 'bias'),
+    'multiply': (color_multiply_array, 'multiply'),
+    'hue': (hue_shift_array, 'hue'),
+    'brightness': (brightness_array, 'multiply'),
+}
 
-def apply_color_multiply(image, r_mult, g_mult, b_mult):
-    """
-    이미지에 RGB 색상 곱셈을 적용하여 새로운 이미지를 생성합니다.
 
-    Args:
-        image: pico2d Image 객체
-        r_mult: Red 채널 곱셈 값 (0.0 ~ 2.0)
-        g_mult: Green 채널 곱셈 값 (0.0 ~ 2.0)
-        b_mult: Blue 채널 곱셈 값 (0.0 ~ 2.0)
+def _cache_params(operation, params):
+    """캐시 키용 파라미터 (brightness는 multiply 파라미터로 정규화)"""
+    if operation == 'brightness':
+        return (params[0], params[0], params[0])
+    return tuple(params)
 
-    Returns:
-        색상이 조정된 새로운 pico2d Image 객체
 
-    Example:
-        >>> original_img = load_image_with_path('enemy.png')
-        >>> darkened_img = apply_color_multiply(original_img, 0.5, 0.5, 0.5)
-        >>> darkened_img.draw(400, 300)
+def _disk_cache_key(path, cache_op, cache_params):
+    """디스크 변형 캐시 키 (캐시가 꺼져 있거나 원본을 읽을 수 없으면 None)"""
+    if not variant_cache.is_enabled():
+        return None
+    try:
+        return variant_cache.variant_key(path, cache_op, cache_params)
+    except OSError:
+        return None
+
+
+def _apply_array_operation(image, operation, params, func_name):
+    """
+    apply_* 함수들의 공통 구현
+    경로 조회 -> 메모리 캐시 확인 -> 디스크 캐시 확인 -> (없으면) 배열 로드/연산/디스크 저장
+    -> 텍스처 업로드 -> 메모리 캐시 저장
     """
     try:
         # 이미지 경로 가져오기
         original_path = _get_image_path(image)
 
         if not original_path:
-            print('\033[91m[ImageAssetManager] apply_color_multiply: 이미지 경로를 찾을 수 없습니다. load_image_with_path()를 사용하거나 register_image_path()로 경로를 등록하세요.\033[0m')
+            print(f'\033[91m[ImageAssetManager] {func_name}: 이미지 경로를 찾을 수 없습니다. load_image_with_path()를 사용하거나 register_image_path()로 경로를 등록하세요.\033[0m')
             return image
 
+        array_op, cache_op = _ARRAY_OPERATIONS[operation]
+
         # 캐시 확인
         if _cache_enabled:
-            cache_key = _get_cache_key(original_path, 'multiply', r_mult, g_mult, b_mult)
+            cache_key = _get_cache_key(original_path, cache_op, *_cache_params(operation, params))
             if cache_key in _image_cache:
                 return _image_cache[cache_key]
 
-        # PIL로 이미지 열기
-        try:
-            pil_image = Image.open(original_path).convert('RGBA')
-        except FileNotFoundError:
-            print(f'\033[91m[ImageAssetManager] apply_color_multiply: 파일을 찾을 수 없습니다: {original_path}\033[0m')
-            return image
-        except Exception as e:
-            print(f'\033[91m[ImageAssetManager] apply_color_multiply: 이미지 로드 실패: {e}\033[0m')
-            return image
-
-        pixels = pil_image.load()
-        width, height = pil_image.size
-
-        for y in range(height):
-            for x in range(width):
-                r, g, b, a = pixels[x, y]
+        # 디스크 변형 캐시 확인 (미리 생성된 RGBA를 그대로 업로드)
+        disk_key = _disk_cache_key(original_path, cache_op, _cache_params(operation, params))
+        cached = variant_cache.load(disk_key) if disk_key else None
 
-                # 색상 곱셈 적용
-                new_r = max(0, min(255, int(r * r_mult)))
-                new_g = max(0, min(255, int(g * g_mult)))
-                new_b = max(0, min(255, int(b * b_mult)))
+        if cached:
+            width, height, rgba_bytes = cached
+        else:
+            # 배열로 이미지 열기
+            try:
+                rgba = load_rgba_array(original_path)
+            except FileNotFoundError:
+                print(f'\033[91m[ImageAssetManager] {func_name}: 파일을 찾을 수 없습니다: {original_path}\033[0m')
+                return image
+            except Exception as e:
+                print(f'\033[91m[ImageAssetManager] {func_name}: 이미지 로드 실패: {e}\033[0m')
+                return image
 
-                pixels[x, y] = (new_r, new_g, new_b, a)
+            # 배열 연산으로 색상 변환
+            try:
+                result = array_op(rgba, *params)
+            except Exception as e:
+                print(f'\033[91m[ImageAssetManager] {func_name}: 색상 변환 실패: {e}\033[0m')
+                return image
 
-        # 임시 파일로 저장
-        temp_path = None
-        try:
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-                temp_path = temp_file.name
-                pil_image.save(temp_path, 'PNG')
-        except Exception as e:
-            print(f'\033[91m[ImageAssetManager] apply_color_multiply: 임시 파일 저장 실패: {e}\033[0m')
-            return image
+            height, width = result.shape[:2]
+            rgba_bytes = np.ascontiguousarray(result).tobytes()
+            if disk_key:
+                variant_cache.store(disk_key, width, height, rgba_bytes)
 
-        # pico2d로 다시 로드
+        # RGBA 버퍼를 텍스처로 직접 업로드 (임시 파일/PNG 인코딩 없음)
         try:
-            new_image = p2.load_image(temp_path)
-            # 새로 생성된 이미지도 경로 등록
+            new_image = create_image_from_rgba(rgba_bytes, width, height)
+            # 새로 생성된 이미지도 경로 등록 (캐시 키로 사용)
             register_image_path(new_image, original_path)
         except Exception as e:
-            print(f'\033[91m[ImageAssetManager] apply_color_multiply: pico2d 이미지 로드 실패: {e}\033[0m')
-            if temp_path:
-                try:
-                    os.remove(temp_path)
-                except:
-                    pass
+            print(f'\033[91m[ImageAssetManager] {func_name}: 텍스처 업로드 실패: {e}\033[0m')
             return image
 
-        # 임시 파일 삭제
-        if temp_path:
-            try:
-                os.remove(temp_path)
-            except Exception as e:
-                print(f'\033[91m[ImageAssetManager] apply_color_multiply: 임시 파일 삭제 실패: {e}\033[0m')
-
         # 캐시에 저장
         if _cache_enabled:
             _image_cache[cache_key] = new_image
@@ -334,114 +372,70 @@ def apply_color_multiply(image, r_mult, g_mult, b_mult):
         return new_image
 
     except Exception as e:
-        print(f'\033[91m[ImageAssetManager] apply_color_multiply: 예기치 않은 오류 발생: {e}\033[0m')
+        print(f'\033[91m[ImageAssetManager] {func_name}: 예기치 않은 오류 발생: {e}\033[0m')
         return image
 
 
-def apply_hue_shift(image, hue_shift):
+# ==================== 기본 색상 조작 함수 (캐싱 적용) ====================
+
+def apply_color_bias(image, r_bias, g_bias, b_bias):
     """
-    이미지의 색조(Hue)를 변경하여 새로운 이미지를 생성합니다.
+    이미지에 RGB 색상 편이를 적용하여 새로운 이미지를 생성합니다.
 
     Args:
         image: pico2d Image 객체
-        hue_shift: 색조 이동 값 (0 ~ 360 도)
+        r_bias: Red 채널 편이 값 (-255 ~ 255)
+        g_bias: Green 채널 편이 값 (-255 ~ 255)
+        b_bias: Blue 채널 편이 값 (-255 ~ 255)
 
     Returns:
-        색조가 조정된 새로운 pico2d Image 객체
+        색상이 조정된 새로운 pico2d Image 객체
 
     Example:
-        >>> original_img = load_image_with_path('character.png')
-        >>> purple_img = apply_hue_shift(original_img, 60)
+        >>> original_img = load_image_with_path('player.png')
+        >>> red_tinted_img = apply_color_bias(original_img, 50, -20, -20)
+        >>> red_tinted_img.draw(400, 300)
     """
-    try:
-        # 이미지 경로 가져오기
-        original_path = _get_image_path(image)
+    return _apply_array_operation(image, 'bias', (r_bias, g_bias, b_bias), 'apply_color_bias')
 
-        if not original_path:
-            print('\033[91m[ImageAssetManager] apply_hue_shift: 이미지 경로를 찾을 수 없습니다. load_image_with_path()를 사용하거나 register_image_path()로 경로를 등록하세요.\033[0m')
-            return image
-
-        # 캐시 확인
-        if _cache_enabled:
-            cache_key = _get_cache_key(original_path, 'hue', hue_shift)
-            if cache_key in _image_cache:
-                return _image_cache[cache_key]
 
-        # PIL로 이미지 열기
-        try:
-            pil_image = Image.open(original_path).convert('RGBA')
-        except FileNotFoundError:
-            print(f'\033[91m[ImageAssetManager] apply_hue_shift: 파일을 찾을 수 없습니다: {original_path}\033[0m')
-            return image
-        except Exception as e:
-            print(f'\033[91m[ImageAssetManager] apply_hue_shift: 이미지 로드 실패: {e}\033[0m')
-            return image
-
-        # RGB를 HSV로 변환하여 색조 변경
-        try:
-            rgb_image = pil_image.convert('RGB')
-            hsv_image = rgb_image.convert('HSV')
-            pixels = hsv_image.load()
-
-            width, height = hsv_image.size
-
-            for y in range(height):
-                for x in range(width):
-                    h, s, v = pixels[x, y]
-                    # 색조 이동 (0-255 범위에서 순환)
-                    new_h = (h + int(hue_shift * 255 / 360)) % 256
-                    pixels[x, y] = (new_h, s, v)
+def apply_color_multiply(image, r_mult, g_mult, b_mult):
+    """
+    이미지에 RGB 색상 곱셈을 적용하여 새로운 이미지를 생성합니다.
 
-            # 다시 RGBA로 변환
-            rgb_converted = hsv_image.convert('RGB')
+    Args:
+        image: pico2d Image 객체
+        r_mult: Red 채널 곱셈 값 (0.0 ~ 2.0)
+        g_mult: Green 채널 곱셈 값 (0.0 ~ 2.0)
+        b_mult: Blue 채널 곱셈 값 (0.0 ~ 2.0)
 
-            # 원본 알파 채널 복원
-            rgb_converted.putalpha(pil_image.split()[3])
-        except Exception as e:
-            print(f'\033[91m[ImageAssetManager] apply_hue_shift: 색조 변환 실패: {e}\033[0m')
-            return image
+    Returns:
+        색상이 조정된 새로운 pico2d Image 객체
 
-        # 임시 파일로 저장
-        temp_path = None
-        try:
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-                temp_path = temp_file.name
-                rgb_converted.save(temp_path, 'PNG')
-        except Exception as e:
-            print(f'\033[91m[ImageAssetManager] apply_hue_shift: 임시 파일 저장 실패: {e}\033[0m')
-            return image
+    Example:
+        >>> original_img = load_image_with_path('enemy.png')
+        >>> darkened_img = apply_color_multiply(original_img, 0.5, 0.5, 0.5)
+        >>> darkened_img.draw(400, 300)
+    """
+    return _apply_array_operation(image, 'multiply', (r_mult, g_mult, b_mult), 'apply_color_multiply')
 
-        # pico2d로 다시 로드
-        try:
-            new_image = p2.load_image(temp_path)
-            # 새로 생성된 이미지도 경로 등록
-            register_image_path(new_image, original_path)
-        except Exception as e:
-            print(f'\033[91m[ImageAssetManager] apply_hue_shift: pico2d 이미지 로드 실패: {e}\033[0m')
-            if temp_path:
-                try:
-                    os.remove(temp_path)
-                except:
-                    pass
-            return image
 
-        # 임시 파일 삭제
-        if temp_path:
-            try:
-                os.remove(temp_path)
-            except Exception as e:
-                print(f'\033[91m[ImageAssetManager] apply_hue_shift: 임시 파일 삭제 실패: {e}\033[0m')
+def apply_hue_shift(image, hue_shift):
+    """
+    이미지의 색조(Hue)를 변경하여 새로운 이미지를 생성합니다.
 
-        # 캐시에 저장
-        if _cache_enabled:
-            _image_cache[cache_key] = new_image
-            _check_cache_limit()
+    Args:
+        image: pico2d Image 객체
+        hue_shift: 색조 이동 값 (0 ~ 360 도)
 
-        return new_image
+    Returns:
+        색조가 조정된 새로운 pico2d Image 객체
 
-    except Exception as e:
-        print(f'\033[91m[ImageAssetManager] apply_hue_shift: 예기치 않은 오류 발생: {e}\033[0m')
-        return image
+    Example:
+        >>> original_img = load_image_with_path('character.png')
+        >>> purple_img = apply_hue_shift(original_img, 60)
+    """
+    return _apply_array_operation(image, 'hue', (hue_shift,), 'apply_hue_shift')
 
 
 def apply_brightness(image, brightness):
@@ -459,7 +453,7 @@ def apply_brightness(image, brightness):
         >>> original_img = p2.load_image('background.png')
         >>> bright_img = apply_brightness(original_img, 1.5)
     """
-    return apply_color_multiply(image, brightness, brightness, brightness)
+    return _apply_array_operation(image, 'brightness', (brightness,), 'apply_brightness')
 
 
 # ==================== 간편 함수 ====================
@@ -577,9 +571,44 @@ def make_invincible_version(image):
 
 # ==================== 배치 처리 ====================
 
+def batch_process_arrays(rgba_frames, operation, *params):
+    """
+    여러 RGBA 배열에 동일한 연산을 한 번에 적용합니다.
+    크기가 같은 프레임끼리 (N, H, W, 4) 배열로 쌓아 연산 1회로 처리합니다.
+
+    Args:
+        rgba_frames: (H, W, 4) uint8 배열 리스트
+        operation: 'brightness', 'bias', 'multiply', 'hue' 중 하나
+        *params: operation에 필요한 파라미터들
+
+    Returns:
+        입력과 같은 순서의 결과 배열 리스트
+
+    Raises:
+        KeyError: 알 수 없는 operation인 경우
+    """
+    array_op = _ARRAY_OPERATIONS[operation][0]
+    results = [None] * len(rgba_frames)
+
+    # 크기별로 묶어서 처리 (애니메이션 프레임은 보통 크기가 모두 같음)
+    groups = {}
+    for i, frame in enumerate(rgba_frames):
+        groups.setdefault(frame.shape, []).append(i)
+
+    for indices in groups.values():
+        stacked = np.stack([rgba_frames[i] for i in indices])
+        processed = array_op(stacked, *params)
+        for slot, i in enumerate(indices):
+            results[i] = processed[slot]
+
+    return results
+
+
 def batch_process_images(images, operation, *params):
     """
     여러 이미지에 동일한 작업을 배치로 처리
+    애니메이션 전체를 하나의 (N, H, W, 4) 배열로 쌓아 한 번의 배열 연산으로 변환합니다.
+    메모리 캐시나 디스크 변형 캐시(sprite_variant_cache)에 있는 프레임은 다시 계산하지 않습니다.
 
     Args:
         images: pico2d Image 객체 리스트
@@ -590,7 +619,7 @@ def batch_process_images(images, operation, *params):
         처리된 이미지 리스트
 
     Example:
-        >>> sprites = [p2.load_image(f'sprite{i}.png') for i in range(5)]
+        >>> sprites = [load_image_with_path(f'sprite{i}.png') for i in range(5)]
         >>> dark_sprites = batch_process_images(sprites, 'brightness', 0.5)
     """
     try:
@@ -598,24 +627,61 @@ def batch_process_images(images, operation, *params):
             print('\033[91m[ImageAssetManager] batch_process_images: 이미지 리스트가 비어있습니다.\033[0m')
             return []
 
-        results = []
+        if operation not in _ARRAY_OPERATIONS:
+            print(f'\033[91m[ImageAssetManager] batch_process_images: 알 수 없는 작업: {operation}\033[0m')
+            return list(images)  # 실패시 원본 이미지 반환
+
+        cache_op = _ARRAY_OPERATIONS[operation][1]
+        cache_params = _cache_params(operation, params)
+
+        results = list(images)  # 실패한 프레임은 원본 이미지 유지
+        uploads = []  # (결과 인덱스, 원본 경로, 캐시 키, width, height, rgba_bytes)
+        pending = []  # (결과 인덱스, 원본 경로, 캐시 키, 디스크 키, 배열)
 
         for i, img in enumerate(images):
+            path = _get_image_path(img)
+            if not path:
+                print(f'\033[91m[ImageAssetManager] batch_process_images: 이미지 {i}의 경로를 찾을 수 없습니다.\033[0m')
+                continue
+
+            cache_key = _get_cache_key(path, cache_op, *cache_params)
+            if _cache_enabled and cache_key in _image_cache:
+                results[i] = _image_cache[cache_key]
+                continue
+
+            # 디스크 변형 캐시에 있으면 연산 없이 바로 업로드
+            disk_key = _disk_cache_key(path, cache_op, cache_params)
+            cached = variant_cache.load(disk_key) if disk_key else None
+            if cached:
+                uploads.append((i, path, cache_key) + cached)
+                continue
+
             try:
-                if operation == 'brightness':
-                    results.append(apply_brightness(img, *params))
-                elif operation == 'bias':
-                    results.append(apply_color_bias(img, *params))
-                elif operation == 'multiply':
-                    results.append(apply_color_multiply(img, *params))
-                elif operation == 'hue':
-                    results.append(apply_hue_shift(img, *params))
-                else:
-                    print(f'\033[91m[ImageAssetManager] batch_process_images: 알 수 없는 작업: {operation}\033[0m')
-                    results.append(img)  # 실패시 원본 이미지 추가
+                pending.append((i, path, cache_key, disk_key, load_rgba_array(path)))
+            except Exception as e:
+                print(f'\033[91m[ImageAssetManager] batch_process_images: 이미지 {i} 로드 실패: {e}\033[0m')
+
+        if pending:
+            processed = batch_process_arrays([entry[4] for entry in pending], operation, *params)
+            for (i, path, cache_key, disk_key, _), rgba in zip(pending, processed):
+                height, width = rgba.shape[:2]
+                rgba_bytes = np.ascontiguousarray(rgba).tobytes()
+                if disk_key:
+                    variant_cache.store(disk_key, width, height, rgba_bytes)
+                uploads.append((i, path, cache_key, width, height, rgba_bytes))
+
+        for i, path, cache_key, width, height, rgba_bytes in uploads:
+            try:
+                new_image = create_image_from_rgba(rgba_bytes, width, height)
+                register_image_path(new_image, path)
+                results[i] = new_image
+                if _cache_enabled:
+                    _image_cache[cache_key] = new_image
             except Exception as e:
                 print(f'\033[91m[ImageAssetManager] batch_process_images: 이미지 {i} 처리 실패: {e}\033[0m')
-                results.append(img)  # 실패시 원본 이미지 추가
+
+        if _cache_enabled:
+            _check_cache_limit()
 
         return results
 
@@ -624,6 +690,42 @@ def batch_process_images(images, operation, *params):
         return images  # 오류 발생시 원본 리스트 반환
 
 
+def prebuild_variants(paths, operation, *params):
+    """
+    디스크 변형 캐시를 미리 채웁니다. (캔버스 없이 동작, tools/build_variant_cache.py에서 사용)
+    이미 캐시에 있는 항목은 건너뜁니다.
+
+    Args:
+        paths: 원본 이미지 파일 경로 리스트
+        operation: 'brightness', 'bias', 'multiply', 'hue' 중 하나
+        *params: operation에 필요한 파라미터들
+
+    Returns:
+        tuple: (새로 생성한 수, 이미 있던 수)
+    """
+    cache_op = _ARRAY_OPERATIONS[operation][1]
+    cache_params = _cache_params(operation, params)
+
+    todo = []  # (디스크 키, 배열)
+    skipped = 0
+    for path in paths:
+        key = variant_cache.variant_key(path, cache_op, cache_params)
+        if variant_cache.contains(key):
+            skipped += 1
+            continue
+        todo.append((key, load_rgba_array(path)))
+
+    if not todo:
+        return 0, skipped
+
+    built = 0
+    for (key, _), rgba in zip(todo, batch_process_arrays([entry[1] for entry in todo], operation, *params)):
+        height, width = rgba.shape[:2]
+        if variant_cache.store(key, width, height, np.ascontiguousarray(rgba).tobytes()):
+            built += 1
+    return built, skipped
+
+
 def create_color_variants(image, presets=None):
     """
     하나의 이미지에서 여러 색상 변형 생성
@@ -815,6 +917,9 @@ if __name__ == "__main__":
     print("  3. apply_hue_shift(image, hue)")
     print("  4. apply_brightness(image, brightness)")
 
+    print("\n🚀 텍스처 업로드:")
+    print("  1. create_image_from_rgba(rgba_bytes, width, height)")
+
     print("\n🌙 간편 함수:")
     print("  1. make_dark(image, darkness=0.5)")
     print("  2. make_shadow(image)")
@@ -835,7 +940,9 @@ if __name__ == "__main__":
 
     print("\n⚡ 배치 처리:")
     print("  1. batch_process_images(images, operation, *params)")
-    print("  2. create_color_variants(image, presets)")
+    print("  2. batch_process_arrays(rgba_frames, operation, *params)")
+    print("  3. create_color_variants(image, presets)")
+    print("  4. prebuild_variants(paths, operation, *params)  # 디스크 변형 캐시 미리 생성")
 
     print("\n🗂️ 리소스 매니저:")
     print("  manager = ImageVariantManager()")
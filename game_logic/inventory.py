@@ -124,11 +124,19 @@ class InventorySlot:
 
 
 class InventoryData:
-    """인벤토리 데이터 컨테이너. UI와 분리된 순수 로직."""
+    """인벤토리 데이터 컨테이너. UI와 분리된 순수 로직.
+    - version: 슬롯 내용이 바뀔 때마다 증가하는 카운터 (UI가 캐시 재생성 여부 판단에 사용)
+      슬롯을 직접 수정했다면 mark_changed()를 호출해야 한다.
+    """
     def __init__(self, cols: int = 6, rows: int = 5):
         self.cols = cols
         self.rows = rows
         self.slots: List[InventorySlot] = [InventorySlot() for _ in range(cols * rows)]
+        self.version = 0
+
+    def mark_changed(self):
+        """슬롯 내용 변경 알림 (version 증가)"""
+        self.version += 1
 
     def index(self, r: int, c: int) -> int:
         return r * self.cols + c
@@ -159,6 +167,8 @@ class InventoryData:
                 break
             if slot.is_empty():
                 remaining = slot.push(item, remaining)
+        if remaining != qty:
+            self.mark_changed()
         return remaining
 
     def remove_from(self, r: int, c: int, qty: int = 1) -> int:
@@ -172,6 +182,7 @@ class InventoryData:
         slot.quantity -= take
         if slot.quantity <= 0:
             slot.clear()
+        self.mark_changed()
         return take
 
     def move(self, src_rc, dst_rc):
@@ -182,6 +193,7 @@ class InventoryData:
         d = self.get_slot(dr, dc)
         if s.is_empty():
             return
+        self.mark_changed()
         if d.is_empty():
             d.item, d.quantity = s.item, s.quantity
             s.clear()
@@ -221,6 +233,8 @@ class InventoryData:
                 slot.item = item
                 slot.quantity = take
                 remaining -= take
+        if remaining != qty:
+            self.mark_changed()
         return remaining
 
     def input(self, pairs: List[tuple], prefer_stack: bool = True):
@@ -1,6 +1,6 @@
 # Simple world item entity used when dropping items from inventory
-import random
-from pico2d import load_wav
+from . import sound_bank
+from . import depth_sort
 
 class WorldItem:
     """월드에 떨어진 아이템 엔티티(간단한 표시용)
@@ -9,10 +9,6 @@ class WorldItem:
     - x, y: 게임 좌표(픽셀)
     - world: (optional) reference to the main world's dict so the item can remove itself and find the player
     """
-    # 클래스 레벨 사운드 (한 번만 로드)
-    pickup_sound_1 = None
-    pickup_sound_2 = None
-
     def __init__(self, item, qty, x, y, scale=0.5, world=None, pickup_radius=60):
         self.item = item
         self.qty = qty
@@ -24,17 +20,6 @@ class WorldItem:
         # 픽업 가능 반경(픽셀)
         self.pickup_radius = pickup_radius
 
-        # 사운드 로드 (클래스 레벨에서 한 번만)
-        if WorldItem.pickup_sound_1 is None:
-            try:
-                WorldItem.pickup_sound_1 = load_wav('resources/Sounds/Pick_Item_1.wav')
-                WorldItem.pickup_sound_1.set_volume(64)
-                WorldItem.pickup_sound_2 = load_wav('resources/Sounds/Pick_Item_2.wav')
-                WorldItem.pickup_sound_2.set_volume(64)
-                print('[WorldItem] 아이템 습득 사운드 로드 완료 (Pick_Item_1~2.wav)')
-            except Exception as e:
-                print(f'\033[91m[WorldItem] 아이템 습득 사운드 로드 실패: {e}\033[0m')
-
     @property
     def icon(self):
         if self._icon is None and self.item is not None:
@@ -95,10 +80,7 @@ class WorldItem:
                     print(f"[WorldItem] picked up {getattr(self.item, 'name', 'Unknown')} x{added} by player")
 
                     # 아이템 습득 사운드 재생 (랜덤으로 1 또는 2)
-                    if WorldItem.pickup_sound_1 and WorldItem.pickup_sound_2:
-                        pickup_sound = random.choice([WorldItem.pickup_sound_1, WorldItem.pickup_sound_2])
-                        pickup_sound.play()
-                        print(f"[WorldItem] 아이템 습득 사운드 재생")
+                    sound_bank.play_random(('pick_item_1', 'pick_item_2'))
 
                     self.qty = leftover
                 # 완전히 주웠으면 월드에서 제거
@@ -123,3 +105,8 @@ class WorldItem:
             ic.draw(draw_x, draw_y, w, h)
         except Exception:
             print(f'\033[91m[WorldItem] failed to draw icon\033[0m')
+
+
+# 충돌 박스가 없으므로 아이콘 아래쪽을 발 위치로 사용 (기본값은 중심)
+depth_sort.register_anchor(
+    WorldItem, lambda obj: -(obj.icon.h * obj.scale) / 2 if obj.icon is not None else 0.0)
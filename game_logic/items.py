@@ -250,11 +250,19 @@ def drop_item(world, item_factory, qty, x, y, drop_chance=1.0):
     """
     import random
     from .item_entity import WorldItem
+    from . import walkable_grid
 
     # 확률 체크
     if random.random() > drop_chance:
         return False
 
+    # 벽 가장자리에서 죽은 몬스터의 드롭이 벽 안에 묻히지 않도록 가장 가까운 걷기 가능 위치로 보정
+    grid = walkable_grid.get_current()
+    if grid is not None:
+        point = grid.nearest_walkable_point(x, y, clearance=20, max_radius=200)
+        if point is not None:
+            x, y = point
+
     try:
         # 아이템 생성
         item = item_factory()
@@ -0,0 +1,179 @@
+"""
+격자 레이캐스트 시야 판정 (AI 인지 공용)
+
+몬스터가 거리만으로 플레이어를 감지하면 벽 너머에서도 보고 쏘게 됩니다.
+walkable_grid의 벽 격자(blocked) 위에서 DDA(Amanatides-Woo) 방식으로 두 셀 사이를 한 칸씩 밟아
+벽 셀이 있는지 확인합니다. 지나가는 셀 수만큼만 검사하므로 벽 개수와 무관합니다.
+
+메모:
+    결과는 (출발 셀, 도착 셀) 키로 같은 프레임 안에서 재사용합니다.
+    같은 셀에 모여 있는 몬스터들이 같은 셀의 플레이어를 보는 경우 한 번만 계산합니다.
+    프레임(게임 시간)이나 격자가 바뀌면 메모를 비웁니다.
+
+판정 규칙:
+    셀 중심에서 셀 중심으로 광선을 쏩니다 (메모 키가 셀이므로 셀 안의 위치와 무관한 결과).
+    광선이 정확히 모서리를 지날 때는 양옆 셀 중 하나라도 벽이면 막힌 것으로 봅니다 (대각선 틈 금지).
+    격자가 없으면(벽 없는 스테이지, 격자 생성 전) 항상 보이는 것으로 판정합니다 - 기존 동작과 같음.
+
+몬스터별 재검사 간격:
+    SightLine은 마지막 결과를 들고 있다가 CHECK_INTERVAL마다 한 번만 다시 쏩니다.
+    첫 검사 시각을 무작위로 흩어 같은 프레임에 몰리지 않게 합니다.
+
+사용법:
+    from game_logic import line_of_sight
+    line_of_sight.has_line_of_sight(cat.x, cat.y, player.x, player.y)
+    self.sight = line_of_sight.SightLine()
+    if distance <= detection_range and self.sight.sees(cat.x, cat.y, player.x, player.y): ...
+    print(line_of_sight.stats())
+"""
+import random
+
+import game_framework as framework
+from . import walkable_grid
+
+# SightLine 기본 재검사 간격(초)
+CHECK_INTERVAL = 0.2
+
+# 프레임 메모 {(출발 셀 인덱스, 도착 셀 인덱스): bool}
+_memo = {}
+_memo_frame = None
+_memo_grid = None
+
+# 통계 (이번 실행 기준)
+_stats = {'queries': 0, 'memo_hits': 0, 'casts': 0, 'cells_visited': 0}
+
+
+def _cast(blocked, c0, r0, c1, r1):
+    """셀 (c0, r0) 중심에서 (c1, r1) 중심까지 벽 셀을 만나지 않으면 True (양 끝 셀 제외)"""
+    dc, dr = c1 - c0, r1 - r0
+    step_c = 1 if dc > 0 else -1
+    step_r = 1 if dr > 0 else -1
+    adc, adr = abs(dc), abs(dr)
+
+    # 셀 중심에서 출발하므로 첫 경계까지는 반 칸. 정수 비교를 위해 (2 * 칸 수) 단위로 계산
+    # t_c = (2 * i + 1) / (2 * adc), t_r = (2 * j + 1) / (2 * adr) -> 교차 비교는 분모를 곱해서
+    i = j = 0
+    col, row = c0, r0
+    visited = 0
+    while i < adc or j < adr:
+        # 다음 세로 경계(i)와 가로 경계(j) 중 먼저 만나는 쪽
+        lhs = (2 * i + 1) * adr
+        rhs = (2 * j + 1) * adc
+        if j >= adr or (i < adc and lhs < rhs):
+            col += step_c
+            i += 1
+        elif i >= adc or lhs > rhs:
+            row += step_r
+            j += 1
+        else:
+            # 정확히 모서리를 지남: 양옆 셀 중 하나라도 벽이면 막힘
+            if blocked[row][col + step_c] or blocked[row + step_r][col]:
+                _stats['cells_visited'] += visited + 2
+                return False
+            col += step_c
+            row += step_r
+            i += 1
+            j += 1
+        visited += 1
+        if (col, row) == (c1, r1):
+            break
+        if blocked[row][col]:
+            _stats['cells_visited'] += visited
+            return False
+    _stats['cells_visited'] += visited
+    return True
+
+
+def _frame_memo(grid):
+    global _memo, _memo_frame, _memo_grid
+    frame = framework.get_game_time()
+    if frame != _memo_frame or grid is not _memo_grid:
+        _memo = {}
+        _memo_frame = frame
+        _memo_grid = grid
+    return _memo
+
+
+def has_line_of_sight(x0, y0, x1, y1):
+    """
+    (x0, y0)에서 (x1, y1)이 벽에 가리지 않고 보이는지
+
+    Returns:
+        bool (격자가 없으면 항상 True)
+    """
+    _stats['queries'] += 1
+    grid = walkable_grid.get_current()
+    if grid is None:
+        return True
+
+    c0, r0 = grid.cell_of(x0, y0)
+    c1, r1 = grid.cell_of(x1, y1)
+    if not grid.in_bounds(c0, r0) or not grid.in_bounds(c1, r1):
+        # 맵 밖은 판정할 벽 정보가 없으므로 기존 동작(보임) 유지
+        return True
+    if (c0, r0) == (c1, r1):
+        return True
+
+    cols = grid.cols
+    key = (r0 * cols + c0, r1 * cols + c1)
+    memo = _frame_memo(grid)
+    result = memo.get(key)
+    if result is not None:
+        _stats['memo_hits'] += 1
+        return result
+
+    _stats['casts'] += 1
+    result = _cast(grid.blocked_rows(), c0, r0, c1, r1)
+    memo[key] = result
+    # 시야는 대칭이므로 반대 방향도 같은 결과
+    memo[(key[1], key[0])] = result
+    return result
+
+
+class SightLine:
+    """
+    몬스터 한 마리의 시야 캐시 (interval마다 한 번만 다시 판정)
+
+    Args:
+        interval: 재검사 간격(초)
+    """
+
+    def __init__(self, interval=CHECK_INTERVAL):
+        self.interval = interval
+        self.visible = False
+        self._next_check = 0.0
+        self._checked = False
+
+    def sees(self, x0, y0, x1, y1):
+        """
+        마지막 판정 결과 (재검사 시각이 지났으면 다시 판정)
+
+        Returns:
+            bool
+        """
+        now = framework.get_game_time()
+        if not self._checked:
+            # 첫 판정은 바로 하고, 다음 검사 시각을 흩어 여러 몬스터가 같은 프레임에 몰리지 않게 함
+            self.visible = has_line_of_sight(x0, y0, x1, y1)
+            self._next_check = now + random.uniform(0.0, self.interval)
+            self._checked = True
+        elif now >= self._next_check:
+            self.visible = has_line_of_sight(x0, y0, x1, y1)
+            self._next_check = now + self.interval
+        return self.visible
+
+    def invalidate(self):
+        """다음 sees()에서 바로 다시 판정"""
+        self._checked = False
+
+
+def stats():
+    """
+    통계
+
+    Returns:
+        dict: {'queries', 'memo_hits', 'casts', 'cells_visited', 'memo_size'}
+    """
+    result = dict(_stats)
+    result['memo_size'] = len(_memo)
+    return result
@@ -3,6 +3,7 @@
 
 import pico2d as p2
 import game_framework as framework
+from . import text_cache
 
 class LoadingScreen:
     """스테이지 로딩 화면 클래스"""
@@ -47,11 +48,11 @@ class LoadingScreen:
         font_path = 'resources/Fonts/pixelroborobo.otf'
         try:
             # 제목용 폰트 (큰 크기)
-            self.font_title = p2.load_font(font_path, 60)
+            self.font_title = text_cache.load_font(font_path, 60)
             # 부제목용 폰트 (중간 크기)
-            self.font_subtitle = p2.load_font(font_path, 40)
+            self.font_subtitle = text_cache.load_font(font_path, 40)
             # 팁용 폰트 (작은 크기)
-            self.font_tip = p2.load_font(font_path, 30)
+            self.font_tip = text_cache.load_font(font_path, 30)
             print(f"[LoadingScreen] 폰트 로드 완료: {font_path}")
         except Exception as e:
             print(f"\033[91m[LoadingScreen] 폰트 로드 실패: {e}\033[0m")
@@ -205,10 +206,9 @@ class LoadingScreen:
                 title_x = center_x - title_width // 2
                 title_y = center_y * 0.8
 
-                # 그림자 효과 (가독성 향상)
-                self.font_title.draw(title_x - 2, title_y - 2, title, (0, 0, 0))
-                # 실제 텍스트
-                self.font_title.draw(title_x, title_y, title, text_color)
+                # 그림자 효과 (가독성 향상) + 실제 텍스트
+                text_cache.draw_shadowed_text(self.font_title, title_x, title_y, title, text_color,
+                                              offsets=((-2, -2),))
 
             # 부제목 그리기 (제목 아래)
             if subtitle and self.font_subtitle:
@@ -217,10 +217,9 @@ class LoadingScreen:
                 subtitle_x = center_x - subtitle_width // 2
                 subtitle_y = center_y * 0.65
 
-                # 그림자 효과
-                self.font_subtitle.draw(subtitle_x - 2, subtitle_y - 2, subtitle, (0, 0, 0))
-                # 실제 텍스트
-                self.font_subtitle.draw(subtitle_x, subtitle_y, subtitle, text_color)
+                # 그림자 효과 + 실제 텍스트
+                text_cache.draw_shadowed_text(self.font_subtitle, subtitle_x, subtitle_y, subtitle, text_color,
+                                              offsets=((-2, -2),))
 
             # 팁 그리기 (부제목 아래)
             if tip and self.font_tip:
@@ -229,10 +228,9 @@ class LoadingScreen:
                 tip_x = center_x - tip_width // 2
                 tip_y = center_y * 0.5
 
-                # 그림자 효과
-                self.font_tip.draw(tip_x - 2, tip_y - 2, tip, (0, 0, 0))
-                # 실제 텍스트 (노란색으로 표시)
-                self.font_tip.draw(tip_x, tip_y, tip, (255, 255, 100))
+                # 그림자 효과 + 실제 텍스트 (노란색으로 표시)
+                text_cache.draw_shadowed_text(self.font_tip, tip_x, tip_y, tip, (255, 255, 100),
+                                              offsets=((-2, -2),))
 
     def handle_event(self, e):
         """이벤트 처리 (로딩 중에는 입력 무시)"""
@@ -8,6 +8,10 @@ from .player import Player
 from .ui_overlay import InventoryOverlay, HealthBar, ManaBar, BuffIndicatorUI
 from .cursor import Cursor
 from .loading_screen import LoadingScreen
+from . import asset_pack
+from . import depth_sort
+from . import static_layers
+from . import render_scale
 from . import defeat_mode
 # 사용할 스테이지 모듈들을 import 합니다.
 from .stages import stage_1, stage_2
@@ -82,6 +86,9 @@ class Camera:
 # Camera 객체를 전역으로 선언
 camera = None
 
+# 하늘 + 바닥을 미리 합성한 정적 배경 (static_layers.StaticLayer)
+static_background = None
+
 def calculate_background_bounds():
     """
     sky와 ground 레이어의 모든 배경 객체들의 실제 범위를 계산합니다.
@@ -129,7 +136,7 @@ def calculate_background_bounds():
     return (min_x, max_x, min_y, max_y)
 
 def enter():
-    global world, camera
+    global world, camera, static_background
     print("[lobby_mode] Starting enter()...")
 
     # clear existing
@@ -167,6 +174,14 @@ def enter():
     bg = LobbyBackGround()
     world['bg'].append(bg)
 
+    # 하늘과 바닥은 움직이지 않으므로 텍스처 한 장으로 미리 합성 (매 프레임 전체 화면 이미지 7장 -> 1장)
+    # 합성 범위 5785x4124 = 약 91MB (GPU 텍스처 크기 제한을 넘으면 타일로 나누고, 메모리 상한을 넘으면 원본을 그대로 그림)
+    try:
+        static_background = static_layers.get_layer('lobby', world['sky'] + world['ground'])
+    except Exception as ex:
+        print(f"\033[91m[lobby_mode] Static background composition failed: {ex}\033[0m")
+        static_background = None
+
     # 낭떠러지(투명 영역) 벽 자동 생성
     try:
         print("[DEBUG] wall_blocks 생성 시도 중...")
@@ -331,6 +346,9 @@ def enter():
 
 
 def exit():
+    global static_background
+    static_layers.clear('lobby')
+    static_background = None
     for k in list(world.keys()):
         try:
             if isinstance(world[k], list):
@@ -480,32 +498,19 @@ def draw():
 
     from .equipment import ShieldRangeEffect
 
-    # 하늘을 가장 먼저 그리기 (배경 뒤)
-    for obj in world['sky']:
-        if hasattr(obj, 'x') and hasattr(obj, 'y'):
-            if camera is not None:
-                draw_x, draw_y = camera.apply(obj.x, obj.y)
-            else:
-                draw_x, draw_y = obj.x, obj.y
-            if hasattr(obj, 'draw'):
-                obj.draw(draw_x, draw_y)
-        else:
-            if hasattr(obj, 'draw'):
-                obj.draw()
-
-    # 나머지 레이어들 (배경, 벽, 엔티티 등)
-    for layer in ['ground', 'walls', 'upper_ground', 'entities', 'effects_back', 'effects_front', 'extra_bg', 'extras']:
-        for obj in world[layer]:
-            # ShieldRangeEffect는 특별 처리 (플레이어 위치 기준)
-            if isinstance(obj, ShieldRangeEffect):
-                if hasattr(obj, 'player') and obj.player:
-                    if camera is not None:
-                        draw_x, draw_y = camera.apply(obj.player.x, obj.player.y)
-                    else:
-                        draw_x, draw_y = obj.player.x, obj.player.y
-                    if hasattr(obj, 'draw'):
-                        obj.draw(draw_x, draw_y)
-            elif hasattr(obj, 'x') and hasattr(obj, 'y'):
+    # 렌더 스케일이 1 미만이면 월드는 내부 해상도 타깃에 그린 뒤 확대
+    render_scale.begin()
+
+    # 그리는 중 예외가 나도 렌더 스케일 타깃을 해제 (UI가 내부 해상도 타깃에 그려지지 않도록)
+    try:
+        # 합성된 정적 배경(하늘 + 바닥)이 있으면 한 장만 그리고 원본 객체는 건너뜀
+        static_drawn = static_background is not None and static_background.draw(camera)
+
+        # 하늘을 가장 먼저 그리기 (배경 뒤)
+        for obj in world['sky']:
+            if static_drawn and static_background.contains(obj):
+                continue
+            if hasattr(obj, 'x') and hasattr(obj, 'y'):
                 if camera is not None:
                     draw_x, draw_y = camera.apply(obj.x, obj.y)
                 else:
@@ -515,6 +520,37 @@ def draw():
             else:
                 if hasattr(obj, 'draw'):
                     obj.draw()
+
+        # 엔티티는 발 위치 Y 기준으로 뒤 -> 앞 순서 유지 (거의 정렬된 상태라 O(n)에 가까움)
+        depth_sort.sort_by_depth(world['entities'])
+
+        # 나머지 레이어들 (배경, 벽, 엔티티 등)
+        for layer in ['ground', 'walls', 'upper_ground', 'entities', 'effects_back', 'effects_front', 'extra_bg', 'extras']:
+            for obj in world[layer]:
+                if static_drawn and static_background.contains(obj):
+                    continue
+                # ShieldRangeEffect는 특별 처리 (플레이어 위치 기준)
+                if isinstance(obj, ShieldRangeEffect):
+                    if hasattr(obj, 'player') and obj.player:
+                        if camera is not None:
+                            draw_x, draw_y = camera.apply(obj.player.x, obj.player.y)
+                        else:
+                            draw_x, draw_y = obj.player.x, obj.player.y
+                        if hasattr(obj, 'draw'):
+                            obj.draw(draw_x, draw_y)
+                elif hasattr(obj, 'x') and hasattr(obj, 'y'):
+                    if camera is not None:
+                        draw_x, draw_y = camera.apply(obj.x, obj.y)
+                    else:
+                        draw_x, draw_y = obj.x, obj.y
+                    if hasattr(obj, 'draw'):
+                        obj.draw(draw_x, draw_y)
+                else:
+                    if hasattr(obj, 'draw'):
+                        obj.draw()
+    finally:
+        render_scale.end()
+
     # UI, cursor 등은 카메라 적용하지 않음
     for obj in world['ui']:
         if hasattr(obj, 'draw'):
@@ -734,7 +770,7 @@ class LobbyWall:
 def generate_walls_from_png(png_path, block_size=16, bg_x=None, bg_y=None, scale=1.0):
     print(f"[DEBUG] generate_walls_from_png 시작: {png_path}, block_size={block_size}, bg_x={bg_x}, bg_y={bg_y}, scale={scale}")
     try:
-        img = Image.open(png_path).convert('RGBA')
+        img = Image.open(asset_pack.open_binary(png_path)).convert('RGBA')
     except Exception as ex:
         print(f"[DEBUG] 이미지 열기 실패: {ex}")
         return []
@@ -1,7 +1,17 @@
-import pico2d as p2
 from ...behavior_tree import BehaviorTree
+from ... import sound_bank
 import game_framework as framework
-import math
+from ... import animation_clips
+from ... import coroutine
+from ...coroutine import wait
+from ... import bullet_patterns
+
+# 120도 부채꼴 7발 (플레이어 조준, 2단 모두 같은 모양)
+THROWING_STAR_FAN = bullet_patterns.compile_pattern({
+    'aimed': True,
+    'speed': 350,
+    'shapes': [{'arc': 120, 'count': 7}],
+}, 'Pattern1 fan')
 
 class AttackPattern1Action:
     """
@@ -18,6 +28,8 @@ class AttackPattern1Action:
     # 클래스 레벨 이미지 시퀀스
     motion_img_seq = []  # PantherAssassin_Shuriken00~16.png (17개)
     fx_img_seq = []      # PantherAssassin_ShurikenFX00~08.png (9개)
+    motion_clip = None   # AnimationClip 'shuriken'
+    fx_clip = None       # AnimationClip 'shuriken_fx'
 
     def __init__(self, panther):
         """
@@ -25,120 +37,47 @@ class AttackPattern1Action:
             panther: PantherAssassin 인스턴스 참조
         """
         self.panther = panther
-        self.phase = 0
-        self.timer = 0.0
+        self.phase = 0  # 0: 대기, 1: 1단 모션, 2: 2단 대기, 3: 2단 모션, 4: 종료 (draw/보스 draw에서 사용)
         # 표창 투척 관련 변수
         self.shot_count = 0  # 현재 투척 단계 (1단, 2단)
         self.max_shots = 2  # 총 투척 단계
         self.shot_interval = 0.25  # 투척 간격
-        self.spread_angle = 120  # 방사형 각도
-        self.projectiles_per_shot = 7  # 한 번에 발사하는 표창 개수
+        self.bullet_pattern = THROWING_STAR_FAN  # 방사형 각도/개수/속도 (모듈 상단 정의)
 
         # 애니메이션 관련
         self.motion_frame = 0
-        self.motion_frame_timer = 0.0
         self.motion_frame_speed = 20.0  # 초당 프레임 수
         self.motion_total_frames = 17  # 0~16
         self.throw_frame = 9  # 9번 프레임에서 표창 발사
-        self.has_thrown = False  # 현재 애니메이션에서 이미 던졌는지 체크
-
-        # 사운드 로드
-        try:
-            self.throw_shuriken_sound = p2.load_wav('resources/Sounds/Throw_Shuriken.wav')
-            self.throw_shuriken_sound.set_volume(32)  # 볼륨 설정 (0~128)
-            print("[Pattern1] Throw_Shuriken.wav 사운드 로드 완료")
-        except Exception as e:
-            print(f"\033[91m[Pattern1] 사운드 로드 실패: {e}\033[0m")
-            self.throw_shuriken_sound = None
-
-        # 이미지 로드 (클래스 레벨에서 한 번만)
+
+        # 패턴 진행은 코루틴으로 (update는 매 프레임 실행기만 진행)
+        self.runner = coroutine.Scheduler()
+        self.task = None
+
+        # 이미지 로드 (클래스 레벨에서 한 번만, resources/Animations/panther_assassin.json 매니페스트)
         if not AttackPattern1Action.motion_img_seq:
-            try:
-                # 캐릭터 모션 이미지 로드 (0~16)
-                for i in range(17):
-                    img_path = f'resources/Texture_organize/Entity/Stage2_Forest_Boss/Panther_Assassin/Character/PantherAssassin_Shuriken{i:02d}.png'
-                    img = p2.load_image(img_path)
-                    AttackPattern1Action.motion_img_seq.append(img)
-                print(f'[Pattern1] 캐릭터 모션 이미지 로드 완료: {len(AttackPattern1Action.motion_img_seq)}개')
-
-                # 이펙트 이미지 로드 (0~8)
-                for i in range(9):
-                    fx_path = f'resources/Texture_organize/Entity/Stage2_Forest_Boss/Panther_Assassin/FX/PantherAssassin_ShurikenFX{i:02d}.png'
-                    fx_img = p2.load_image(fx_path)
-                    AttackPattern1Action.fx_img_seq.append(fx_img)
-                print(f'[Pattern1] 이펙트 이미지 로드 완료: {len(AttackPattern1Action.fx_img_seq)}개')
-            except FileNotFoundError as e:
-                print(f'\033[91m[Pattern1] 이미지 로드 실패: {e}\033[0m')
+            AttackPattern1Action.motion_clip = animation_clips.get_clip('panther_assassin', 'shuriken')
+            AttackPattern1Action.fx_clip = animation_clips.get_clip('panther_assassin', 'shuriken_fx')
+            if AttackPattern1Action.motion_clip:
+                AttackPattern1Action.motion_img_seq = AttackPattern1Action.motion_clip.frames
+            if AttackPattern1Action.fx_clip:
+                AttackPattern1Action.fx_img_seq = AttackPattern1Action.fx_clip.frames
+
+        # 재생 속도/길이는 매니페스트 값 사용
+        if AttackPattern1Action.motion_clip:
+            self.motion_frame_speed = AttackPattern1Action.motion_clip.fps
+            self.motion_total_frames = AttackPattern1Action.motion_clip.frame_count
 
     def update(self):
-        """패턴 1 로직 실행"""
-        dt = framework.get_delta_time()
-
-        if self.phase == 0:
-            # 초기화: 1단계 애니메이션 시작
-            self.shot_count = 0
-            self.timer = 0.0
-            self.motion_frame = 0
-            self.motion_frame_timer = 0.0
-            self.has_thrown = False
-            self.phase = 1
-            print("[Pattern1] 1단계 애니메이션 시작!")
-
-        elif self.phase == 1:
-            # 1단계: 애니메이션 재생 및 9번 프레임에서 표창 발사
-            self.motion_frame_timer += dt
-
-            if self.motion_frame_timer >= 1.0 / self.motion_frame_speed:
-                self.motion_frame += 1
-                self.motion_frame_timer = 0.0
-
-                # 9번 프레임에 도달하면 표창 발사
-                if self.motion_frame == self.throw_frame and not self.has_thrown:
-                    self._shoot_shurikens()
-                    self.has_thrown = True
-                    self.shot_count = 1
-                    print("[Pattern1] 1단계 표창 발사!")
-
-                # 애니메이션 종료 (16번 프레임까지)
-                if self.motion_frame >= self.motion_total_frames:
-                    self.timer = 0.0
-                    self.phase = 2
-                    print("[Pattern1] 1단계 완료, 2단계 대기")
+        """패턴 1 로직 실행 (코루틴 진행)"""
+        if self.task is None:
+            self.task = self.runner.start(self._pattern(), 'Pattern1')
 
-        elif self.phase == 2:
-            # 2단계 표창 발사 대기
-            self.timer += dt
-
-            if self.timer >= self.shot_interval:
-                # 2단계 애니메이션 시작
-                self.motion_frame = 0
-                self.motion_frame_timer = 0.0
-                self.has_thrown = False
-                self.phase = 3
-                print("[Pattern1] 2단계 애니메이션 시작!")
-
-        elif self.phase == 3:
-            # 2단계: 애니메이션 재생 및 9번 프레임에서 표창 발사
-            self.motion_frame_timer += dt
-
-            if self.motion_frame_timer >= 1.0 / self.motion_frame_speed:
-                self.motion_frame += 1
-                self.motion_frame_timer = 0.0
-
-                # 9번 프레임에 도달하면 표창 발사
-                if self.motion_frame == self.throw_frame and not self.has_thrown:
-                    self._shoot_shurikens()
-                    self.has_thrown = True
-                    self.shot_count = 2
-                    print("[Pattern1] 2단계 표창 발사!")
-
-                # 애니메이션 종료 (16번 프레임까지)
-                if self.motion_frame >= self.motion_total_frames:
-                    self.phase = 4
-                    print("[Pattern1] 2단계 완료")
-
-        elif self.phase == 4:
+        self.runner.update(framework.get_delta_time())
+
+        if self.task.done:
             # 패턴 완료
+            self.task = None
             self.phase = 0
             self.panther.attack_timer = self.panther.attack_cooldown
             print("[Pattern1] 패턴 완료!")
@@ -146,48 +85,60 @@ class AttackPattern1Action:
 
         return BehaviorTree.RUNNING
 
+    def _pattern(self):
+        """패턴 1 진행 순서"""
+        self.shot_count = 0
+
+        self.phase = 1
+        print("[Pattern1] 1단계 애니메이션 시작!")
+        yield from self._throw_motion(1)
+        print("[Pattern1] 1단계 완료, 2단계 대기")
+
+        # 2단계 표창 발사 대기 (마지막 프레임 유지)
+        self.phase = 2
+        yield wait(self.shot_interval)
+
+        self.phase = 3
+        print("[Pattern1] 2단계 애니메이션 시작!")
+        yield from self._throw_motion(2)
+        print("[Pattern1] 2단계 완료")
+
+        # 종료 프레임 한 번 쉬고 완료
+        self.phase = 4
+        yield
+
+    def _throw_motion(self, shot):
+        """투척 모션 재생, throw_frame에서 표창 발사"""
+        self.motion_frame = 0
+        frame_time = 1.0 / self.motion_frame_speed
+        while self.motion_frame < self.motion_total_frames:
+            yield wait(frame_time)
+            self.motion_frame += 1
+
+            # 9번 프레임에 도달하면 표창 발사
+            if self.motion_frame == self.throw_frame:
+                self._shoot_shurikens()
+                self.shot_count = shot
+                print(f"[Pattern1] {shot}단계 표창 발사!")
+
     def _shoot_shurikens(self):
-        """플레이어를 향해 180도 범위 내에 9개의 표창을 방사형으로 발사"""
+        """플레이어를 향해 120도 범위 내에 7개의 표창을 방사형으로 발사"""
         if not self.panther.target:
             return
 
         # 수리검 투척 사운드 재생
-        if self.throw_shuriken_sound:
-            self.throw_shuriken_sound.play()
-
-        # 플레이어를 향한 기본 각도 계산
-        dx = self.panther.target.x - self.panther.x
-        dy = self.panther.target.y - self.panther.y
-        base_angle = math.atan2(dy, dx)
-
-        # 방사형으로 표창 발사
-        for i in range(self.projectiles_per_shot):
-            # 180도를 9개로 나누어 각도 계산 (중앙을 기준으로 -90도 ~ +90도)
-            offset_angle = (i - (self.projectiles_per_shot - 1) / 2) * (math.radians(self.spread_angle) / (self.projectiles_per_shot - 1))
-            angle = base_angle + offset_angle
-
-            # 표창의 목표 지점 계산 (멀리 날아가도록)
-            distance = 1000  # 충분히 먼 거리
-            target_x = self.panther.x + math.cos(angle) * distance
-            target_y = self.panther.y + math.sin(angle) * distance
-
-            # 표창 생성
-            from ..panther_assassin import PantherThrowingStar
-            shuriken = PantherThrowingStar(
-                self.panther.x,
-                self.panther.y,
-                target_x,
-                target_y,
-                speed=350,
-                from_player=False,
-                damage=20,
-                scale=2.5
-            )
-
-            # world의 effects_front 레이어에 추가
-            if self.panther.world and 'effects_front' in self.panther.world:
-                self.panther.world['effects_front'].append(shuriken)
-                print(f"[Pattern1] 표창 world 레이어에 추가: ({int(self.panther.x)}, {int(self.panther.y)}) -> ({int(target_x)}, {int(target_y)})")
+        sound_bank.play('throw_shuriken')
+
+        # 플레이어를 향한 방향 (이번 틱에 블랙보드가 계산한 값 공유)
+        aim = self.panther.blackboard.get('target_direction')
+
+        # 방사형으로 표창 발사 (world의 effects_front 레이어에 한 번에 추가)
+        from ..panther_assassin import PantherThrowingStar
+        layer = self.panther.world.get('effects_front') if self.panther.world else None
+        stars = bullet_patterns.emit(self.bullet_pattern, self.panther.x, self.panther.y, PantherThrowingStar, layer,
+                                     aim=aim, from_player=False, damage=20, scale=2.5)
+        if layer is not None:
+            print(f"[Pattern1] 표창 {len(stars)}개 world 레이어에 추가: ({int(self.panther.x)}, {int(self.panther.y)})")
 
     def draw(self, draw_x, draw_y):
         """
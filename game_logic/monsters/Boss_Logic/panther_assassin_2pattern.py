@@ -3,6 +3,9 @@ from ...behavior_tree import BehaviorTree
 import game_framework as framework
 import random
 import math
+from ... import animation_clips
+from ... import sound_bank
+from ... import walkable_grid
 
 class AttackPattern2Action:
     """
@@ -39,10 +42,7 @@ class AttackPattern2Action:
     stealth_img_seq = []  # Die 모션 (은신용)
     dash_img_seq = []     # BladeAttack 0~7 (돌진)
     swing_img_seq = []    # BladeAttack 8~17 (휘두르기)
-
-    # 클래스 레벨 사운드
-    dash_sound_1 = None
-    dash_sound_2 = None
+    clips = {}            # {'stealth'|'dash'|'swing': AnimationClip}
 
     def __init__(self, panther):
         """
@@ -98,43 +98,19 @@ class AttackPattern2Action:
         self.swing_fx_frame_speed = 20.0  # 초당 프레임 수
         self.swing_fx_total_frames = 8    # 0~7 (총 8프레임)
 
-        # 이미지 로드 (클래스 레벨에서 한 번만)
+        # 이미지 로드 (클래스 레벨에서 한 번만, resources/Animations/panther_assassin.json 매니페스트)
         if not AttackPattern2Action.stealth_img_seq:
-            try:
-                # 은신 모션 이미지 로드 (Die 0~10)
-                for i in range(11):
-                    img_path = f'resources/Texture_organize/Entity/Stage2_Forest_Boss/Panther_Assassin/Character/PantherAssassin_Die{i:02d}.png'
-                    img = p2.load_image(img_path)
-                    AttackPattern2Action.stealth_img_seq.append(img)
-                print(f'[Pattern2] 은신 모션 이미지 로드 완료: {len(AttackPattern2Action.stealth_img_seq)}개')
-
-                # 돌진 모션 이미지 로드 (BladeAttack 0~7)
-                for i in range(8):
-                    img_path = f'resources/Texture_organize/Entity/Stage2_Forest_Boss/Panther_Assassin/Character/PantherAssassin_BladeAttack{i:02d}.png'
-                    img = p2.load_image(img_path)
-                    AttackPattern2Action.dash_img_seq.append(img)
-                print(f'[Pattern2] 돌진 모션 이미지 로드 완료: {len(AttackPattern2Action.dash_img_seq)}개')
-
-                # 휘두르기 모션 이미지 로드 (BladeAttack 8~17)
-                for i in range(8, 18):
-                    img_path = f'resources/Texture_organize/Entity/Stage2_Forest_Boss/Panther_Assassin/Character/PantherAssassin_BladeAttack{i:02d}.png'
-                    img = p2.load_image(img_path)
-                    AttackPattern2Action.swing_img_seq.append(img)
-                print(f'[Pattern2] 휘두르기 모션 이미지 로드 완료: {len(AttackPattern2Action.swing_img_seq)}개')
-
-            except FileNotFoundError as e:
-                print(f'\033[91m[Pattern2] 이미지 로드 실패: {e}\033[0m')
-
-        # 사운드 로드 (클래스 레벨에서 한 번만)
-        if AttackPattern2Action.dash_sound_1 is None:
-            try:
-                AttackPattern2Action.dash_sound_1 = p2.load_wav('resources/Sounds/Dash_Attack_1.wav')
-                AttackPattern2Action.dash_sound_1.set_volume(64)
-                AttackPattern2Action.dash_sound_2 = p2.load_wav('resources/Sounds/Dash_Attack_2.wav')
-                AttackPattern2Action.dash_sound_2.set_volume(64)
-                print(f'[Pattern2] 돌진 사운드 로드 완료 (Dash_Attack_1~2.wav)')
-            except Exception as e:
-                print(f'\033[91m[Pattern2] 사운드 로드 실패: {e}\033[0m')
+            for attr, clip_name in (('stealth', 'stealth'), ('dash', 'blade_dash'), ('swing', 'blade_swing')):
+                clip = animation_clips.get_clip('panther_assassin', clip_name)
+                AttackPattern2Action.clips[attr] = clip
+                if clip:
+                    setattr(AttackPattern2Action, f'{attr}_img_seq', clip.frames)
+
+        # 재생 속도/길이는 매니페스트 값 사용
+        for attr, clip in AttackPattern2Action.clips.items():
+            if clip:
+                setattr(self, f'{attr}_frame_speed', clip.fps)
+                setattr(self, f'{attr}_total_frames', clip.frame_count)
 
     def update(self):
         """패턴 2 로직 실행"""
@@ -168,6 +144,8 @@ class AttackPattern2Action:
             # 텔레포트 실행 (순간 이동)
             self.panther.x = self.teleport_x
             self.panther.y = self.teleport_y
+            # 위치가 바뀌었으므로 이번 틱의 거리/각도 캐시를 비움
+            self.panther.blackboard.invalidate()
 
             # 돌진 준비
             self._prepare_dash()
@@ -274,6 +252,16 @@ class AttackPattern2Action:
             self.teleport_y = self.panther.y
             return
 
+        # 스테이지 격자가 있으면 플레이어 주변 고리 안의 빈 셀에서 바로 선택
+        grid = walkable_grid.get_current()
+        if grid is not None:
+            point = grid.random_point_in_annulus(self.panther.target.x, self.panther.target.y,
+                                                 self.teleport_distance - 20, self.teleport_distance + 20,
+                                                 clearance=30)
+            if point is not None:
+                self.teleport_x, self.teleport_y = point
+                return
+
         # 벽이 아닌 유효한 위치를 찾을 때까지 시도
         max_attempts = 20
         for attempt in range(max_attempts):
@@ -312,6 +300,11 @@ class AttackPattern2Action:
         if not self.panther.world or 'walls' not in self.panther.world:
             return False
 
+        # 스테이지 격자가 있으면 주변 셀만 확인 (모든 벽 순회 생략)
+        grid = walkable_grid.get_current()
+        if grid is not None:
+            return not grid.is_walkable(x, y, check_radius)
+
         walls = self.panther.world['walls']
         for wall in walls:
             # 벽과의 충돌 체크 (보스의 크기를 고려하여 check_radius만큼 여유 공간 확보)
@@ -334,9 +327,9 @@ class AttackPattern2Action:
             self.dash_target_y = self.panther.y + math.sin(rad) * distance
         else:
             # 플레이어까지의 거리의 1.5배 지점으로 돌진
-            dx = self.panther.target.x - self.panther.x
-            dy = self.panther.target.y - self.panther.y
-            distance = math.sqrt(dx**2 + dy**2)
+            blackboard = self.panther.blackboard
+            dx, dy = blackboard.get('target_delta')
+            distance = blackboard.get('target_distance')
 
             if distance > 0:
                 # 정규화된 방향 벡터
@@ -355,10 +348,7 @@ class AttackPattern2Action:
                 self.dash_target_y = self.panther.y + math.sin(rad) * 300
 
         # 돌진 사운드 재생 (랜덤으로 1 또는 2)
-        if AttackPattern2Action.dash_sound_1 and AttackPattern2Action.dash_sound_2:
-            dash_sound = random.choice([AttackPattern2Action.dash_sound_1, AttackPattern2Action.dash_sound_2])
-            dash_sound.play()
-            print(f"[Pattern2] 돌진 사운드 재생")
+        sound_bank.play_random(('dash_attack_1', 'dash_attack_2'))
 
         # 돌진 변수 초기화
         self.dash_progress = 0.0
@@ -1,8 +1,18 @@
 import pico2d as p2
 from ...behavior_tree import BehaviorTree
+from ... import sound_bank
+from ... import walkable_grid
 import game_framework as framework
 import math
 import random
+from ... import bullet_patterns
+
+# 콤보3 수리검: 8방향 원형 (월드 기준 0도부터 45도 간격)
+COMBO3_RING = bullet_patterns.compile_pattern({
+    'aimed': False,
+    'speed': 600,
+    'shapes': [{'ring': 8, 'start': 0}],
+}, 'Pattern3 combo3 ring')
 
 class AttackPattern3Action:
     """
@@ -48,11 +58,6 @@ class AttackPattern3Action:
     combo3_attack_img_seq = []   # Combo3_Attack 0~9 (10프레임)
     combo3_swing_fx_img_seq = []  # Combo3 수리검 발사 이펙트 0~3 (4프레임) - 대미지 없음
 
-    # 클래스 레벨 사운드
-    combo1_sound = None  # Dash_Attack_1.wav
-    combo2_sound = None  # Dash_Attack_2.wav
-    combo3_sound = None  # Throw_Shuriken.wav
-
     def __init__(self, panther):
         """
         Args:
@@ -122,8 +127,7 @@ class AttackPattern3Action:
         self.combo3_shuriken_thrown = False  # 수리검 발사 완료 플래그
         self.combo3_shoot_frame = 5  # 5번 프레임에서 수리검 발사
         self.combo3_has_shot = False  # 수리검을 이미 발사했는지
-        self.combo3_projectile_directions = 8  # 8방향
-        self.combo3_projectile_speed = 600  # 수리검 속도
+        self.combo3_bullet_pattern = COMBO3_RING  # 8방향, 속도 600 (모듈 상단 정의)
 
         # 콤보3 수리검 발사 이펙트 관련 변수
         self.combo3_fx_frame = 0
@@ -194,23 +198,6 @@ class AttackPattern3Action:
             except FileNotFoundError as e:
                 print(f'\033[91m[Pattern3] 이미지 로드 실패: {e}\033[0m')
 
-        # 사운드 로드 (클래스 레벨에서 한 번만)
-        if AttackPattern3Action.combo1_sound is None:
-            try:
-                AttackPattern3Action.combo1_sound = p2.load_wav('resources/Sounds/Dash_Attack_1.wav')
-                AttackPattern3Action.combo1_sound.set_volume(64)  # 볼륨 조절 (0~128)
-                print(f'[Pattern3] 콤보1 사운드 로드 완료')
-
-                AttackPattern3Action.combo2_sound = p2.load_wav('resources/Sound/Dash_Attack_2.wav')
-                AttackPattern3Action.combo2_sound.set_volume(64)
-                print(f'[Pattern3] 콤보2 사운드 로드 완료')
-
-                AttackPattern3Action.combo3_sound = p2.load_wav('resources/Sound/Throw_Shuriken.wav')
-                AttackPattern3Action.combo3_sound.set_volume(64)
-                print(f'[Pattern3] 콤보3 사운드 로드 완료')
-
-            except Exception as e:
-                print(f'\033[91m[Pattern3] 사운드 로드 실패: {e}\033[0m')
 
     def update(self):
         """패턴 3 로직 실행"""
@@ -239,9 +226,7 @@ class AttackPattern3Action:
                     # 돌진 준비
                     self._prepare_combo1_dash()
                     # 콤보1 사운드 재생
-                    if AttackPattern3Action.combo1_sound:
-                        AttackPattern3Action.combo1_sound.play()
-                        print("[Pattern3] 콤보1 사운드 재생 (Dash_Attack_1.wav)")
+                    sound_bank.play('dash_attack_1')
                     self.phase = 2
                     print("[Pattern3] 콤보1 준비 완료 - 돌진 시작!")
 
@@ -315,9 +300,7 @@ class AttackPattern3Action:
                     # 돌진 준비
                     self._prepare_combo2_dash()
                     # 콤보2 사운드 재생
-                    if AttackPattern3Action.combo2_sound:
-                        AttackPattern3Action.combo2_sound.play()
-                        print("[Pattern3] 콤보2 사운드 재생 (Dash_Attack_2.wav)")
+                    sound_bank.play('dash_attack_2')
                     self.phase = 4
                     print("[Pattern3] 콤보2 준비 완료 - 돌진 시작!")
 
@@ -420,9 +403,7 @@ class AttackPattern3Action:
                 if self.combo3_attack_frame == self.combo3_shoot_frame and not self.combo3_has_shot:
                     self._shoot_combo3_shurikens()
                     # 콤보3 사운드 재생
-                    if AttackPattern3Action.combo3_sound:
-                        AttackPattern3Action.combo3_sound.play()
-                        print("[Pattern3] 콤보3 사운드 재생 (Throw_Shuriken.wav)")
+                    sound_bank.play('throw_shuriken', volume=64)
                     self.combo3_has_shot = True
                     self.combo3_show_fx = True  # 이펙트 표시 시작
                     print("[Pattern3] 콤보3 수리검 8방향 발사!")
@@ -462,9 +443,9 @@ class AttackPattern3Action:
             self.combo1_dash_target_y = self.panther.y + math.sin(rad) * distance
         else:
             # 플레이어까지의 거리의 1배 지점으로 돌진
-            dx = self.panther.target.x - self.panther.x
-            dy = self.panther.target.y - self.panther.y
-            distance = math.sqrt(dx**2 + dy**2)
+            blackboard = self.panther.blackboard
+            dx, dy = blackboard.get('target_delta')
+            distance = blackboard.get('target_distance')
 
             if distance > 0:
                 # 정규화된 방향 벡터
@@ -549,9 +530,9 @@ class AttackPattern3Action:
             self.combo2_dash_target_y = self.panther.y + math.sin(rad) * distance
         else:
             # 플레이어까지의 거리의 1.5배 지점으로 돌진
-            dx = self.panther.target.x - self.panther.x
-            dy = self.panther.target.y - self.panther.y
-            distance = math.sqrt(dx**2 + dy**2)
+            blackboard = self.panther.blackboard
+            dx, dy = blackboard.get('target_delta')
+            distance = blackboard.get('target_distance')
 
             if distance > 0:
                 # 정규화된 방향 벡터
@@ -629,33 +610,11 @@ class AttackPattern3Action:
             print("[Pattern3] world가 없어서 수리검 발사 실패")
             return
 
-        # 8방향으로 수리검 발사
-        for i in range(self.combo3_projectile_directions):
-            # 360도를 8개로 나누어 각도 계산
-            angle = (360 / self.combo3_projectile_directions) * i
-            rad = math.radians(angle)
-
-            # 수리검의 목표 지점 계산 (멀리 날아가도록)
-            distance = 1000  # 충분히 먼 거리
-            target_x = self.panther.x + math.cos(rad) * distance
-            target_y = self.panther.y + math.sin(rad) * distance
-
-            # 수리검 생성
-            from ..panther_assassin import PantherShuriken
-            shuriken = PantherShuriken(
-                self.panther.x,
-                self.panther.y,
-                target_x,
-                target_y,
-                speed=self.combo3_projectile_speed,
-                from_player=False,
-                damage=20,
-                scale=2.5
-            )
-
-            # world의 effects_front 레이어에 추가
-            self.panther.world['effects_front'].append(shuriken)
-            print(f"[Pattern3] 콤보3 수리검 발사: 각도 {angle:.0f}도")
+        # 8방향으로 수리검 발사 (world의 effects_front 레이어에 한 번에 추가)
+        from ..panther_assassin import PantherShuriken
+        shurikens = bullet_patterns.emit(self.combo3_bullet_pattern, self.panther.x, self.panther.y, PantherShuriken,
+                                         self.panther.world['effects_front'], from_player=False, damage=20, scale=2.5)
+        print(f"[Pattern3] 콤보3 수리검 {len(shurikens)}방향 발사")
 
     def _is_position_on_wall(self, x, y, check_radius=30):
         """
@@ -670,6 +629,11 @@ class AttackPattern3Action:
         if not self.panther.world or 'walls' not in self.panther.world:
             return False
 
+        # 스테이지 격자가 있으면 주변 셀만 확인 (모든 벽 순회 생략)
+        grid = walkable_grid.get_current()
+        if grid is not None:
+            return not grid.is_walkable(x, y, check_radius)
+
         walls = self.panther.world['walls']
         for wall in walls:
             # 벽과의 충돌 체크 (보스의 크기를 고려하여 check_radius만큼 여유 공간 확보)
@@ -3,6 +3,8 @@ import random
 import math
 import game_framework as framework
 from ...behavior_tree import BehaviorTree
+from ... import sound_bank
+from ... import walkable_grid
 
 class AttackPattern4Action:
     """
@@ -66,15 +68,6 @@ class AttackPattern4Action:
         self.teleport_target_x = 0  # 텔레포트 목표 위치 X
         self.teleport_target_y = 0  # 텔레포트 목표 위치 Y
 
-        # 사운드 로드
-        try:
-            self.throw_shuriken_sound = p2.load_wav('resources/Sounds/Throw_Shuriken.wav')
-            self.throw_shuriken_sound.set_volume(32)  # 볼륨 설정 (0~128)
-            print("[Pattern4] Throw_Shuriken.wav 사운드 로드 완료")
-        except Exception as e:
-            print(f"\033[91m[Pattern4] 사운드 로드 실패: {e}\033[0m")
-            self.throw_shuriken_sound = None
-
         # 이미지 로드
         self._load_images()
 
@@ -108,10 +101,7 @@ class AttackPattern4Action:
                     img = p2.load_image(img_path)
                     self.original_images['throw_1st'].append(img)
 
-                    # 경로 등록 후 어두운 버전 생성 (panther_assassin과 동일한 방식)
                     iam.register_image_path(img, img_path)
-                    clone_img = iam.make_dark(img, darkness=0.25)
-                    self.clone_images['throw_1st'].append(clone_img)
                 except Exception as e:
                     print(f"\033[91m[Pattern4._load_images] Throw_1st{i:02d}.png 로드 실패: {e}\033[0m")
                     import traceback
@@ -124,10 +114,7 @@ class AttackPattern4Action:
                     img = p2.load_image(img_path)
                     self.original_images['throw_2nd'].append(img)
 
-                    # 경로 등록 후 어두운 버전 생성
                     iam.register_image_path(img, img_path)
-                    clone_img = iam.make_dark(img, darkness=0.25)
-                    self.clone_images['throw_2nd'].append(clone_img)
                 except Exception as e:
                     print(f"\033[91m[Pattern4._load_images] Throw_2nd{i:02d}.png 로드 실패: {e}\033[0m")
                     import traceback
@@ -140,10 +127,7 @@ class AttackPattern4Action:
                     img = p2.load_image(img_path)
                     self.original_images['move'].append(img)
 
-                    # 경로 등록 후 어두운 버전 생성
                     iam.register_image_path(img, img_path)
-                    clone_img = iam.make_dark(img, darkness=0.25)
-                    self.clone_images['move'].append(clone_img)
                 except Exception as e:
                     print(f"\033[91m[Pattern4._load_images] Move{i:02d}.png 로드 실패: {e}\033[0m")
                     import traceback
@@ -156,15 +140,18 @@ class AttackPattern4Action:
                     img = p2.load_image(img_path)
                     self.original_images['stealth'].append(img)
                     
-                    # 분신용 Die 애니메이션도 어두운 버전으로 생성
                     iam.register_image_path(img, img_path)
-                    clone_die_img = iam.make_dark(img, darkness=0.25)
-                    self.clone_images['die'].append(clone_die_img)
                 except Exception as e:
                     print(f"\033[91m[Pattern4._load_images] Die{i:02d}.png (은신 모션) 로드 실패: {e}\033[0m")
                     import traceback
                     traceback.print_exc()
 
+            # 분신용 어두운 버전은 애니메이션 단위로 한 번에 생성 (프레임 묶음 배열 연산)
+            clone_sources = {'throw_1st': 'throw_1st', 'throw_2nd': 'throw_2nd', 'move': 'move', 'die': 'stealth'}
+            for clone_key, source_key in clone_sources.items():
+                self.clone_images[clone_key] = iam.batch_process_images(
+                    self.original_images[source_key], 'brightness', 0.25)
+
             print(f"[Pattern4._load_images] 원본 이미지 로드 결과 - "
                   f"Throw1st: {len(self.original_images['throw_1st'])}개, "
                   f"Throw2nd: {len(self.original_images['throw_2nd'])}개, "
@@ -284,8 +271,7 @@ class AttackPattern4Action:
                     if self.shot_count < self.max_shots:
                         try:
                             # 수리검 투척 사운드 재생
-                            if self.throw_shuriken_sound:
-                                self.throw_shuriken_sound.play()
+                            sound_bank.play('throw_shuriken')
 
                             # 각 분신에서 수리검 발사
                             for clone in self.clones:
@@ -322,27 +308,34 @@ class AttackPattern4Action:
                 if self.shot_count >= self.max_shots:
                     # 본체 텔레포트 목표 위치 계산 (플레이어 주위 랜덤 위치, 벽 체크)
                     if self.panther.target:
-                        # 벽이 아닌 유효한 위치를 찾을 때까지 시도
-                        max_attempts = 20
-                        found_valid_position = False
-
-                        for attempt in range(max_attempts):
-                            angle = random.uniform(0, 360)
-                            rad = math.radians(angle)
-                            distance = random.uniform(100, 200)  # 플레이어로부터 거리
-
-                            teleport_x = self.panther.target.x + math.cos(rad) * distance
-                            teleport_y = self.panther.target.y + math.sin(rad) * distance
-
-                            # 벽이 아닌 위치를 찾으면 사용
-                            if not self._is_position_on_wall(teleport_x, teleport_y, check_radius=30):
-                                self.teleport_target_x = teleport_x
-                                self.teleport_target_y = teleport_y
-                                found_valid_position = True
-                                break
-
-                            if attempt % 5 == 0 and attempt > 0:
-                                print(f"[Pattern4] 텔레포트 위치 재계산 중... (시도 {attempt + 1}/{max_attempts})")
+                        # 스테이지 격자가 있으면 플레이어 주변 고리(100~200) 안의 빈 셀에서 바로 선택
+                        grid = walkable_grid.get_current()
+                        point = grid.random_point_in_annulus(self.panther.target.x, self.panther.target.y,
+                                                             100, 200, clearance=30) if grid is not None else None
+                        if point is not None:
+                            self.teleport_target_x, self.teleport_target_y = point
+                            found_valid_position = True
+                        else:
+                            # 격자가 없거나 빈 셀을 못 찾으면 벽이 아닌 유효한 위치를 찾을 때까지 무작위 시도
+                            found_valid_position = False
+                            max_attempts = 20
+                            for attempt in range(max_attempts):
+                                angle = random.uniform(0, 360)
+                                rad = math.radians(angle)
+                                distance = random.uniform(100, 200)  # 플레이어로부터 거리
+
+                                teleport_x = self.panther.target.x + math.cos(rad) * distance
+                                teleport_y = self.panther.target.y + math.sin(rad) * distance
+
+                                # 벽이 아닌 위치를 찾으면 사용
+                                if not self._is_position_on_wall(teleport_x, teleport_y, check_radius=30):
+                                    self.teleport_target_x = teleport_x
+                                    self.teleport_target_y = teleport_y
+                                    found_valid_position = True
+                                    break
+
+                                if attempt % 5 == 0 and attempt > 0:
+                                    print(f"[Pattern4] 텔레포트 위치 재계산 중... (시도 {attempt + 1}/{max_attempts})")
 
                         if not found_valid_position:
                             # 유효한 위치를 찾지 못한 경우 플레이어 근처로 폴백
@@ -353,6 +346,8 @@ class AttackPattern4Action:
                         # 본체 텔레포트 즉시 실행
                         self.panther.x = self.teleport_target_x
                         self.panther.y = self.teleport_target_y
+                        # 위치가 바뀌었으므로 이번 틱의 거리/각도 캐시를 비움
+                        self.panther.blackboard.invalidate()
                         print(f"[Pattern4] 본체 텔레포트 완료: ({self.panther.x:.0f}, {self.panther.y:.0f})")
                     else:
                         # 타겟이 없으면 현재 위치 유지
@@ -473,6 +468,11 @@ class AttackPattern4Action:
         if not self.panther.world or 'walls' not in self.panther.world:
             return False
 
+        # 스테이지 격자가 있으면 주변 셀만 확인 (모든 벽 순회 생략)
+        grid = walkable_grid.get_current()
+        if grid is not None:
+            return not grid.is_walkable(x, y, check_radius)
+
         walls = self.panther.world['walls']
         for wall in walls:
             # 벽과의 충돌 체크 (클론의 크기를 고려하여 check_radius만큼 여유 공간 확보)
@@ -489,6 +489,13 @@ class AttackPattern4Action:
         Returns:
             tuple: (target_x, target_y) 또는 None (유효한 위치를 찾지 못한 경우)
         """
+        # 스테이지 격자가 있으면 고리(150~250) 안의 빈 셀에서 바로 선택
+        grid = walkable_grid.get_current()
+        if grid is not None:
+            point = grid.random_point_in_annulus(self.panther.x, self.panther.y, 150, 250, clearance=20)
+            if point is not None:
+                return point
+
         for attempt in range(max_attempts):
             # 랜덤 위치 계산
             angle = random.uniform(0, 360)
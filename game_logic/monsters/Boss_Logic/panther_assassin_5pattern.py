@@ -3,6 +3,17 @@ import random
 import math
 import game_framework as framework
 from ...behavior_tree import BehaviorTree
+from ... import sound_bank
+from ... import walkable_grid
+from ... import bullet_patterns
+
+# 360도 방사형 수리검: 0, 90, 180, 270도 ±20도를 비우고 사분면마다 7발 (총 28발)
+# 1차 투척 450, 2차 투척 325 픽셀/초
+SHURIKEN_RING = bullet_patterns.compile_pattern({
+    'aimed': False,
+    'shapes': [{'ring_excluding': [0, 90, 180, 270], 'margin': 20, 'per_gap': 7}],
+    'waves': [{'speed': 450}, {'speed': 325}],
+}, 'Pattern5 ring')
 
 
 class AttackPattern5Action:
@@ -50,9 +61,7 @@ class AttackPattern5Action:
         self.shot_count = 0  # 현재 투척 횟수 (1회, 2회)
         self.max_shots = 2  # 최대 투척 횟수 (2회)
         self.shot_interval = 0.1  # 투척 간격
-        self.first_speed = 450  # 첫 번째 투척 속도
-        self.second_speed = 325  # 두 번째 투척 속도
-        self.projectiles_per_shot = 35  # 한 번에 발사하는 수리검 개수 (약 7개씩 * 4구간)
+        self.bullet_pattern = SHURIKEN_RING  # 각도/개수/웨이브별 속도 (모듈 상단 정의)
 
         # 애니메이션 관련 변수
         self.whirlwind_frame = 0  # Whirlwind 애니메이션 프레임
@@ -67,15 +76,6 @@ class AttackPattern5Action:
         self.withdraw_frame_speed = 15.0  # 초당 프레임 수
         self.withdraw_total_frames = 10  # 0~9 (총 10프레임)
 
-        # 사운드 로드
-        try:
-            self.throw_shuriken_sound = p2.load_wav('resources/Sounds/Throw_Shuriken.wav')
-            self.throw_shuriken_sound.set_volume(32)  # 볼륨 설정 (0~128)
-            print("[Pattern5] Throw_Shuriken.wav 사운드 로드 완료")
-        except Exception as e:
-            print(f"\033[91m[Pattern5] 사운드 로드 실패: {e}\033[0m")
-            self.throw_shuriken_sound = None
-
         # 이미지 로드
         self._load_images()
 
@@ -110,10 +110,7 @@ class AttackPattern5Action:
                     img = p2.load_image(img_path)
                     self.original_images['whirlwind'].append(img)
 
-                    # 분신용 어두운 버전 생성
                     iam.register_image_path(img, img_path)
-                    clone_img = iam.make_dark(img, darkness=0.25)
-                    self.clone_images['whirlwind'].append(clone_img)
                 except Exception as e:
                     print(f"\033[91m[Pattern5._load_images] Whirlwind{i:02d}.png 로드 실패: {e}\033[0m")
 
@@ -124,10 +121,7 @@ class AttackPattern5Action:
                     img = p2.load_image(img_path)
                     self.original_images['withdraw'].append(img)
 
-                    # 분신용 어두운 버전 생성
                     iam.register_image_path(img, img_path)
-                    clone_img = iam.make_dark(img, darkness=0.25)
-                    self.clone_images['withdraw'].append(clone_img)
                 except Exception as e:
                     print(f"\033[91m[Pattern5._load_images] Throw_All_Withdraw{i:02d}.png 로드 실패: {e}\033[0m")
 
@@ -138,10 +132,7 @@ class AttackPattern5Action:
                     img = p2.load_image(img_path)
                     self.original_images['move'].append(img)
 
-                    # 분신용 어두운 버전 생성
                     iam.register_image_path(img, img_path)
-                    clone_img = iam.make_dark(img, darkness=0.25)
-                    self.clone_images['move'].append(clone_img)
                 except Exception as e:
                     print(f"\033[91m[Pattern5._load_images] Move{i:02d}.png 로드 실패: {e}\033[0m")
 
@@ -152,16 +143,18 @@ class AttackPattern5Action:
                     img = p2.load_image(img_path)
                     self.original_images['die'].append(img)
 
-                    # 분신용 Die 애니메이션
                     iam.register_image_path(img, img_path)
-                    clone_die_img = iam.make_dark(img, darkness=0.25)
-                    self.clone_images['die'].append(clone_die_img)
                 except Exception as e:
                     print(f"\033[91m[Pattern5._load_images] Die{i:02d}.png 로드 실패: {e}\033[0m")
 
             # Stealth 모션도 Die 모션 사용 (본체용)
             self.original_images['stealth'] = self.original_images['die']
 
+            # 분신용 어두운 버전은 애니메이션 단위로 한 번에 생성 (프레임 묶음 배열 연산)
+            for key in self.clone_images:
+                self.clone_images[key] = iam.batch_process_images(
+                    self.original_images[key], 'brightness', 0.25)
+
             print(f"[Pattern5._load_images] 원본 이미지 로드 완료 - "
                   f"Whirlwind: {len(self.original_images['whirlwind'])}개, "
                   f"Withdraw: {len(self.original_images['withdraw'])}개, "
@@ -256,10 +249,10 @@ class AttackPattern5Action:
 
                     # 프레임 3에 도달하면 첫 번째 투척
                     if self.whirlwind_frame >= self.throw_start_frame and not self.has_thrown_in_cycle:
-                        self._shoot_shurikens_360(self.first_speed)
+                        self._shoot_shurikens_360(0)
                         self.shot_count = 1
                         self.has_thrown_in_cycle = True
-                        print(f"[Pattern5] 1차 투척 완료 (속도: {self.first_speed})")
+                        print(f"[Pattern5] 1차 투척 완료 (속도: {self.bullet_pattern.waves[0].speeds[0]})")
 
                     self.whirlwind_frame += 1
 
@@ -301,10 +294,10 @@ class AttackPattern5Action:
 
                     # 프레임 3에 도달하면 두 번째 투척
                     if self.whirlwind_frame >= self.throw_start_frame and not self.has_thrown_in_cycle:
-                        self._shoot_shurikens_360(self.second_speed)
+                        self._shoot_shurikens_360(1)
                         self.shot_count = 2
                         self.has_thrown_in_cycle = True
-                        print(f"[Pattern5] 2차 투척 완료 (속도: {self.second_speed})")
+                        print(f"[Pattern5] 2차 투척 완료 (속도: {self.bullet_pattern.waves[1].speeds[0]})")
 
                     self.whirlwind_frame += 1
 
@@ -361,76 +354,32 @@ class AttackPattern5Action:
             self.panther.attack_timer = self.panther.attack_cooldown
             return BehaviorTree.FAIL
 
-    def _shoot_shurikens_360(self, speed):
+    def _shoot_shurikens_360(self, wave):
         """
-        360도 모든 방향으로 수리검 발사 (0, 90, 180, 270도 +-10도 제외)
+        360도 모든 방향으로 수리검 발사 (0, 90, 180, 270도 ±20도 제외), 본체와 분신에서 같은 방향으로
 
         Args:
-            speed: 수리검 속도
+            wave: SHURIKEN_RING 웨이브 인덱스 (0: 1차, 1: 2차)
         """
         if not self.clone or not self.panther.world:
             return
 
         try:
             # 수리검 투척 사운드 재생
-            if self.throw_shuriken_sound:
-                self.throw_shuriken_sound.play()
-
-            # 허용된 각도 범위 계산
-            excluded_angle = 20
-            allowed_ranges = [
-                (0 + excluded_angle, 90 - excluded_angle),
-                (90 + excluded_angle, 180 - excluded_angle),
-                (180 + excluded_angle, 270 - excluded_angle),
-                (270 + excluded_angle, 360 - excluded_angle),
-            ]
-
-            # 각 범위에서 7개씩 수리검 발사
-            shurikens_per_range = 7
-            total_shurikens = 0
+            sound_bank.play('throw_shuriken')
 
-            for angle_min, angle_max in allowed_ranges:
-                angle_step = (angle_max - angle_min) / (shurikens_per_range - 1)
-
-                for i in range(shurikens_per_range):
-                    angle = angle_min + angle_step * i
-                    rad = math.radians(angle)
-
-                    # 수리검이 날아갈 목표 위치 계산 (충분히 먼 거리)
-                    target_distance = 2000
-                    target_x = self.clone.x + math.cos(rad) * target_distance
-                    target_y = self.clone.y + math.sin(rad) * target_distance
-
-                    # 본체에서 수리검 발사
-                    from ..panther_assassin import PantherShuriken
-                    shuriken_body = PantherShuriken(
-                        self.panther.x, self.panther.y,
-                        target_x, target_y,
-                        speed=speed,
-                        from_player=False,
-                        damage=20,
-                        scale=2.5
-                    )
-                    self.panther.world['effects_front'].append(shuriken_body)
-                    total_shurikens += 1
-
-                    # 분신에서 수리검 발사
-                    shuriken_clone = PantherShuriken(
-                        self.clone.x, self.clone.y,
-                        target_x, target_y,
-                        speed=speed,
-                        from_player=False,
-                        damage=20,
-                        scale=2.5
-                    )
-                    self.panther.world['effects_front'].append(shuriken_clone)
-                    total_shurikens += 1
+            # 본체와 분신에서 수리검 발사 (world의 effects_front 레이어에 한 번에 추가)
+            from ..panther_assassin import PantherShuriken
+            layer = self.panther.world['effects_front']
+            total_shurikens = 0
+            for shooter in (self.panther, self.clone):
+                shurikens = bullet_patterns.emit(self.bullet_pattern, shooter.x, shooter.y, PantherShuriken, layer,
+                                                 wave=wave, from_player=False, damage=20, scale=2.5)
+                total_shurikens += len(shurikens)
 
             print(f"[Pattern5] 360도 방사형 수리검 발사 완료")
-            print(f"  - 속도: {speed} 픽셀/초")
-            print(f"  - 총 수리검 개수: {total_shurikens}개 (본체: {shurikens_per_range * 4}개, 분신: {shurikens_per_range * 4}개)")
-            print(f"  - 각 사분면당: {shurikens_per_range}개씩")
-            print(f"  - 제외 각도: 0°±{excluded_angle}°, 90°±{excluded_angle}°, 180°±{excluded_angle}°, 270°±{excluded_angle}°")
+            print(f"  - 속도: {self.bullet_pattern.waves[wave].speeds[0]} 픽셀/초")
+            print(f"  - 총 수리검 개수: {total_shurikens}개 (본체/분신 각 {self.bullet_pattern.count(wave)}개)")
 
         except Exception as e:
             print(f"\033[91m[Pattern5._shoot_shurikens_360] 수리검 발사 중 오류: {e}\033[0m")
@@ -474,6 +423,11 @@ class AttackPattern5Action:
         if not self.panther.world or 'walls' not in self.panther.world:
             return False
 
+        # 스테이지 격자가 있으면 주변 셀만 확인 (모든 벽 순회 생략)
+        grid = walkable_grid.get_current()
+        if grid is not None:
+            return not grid.is_walkable(x, y, check_radius)
+
         walls = self.panther.world['walls']
         for wall in walls:
             # 벽과의 충돌 체크 (클론의 크기를 고려하여 check_radius만큼 여유 공간 확보)
@@ -490,6 +444,13 @@ class AttackPattern5Action:
         Returns:
             tuple: (target_x, target_y)
         """
+        # 스테이지 격자가 있으면 고리(200~300) 안의 빈 셀에서 바로 선택
+        grid = walkable_grid.get_current()
+        if grid is not None:
+            point = grid.random_point_in_annulus(self.panther.x, self.panther.y, 200, 300, clearance=20)
+            if point is not None:
+                return point
+
         for attempt in range(max_attempts):
             # 랜덤 위치 계산
             angle = random.uniform(0, 360)
@@ -3,6 +3,17 @@ import random
 import math
 import game_framework as framework
 from ...behavior_tree import BehaviorTree
+from ... import walkable_grid
+from ... import coroutine
+from ...coroutine import wait, wait_until
+from ... import bullet_patterns
+
+# 투척 1회: 플레이어 방향 기준 ±15, 30도 5발
+SPREAD_THROW = bullet_patterns.compile_pattern({
+    'aimed': True,
+    'speed': 600,
+    'shapes': [{'angles': [-30, -15, 0, 15, 30]}],
+}, 'Pattern6 spread')
 
 
 class AttackPattern6Action:
@@ -27,6 +38,7 @@ class AttackPattern6Action:
         - 분신 이동 중(Phase 1): 본체는 IDLE 모션
         - 투척 중(Phase 2~3): 본체와 분신 모두 Ready → Attack 모션 동기화
         - 분신 소멸 중(Phase 4): 본체는 IDLE 모션
+        - 진행 순서는 _pattern() 코루틴에 위에서 아래로 작성 (game_logic/coroutine.py)
         - 각 개체가 한 번씩 투척하는 것을 1사이클로 계산, 총 3사이클 반복
 
     """
@@ -37,38 +49,35 @@ class AttackPattern6Action:
             panther: PantherAssassin 인스턴스 참조
         """
         self.panther = panther
-        self.phase = 0
-        self.timer = 0.0
+        self.phase = 0  # 1: 분신 이동, 2: Ready, 3: Attack, 4: 분신 소멸, 5: 다음 투척자 대기 (draw/보스 draw에서 사용)
 
         # 분신 소환 관련 변수
         self.clone_count = 2  # 분신 개수 (2체)
         self.clones = []  # Clone 객체 리스트
-        self.clones_spawned = False  # 분신 소환 완료 플래그
 
         # 수리검 투척 관련 변수 (사이클 기반으로 재설계)
         self.total_shooters = 3  # 본체(1) + 분신(2) = 총 3명
         self.current_shooter = 0  # 현재 투척하는 개체 (0: 본체, 1: 분신1, 2: 분신2)
         self.current_cycle = 0  # 현재 사이클 (0, 1, 2 - 총 3사이클)
         self.max_cycles = 3  # 최대 사이클 수 (3회 반복)
-        self.projectiles_per_shot = 5  # 한 번에 발사하는 수리검 개수 (5개)
-        self.spread_angles = [-30, -15, 0, 15, 30]  # 방사형 각도 (플레이어 방향 기준 ±15, 30도)
-        self.projectile_speed = 600  # 수리검 속도
+        self.bullet_pattern = SPREAD_THROW  # 방사형 각도/개수/속도 (모듈 상단 정의)
 
         # 애니메이션 관련 변수
         self.ready_frame = 0  # Throw_All_Ready 애니메이션 프레임
-        self.ready_frame_timer = 0.0
         self.ready_frame_speed = 12.0  # 초당 프레임 수
         self.ready_total_frames = 5  # 0~4 (총 5프레임)
 
         self.attack_frame = 0  # Throw_All_Attack 애니메이션 프레임
-        self.attack_frame_timer = 0.0
         self.attack_frame_speed = 15.0  # 초당 프레임 수
         self.attack_total_frames = 10  # 0~9 (총 10프레임)
-        self.attack_throw_frame = 0  # 5번 프레임에서 수리검 발사
-        self.has_thrown_in_attack = False  # 현재 Attack 애니메이션에서 이미 투척했는지
+        self.attack_throw_frame = 0  # 0번 프레임에서 수리검 발사
 
         self.shot_interval = 0.1  # 각 투척 후 대기 시간 (다음 투척자로 전환)
 
+        # 패턴 진행은 코루틴으로 (update는 매 프레임 실행기만 진행)
+        self.runner = coroutine.Scheduler()
+        self.task = None
+
         # 이미지 로드
         self._load_images()
 
@@ -102,10 +111,7 @@ class AttackPattern6Action:
                     img = p2.load_image(img_path)
                     self.original_images['ready'].append(img)
 
-                    # 분신용 어두운 버전 생성
                     iam.register_image_path(img, img_path)
-                    clone_img = iam.make_dark(img, darkness=0.25)
-                    self.clone_images['ready'].append(clone_img)
                 except Exception as e:
                     print(f"\033[91m[Pattern6._load_images] Throw_All_Ready{i:02d}.png 로드 실패: {e}\033[0m")
 
@@ -116,10 +122,7 @@ class AttackPattern6Action:
                     img = p2.load_image(img_path)
                     self.original_images['attack'].append(img)
 
-                    # 분신용 어두운 버전 생성
                     iam.register_image_path(img, img_path)
-                    clone_img = iam.make_dark(img, darkness=0.25)
-                    self.clone_images['attack'].append(clone_img)
                 except Exception as e:
                     print(f"\033[91m[Pattern6._load_images] Throw_All_Attack{i:02d}.png 로드 실패: {e}\033[0m")
 
@@ -130,10 +133,7 @@ class AttackPattern6Action:
                     img = p2.load_image(img_path)
                     self.original_images['move'].append(img)
 
-                    # 분신용 어두운 버전 생성
                     iam.register_image_path(img, img_path)
-                    clone_img = iam.make_dark(img, darkness=0.25)
-                    self.clone_images['move'].append(clone_img)
                 except Exception as e:
                     print(f"\033[91m[Pattern6._load_images] Move{i:02d}.png 로드 실패: {e}\033[0m")
 
@@ -144,13 +144,15 @@ class AttackPattern6Action:
                     img = p2.load_image(img_path)
                     self.original_images['die'].append(img)
 
-                    # 분신용 Die 애니메이션
                     iam.register_image_path(img, img_path)
-                    clone_die_img = iam.make_dark(img, darkness=0.25)
-                    self.clone_images['die'].append(clone_die_img)
                 except Exception as e:
                     print(f"\033[91m[Pattern6._load_images] Die{i:02d}.png 로드 실패: {e}\033[0m")
 
+            # 분신용 어두운 버전은 애니메이션 단위로 한 번에 생성 (프레임 묶음 배열 연산)
+            for key in self.clone_images:
+                self.clone_images[key] = iam.batch_process_images(
+                    self.original_images[key], 'brightness', 0.25)
+
             print(f"[Pattern6._load_images] 원본 이미지 로드 완료 - "
                   f"Ready: {len(self.original_images['ready'])}개, "
                   f"Attack: {len(self.original_images['attack'])}개, "
@@ -169,195 +171,128 @@ class AttackPattern6Action:
             traceback.print_exc()
 
     def update(self):
-        """패턴 6 로직 실행"""
+        """패턴 6 로직 실행 (코루틴 진행)"""
         try:
-            dt = framework.get_delta_time()
-
-            if self.phase == 0:
-                # Phase 0: 초기화 및 분신 소환 시작
-                self.timer = 0.0
-                self.current_shooter = 0
-                self.current_cycle = 0
-                self.ready_frame = 0
-                self.ready_frame_timer = 0.0
-                self.attack_frame = 0
-                self.attack_frame_timer = 0.0
-                self.has_thrown_in_attack = False
-                self.clones = []
-                self.clones_spawned = False
-
-                print("[Pattern6] 패턴 시작 - 분신 소환 시작!")
-                self.phase = 1
-
-            elif self.phase == 1:
-                # Phase 1: 분신 소환 (본체 위치에 생성 후 랜덤 위치로 이동)
-                # 이 단계에서는 본체 IDLE 모션 표시 (panther_assassin.py의 draw에서 처리)
-                if not self.clones_spawned:
-                    try:
-                        print(f"[Pattern6] 분신 소환 - 본체 위치: ({self.panther.x:.0f}, {self.panther.y:.0f})")
-
-                        # 모든 분신을 한 번에 생성
-                        for i in range(self.clone_count):
-                            # 각 분신마다 랜덤 위치 계산
-                            angle = random.uniform(0, 360)
-                            rad = math.radians(angle)
-                            distance = random.uniform(200, 300)  # 본체로부터 거리
-
-                            target_x = self.panther.x + math.cos(rad) * distance
-                            target_y = self.panther.y + math.sin(rad) * distance
-
-                            # 벽 체크 후 유효한 위치 찾기
-                            # while self._is_position_on_wall(target_x, target_y):
-                            #     angle = random.uniform(0, 360)
-                            #     rad = math.radians(angle)
-                            #     target_x = self.panther.x + math.cos(rad) * distance
-                            #     target_y = self.panther.y + math.sin(rad) * distance
-
-                            # 유효한 위치 찾기 시도
-                            target_x, target_y = self._find_valid_clone_position()
-
-                            # 분신 생성 (본체 위치에서 시작)
-                            from ..panther_assassin import Clone
-                            clone = Clone(
-                                self.panther.x, self.panther.y,
-                                target_x, target_y,
-                                self.clone_images,
-                                self.panther.scale_factor
-                            )
-                            self.clones.append(clone)
-
-                            # effects_front 레이어에 추가
-                            if self.panther.world and 'effects_front' in self.panther.world:
-                                self.panther.world['effects_front'].append(clone)
-                                print(f"[Pattern6] 분신 {i+1}/{self.clone_count} 소환: ({target_x:.0f}, {target_y:.0f}) - effects_front 레이어에 추가됨")
-
-                        self.clones_spawned = True
-                        print(f"[Pattern6] 모든 분신 소환 완료! 총 {len(self.clones)}체")
-
-                    except Exception as e:
-                        print(f"\033[91m[Pattern6] 분신 소환 중 오류: {e}\033[0m")
-                        import traceback
-                        traceback.print_exc()
-
-                # 모든 분신의 이동 완료 대기
-                if self.clones_spawned and len(self.clones) == self.clone_count:
-                    all_moved = all(not clone.is_moving for clone in self.clones)
-
-                    if all_moved:
-                        # Phase 2로 전환 (투척 준비)
-                        self.timer = 0.0
-                        self.ready_frame = 0
-                        self.ready_frame_timer = 0.0
-
-                        # 분신들을 Ready 애니메이션으로 전환
-                        for clone in self.clones:
-                            clone.switch_animation('ready')
-
-                        self.phase = 2
-                        print(f"[Pattern6] 분신 이동 완료! 투척 준비 시작 - Cycle {self.current_cycle + 1}/{self.max_cycles}, Shooter {self.current_shooter}")
-
-            elif self.phase == 2:
-                # Phase 2: Throw_All_Ready 애니메이션 재생 (본체와 분신 모두 동기화)
-                self.ready_frame_timer += dt
-
-                if self.ready_frame_timer >= 1.0 / self.ready_frame_speed:
-                    self.ready_frame_timer = 0.0
-                    self.ready_frame += 1
-
-                    # Ready 애니메이션 완료 (0~4, 총 5프레임)
-                    if self.ready_frame >= self.ready_total_frames:
-                        # Attack 애니메이션으로 전환
-                        self.attack_frame = 0
-                        self.attack_frame_timer = 0.0
-                        self.has_thrown_in_attack = False
-
-                        # 분신들도 Attack 애니메이션으로 전환
-                        for clone in self.clones:
-                            clone.switch_animation('attack')
-
-                        self.phase = 3
-                        print(f"[Pattern6] Ready 완료, Attack 시작 - Cycle {self.current_cycle + 1}/{self.max_cycles}, Shooter {self.current_shooter}")
-
-            elif self.phase == 3:
-                # Phase 3: Throw_All_Attack 애니메이션 재생 및 수리검 투척
-                self.attack_frame_timer += dt
-
-                if self.attack_frame_timer >= 1.0 / self.attack_frame_speed:
-                    self.attack_frame_timer = 0.0
-
-                    # 프레임 5에 도달하면 수리검 발사 (한 번만)
-                    if self.attack_frame == self.attack_throw_frame and not self.has_thrown_in_attack:
-                        self._shoot_spread_shurikens()
-                        self.has_thrown_in_attack = True
-                        print(f"[Pattern6] 투척 실행! Cycle {self.current_cycle + 1}/{self.max_cycles}, Shooter {self.current_shooter}")
-
-                    self.attack_frame += 1
-
-                    # Attack 애니메이션 완료 (0~9, 총 10프레임)
-                    if self.attack_frame >= self.attack_total_frames:
-                        # 다음 투척자로 전환
-                        self.current_shooter += 1
-
-                        # 한 사이클 완료 체크 (본체 → 분신1 → 분신2 순서)
-                        if self.current_shooter >= self.total_shooters:
-                            self.current_shooter = 0
-                            self.current_cycle += 1
-                            print(f"[Pattern6] 사이클 {self.current_cycle}/{self.max_cycles} 완료!")
-
-                            # 모든 사이클 완료 체크
-                            if self.current_cycle >= self.max_cycles:
-                                # 패턴 종료 - 분신 소멸
-                                self.phase = 4
-                                print("[Pattern6] 모든 사이클 완료! 분신 소멸 시작")
-                                return BehaviorTree.RUNNING
-
-                        # 다음 투척 대기
-                        self.timer = 0.0
-                        self.phase = 5
-                        print(f"[Pattern6] 다음 투척자 대기 - Cycle {self.current_cycle + 1}/{self.max_cycles}, Next Shooter {self.current_shooter}")
-
-            elif self.phase == 4:
-                # Phase 4: 패턴 종료 정리 - 분신 소멸
-                # 이 단계에서는 본체 IDLE 모션 표시 (panther_assassin.py의 draw에서 처리)
-
-                # 분신에게 사라지는 애니메이션 시작 명령
-                for clone in self.clones:
-                    clone.start_dying()
-                    print(f"[Pattern6] 분신 Die 애니메이션 시작 - 위치: ({clone.x:.0f}, {clone.y:.0f})")
-
-                # 분신은 자동으로 애니메이션 후 제거되므로 여기서는 리스트만 비움
-                self.clones = []
-
-                # 패턴 종료
+            if self.task is None:
+                self.task = self.runner.start(self._pattern(), 'Pattern6')
+
+            self.runner.update(framework.get_delta_time())
+
+            if self.task.done:
+                # 패턴 종료 (코루틴이 예외로 끝난 경우에도 분신은 정리)
+                self.task = None
+                self._dismiss_clones()
                 self.phase = 0
                 if hasattr(self.panther, 'attack_timer') and hasattr(self.panther, 'attack_cooldown'):
                     self.panther.attack_timer = self.panther.attack_cooldown
                 print("[Pattern6] 패턴 종료!")
                 return BehaviorTree.SUCCESS
 
-            elif self.phase == 5:
-                # Phase 5: 다음 투척자로 전환 대기 (대기 모션)
-                self.timer += dt
-
-                if self.timer >= self.shot_interval:
-                    # 다음 투척 시작 - Ready 애니메이션으로 전환
-                    self.ready_frame = 0
-                    self.ready_frame_timer = 0.0
+            return BehaviorTree.RUNNING
 
-                    # 분신들도 Ready 애니메이션으로 전환
-                    for clone in self.clones:
-                        clone.switch_animation('ready')
+        except Exception as e:
+            print(f"\033[91m[Pattern6.update] 전체 업데이트 오류 (phase={self.phase}): {e}\033[0m")
+            import traceback
+            traceback.print_exc()
+            return BehaviorTree.RUNNING
 
-                    self.phase = 2
+    def _pattern(self):
+        """패턴 6 진행 순서"""
+        self.current_shooter = 0
+        self.current_cycle = 0
+        self.clones = []
+
+        # Phase 1: 분신 소환 후 모두 자리를 잡을 때까지 대기 (본체 IDLE 모션은 panther_assassin.py의 draw에서 처리)
+        print("[Pattern6] 패턴 시작 - 분신 소환 시작!")
+        self.phase = 1
+        yield
+        self._spawn_clones()
+        yield wait_until(lambda: len(self.clones) == self.clone_count and
+                         all(not clone.is_moving for clone in self.clones))
+        print(f"[Pattern6] 분신 이동 완료! 투척 준비 시작 - Cycle {self.current_cycle + 1}/{self.max_cycles}, Shooter {self.current_shooter}")
+
+        # 본체 → 분신1 → 분신2 순서로 max_cycles 사이클
+        for cycle in range(self.max_cycles):
+            self.current_cycle = cycle
+            for shooter in range(self.total_shooters):
+                self.current_shooter = shooter
+                if cycle or shooter:
+                    # Phase 5: 다음 투척자로 전환 대기 (대기 모션)
+                    self.phase = 5
+                    yield wait(self.shot_interval)
                     print(f"[Pattern6] 대기 완료, Ready 시작 - Cycle {self.current_cycle + 1}/{self.max_cycles}, Shooter {self.current_shooter}")
+                yield from self._throw()
+            print(f"[Pattern6] 사이클 {self.current_cycle + 1}/{self.max_cycles} 완료!")
+
+        # Phase 4: 분신 소멸 (본체 IDLE 모션은 panther_assassin.py의 draw에서 처리)
+        self.phase = 4
+        print("[Pattern6] 모든 사이클 완료! 분신 소멸 시작")
+        yield
+        self._dismiss_clones()
+
+    def _throw(self):
+        """현재 투척자의 Ready → Attack 모션 (본체와 분신 모두 동기화), attack_throw_frame에서 수리검 발사"""
+        # Phase 2: Throw_All_Ready 애니메이션
+        self.phase = 2
+        self.ready_frame = 0
+        for clone in self.clones:
+            clone.switch_animation('ready')
+        ready_time = 1.0 / self.ready_frame_speed
+        while self.ready_frame < self.ready_total_frames:
+            yield wait(ready_time)
+            self.ready_frame += 1
+
+        # Phase 3: Throw_All_Attack 애니메이션
+        self.phase = 3
+        self.attack_frame = 0
+        for clone in self.clones:
+            clone.switch_animation('attack')
+        print(f"[Pattern6] Ready 완료, Attack 시작 - Cycle {self.current_cycle + 1}/{self.max_cycles}, Shooter {self.current_shooter}")
+        attack_time = 1.0 / self.attack_frame_speed
+        while self.attack_frame < self.attack_total_frames:
+            yield wait(attack_time)
+            if self.attack_frame == self.attack_throw_frame:
+                self._shoot_spread_shurikens()
+                print(f"[Pattern6] 투척 실행! Cycle {self.current_cycle + 1}/{self.max_cycles}, Shooter {self.current_shooter}")
+            self.attack_frame += 1
+
+    def _spawn_clones(self):
+        """분신 소환 (본체 위치에 생성 후 랜덤 위치로 이동)"""
+        try:
+            print(f"[Pattern6] 분신 소환 - 본체 위치: ({self.panther.x:.0f}, {self.panther.y:.0f})")
 
-            return BehaviorTree.RUNNING
+            from ..panther_assassin import Clone
+            for i in range(self.clone_count):
+                # 유효한 위치 찾기 시도
+                target_x, target_y = self._find_valid_clone_position()
+
+                # 분신 생성 (본체 위치에서 시작)
+                clone = Clone(
+                    self.panther.x, self.panther.y,
+                    target_x, target_y,
+                    self.clone_images,
+                    self.panther.scale_factor
+                )
+                self.clones.append(clone)
+
+                # effects_front 레이어에 추가
+                if self.panther.world and 'effects_front' in self.panther.world:
+                    self.panther.world['effects_front'].append(clone)
+                    print(f"[Pattern6] 분신 {i+1}/{self.clone_count} 소환: ({target_x:.0f}, {target_y:.0f}) - effects_front 레이어에 추가됨")
+
+            print(f"[Pattern6] 모든 분신 소환 완료! 총 {len(self.clones)}체")
 
         except Exception as e:
-            print(f"\033[91m[Pattern6.update] 전체 업데이트 오류 (phase={self.phase}): {e}\033[0m")
+            print(f"\033[91m[Pattern6] 분신 소환 중 오류: {e}\033[0m")
             import traceback
             traceback.print_exc()
-            return BehaviorTree.RUNNING
+
+    def _dismiss_clones(self):
+        """분신에게 사라지는 애니메이션 시작 명령 (분신은 애니메이션 후 자동 제거되므로 리스트만 비움)"""
+        for clone in self.clones:
+            clone.start_dying()
+            print(f"[Pattern6] 분신 Die 애니메이션 시작 - 위치: ({clone.x:.0f}, {clone.y:.0f})")
+        self.clones = []
 
     def _shoot_spread_shurikens(self):
         """
@@ -381,37 +316,14 @@ class AttackPattern6Action:
                 print(f"\033[91m[Pattern6._shoot_spread_shurikens] 잘못된 shooter 인덱스: {self.current_shooter}\033[0m")
                 return
 
-            # 플레이어를 향한 기본 각도 계산
-            dx = self.panther.target.x - shooter_x
-            dy = self.panther.target.y - shooter_y
-            base_angle = math.degrees(math.atan2(dy, dx))
-
-            # 각 방사형 각도로 수리검 발사
-            for spread_angle in self.spread_angles:
-                # 최종 발사 각도 계산
-                final_angle = base_angle + spread_angle
-                rad = math.radians(final_angle)
-
-                # 목표 위치 계산 (충분히 먼 거리)
-                target_distance = 2000
-                target_x = shooter_x + math.cos(rad) * target_distance
-                target_y = shooter_y + math.sin(rad) * target_distance
-
-                # 수리검 생성
-                from ..panther_assassin import PantherShuriken
-                shuriken = PantherShuriken(
-                    shooter_x, shooter_y,
-                    target_x, target_y,
-                    speed=self.projectile_speed,
-                    from_player=False,
-                    damage=20,
-                    scale=2.5
-                )
-
-                # world의 effects_front 레이어에 추가
-                self.panther.world['effects_front'].append(shuriken)
+            # 플레이어 방향 기준으로 수리검 발사 (world의 effects_front 레이어에 한 번에 추가)
+            from ..panther_assassin import PantherShuriken
+            aim = bullet_patterns.aim_at(shooter_x, shooter_y, self.panther.target.x, self.panther.target.y)
+            bullet_patterns.emit(self.bullet_pattern, shooter_x, shooter_y, PantherShuriken,
+                                 self.panther.world['effects_front'], aim=aim,
+                                 from_player=False, damage=20, scale=2.5)
 
-            print(f"[Pattern6._shoot_spread_shurikens] 수리검 {self.projectiles_per_shot}개 발사 완료 - "
+            print(f"[Pattern6._shoot_spread_shurikens] 수리검 {self.bullet_pattern.count()}개 발사 완료 - "
                   f"Cycle {self.current_cycle + 1}/{self.max_cycles}, Shooter {self.current_shooter}, 위치: ({shooter_x:.0f}, {shooter_y:.0f})")
 
         except Exception as e:
@@ -466,6 +378,11 @@ class AttackPattern6Action:
         if not self.panther.world or 'walls' not in self.panther.world:
             return False
 
+        # 스테이지 격자가 있으면 주변 셀만 확인 (모든 벽 순회 생략)
+        grid = walkable_grid.get_current()
+        if grid is not None:
+            return not grid.is_walkable(x, y, check_radius)
+
         walls = self.panther.world['walls']
         for wall in walls:
             # 벽과의 충돌 체크 (클론의 크기를 고려하여 check_radius만큼 여유 공간 확보)
@@ -482,6 +399,13 @@ class AttackPattern6Action:
         Returns:
             tuple: (target_x, target_y)
         """
+        # 스테이지 격자가 있으면 고리(200~300) 안의 빈 셀에서 바로 선택
+        grid = walkable_grid.get_current()
+        if grid is not None:
+            point = grid.random_point_in_annulus(self.panther.x, self.panther.y, 200, 300, clearance=20)
+            if point is not None:
+                return point
+
         for attempt in range(max_attempts):
             # 랜덤 위치 계산
             angle = random.uniform(0, 360)
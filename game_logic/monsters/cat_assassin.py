@@ -4,33 +4,35 @@ import math
 
 import game_framework as framework
 from ..items import carrot
-from ..state_machine import StateMachine
+from ..state_machine import StateMachine, event_predicate
 from ..projectile import Projectile
 from ..stats import CatAssassinStats
 from ..damage_indicator import DamageIndicator
 from ..ui_overlay import MonsterHealthBar
+from .. import animation_clips
+from .. import bullet_patterns
+from .. import encounter_director
+from .. import flow_field
+from .. import line_of_sight
+from .. import walkable_grid
 
 # ========== Idle State ==========
 class Idle:
     images = None
+    clip = None
 
     def __init__(self, cat):
         self.cat = cat
         self.detection_range = 300  # 플레이어 감지 범위 (픽셀)
+        self.sight = line_of_sight.SightLine()  # 벽 너머의 플레이어는 감지하지 않음
 
         if Idle.images is None:
-            Idle.images = []
-            try:
-                for i in range(6):  # Cat_Assassin_Idle0 ~ Idle5
-                    img = p2.load_image(f'resources/Texture_organize/Entity/Stage2_Forest/Cat_Assassin/character/Cat_Assassin_Idle{i}.png')
-                    Idle.images.append(img)
-                print(f"[CatAssassin Idle] Loaded {len(Idle.images)} images")
-            except Exception as e:
-                print(f"\033[91m[CatAssassin Idle] Failed to load images: {e}\033[0m")
-                Idle.images = []
+            # 프레임 목록/타이밍은 resources/Animations/cat_assassin.json 매니페스트에서 로드 (타입당 1회)
+            Idle.clip = animation_clips.get_clip('cat_assassin', 'idle')
+            Idle.images = Idle.clip.frames if Idle.clip else ()
 
         self.cat.frame = 0
-        self.cat.animation_speed = 10  # frames per second
+        self.cat.animation_speed = Idle.clip.fps if Idle.clip else 10  # frames per second
         self.cat.animation_time = 0
 
     def enter(self, e):
@@ -54,8 +56,8 @@ class Idle:
             dy = player.y - self.cat.y
             distance = math.sqrt(dx**2 + dy**2)
 
-            # 감지 범위 내에 플레이어가 있으면 Chase 상태로 전환
-            if distance <= self.detection_range:
+            # 감지 범위 내에 플레이어가 보이면 Chase 상태로 전환
+            if distance <= self.detection_range and self.sight.sees(self.cat.x, self.cat.y, player.x, player.y):
                 self.cat.state_machine.handle_state_event(('DETECT_PLAYER', player))
 
     def draw(self, draw_x, draw_y):
@@ -75,6 +77,11 @@ class Chase:
         self.attack_range_exit = 350  # 공격 범위를 벗어나는 거리 (여유를 둠)
         self.kiting_min_range = 250  # 너무 가까우면 후퇴할 거리
 
+        # 시야 관련 - 벽에 가려도 플로우 필드로 쫓아가다가 lose_sight_time 동안 못 보면 놓침
+        self.sight = line_of_sight.SightLine()
+        self.lose_sight_time = 3.0
+        self.unseen_timer = 0.0
+
         # 공격 쿨타임 관련
         self.attack_cooldown = 2.0  # 공격 후 2초 대기
         self.attack_cooldown_timer = 0.0  # 쿨타임 타이머
@@ -99,6 +106,8 @@ class Chase:
         # 추적 시작 시 쿨타임 초기화
         self.can_attack = False
         self.attack_cooldown_timer = 0.0
+        self.unseen_timer = 0.0
+        self.sight.invalidate()
         # 하위 상태 머신을 Run 상태로 초기화 (이미 __init__에서 초기화됨)
         # sub_state_machine의 cur_state는 이미 RUN으로 설정되어 있음
         self.sub_state_machine.cur_state.enter(e)
@@ -125,8 +134,12 @@ class Chase:
             dy = player.y - self.cat.y
             distance = math.sqrt(dx**2 + dy**2)
 
+            # 벽에 가려 보이지 않는 시간 누적
+            visible = self.sight.sees(self.cat.x, self.cat.y, player.x, player.y)
+            self.unseen_timer = 0.0 if visible else self.unseen_timer + dt
+
             # 플레이어를 놓쳤으면 Idle로 복귀
-            if distance > self.lose_range:
+            if distance > self.lose_range or self.unseen_timer > self.lose_sight_time:
                 self.cat.state_machine.handle_state_event(('LOSE_PLAYER', None))
                 return
 
@@ -136,18 +149,18 @@ class Chase:
 
             # 거리에 따른 상태 전환 (Hysteresis 적용)
             if isinstance(current_sub_state, Run):
-                # Run 상태: attack_range 이하면 Kiting으로
-                if distance <= self.attack_range:
+                # Run 상태: attack_range 이하이고 보이면 Kiting으로 (벽 너머에서는 계속 돌아서 접근)
+                if distance <= self.attack_range and visible:
                     print(f"[Chase State] 거리 {distance:.1f} - Kiting 상태로 전환")
                     self.sub_state_machine.handle_state_event(('IN_ATTACK_RANGE', player))
 
             elif isinstance(current_sub_state, Kiting):
-                # Kiting 상태: attack_range_exit 초과하면 Run으로, can_attack이면 Attack으로
-                if distance > self.attack_range_exit:
-                    print(f"[Chase State] 거리 {distance:.1f} > {self.attack_range_exit} - Run 상태로 전환")
+                # Kiting 상태: attack_range_exit 초과하거나 시야가 가리면 Run으로, can_attack이면 Attack으로
+                if distance > self.attack_range_exit or not visible:
+                    print(f"[Chase State] 거리 {distance:.1f} (시야: {visible}) - Run 상태로 전환")
                     self.sub_state_machine.handle_state_event(('OUT_ATTACK_RANGE', player))
-                elif self.can_attack:
-                    # 쿨타임 끝나고 공격 가능 - Attack 상태로
+                elif self.can_attack and encounter_director.request_token(self.cat, projectiles=SHURIKEN_SPREAD.count()):
+                    # 쿨타임 끝나고 공격 토큰을 받으면 Attack 상태로 (못 받으면 Kiting 유지하며 대기열에서 기다림)
                     print(f"[Chase State] 거리 {distance:.1f} - 공격 준비! (can_attack: {self.can_attack})")
                     self.sub_state_machine.handle_state_event(('READY_TO_ATTACK', player))
                     # 공격 쿨타임 시작 (Attack 상태 진입 시점에 쿨타임 시작)
@@ -168,20 +181,15 @@ class Chase:
 # ========== Run State (Chase의 하위 상태) ==========
 class Run:
     images = None
+    clip = None
 
     def __init__(self, cat):
         self.cat = cat
 
         if Run.images is None:
-            Run.images = []
-            try:
-                for i in range(8):  # Cat_Assassin_Move0 ~ Move8
-                    img = p2.load_image(f'resources/Texture_organize/Entity/Stage2_Forest/Cat_Assassin/character/Cat_Assassin_Move{i}.png')
-                    Run.images.append(img)
-                print(f"[CatAssassin Run] Loaded {len(Run.images)} images")
-            except Exception as e:
-                print(f"\033[91m[CatAssassin Run] Failed to load images: {e}\033[0m")
-                Run.images = []
+            # 프레임 목록/타이밍은 resources/Animations/cat_assassin.json 매니페스트에서 로드 (타입당 1회)
+            Run.clip = animation_clips.get_clip('cat_assassin', 'move')
+            Run.images = Run.clip.frames if Run.clip else ()
 
         # 랜덤 움직임 관련 변수
         self.wander_angle = 0  # 현재 방향에서 벗어나는 각도
@@ -192,7 +200,7 @@ class Run:
     def enter(self, e):
         self.cat.frame = 0
         self.cat.animation_time = 0
-        self.cat.animation_speed = 12
+        self.cat.animation_speed = Run.clip.fps if Run.clip else 12
         self.wander_angle = random.uniform(-math.pi/4, math.pi/4)  # -45도 ~ 45도
         self.wander_change_timer = 0
         print("[Run State] 달리기 시작")
@@ -219,9 +227,8 @@ class Run:
 
             # 방향 계산 (정규화)
             if distance > 0:
-                # 플레이어 방향으로의 기본 방향
-                base_dx = dx / distance
-                base_dy = dy / distance
+                # 플레이어 방향으로의 기본 방향 (플로우 필드: 벽이 가로막으면 돌아가는 방향)
+                base_dx, base_dy = flow_field.direction_toward(player.x, player.y, self.cat.x, self.cat.y)
 
                 # 랜덤 방향 변경 타이머 업데이트
                 self.wander_change_timer += dt
@@ -245,29 +252,11 @@ class Run:
                 new_y = self.cat.y + move_dy * self.cat.speed * dt
 
                 # 벽 충돌 체크 (몬스터 크기: 32x48 픽셀로 가정)
+                # 스테이지 격자로 검사하며, 막힌 축은 미끄러져 모서리에 걸리지 않음
                 monster_width = 32
                 monster_height = 48
-                collided = False
-
-                # world의 walls 레이어에서 벽과 충돌 체크
-                if 'walls' in self.cat.world:
-                    for wall in self.cat.world['walls']:
-                        if hasattr(wall, 'check_collision'):
-                            # 몬스터의 바운딩 박스로 충돌 검사
-                            if wall.check_collision(
-                                new_x - monster_width // 2,
-                                new_y - monster_height // 2,
-                                monster_width,
-                                monster_height
-                            ):
-                                collided = True
-                                break
-
-                # 벽과 충돌하지 않았을 때만 위치 업데이트
-                if not collided:
-                    self.cat.x = new_x
-                    self.cat.y = new_y
-                # 충돌했을 때는 이동하지 않음 (벽에 막힘)
+                self.cat.x, self.cat.y = walkable_grid.resolve_move(
+                    self.cat.world, self.cat.x, self.cat.y, new_x, new_y, monster_width, monster_height)
 
     def draw(self, draw_x, draw_y):
         if Run.images and len(Run.images) > 0:
@@ -295,7 +284,7 @@ class Kiting:
     def enter(self, e):
         self.cat.frame = 0
         self.cat.animation_time = 0
-        self.cat.animation_speed = 12  # Run과 같은 빠른 애니메이션
+        self.cat.animation_speed = Run.clip.fps if Run.clip else 12  # Run과 같은 빠른 애니메이션
         self.strafe_direction = random.choice([-1, 1])
         self.strafe_change_timer = 0
         print("[Kiting State] 거리 유지하며 움직이기 시작")
@@ -348,9 +337,10 @@ class Kiting:
                     move_y = flee_dy * base_speed * dt
 
                 elif distance > self.chase_state.attack_range:
-                    # 너무 멀면 조금 다가가기 (적당한 속도로)
-                    move_x = to_player_x * base_speed * 0.5 * dt
-                    move_y = to_player_y * base_speed * 0.5 * dt
+                    # 너무 멀면 조금 다가가기 (적당한 속도로, 벽은 플로우 필드로 돌아감)
+                    approach_x, approach_y = flow_field.direction_toward(player.x, player.y, self.cat.x, self.cat.y)
+                    move_x = approach_x * base_speed * 0.5 * dt
+                    move_y = approach_y * base_speed * 0.5 * dt
 
                 else:
                     # 적정 거리 - 측면으로 이동 (strafing)
@@ -366,29 +356,11 @@ class Kiting:
                 new_y = self.cat.y + move_y
 
                 # 벽 충돌 체크 (몬스터 크기: 32x48 픽셀로 가정)
+                # 스테이지 격자로 검사하며, 막힌 축은 미끄러져 모서리에 걸리지 않음
                 monster_width = 32
                 monster_height = 48
-                collided = False
-
-                # world의 walls 레이어에서 벽과 충돌 체크
-                if 'walls' in self.cat.world:
-                    for wall in self.cat.world['walls']:
-                        if hasattr(wall, 'check_collision'):
-                            # 몬스터의 바운딩 박스로 충돌 검사
-                            if wall.check_collision(
-                                new_x - monster_width // 2,
-                                new_y - monster_height // 2,
-                                monster_width,
-                                monster_height
-                            ):
-                                collided = True
-                                break
-
-                # 벽과 충돌하지 않았을 때만 위치 업데이트
-                if not collided:
-                    self.cat.x = new_x
-                    self.cat.y = new_y
-                # 충돌했을 때는 이동하지 않음 (벽에 막힘)
+                self.cat.x, self.cat.y = walkable_grid.resolve_move(
+                    self.cat.world, self.cat.x, self.cat.y, new_x, new_y, monster_width, monster_height)
 
     def draw(self, draw_x, draw_y):
         # Run 이미지 사용
@@ -400,21 +372,16 @@ class Kiting:
 # ========== Attack State (Chase의 하위 상태) ==========
 class Attack:
     images = None
+    clip = None
 
     def __init__(self, cat, chase_state = None):
         self.cat = cat
         self.chase_state = chase_state  # Chase 상태에 대한 참조 (optional)
 
         if Attack.images is None:
-            Attack.images = []
-            try:
-                for i in range(7):  # Cat_Assassin_Attack0 ~ Attack6
-                    img = p2.load_image(f'resources/Texture_organize/Entity/Stage2_Forest/Cat_Assassin/character/Cat_Assassin_Attack{i}.png')
-                    Attack.images.append(img)
-                print(f"[CatAssassin Attack] Loaded {len(Attack.images)} images")
-            except Exception as e:
-                print(f"\033[91m[CatAssassin Attack] Failed to load images: {e}\033[0m")
-                Attack.images = []
+            # 프레임 목록/타이밍은 resources/Animations/cat_assassin.json 매니페스트에서 로드 (타입당 1회)
+            Attack.clip = animation_clips.get_clip('cat_assassin', 'attack')
+            Attack.images = Attack.clip.frames if Attack.clip else ()
 
         self.animation_finished = False
         self.projectile_spawned = False
@@ -422,13 +389,14 @@ class Attack:
     def enter(self, e):
         self.cat.frame = 0
         self.cat.animation_time = 0
-        self.cat.animation_speed = 10  # 공격 애니메이션은 빠르게
+        self.cat.animation_speed = Attack.clip.fps if Attack.clip else 10  # 공격 애니메이션은 빠르게
         self.animation_finished = False
         self.projectile_spawned = False
         print("[Attack State] 공격 시작")
 
     def exit(self, e):
-        pass
+        # 공격 종료/중단(피격, 사망) 모두 여기서 토큰 반납
+        encounter_director.release_token(self.cat)
 
     def do(self):
         dt = framework.get_delta_time()
@@ -467,22 +435,17 @@ class Attack:
 # ========== Hit State ==========
 class Hit:
     images = None
+    clip = None
 
     def __init__(self, cat):
         self.cat = cat
 
         if Hit.images is None:
-            Hit.images = []
-            try:
-                for i in range(3):  # Cat_Assassin_Airborne0 ~ Airborne2
-                    img = p2.load_image(f'resources/Texture_organize/Entity/Stage2_Forest/Cat_Assassin/character/Cat_Assassin_Airborne{i}.png')
-                    Hit.images.append(img)
-                print(f"[CatAssassin Hit] Loaded {len(Hit.images)} images")
-            except Exception as e:
-                print(f"\033[91m[CatAssassin Hit] Failed to load images: {e}\033[0m")
-                Hit.images = []
+            # 프레임 목록/타이밍은 resources/Animations/cat_assassin.json 매니페스트에서 로드 (타입당 1회)
+            Hit.clip = animation_clips.get_clip('cat_assassin', 'airborne')
+            Hit.images = Hit.clip.frames if Hit.clip else ()
 
-        self.cat.animation_speed = 12  # 피격 애니메이션은 빠르게
+        self.cat.animation_speed = Hit.clip.fps if Hit.clip else 12  # 피격 애니메이션은 빠르게
         self.animation_finished = False
 
         # 넉백 관련 변수
@@ -565,12 +528,8 @@ class Death:
         self.cat = cat
 
         if Death.image is None:
-            try:
-                Death.image = p2.load_image(f'resources/Texture_organize/Entity/Stage2_Forest/Cat_Assassin/character/Cat_Assassin_Down0.png')
-                print(f"[CatAssassin Death] Loaded Down0 image")
-            except Exception as e:
-                print(f"\033[91m[CatAssassin Death] Failed to load image: {e}\033[0m")
-                Death.image = None
+            clip = animation_clips.get_clip('cat_assassin', 'down')
+            Death.image = clip.frames[0] if clip and clip.frames else None
 
         self.death_timer = 0.0
         self.death_duration = 3.0
@@ -654,40 +613,56 @@ class Death:
                            Death.image.h * self.cat.scale)
 
 # ========== Event Predicates ==========
+@event_predicate('DETECT_PLAYER')
 def detect_player(e):
     return e[0] == 'DETECT_PLAYER'
 
+@event_predicate('LOSE_PLAYER')
 def lose_player(e):
     return e[0] == 'LOSE_PLAYER'
 
+@event_predicate('IN_ATTACK_RANGE')
 def in_attack_range(e):
     return e[0] == 'IN_ATTACK_RANGE'
 
+@event_predicate('OUT_ATTACK_RANGE')
 def out_attack_range(e):
     return e[0] == 'OUT_ATTACK_RANGE'
 
+@event_predicate('READY_TO_ATTACK')
 def ready_to_attack(e):
     return e[0] == 'READY_TO_ATTACK'
 
+@event_predicate('ATTACK_END')
 def attack_end(e):
     return e[0] == 'ATTACK_END'
 
+@event_predicate('TAKE_HIT')
 def take_hit(e):
     return e[0] == 'TAKE_HIT'
 
+@event_predicate('HIT_END')
 def hit_end(e):
     return e[0] == 'HIT_END'
 
+@event_predicate('DIE')
 def die(e):
     return e[0] == 'DIE'
 
+# CatAssassin 공격: 타겟 방향 기준 0, ±22.5, ±45도 5발
+SHURIKEN_SPREAD = bullet_patterns.compile_pattern({
+    'aimed': True,
+    'speed': 400,
+    'shapes': [{'angles': [0.0, 22.5, -22.5, 45.0, -45.0]}],
+}, 'CatAssassin spread')
+
 # Shuriken (projectile)
 class Shuriken(Projectile):
     """수리검 발사체 - Projectile을 상속받음"""
     images = None
 
-    def __init__(self, x, y, target_x, target_y, owner=None):
-        super().__init__(x, y, target_x, target_y, speed=400, from_player=False)
+    def __init__(self, x, y, target_x, target_y, owner=None, speed=400, direction=None):
+        super().__init__(x, y, target_x, target_y, speed=speed, from_player=False, direction=direction)
 
         self.owner = owner
         self.scale = 2.5
@@ -737,6 +712,10 @@ class Shuriken(Projectile):
 
 # CatAssassin (monster)
 class CatAssassin:
+    # ai_scheduler: 화면 밖에서는 낮은 빈도로, 놓치는 거리(Chase.lose_range 600)보다 충분히 멀면 휴면
+    ai_lod = True
+    ai_dormant_range = 800
+
     def __init__(self, x = 800, y = 450):
         self.x, self.y = x, y
         self.speed = 100
@@ -812,23 +791,12 @@ class CatAssassin:
             # Shuriken을 CatAssassin의 월드 좌표(self.x, self.y)에서 생성
             # target의 월드 좌표(target.x, target.y)를 향해 발사
 
-            # 추가 수리검 생성 (총 5개, 중앙 + 4방향)
-            angle_offsets = [0.0, 22.5, -22.5, 45.0, -45.0]
-            for angle in angle_offsets:
-                rad = math.radians(angle)
-                dx = target.x - self.x
-                dy = target.y - self.y
-                distance = math.sqrt(dx**2 + dy**2)
-                if distance > 0:
-                    dir_x = dx / distance
-                    dir_y = dy / distance
-                    # 회전 변환
-                    rotated_x = dir_x * math.cos(rad) - dir_y * math.sin(rad)
-                    rotated_y = dir_x * math.sin(rad) + dir_y * math.cos(rad)
-                    new_target_x = self.x + rotated_x * distance
-                    new_target_y = self.y + rotated_y * distance
-                    extra_shuriken = Shuriken(self.x, self.y, new_target_x, new_target_y, owner=self)
-                    self.world['effects_front'].append(extra_shuriken)
+            # 수리검 5개 (중앙 + 4방향, 모듈 상단 SHURIKEN_SPREAD)
+            if target.x != self.x or target.y != self.y:
+                aim = bullet_patterns.aim_at(self.x, self.y, target.x, target.y)
+                bullet_patterns.emit(SHURIKEN_SPREAD, self.x, self.y, Shuriken, self.world['effects_front'],
+                                     aim=aim, owner=self)
+                encounter_director.report_fired(self)
 
             print(f"[CatAssassin] 수리검 발사: 시작({int(self.x)}, {int(self.y)}) -> 목표({int(target.x)}, {int(target.y)})")
 
@@ -962,7 +930,7 @@ class CatAssassin:
         if self.world and 'effects_front' in self.world:
             try:
                 # 몬스터 위치 위쪽에 데미지 인디케이터 생성
-                damage_indicator = DamageIndicator(
+                damage_indicator = DamageIndicator.spawn(
                     self.x,
                     self.y + 30,  # 몬스터 위치보다 30 픽셀 위에 표시
                     final_damage,
@@ -2,11 +2,13 @@ import pico2d as p2
 import math
 import random
 import game_framework as framework
-from ..behavior_tree import BehaviorTree, Selector, Sequence, Action, Condition, RandomSelector
+from ..behavior_tree import BehaviorTree, Selector, Sequence, Action, Condition, RandomSelector, Blackboard, add_perception
 from ..projectile import Projectile
 from .. import image_asset_manager as iam
 from ..damage_indicator import DamageIndicator
 from ..ui_overlay import MonsterHealthBar
+from .. import line_of_sight
+from .. import depth_sort
 
 # ==================== 공격 패턴 클래스 참조 ====================
 from .Boss_Logic.panther_assassin_1pattern import AttackPattern1Action
@@ -131,6 +133,13 @@ class PantherAssassin:
         self.recognition_distance = 400 # 플레이어 인식 거리
         self.unrecognition_distance = 800 # 플레이어 미인식 거리
         self.attack_range = 800  # 공격 범위 (추가)
+        self.sight = line_of_sight.SightLine()  # 벽 너머의 플레이어는 인식/공격하지 않음
+
+        # 블랙보드: 타겟/플레이어까지의 거리, 각도, 시야를 틱마다 한 번만 계산해 조건/패턴이 공유
+        self.blackboard = Blackboard()
+        add_perception(self.blackboard, 'target', self, lambda: self.target, sight=self.sight)
+        add_perception(self.blackboard, 'player', self,
+                       lambda: self.world.get('player') if self.world else None, sight=self.sight)
         self.attack_cooldown = 2.0  # 공격 쿨타임 (초)
         self.attack_timer = 0.0  # 현재 쿨타임 타이머
 
@@ -286,11 +295,9 @@ class PantherAssassin:
         if self.target is None:
             return False
 
-        dx = self.target.x - self.x
-        dy = self.target.y - self.y
-        distance = math.sqrt(dx**2 + dy**2)
-
-        return distance <= self.attack_range
+        if self.blackboard.get('target_distance') > self.attack_range:
+            return False
+        return self.blackboard.get('target_visible')
 
     # ==================== 행동 액션 메서드 ====================
 
@@ -323,6 +330,9 @@ class PantherAssassin:
                     self.mark_for_removal = True
             return  # 사망 애니메이션 진행 중 - 아무것도 반환하지 않음
 
+        # 이번 틱의 인지 값(거리/각도/시야) 캐시 초기화 - 아래 타겟 탐색과 행동 트리가 같은 값을 읽음
+        self.blackboard.begin_tick()
+
         # 무적시간 업데이트
         if self.invincible:
             self.invincible_timer -= dt
@@ -346,9 +356,7 @@ class PantherAssassin:
 
         # 플레이어 인식 거리 체크 (target이 None일 때 예외 처리)
         if self.target is not None:
-            dx = self.target.x - self.x
-            dy = self.target.y - self.y
-            distance = math.sqrt(dx**2 + dy**2)
+            distance = self.blackboard.get('target_distance')
 
             # 인식 거리를 벗어나면 타겟 해제
             if distance >= self.unrecognition_distance:
@@ -356,14 +364,12 @@ class PantherAssassin:
                 print(f'[PantherAssassin] 타겟 상실 (거리: {distance:.1f})')
         else:
             # 타겟이 없을 때 플레이어 탐색
-            if self.world and 'player' in self.world:
-                player = self.world['player']
-                dx = player.x - self.x
-                dy = player.y - self.y
-                distance = math.sqrt(dx**2 + dy**2)
-
-                # 인식 거리 내에 들어오면 타겟 설정
-                if distance <= self.recognition_distance:
+            player = self.blackboard.get('player')
+            if player is not None:
+                distance = self.blackboard.get('player_distance')
+
+                # 인식 거리 내에서 플레이어가 보이면 타겟 설정
+                if distance <= self.recognition_distance and self.blackboard.get('player_visible'):
                     self.set_target(player)
                     print(f'[PantherAssassin] 타겟 인식: 플레이어 at ({player.x}, {player.y}), 거리: {distance:.1f}')
 
@@ -528,6 +534,8 @@ class PantherAssassin:
     def set_target(self, target):
         """타겟 설정 (주로 플레이어)"""
         self.target = target
+        # 타겟 기준 값은 새 타겟으로 다시 계산
+        self.blackboard.invalidate()
 
     # ==================== 피격 판정 메서드 ====================
 
@@ -656,7 +664,7 @@ class PantherAssassin:
         if self.world and 'effects_front' in self.world:
             try:
                 # 보스 위치 위쪽에 데미지 인디케이터 생성
-                damage_indicator = DamageIndicator(
+                damage_indicator = DamageIndicator.spawn(
                     self.x,
                     self.y + 50,  # 보스 위치보다 50 픽셀 위에 표시
                     final_damage,
@@ -711,7 +719,7 @@ class PantherThrowingStar(Projectile):
     """
     image_seq = []
 
-    def __init__(self, x, y, target_x, target_y, speed=400, from_player=False, damage=15, scale=1.2):
+    def __init__(self, x, y, target_x, target_y, speed=400, from_player=False, damage=15, scale=1.2, direction=None):
         """
         PantherThrowingStar 초기화
 
@@ -722,8 +730,9 @@ class PantherThrowingStar(Projectile):
             from_player: 플레이어가 발사했는지 여부
             damage: 투사체 피해량
             scale: 이미지 크기 배율
+            direction: 정규화된 방향 벡터 (주면 목표 위치 대신 사용)
         """
-        super().__init__(x, y, target_x, target_y, speed, from_player)
+        super().__init__(x, y, target_x, target_y, speed, from_player, direction)
 
         # 투사체 속성
         self.damage = damage
@@ -806,8 +815,10 @@ class PantherShuriken(Projectile):
     """
     flying_image = None
     dissolve_images = []
+    uses_heading = True  # bullet_patterns.emit이 회전 각도(heading)를 함께 넘김
 
-    def __init__(self, x, y, target_x, target_y, speed=400, from_player=False, damage=15, scale=1.2):
+    def __init__(self, x, y, target_x, target_y, speed=400, from_player=False, damage=15, scale=1.2,
+                 direction=None, heading=None):
         """
         PantherShuriken 초기화
 
@@ -818,8 +829,10 @@ class PantherShuriken(Projectile):
             from_player: 플레이어가 발사했는지 여부
             damage: 투사체 피해량
             scale: 이미지 크기 배율
+            direction: 정규화된 방향 벡터 (주면 목표 위치 대신 사용)
+            heading: direction의 각도(라디안) (주면 atan2 생략)
         """
-        super().__init__(x, y, target_x, target_y, speed, from_player)
+        super().__init__(x, y, target_x, target_y, speed, from_player, direction)
 
         # 투사체 속성
         self.damage = damage
@@ -829,8 +842,9 @@ class PantherShuriken(Projectile):
 
         # 회전 각도 계산 (원본 이미지가 위쪽을 바라봄, +y 방향 기준)
         # math.atan2를 사용하여 방향 벡터로부터 각도 계산
-        import math
-        self.rotation_angle = math.atan2(self.dy, self.dx) + math.radians(-90) # 라디안 단위
+        if heading is None:
+            heading = math.atan2(self.dy, self.dx)
+        self.rotation_angle = heading + math.radians(-90) # 라디안 단위
 
         # 상태 관리 변수
         self.is_dissolving = False  # 소멸 애니메이션 재생 중인지
@@ -1188,3 +1202,8 @@ class Clone:
             print(f"\033[91m[Clone.draw] 오류 발생: {e}\033[0m")
             import traceback
             traceback.print_exc()
+
+
+# 충돌 박스가 collision_box_offset_y만큼 아래로 내려가 있으므로 박스 아래쪽을 발 위치로 사용
+depth_sort.register_anchor(
+    PantherAssassin, lambda obj: obj.collision_box_offset_y - obj.collision_height / 2)
@@ -0,0 +1,312 @@
+"""
+배열 기반 파티클 시스템
+
+파티클 하나마다 객체를 만들고 update()를 호출하는 대신, 위치/속도/나이/종류를 미리 할당한
+numpy 배열에 저장하고 한 번의 벡터 연산으로 모든 파티클을 적분합니다.
+수명이 다한 파티클은 마스크 인덱싱으로 한 번에 앞으로 당겨 채웁니다(compaction).
+
+이펙트 종류는 define()으로 등록한 EmitterDef(프레임, 프레임 간격, 반복 여부, 배율, 중력, 우선순위)로 구분합니다.
+
+파티클 예산 (모든 ParticleSystem 합계):
+    SOFT_BUDGET 이하: 모두 생성
+    SOFT_BUDGET ~ HARD_BUDGET: 우선순위 0 이펙트(달리기 먼지 등 장식)는 남은 여유만큼 확률적으로 솎아냄
+    HARD_BUDGET 이상: 새 파티클 생성하지 않음 (우선순위와 무관)
+
+사용법:
+    from game_logic import particles
+    particles.define('wound', frames=load_wound_frames, frame_duration=0.08, loop=False,
+                     scale=3.0, gravity=200.0, priority=1)
+    system = particles.ParticleSystem()
+    system.emit('wound', x, y, vx, vy)
+    system.update(dt)
+    system.draw(camera)
+    print(particles.stats())
+"""
+import numpy as np
+
+# 전역 파티클 예산
+SOFT_BUDGET = 768
+HARD_BUDGET = 1024
+
+# ParticleSystem 기본 용량 (가득 차면 두 배로 늘림, 예산을 넘지는 않음)
+DEFAULT_CAPACITY = 64
+
+# 이펙트 정의 {이름: EmitterDef}
+EMITTERS = {}
+
+# 이펙트 이름 <-> 종류 번호 (배열에는 번호만 저장)
+_kind_names = []
+
+# 종류 번호별 파라미터 배열 (define() 시 갱신)
+_frame_duration = np.zeros(0, dtype=np.float32)
+_frame_count = np.zeros(0, dtype=np.int32)
+_lifetime = np.zeros(0, dtype=np.float32)
+_gravity = np.zeros(0, dtype=np.float32)
+_loop = np.zeros(0, dtype=bool)
+
+# 모든 ParticleSystem의 살아 있는 파티클 수 합계
+_alive_total = 0
+
+# 통계 (이번 실행 기준)
+_stats = {'emitted': 0, 'thinned': 0, 'dropped': 0, 'peak': 0}
+
+
+class EmitterDef:
+    """
+    이펙트 종류 정의
+
+    Args:
+        name: 이펙트 이름
+        frames: pico2d Image 리스트 또는 리스트를 반환하는 함수 (처음 사용할 때 한 번 로드)
+        frame_duration: 프레임 간격(초)
+        loop: True면 수명 동안 프레임 반복, False면 마지막 프레임 유지
+        scale: 그리기 배율
+        gravity: 아래 방향 가속도 (픽셀/초^2)
+        lifetime: 수명(초), None이면 프레임 수 * 프레임 간격
+        priority: 0이면 예산이 빠듯할 때 솎아낼 수 있는 장식 이펙트, 1 이상이면 HARD_BUDGET까지 항상 생성
+    """
+
+    def __init__(self, name, frames, frame_duration, loop=True, scale=1.0, gravity=0.0,
+                 lifetime=None, priority=0):
+        self.name = name
+        self._frames = frames
+        self.frame_duration = frame_duration
+        self.loop = loop
+        self.scale = scale
+        self.gravity = gravity
+        self._lifetime = lifetime
+        self.priority = priority
+
+    @property
+    def frames(self):
+        return self.load()
+
+    def load(self):
+        """지연 로드 프레임이면 지금 로드 (수명이 프레임 수에 의존하므로 첫 생성 전에 호출)"""
+        if callable(self._frames):
+            try:
+                self._frames = list(self._frames())
+            except Exception as ex:
+                print(f'\033[91m[Particles] {self.name} 프레임 로드 실패: {ex}\033[0m')
+                self._frames = []
+            _refresh_tables()
+        return self._frames
+
+    @property
+    def frame_count(self):
+        return len(self._frames) if not callable(self._frames) else 0
+
+    @property
+    def lifetime(self):
+        if self._lifetime is not None:
+            return self._lifetime
+        return self.frame_count * self.frame_duration
+
+
+def _refresh_tables():
+    global _frame_duration, _frame_count, _lifetime, _gravity, _loop
+    defs = [EMITTERS[name] for name in _kind_names]
+    _frame_duration = np.array([max(d.frame_duration, 1e-6) for d in defs], dtype=np.float32)
+    _frame_count = np.array([max(d.frame_count, 1) for d in defs], dtype=np.int32)
+    _lifetime = np.array([d.lifetime for d in defs], dtype=np.float32)
+    _gravity = np.array([d.gravity for d in defs], dtype=np.float32)
+    _loop = np.array([d.loop for d in defs], dtype=bool)
+
+
+def define(name, frames, frame_duration, loop=True, scale=1.0, gravity=0.0, lifetime=None, priority=0):
+    """
+    이펙트 종류 등록 (같은 이름이면 정의 교체)
+
+    Returns:
+        EmitterDef
+    """
+    emitter = EmitterDef(name, frames, frame_duration, loop, scale, gravity, lifetime, priority)
+    if name not in EMITTERS:
+        _kind_names.append(name)
+    EMITTERS[name] = emitter
+    _refresh_tables()
+    return emitter
+
+
+def _kind_of(name):
+    emitter = EMITTERS.get(name)
+    if emitter is None:
+        raise KeyError(f'정의되지 않은 파티클 이펙트: {name}')
+    emitter.load()
+    return _kind_names.index(name), emitter
+
+
+def _accept_count(requested, priority):
+    """예산에 따라 실제로 생성할 수 (솎아낸 수, 버린 수는 통계에 기록)"""
+    room = HARD_BUDGET - _alive_total
+    if room <= 0:
+        _stats['dropped'] += requested
+        return 0
+    count = min(requested, room)
+    _stats['dropped'] += requested - count
+
+    if priority <= 0 and _alive_total + count > SOFT_BUDGET:
+        # 여유가 줄어들수록 장식 파티클 생성 확률을 낮춤
+        keep_ratio = max(0.0, (HARD_BUDGET - _alive_total) / float(HARD_BUDGET - SOFT_BUDGET))
+        kept = int(np.random.binomial(count, min(1.0, keep_ratio)))
+        _stats['thinned'] += count - kept
+        count = kept
+    return count
+
+
+class ParticleSystem:
+    """
+    파티클 배열 묶음 (소유자마다 하나, 예산은 모든 시스템 공유)
+
+    배열 [0, count) 구간이 살아 있는 파티클입니다.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.count = 0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        old = self.count
+        fields = {
+            'x': np.float32, 'y': np.float32, 'vx': np.float32, 'vy': np.float32,
+            'age': np.float32, 'kind': np.int16,
+        }
+        for field, dtype in fields.items():
+            array = np.zeros(capacity, dtype=dtype)
+            if old:
+                array[:old] = getattr(self, field)[:old]
+            setattr(self, field, array)
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def emit(self, name, x, y, vx=0.0, vy=0.0):
+        """
+        파티클 1개 생성
+
+        Returns:
+            bool: 예산 때문에 생성하지 않았으면 False
+        """
+        return self.emit_many(name, [x], [y], [vx], [vy]) == 1
+
+    def emit_many(self, name, xs, ys, vxs=None, vys=None):
+        """
+        같은 종류 파티클 여러 개를 한 번에 생성
+
+        Args:
+            name: define()으로 등록한 이펙트 이름
+            xs, ys: 월드 좌표 시퀀스
+            vxs, vys: 속도 시퀀스 (None이면 0)
+
+        Returns:
+            int: 실제로 생성한 수
+        """
+        global _alive_total
+        kind, emitter = _kind_of(name)
+        requested = len(xs)
+        n = _accept_count(requested, emitter.priority)
+        if n <= 0:
+            return 0
+
+        if self.count + n > self.capacity:
+            capacity = self.capacity
+            while self.count + n > capacity:
+                capacity *= 2
+            self._allocate(capacity)
+
+        start, end = self.count, self.count + n
+        self.x[start:end] = np.asarray(xs, dtype=np.float32)[:n]
+        self.y[start:end] = np.asarray(ys, dtype=np.float32)[:n]
+        self.vx[start:end] = 0.0 if vxs is None else np.asarray(vxs, dtype=np.float32)[:n]
+        self.vy[start:end] = 0.0 if vys is None else np.asarray(vys, dtype=np.float32)[:n]
+        self.age[start:end] = 0.0
+        self.kind[start:end] = kind
+        self.count = end
+
+        _alive_total += n
+        _stats['emitted'] += n
+        _stats['peak'] = max(_stats['peak'], _alive_total)
+        return n
+
+    def update(self, dt):
+        """모든 파티클 적분 후 수명이 다한 파티클 제거"""
+        global _alive_total
+        n = self.count
+        if n == 0:
+            return
+        kind = self.kind[:n]
+        self.x[:n] += self.vx[:n] * dt
+        self.y[:n] += self.vy[:n] * dt
+        self.vy[:n] -= _gravity[kind] * dt
+        age = self.age[:n]
+        age += dt
+
+        alive = age < _lifetime[kind]
+        keep = np.flatnonzero(alive)
+        if len(keep) == n:
+            return
+        m = len(keep)
+        for array in (self.x, self.y, self.vx, self.vy, self.age, self.kind):
+            array[:m] = array[keep]
+        self.count = m
+        _alive_total -= n - m
+
+    def frame_indices(self):
+        """살아 있는 파티클의 현재 프레임 번호 배열"""
+        n = self.count
+        kind = self.kind[:n]
+        frame = (self.age[:n] / _frame_duration[kind]).astype(np.int32)
+        count = _frame_count[kind]
+        return np.where(_loop[kind], frame % count, np.minimum(frame, count - 1))
+
+    def draw(self, camera=None):
+        """
+        파티클 그리기
+
+        Args:
+            camera: apply(x, y)를 제공하는 카메라 (None이면 월드 좌표 그대로)
+        """
+        n = self.count
+        if n == 0:
+            return
+        # 카메라 변환은 평행 이동이므로 원점 오프셋 한 번만 계산
+        ox, oy = camera.apply(0, 0) if camera is not None else (0, 0)
+        sx = (self.x[:n] + ox).tolist()
+        sy = (self.y[:n] + oy).tolist()
+        frames = self.frame_indices().tolist()
+        kinds = self.kind[:n].tolist()
+        emitters = [EMITTERS[name] for name in _kind_names]
+        for i in range(n):
+            emitter = emitters[kinds[i]]
+            images = emitter.frames
+            if not images:
+                continue
+            image = images[frames[i]]
+            image.draw(sx[i], sy[i], image.w * emitter.scale, image.h * emitter.scale)
+
+    def clear(self):
+        """모든 파티클 제거"""
+        global _alive_total
+        _alive_total -= self.count
+        self.count = 0
+
+    def __del__(self):
+        # 소유자가 사라지면 예산에서도 제외
+        try:
+            self.clear()
+        except Exception:
+            pass
+
+
+def stats():
+    """
+    통계
+
+    Returns:
+        dict: {'alive', 'emitted', 'thinned', 'dropped', 'peak', 'emitters'}
+    """
+    result = {'alive': _alive_total}
+    result.update(_stats)
+    result['emitters'] = len(EMITTERS)
+    return result
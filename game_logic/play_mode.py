@@ -9,6 +9,14 @@ from .player import Player
 from .ui_overlay import InventoryOverlay, HealthBar, ManaBar, DashBar, BuffIndicatorUI
 from .cursor import Cursor
 from .loading_screen import LoadingScreen
+from . import asset_pack
+from . import render_queue
+from . import depth_sort
+from . import static_layers
+from . import render_scale
+from . import walkable_grid
+from . import ai_scheduler
+from . import encounter_director
 from . import defeat_mode, victory_mode
 # 사용할 스테이지 모듈들을 import 합니다.
 from .stages import stage_1, stage_2, stage_3
@@ -125,6 +133,9 @@ class Camera:
 # Camera 객체를 전역으로 선언
 camera = None
 
+# 스테이지의 정적 월드 배경을 미리 합성한 레이어 (static_layers.StaticLayer)
+stage_background = None
+
 
 def calculate_background_bounds():
     """
@@ -280,7 +291,7 @@ def generate_walls_from_png(png_path, block_size=8, map_x=0, map_y=0, map_scale=
     print(f"  - block_size={block_size}, map_x={map_x}, map_y={map_y}, map_scale={map_scale}")
 
     try:
-        img = Image.open(png_path).convert('RGBA')
+        img = Image.open(asset_pack.open_binary(png_path)).convert('RGBA')
     except Exception as ex:
         print(f"\033[91m[generate_walls_from_png] 이미지 열기 실패: {ex}\033[0m")
         return []
@@ -339,6 +350,7 @@ def generate_walls_from_png(png_path, block_size=8, map_x=0, map_y=0, map_scale=
 def _complete_stage_change():
     """로딩이 완료된 후 실제 스테이지 전환을 수행"""
     global current_stage_index, world, is_stage_cleared, loading_screen, is_loading, next_stage_to_load, camera
+    global stage_background
 
     print(f"[_complete_stage_change] 스테이지 {next_stage_to_load + 1} 로드 시작")
 
@@ -356,6 +368,9 @@ def _complete_stage_change():
 
     # 새 스테이지 로드
     stages[current_stage_index].load(world)
+    walkable_grid.clear()
+    ai_scheduler.clear()
+    encounter_director.reset(getattr(stages[current_stage_index], 'ENCOUNTER_LIMITS', None))
 
     # 스테이지 맵에서 벽 생성 (ground 레이어의 첫 번째 객체가 맵이라고 가정)
     try:
@@ -383,9 +398,40 @@ def _complete_stage_change():
                         world['walls'].append(wall)
 
                     print(f"[_complete_stage_change] {len(wall_blocks)}개의 벽 생성 완료")
+
+                    # 스폰/텔레포트 위치 샘플링용 걷기 가능 셀 인덱스 (벽 목록에서 1회 생성)
+                    map_w = stage_map.width
+                    map_h = stage_map.height
+                    walkable_grid.build(world['walls'], bounds=(
+                        stage_map.x - map_w / 2, stage_map.y - map_h / 2,
+                        stage_map.x + map_w / 2, stage_map.y + map_h / 2))
     except Exception as ex:
         print(f"\033[91m[_complete_stage_change] 벽 생성 실패: {ex}\033[0m")
 
+    # 스테이지 데이터의 몬스터 위치가 벽과 겹치면 가장 가까운 걷기 가능 위치로 옮김
+    grid = walkable_grid.get_current()
+    if grid is not None:
+        for o in world['entities']:
+            if o is player or not hasattr(o, 'collision_width'):
+                continue
+            clearance = max(o.collision_width, getattr(o, 'collision_height', 0)) / 2
+            point = grid.nearest_walkable_point(o.x, o.y, clearance)
+            if point is not None and point != (o.x, o.y):
+                print(f"[_complete_stage_change] {o.__class__.__name__} 스폰 위치 보정: "
+                      f"({o.x:.0f}, {o.y:.0f}) -> ({point[0]:.0f}, {point[1]:.0f})")
+                o.x, o.y = point
+
+    # 카메라를 따라 움직이는 정적 배경(StageMap 등)은 텍스처 한 장으로 미리 합성 (이미지가 2장 이상일 때만)
+    try:
+        from .background import FixedBackground
+        static_layers.clear()
+        stage_background = static_layers.get_layer(
+            f'stage_{current_stage_index + 1}',
+            [o for o in world['bg'] if not isinstance(o, FixedBackground)])
+    except Exception as ex:
+        print(f"\033[91m[_complete_stage_change] 정적 배경 합성 실패: {ex}\033[0m")
+        stage_background = None
+
     # 플레이어 위치 설정 (스테이지에 PLAYER_START_POSITION이 있으면 사용)
     if player:
         next_stage_module = stages[current_stage_index]
@@ -653,6 +699,12 @@ def enter(player=None):
     # Camera 초기화는 _complete_stage_change에서 진행됨
 
 def exit():
+    global stage_background
+    static_layers.clear()
+    stage_background = None
+    walkable_grid.clear()
+    ai_scheduler.clear()
+    encounter_director.reset()
     for k in list(world.keys()):
         try:
             if isinstance(world[k], list):
@@ -766,12 +818,21 @@ def update():
     if camera is not None:
         camera.update()
 
+    # 몬스터 AI 틱 계획 (화면 밖/먼 몬스터는 낮은 빈도로)
+    ai_scheduler.begin_frame(world['entities'], world.get('player'), camera)
+    # 공격 토큰/투사체 예산 정리 (몬스터 공격 상태가 이번 프레임에 토큰을 요청하기 전에)
+    encounter_director.begin_frame(world)
+
     # 일반 게임 업데이트
     for layer_name in ['bg', 'effects_back', 'entities', 'effects_front', 'ui', 'extra_bg', 'extras', 'cursor']:
         new_list = []
         for o in list(world[layer_name]):
             try:
-                if hasattr(o, 'update'):
+                if ai_scheduler.is_agent(o):
+                    alive = ai_scheduler.update_agent(o)
+                    if alive is False:
+                        continue
+                elif hasattr(o, 'update'):
                     alive = o.update()
                     if alive is False:
                         continue
@@ -915,45 +976,71 @@ def draw():
         from .background import FixedBackground
         from .equipment import ShieldRangeEffect
 
-        for o in world['bg']:
-            if isinstance(o, FixedBackground):
-                try:
-                    if hasattr(o, 'draw'):
-                        o.draw()  # FixedBackground는 인자 없이 호출
-                except Exception as ex:
-                    print(f'\033[91m[play_mode] FixedBackground 그리기 오류: {ex}\033[0m')
-                    pass
+        # 엔티티는 발 위치 Y 기준으로 뒤 -> 앞 순서 유지 (거의 정렬된 상태라 O(n)에 가까움)
+        depth_sort.sort_by_depth(world['entities'])
 
-        # 2. 나머지 객체들은 카메라 좌표 적용하여 그리기
-        for layer_name in ['bg', 'walls', 'upper_ground', 'effects_back', 'entities', 'effects_front', 'extra_bg', 'extras']:
-            for o in world[layer_name]:
-                # FixedBackground는 이미 그렸으므로 스킵
+        # 렌더 스케일이 1 미만이면 월드는 내부 해상도 타깃에 그린 뒤 확대
+        render_scale.begin()
+
+        # 월드 레이어 그리기 호출은 렌더 큐에 모았다가 레이어/텍스처 순으로 정렬해 한 번에 내보냄
+        # 그리는 중 예외가 나도 기록 함수를 걷어내고 쌓인 명령을 내보냄 (다음 프레임에 섞이지 않도록)
+        # 렌더 스케일 타깃도 같이 해제해 UI가 내부 해상도 타깃에 그려지지 않게 함
+        try:
+            render_queue.begin()
+
+            for o in world['bg']:
                 if isinstance(o, FixedBackground):
-                    continue
+                    render_queue.next_object()
+                    try:
+                        if hasattr(o, 'draw'):
+                            o.draw()  # FixedBackground는 인자 없이 호출
+                    except Exception as ex:
+                        print(f'\033[91m[play_mode] FixedBackground 그리기 오류: {ex}\033[0m')
+                        pass
 
-                try:
-                    if hasattr(o, 'draw'):
-                        # ShieldRangeEffect는 특별 처리 (플레이어 위치 기준)
-                        if isinstance(o, ShieldRangeEffect):
-                            if hasattr(o, 'player') and o.player:
+            # 2. 나머지 객체들은 카메라 좌표 적용하여 그리기
+            for layer_index, layer_name in enumerate(['bg', 'walls', 'upper_ground', 'effects_back', 'entities', 'effects_front', 'extra_bg', 'extras'], start=1):
+                render_queue.set_layer(layer_index, batch=layer_name in render_queue.BATCH_LAYERS)
+                static_drawn = False
+                if layer_name == 'bg' and stage_background is not None:
+                    render_queue.next_object()
+                    static_drawn = stage_background.draw(camera)
+                for o in world[layer_name]:
+                    # FixedBackground는 이미 그렸으므로 스킵
+                    if isinstance(o, FixedBackground):
+                        continue
+                    # 합성된 정적 배경에 포함된 객체도 스킵
+                    if static_drawn and stage_background.contains(o):
+                        continue
+
+                    render_queue.next_object()
+
+                    try:
+                        if hasattr(o, 'draw'):
+                            # ShieldRangeEffect는 특별 처리 (플레이어 위치 기준)
+                            if isinstance(o, ShieldRangeEffect):
+                                if hasattr(o, 'player') and o.player:
+                                    if camera is not None:
+                                        draw_x, draw_y = camera.apply(o.player.x, o.player.y)
+                                    else:
+                                        draw_x, draw_y = o.player.x, o.player.y
+                                    o.draw(draw_x, draw_y)
+                            # x, y 속성이 있는 객체는 카메라 좌표로 변환하여 그리기
+                            elif hasattr(o, 'x') and hasattr(o, 'y'):
                                 if camera is not None:
-                                    draw_x, draw_y = camera.apply(o.player.x, o.player.y)
+                                    draw_x, draw_y = camera.apply(o.x, o.y)
                                 else:
-                                    draw_x, draw_y = o.player.x, o.player.y
+                                    draw_x, draw_y = o.x, o.y
                                 o.draw(draw_x, draw_y)
-                        # x, y 속성이 있는 객체는 카메라 좌표로 변환하여 그리기
-                        elif hasattr(o, 'x') and hasattr(o, 'y'):
-                            if camera is not None:
-                                draw_x, draw_y = camera.apply(o.x, o.y)
                             else:
-                                draw_x, draw_y = o.x, o.y
-                            o.draw(draw_x, draw_y)
-                        else:
-                            # x, y 속성이 없는 객체는 그대로 그리기
-                            o.draw()
-                except Exception as ex:
-                    print(f'\033[91m[play_mode] {layer_name} 레이어의 {o.__class__.__name__} 그리기 오류: {ex}\033[0m')
-                    pass
+                                # x, y 속성이 없는 객체는 그대로 그리기
+                                o.draw()
+                    except Exception as ex:
+                        print(f'\033[91m[play_mode] {layer_name} 레이어의 {o.__class__.__name__} 그리기 오류: {ex}\033[0m')
+                        pass
+        finally:
+            render_queue.flush()
+            render_scale.end()
 
         # 3. UI와 커서는 카메라 적용하지 않음 (고정 UI)
         for o in world['ui']:
@@ -9,54 +9,72 @@ import os
 import random
 import time
 
-from pico2d import load_image, get_canvas_height, get_canvas_width, draw_rectangle, load_wav
+from pico2d import load_image, get_canvas_height, get_canvas_width, draw_rectangle
 from sdl2 import (SDL_KEYDOWN, SDL_KEYUP, SDLK_a, SDLK_d, SDLK_w, SDLK_s, SDLK_TAB, SDLK_SPACE, SDL_GetMouseState,
                    SDL_MOUSEBUTTONDOWN, SDL_MOUSEBUTTONUP, SDL_BUTTON_LEFT, SDL_BUTTON_RIGHT)
 
 from .equipment import EquipmentManager, Sword, Shield
-from .state_machine import StateMachine
+from .state_machine import StateMachine, event_predicate
 import game_framework as framework
 # 인벤토리 데이터 모델 import
 from .inventory import InventoryData, seed_debug_inventory
 from .stats import PlayerStats, StatModifier
 from .damage_indicator import DamageIndicator
+from . import asset_pack
+from . import sound_bank
+from . import particles
+from .animation_clips import Animator, make_clip
 
+@event_predicate('INPUT', SDL_KEYDOWN, SDLK_a)
 def Akey_down(e):
     return e[0] == 'INPUT' and e[1].type == SDL_KEYDOWN and e[1].key == SDLK_a
+@event_predicate('INPUT', SDL_KEYUP, SDLK_a)
 def Akey_up(e):
     return e[0] == 'INPUT' and e[1].type == SDL_KEYUP and e[1].key == SDLK_a
+@event_predicate('INPUT', SDL_KEYDOWN, SDLK_d)
 def Dkey_down(e):
     return e[0] == 'INPUT' and e[1].type == SDL_KEYDOWN and e[1].key == SDLK_d
+@event_predicate('INPUT', SDL_KEYUP, SDLK_d)
 def Dkey_up(e):
     return e[0] == 'INPUT' and e[1].type == SDL_KEYUP and e[1].key == SDLK_d
+@event_predicate('INPUT', SDL_KEYDOWN, SDLK_w)
 def Wkey_down(e):
     return e[0] == 'INPUT' and e[1].type == SDL_KEYDOWN and e[1].key == SDLK_w
+@event_predicate('INPUT', SDL_KEYUP, SDLK_w)
 def Wkey_up(e):
     return e[0] == 'INPUT' and e[1].type == SDL_KEYUP and e[1].key == SDLK_w
+@event_predicate('INPUT', SDL_KEYDOWN, SDLK_s)
 def Skey_down(e):
     return e[0] == 'INPUT' and e[1].type == SDL_KEYDOWN and e[1].key == SDLK_s
+@event_predicate('INPUT', SDL_KEYUP, SDLK_s)
 def Skey_up(e):
     return e[0] == 'INPUT' and e[1].type == SDL_KEYUP and e[1].key == SDLK_s
 
 # 스페이스바 입력 검사용 predicate
+@event_predicate('INPUT', SDL_KEYDOWN, SDLK_SPACE)
 def Space_down(e):
     return e[0] == 'INPUT' and e[1].type == SDL_KEYDOWN and e[1].key == SDLK_SPACE
 
 # 커스텀 이벤트 정의
+@event_predicate('MOVE')
 def move_event(e):
     return e[0] == 'MOVE'
 
+@event_predicate('STOP')
 def stop_event(e):
     return e[0] == 'STOP'
 
 # 대시 이벤트 정의
+@event_predicate('DASH')
 def dash_event(e):
     return e[0] == 'DASH'
 
+@event_predicate('DASH_END')
 def dash_end_event(e):
     return e[0] == 'DASH_END'
 
 # Tab 키 입력 검사용 predicate (StateMachine 매핑용)
+@event_predicate('INPUT', SDL_KEYDOWN, SDLK_TAB)
 def Tab_down(e):
     return e[0] == 'INPUT' and e[1].type == SDL_KEYDOWN and e[1].key == SDLK_TAB
 
@@ -66,7 +84,7 @@ class Run:
         folder = os.path.join('resources', 'Texture_organize', 'Player_character', 'Adventurer')
 
         def load_seq(prefix, path):
-            files = sorted([f for f in os.listdir(path)
+            files = sorted([f for f in asset_pack.listdir(path)
                            if isinstance(f, str) and f.startswith(prefix) and f.lower().endswith('.png')])
             return [load_image(os.path.join(path, f)) for f in files]
 
@@ -76,15 +94,15 @@ class Run:
         # 파티클 리소스 로드
         particle_folder = os.path.join('resources', 'Texture_organize', 'VFX', 'Run_Dust')
         self.particle_frames = load_seq('RunDust_Ver2_', particle_folder)
+        particles.define('run_dust', self.particle_frames, frame_duration=0.05, scale=2.0)
         self.particle_spawn_timer = 0.0
         self.particle_spawn_interval = 0.15 # 파티클 생성 간격
 
         if not self.lower_frames or not self.upper_frames:
             raise RuntimeError(f'Move frames not found in {folder}')
 
-        self.frame = 0
-        self.frame_time_acc = 0.0
-        self.frame_duration = 0.06
+        # 상·하체 프레임 수가 같으므로 하체 클립의 프레임 번호를 상체에도 사용
+        self.animator = Animator(make_clip('player_run', self.lower_frames, 0.06))
         self.moving_speed = 300 # 초당 픽셀
 
     def enter(self, e):
@@ -98,12 +116,7 @@ class Run:
     def do(self):
         dt = framework.get_delta_time()
 
-        # 플레이어 애니메이션 및 위치 업데이트
-        self.frame_time_acc += dt
-        if self.frame_time_acc >= self.frame_duration:
-            self.frame_time_acc -= self.frame_duration
-            self.frame = (self.frame + 1) % len(self.lower_frames)
-
+        # 플레이어 위치 업데이트 (애니메이션 프레임은 draw에서 시계로 계산)
         # 현재 스탯 기반 이동 속도 사용
         moving_speed = self.player.stats.get('move_speed') if hasattr(self.player, 'stats') else self.moving_speed
         dir_magnitude = (self.player.dir[0] ** 2 + self.player.dir[1] ** 2) ** 0.5
@@ -171,8 +184,7 @@ class Run:
             # y 오프셋을 줄여서 발 위치에 더 가깝게 배치
             particle_x = self.player.x + random.uniform(-10, 10)
             particle_y = self.player.y - 20 + random.uniform(-5, 5)  # -40에서 -20으로 조정
-            new_particle = VFX_Run_Particle(particle_x, particle_y, self.particle_frames, 0.05, 2.0)
-            self.player.particles.append(new_particle)
+            self.player.particles.emit('run_dust', particle_x, particle_y)
 
 
     def draw(self, draw_x, draw_y):
@@ -211,8 +223,9 @@ class Run:
         else:
             self.player.face_dir = 1
         flip = '' if self.player.face_dir == 1 else 'h'
-        lower = self.lower_frames[self.frame]
-        upper = self.upper_frames[self.frame]
+        frame = self.animator.frame_index
+        lower = self.lower_frames[frame]
+        upper = self.upper_frames[frame]
         lw, lh = lower.w, lower.h
         uw, uh = upper.w, upper.h
 
@@ -235,7 +248,7 @@ class Dash:
         folder = os.path.join('resources', 'Texture_organize', 'Player_character', 'Adventurer')
 
         def load_seq(prefix, path):
-            files = sorted([f for f in os.listdir(path)
+            files = sorted([f for f in asset_pack.listdir(path)
                            if isinstance(f, str) and f.startswith(prefix) and f.lower().endswith('.png')])
             return [load_image(os.path.join(path, f)) for f in files]
 
@@ -246,9 +259,7 @@ class Dash:
         if not self.lower_frames or not self.upper_frames:
             raise RuntimeError(f'Dash frames not found in {folder}')
 
-        self.frame = 0
-        self.frame_time_acc = 0.0
-        self.frame_duration = 0.03  # Run보다 2배 빠른 애니메이션
+        self.animator = Animator(make_clip('player_dash', self.lower_frames, 0.03))  # Run보다 2배 빠른 애니메이션
 
         # 대시 설정
         self.dash_duration = 0.15  # 대시 지속 시간 (0.15초)
@@ -267,8 +278,7 @@ class Dash:
         """대시 상태 진입"""
         # 대시 타이머 초기화
         self.dash_timer = 0.0
-        self.frame = 0
-        self.frame_time_acc = 0.0
+        self.animator.play()
 
         # 잔상 타이머 초기화
         self.trail_timer = 0.0
@@ -311,12 +321,6 @@ class Dash:
             # 잔상 이펙트 생성
             self._create_trail_effect()
 
-        # 애니메이션 업데이트
-        self.frame_time_acc += dt
-        if self.frame_time_acc >= self.frame_duration:
-            self.frame_time_acc -= self.frame_duration
-            self.frame = (self.frame + 1) % len(self.lower_frames)
-
         # 대시 이동 처리
         # 현재 스탯 기반 이동 속도 사용
         base_speed = self.player.stats.get('move_speed') if hasattr(self.player, 'stats') else 300
@@ -441,8 +445,9 @@ class Dash:
             self.player.face_dir = 1
         flip = '' if self.player.face_dir == 1 else 'h'
 
-        lower = self.lower_frames[self.frame]
-        upper = self.upper_frames[self.frame]
+        frame = self.animator.frame_index
+        lower = self.lower_frames[frame]
+        upper = self.upper_frames[frame]
         lw, lh = lower.w, lower.h
         uw, uh = upper.w, upper.h
 
@@ -464,7 +469,7 @@ class Idle:
         folder = os.path.join('resources', 'Texture_organize', 'Player_character', 'Adventurer')
 
         def load_seq(prefix):
-            files = sorted([f for f in os.listdir(folder)
+            files = sorted([f for f in asset_pack.listdir(folder)
                            if isinstance(f, str) and f.startswith(prefix) and f.lower().endswith('.png')])
             return [load_image(os.path.join(folder, f)) for f in files]
 
@@ -474,9 +479,7 @@ class Idle:
         if not self.lower_frames or not self.upper_frames:
             raise RuntimeError(f'Idle frames not found in {folder}')
 
-        self.frame = 0
-        self.frame_time_acc = 0.0
-        self.frame_duration = 0.12
+        self.animator = Animator(make_clip('player_idle', self.lower_frames, 0.12))
 
     def enter(self, e):
         self.player.dir = [0, 0]
@@ -485,12 +488,8 @@ class Idle:
         pass
 
     def do(self):
-        dt = framework.get_delta_time()
-
-        self.frame_time_acc += dt
-        while self.frame_time_acc >= self.frame_duration:
-            self.frame_time_acc -= self.frame_duration
-            self.frame = (self.frame + 1) % len(self.lower_frames)
+        # 애니메이션 프레임은 draw에서 시계로 계산하므로 갱신할 것이 없음
+        pass
 
     def draw(self, draw_x, draw_y):
         # 마우스 위치 읽기
@@ -528,8 +527,9 @@ class Idle:
         else:
             self.player.face_dir = 1
         flip = '' if self.player.face_dir == 1 else 'h'
-        lower = self.lower_frames[self.frame]
-        upper = self.upper_frames[self.frame]
+        frame = self.animator.frame_index
+        lower = self.lower_frames[frame]
+        upper = self.upper_frames[frame]
         lw, lh = lower.w, lower.h
         uw, uh = upper.w, upper.h
 
@@ -829,15 +829,12 @@ class Death:
 
 
 # 사망 이벤트 predicate
+@event_predicate('DIE')
 def die(e):
     return e[0] == 'DIE'
 
 
 class Player:
-    attack1_sound = None
-    attack2_sound = None
-    attack3_sound = None
-
     def __init__(self):
         self.x = get_canvas_width() // 2
         self.y = get_canvas_height() // 2
@@ -849,7 +846,7 @@ class Player:
         self.scale_factor = 3.0
         self.keys_down = {'w': False, 'a': False, 's': False, 'd': False}
         self.moving = False # 이동 상태 플래그
-        self.particles = [] # 파티클 리스트를 Player로 이동
+        self.particles = particles.ParticleSystem() # 달리기 먼지, 피격 파티클 (배열 기반)
         self.attack_effects = [] # 공격 이펙트 리스트
         self.dash_stack_max = 3 # 대시 최대 스택
         self.dash_stack = self.dash_stack_max # 대시 스택 초기화
@@ -907,11 +904,8 @@ class Player:
         self.equipment_manager.equip(self.sword)
         self.equipment_manager.equip(self.shield)
 
-        if Player.attack1_sound is None:
-            Player.attack1_sound = load_wav('resources/Sounds/Sword_Attack_1.wav')
-            Player.attack2_sound = load_wav('resources/Sounds/Sword_Attack_2.wav')
-            Player.attack3_sound = load_wav('resources/Sounds/Sword_Attack_3.wav')
-            print('[Player] 검 공격 사운드 로드 완료 (Sword_Attack_1~3.wav)')
+        # 검 공격 사운드 (사운드 뱅크에서 한 번만 로드)
+        sound_bank.preload(('sword_attack_1', 'sword_attack_2', 'sword_attack_3'))
 
         # 상태 정의
         self.IDLE = Idle(self)
@@ -1026,9 +1020,7 @@ class Player:
                     pass
 
         # 파티클 업데이트 (상태와 무관하게 항상 실행)
-        for p in self.particles:
-            p.update()
-        self.particles = [p for p in self.particles if p.life > 0]
+        self.particles.update(framework.get_delta_time())
 
         # 공격 이펙트 업데이트
         for effect in self.attack_effects:
@@ -1282,13 +1274,7 @@ class Player:
         # 4) 파티클/공격 이펙트 (카메라 적용)
         try:
             # 위에서 이미 가져온 camera 사용
-            for p in getattr(self, 'particles', []):
-                if hasattr(p, 'draw'):
-                    if camera is not None:
-                        particle_draw_x, particle_draw_y = camera.apply(p.x, p.y)
-                        p.draw(particle_draw_x, particle_draw_y)
-                    else:
-                        p.draw(p.x, p.y)
+            self.particles.draw(camera)
             for e in getattr(self, 'attack_effects', []):
                 if hasattr(e, 'draw'):
                     if camera is not None:
@@ -1498,31 +1484,25 @@ class Player:
             print(f"[Player] 피격당함! 공격자: {attacker_name} (스탯 시스템 없음)")
 
         # 피격 이펙트 재생 - Wound Particle 생성 (4개)
+        xs, ys, vxs, vys = [], [], [], []
         for i in range(4):
             # 랜덤한 방향으로 파티클 발사
             angle = random.uniform(0, 2 * math.pi)
             speed = random.uniform(80, 150)  # 속도 랜덤
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed + random.uniform(50, 100) # 위쪽으로 약간 더 많이
+            vxs.append(math.cos(angle) * speed)
+            vys.append(math.sin(angle) * speed + random.uniform(50, 100)) # 위쪽으로 약간 더 많이
 
             # 플레이어 위치에서 약간 랜덤한 오프셋
-            offset_x = random.uniform(-10, 10)
-            offset_y = random.uniform(-10, 10)
-
-            wound_particle = VFX_Wound_Particle(
-                self.x + offset_x,
-                self.y + offset_y,
-                vx, vy,
-                scale=3.0
-            )
-            self.particles.append(wound_particle)
+            xs.append(self.x + random.uniform(-10, 10))
+            ys.append(self.y + random.uniform(-10, 10))
+        self.particles.emit_many('wound', xs, ys, vxs, vys)
 
         print(f"[Player] 피격 이펙트 생성 완료 (Wound Particle x4)")
 
         # 데미지 인디케이터 생성
         try:
             if hasattr(self, 'world') and self.world and 'effects_front' in self.world:
-                dmg_indicator = DamageIndicator(
+                dmg_indicator = DamageIndicator.spawn(
                     x=self.x,
                     y=self.y,
                     damage=final_damage,
@@ -1542,105 +1522,17 @@ class Player:
         print("[Player] on_death 호출 - Death 상태로 전환")
         self.state_machine.handle_state_event(('DIE', None))
 
-class VFX_Run_Particle:
-    def __init__(self, x, y, frames, frame_duration, scale):
-        self.x, self.y = x, y
-        self.frames = frames
-        self.frame = 0
-        self.frame_time_acc = 0.0
-        self.frame_duration = frame_duration
-        self.scale_factor = scale
-        self.life = len(frames) * frame_duration
-
-    def update(self):
-        dt = framework.get_delta_time()
-        self.life -= dt
-        if self.life < 0:
-            return False  # 수명이 다하면 False 반환
-
-        self.frame_time_acc += dt
-        if self.frame_time_acc >= self.frame_duration:
-            self.frame_time_acc -= self.frame_duration
-            self.frame = (self.frame + 1) % len(self.frames)
-        return True
-
-    def draw(self, draw_x, draw_y):
-        # draw_x, draw_y는 카메라가 적용된 화면 좌표
-        if self.frame < len(self.frames):
-            image = self.frames[self.frame]
-            image.draw(draw_x, draw_y, image.w * self.scale_factor, image.h * self.scale_factor)
-
-
-class VFX_Wound_Particle:
-    """피격 시 출혈 파티클 이펙트 (개별 이미지 파일 사용)"""
-    _frames = None  # 클래스 변수로 이미지 프레임 공유
+def _load_wound_frames():
+    """피격 출혈 파티클 프레임 로드 (WoundParticle_0 ~ WoundParticle_4)"""
+    wound_folder = os.path.join('resources', 'Texture_organize', 'VFX', 'Wound_Particle')
+    frames = [load_image(os.path.join(wound_folder, f'WoundParticle_{i}.png')) for i in range(5)]
+    print(f"[WoundParticle] 이미지 로드 완료: {len(frames)}개 프레임")
+    return frames
 
-    def __init__(self, x, y, vx, vy, scale=3.0):
-        # 이미지 프레임 로드 (최초 1회만)
-        if VFX_Wound_Particle._frames is None:
-            VFX_Wound_Particle._frames = []
-            wound_folder = os.path.join('resources', 'Texture_organize', 'VFX', 'Wound_Particle')
-            try:
-                for i in range(5):  # WoundParticle_0 ~ WoundParticle_4
-                    img_path = os.path.join(wound_folder, f'WoundParticle_{i}.png')
-                    frame = load_image(img_path)
-                    VFX_Wound_Particle._frames.append(frame)
-                print(f"[WoundParticle] 이미지 로드 완료: {len(VFX_Wound_Particle._frames)}개 프레임")
-            except Exception as ex:
-                print(f"[WoundParticle] 이미지 로드 실패: {ex}")
-                VFX_Wound_Particle._frames = []
 
-        self.x = x
-        self.y = y
-        self.vx = vx  # x 방향 속도
-        self.vy = vy  # y 방향 속도
-        self.scale_factor = scale
-
-        # 애니메이션 설정
-        self.total_frames = 5  # 총 프레임 수
-        self.current_frame = 0
-        self.frame_duration = 0.08  # 각 프레임당 0.08초
-        self.frame_time_acc = 0.0
-        self.life = self.total_frames * self.frame_duration  # 총 수명
-
-        # 중력 효과
-        self.gravity = 200.0  # 픽셀/초^2
-
-    def update(self):
-        dt = framework.get_delta_time()
-
-        # 수명 감소
-        self.life -= dt
-        if self.life <= 0:
-            return False
-
-        # 물리 업데이트
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.vy -= self.gravity * dt  # 중력 적용
-
-        # 애니메이션 업데이트
-        self.frame_time_acc += dt
-        if self.frame_time_acc >= self.frame_duration:
-            self.frame_time_acc -= self.frame_duration
-            self.current_frame += 1
-            if self.current_frame >= self.total_frames:
-                self.current_frame = self.total_frames - 1  # 마지막 프레임 유지
-
-        return True
-
-    def draw(self, draw_x, draw_y):
-        # draw_x, draw_y는 카메라가 적용된 화면 좌표
-        if not VFX_Wound_Particle._frames or len(VFX_Wound_Particle._frames) == 0:
-            return
-
-        if self.current_frame < len(VFX_Wound_Particle._frames):
-            image = VFX_Wound_Particle._frames[self.current_frame]
-            image.draw(
-                draw_x, draw_y,
-                image.w * self.scale_factor,
-                image.h * self.scale_factor
-            )
+# 피격 시 출혈 파티클 (마지막 프레임 유지, 중력 200 픽셀/초^2)
+particles.define('wound', _load_wound_frames, frame_duration=0.08, loop=False,
+                 scale=3.0, gravity=200.0, priority=1)
 
 
 # VFX 전역 배율 설정: 전체 이펙트 크기와 거리(범위)를 일괄 조정
@@ -20,13 +20,14 @@ class Projectile:
         from_player: 플레이어가 쏜 투사체인지 (True), 몬스터가 쏜 투사체인지 (False)
     """
 
-    def __init__(self, x, y, target_x, target_y, speed=400, from_player=False):
+    def __init__(self, x, y, target_x, target_y, speed=400, from_player=False, direction=None):
         """
         Args:
             x, y: 시작 위치
-            target_x, target_y: 목표 위치
+            target_x, target_y: 목표 위치 (direction을 주면 사용하지 않음)
             speed: 이동 속도 (픽셀/초)
             from_player: 플레이어가 쏜 투사체인지 여부
+            direction: 이미 정규화된 방향 벡터 (ux, uy) - bullet_patterns 테이블에서 바로 넘길 때
         """
         self.x = x
         self.y = y
@@ -36,17 +37,20 @@ class Projectile:
         # Bounding box 크기 초기화
         self.collision_width, self.collision_height = 30, 30
 
-        # 방향 벡터 계산
-        dx = target_x - self.x
-        dy = target_y - self.y
-        dist = math.sqrt(dx**2 + dy**2)
-
-        if dist > 0:
-            self.dx = dx / dist
-            self.dy = dy / dist
+        # 방향 벡터 계산 (단위 벡터를 받았으면 그대로 사용)
+        if direction is not None:
+            self.dx, self.dy = direction
         else:
-            self.dx = 0
-            self.dy = -1 if not from_player else 1
+            dx = target_x - self.x
+            dy = target_y - self.y
+            dist = math.sqrt(dx**2 + dy**2)
+
+            if dist > 0:
+                self.dx = dx / dist
+                self.dy = dy / dist
+            else:
+                self.dx = 0
+                self.dy = -1 if not from_player else 1
 
     def update(self):
         """투사체 위치 업데이트
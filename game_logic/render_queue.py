@@ -0,0 +1,269 @@
+"""
+렌더 큐 (스프라이트 배칭 / 텍스처 기준 그리기 순서 정렬)
+
+월드 레이어를 그리는 동안 pico2d의 그리기 호출(Image.draw, clip_draw, composite_draw,
+clip_composite_draw, rotate_draw, draw_rectangle 등)을 바로 렌더러로 보내지 않고
+(텍스처, 원본 사각형, 대상 사각형, 회전, 뒤집기, 알파, 레이어, 정렬 키) 명령으로 모아 두었다가
+프레임 끝에 레이어 -> 정렬 키 -> 텍스처 순으로 정렬해 한 번에 내보냅니다.
+
+begin()~flush() 사이에만 pico2d 모듈 전역 SDL_RenderCopy/SDL_RenderCopyEx 등을 기록 함수로 바꿔 끼웁니다
+(draw_hooks). 엔티티 draw() 코드는 수정할 필요가 없습니다.
+
+정렬 규칙:
+    - 레이어 순서는 항상 유지
+    - 같은 레이어 안에서는 정렬 키(set_sort_key) 순서를 유지 (기본값: 객체 제출 순서)
+    - batch=True 레이어(이펙트처럼 서로 겹치는 순서가 중요하지 않은 레이어)에서는
+      모든 객체가 같은 정렬 키를 쓰므로 텍스처별로 묶여 텍스처 전환이 줄어듦
+
+사용법 (play_mode.draw):
+    render_queue.begin()
+    for index, layer_name in enumerate(layers):
+        render_queue.set_layer(index, batch=layer_name in render_queue.BATCH_LAYERS)
+        for o in world[layer_name]:
+            render_queue.next_object()
+            o.draw(...)
+    render_queue.flush()
+    print(render_queue.stats())  # draw_calls, texture_switches, unsorted_texture_switches
+"""
+import ctypes
+
+import pico2d as p2
+import sdl2
+
+from . import draw_hooks
+from .draw_hooks import texture_alpha as _texture_alpha
+
+# 텍스처 기준으로 묶어도 되는 레이어 (객체 간 겹침 순서가 의미 없는 레이어)
+BATCH_LAYERS = ('walls', 'effects_back', 'effects_front')
+
+# 명령 종류
+_CMD_COPY = 0
+_CMD_COPY_EX = 1
+_CMD_FILL_RECT = 2
+_CMD_DRAW_RECT = 3
+
+_enabled = True
+_recording = False
+_originals = {}  # 기록 전 pico2d 전역 함수 (draw_hooks.install 반환값)
+
+# 기록된 명령 리스트 [(정렬 키 튜플, 명령 종류, 텍스처, 텍스처 주소, src, dst, 각도, 뒤집기, 알파 또는 색상)]
+_commands = []
+
+# flush 후에 해제할 텍스처 (Font.draw처럼 그리기 직후 소멸하는 임시 Image)
+_deferred_destroy = []
+
+# 현재 기록 상태
+_layer = 0
+_batch = False
+_sort_key = 0
+_object_index = 0
+_draw_color = (255, 255, 255, 255)
+
+# 마지막 flush 통계
+_last_stats = {'draw_calls': 0, 'texture_switches': 0, 'unsorted_texture_switches': 0, 'layers': 0}
+
+
+def set_enabled(enabled=True):
+    """렌더 큐 사용 여부 (False면 begin/flush가 아무것도 하지 않고 즉시 그리기)"""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def is_enabled():
+    return _enabled
+
+
+def _texture_key(texture):
+    return ctypes.cast(texture, ctypes.c_void_p).value or 0
+
+
+def _key(texture_key):
+    # batch 레이어는 같은 정렬 키 안에서 텍스처 순, 그 외에는 제출 순서만 사용
+    seq = len(_commands)
+    if _batch:
+        return (_layer, _sort_key, texture_key, seq)
+    return (_layer, _sort_key, 0, seq)
+
+
+def _record_copy(renderer, texture, src, dst):
+    key = _texture_key(texture)
+    _commands.append((_key(key), _CMD_COPY, texture, key, src, dst, 0.0, 0, _texture_alpha(texture)))
+    return 0
+
+
+def _record_copy_ex(renderer, texture, src, dst, angle, center, flip):
+    key = _texture_key(texture)
+    _commands.append((_key(key), _CMD_COPY_EX, texture, key, src, dst, angle, flip, _texture_alpha(texture)))
+    return 0
+
+
+def _record_draw_color(renderer, r, g, b, a):
+    global _draw_color
+    _draw_color = (r, g, b, a)
+    return 0
+
+
+def _record_fill_rect(renderer, rect):
+    _commands.append((_key(0), _CMD_FILL_RECT, None, None, None, rect, 0.0, 0, _draw_color))
+    return 0
+
+
+def _record_draw_rect(renderer, rect):
+    _commands.append((_key(0), _CMD_DRAW_RECT, None, None, None, rect, 0.0, 0, _draw_color))
+    return 0
+
+
+def _defer_destroy(texture):
+    _deferred_destroy.append(texture)
+
+
+# 기록 중 교체할 pico2d 모듈 전역 함수
+# (SDL_DestroyTexture: 기록 중 소멸한 임시 Image의 텍스처는 flush 후에 해제)
+_RECORDERS = {
+    'SDL_RenderCopy': _record_copy,
+    'SDL_RenderCopyEx': _record_copy_ex,
+    'SDL_SetRenderDrawColor': _record_draw_color,
+    'SDL_RenderFillRect': _record_fill_rect,
+    'SDL_RenderDrawRect': _record_draw_rect,
+    'SDL_DestroyTexture': _defer_destroy,
+}
+
+
+def begin():
+    """
+    기록 시작 (이후 pico2d 그리기 호출은 flush() 전까지 큐에 쌓임)
+    """
+    global _recording, _originals, _layer, _batch, _sort_key, _object_index, _draw_color
+    if not _enabled or _recording:
+        return
+
+    _originals = draw_hooks.install(_RECORDERS)
+
+    _commands.clear()
+    _layer = 0
+    _batch = False
+    _sort_key = 0
+    _object_index = 0
+    _draw_color = (255, 255, 255, 255)
+    _recording = True
+
+
+def set_layer(layer, batch=False):
+    """
+    이후 제출되는 명령의 레이어 설정
+
+    Args:
+        layer: 레이어 순서 (작을수록 먼저 그림)
+        batch: True면 이 레이어 안에서 텍스처 기준으로 묶음
+    """
+    global _layer, _batch, _sort_key, _object_index
+    _layer = layer
+    _batch = batch
+    _sort_key = 0
+    _object_index = 0
+
+
+def next_object():
+    """다음 객체 제출 시작 (batch가 아닌 레이어에서는 객체 순서가 정렬 키가 됨)"""
+    global _sort_key, _object_index
+    _object_index += 1
+    _sort_key = 0 if _batch else _object_index
+
+
+def set_sort_key(sort_key):
+    """
+    현재 객체의 정렬 키 직접 지정 (같은 레이어 안에서 작은 값이 먼저 그려짐)
+
+    Args:
+        sort_key: 비교 가능한 값 (예: 깊이 정렬용 -y)
+    """
+    global _sort_key
+    _sort_key = sort_key
+
+
+def _restore_hooks():
+    global _recording
+    draw_hooks.restore(_originals)
+    _recording = False
+
+
+def flush():
+    """
+    기록 종료 후 정렬하여 렌더러로 내보내기
+
+    Returns:
+        dict: 이번 프레임 통계 (stats()와 동일)
+    """
+    if not _recording:
+        return _last_stats
+
+    _restore_hooks()
+    renderer = p2.pico2d.renderer
+
+    # 정렬 전 순서 기준 텍스처 전환 수 (배칭 효과 비교용)
+    unsorted_switches = 0
+    prev = None
+    for cmd in _commands:
+        tex = cmd[3]
+        if tex != prev:
+            unsorted_switches += 1
+            prev = tex
+
+    _commands.sort(key=lambda cmd: cmd[0])
+
+    # 프레임 끝 시점의 텍스처 알파 (기록 중 opacify로 바뀐 값)를 flush 후 복원
+    restore_alpha = {}
+    current_alpha = {}
+    switches = 0
+    prev = None
+    layers = set()
+    for (sort_key, kind, texture, tex, src, dst, angle, flip, state) in _commands:
+        layers.add(sort_key[0])
+        if texture is not None:
+            if tex != prev:
+                switches += 1
+                prev = tex
+            if tex not in current_alpha:
+                current_alpha[tex] = _texture_alpha(texture)
+                restore_alpha[tex] = (texture, current_alpha[tex])
+            if current_alpha[tex] != state:
+                sdl2.SDL_SetTextureAlphaMod(texture, state)
+                current_alpha[tex] = state
+            if kind == _CMD_COPY:
+                sdl2.SDL_RenderCopy(renderer, texture, src, dst)
+            else:
+                sdl2.SDL_RenderCopyEx(renderer, texture, src, dst, angle, None, flip)
+        else:
+            if prev is not None:
+                switches += 1
+                prev = None
+            sdl2.SDL_SetRenderDrawColor(renderer, *state)
+            if kind == _CMD_FILL_RECT:
+                sdl2.SDL_RenderFillRect(renderer, dst)
+            else:
+                sdl2.SDL_RenderDrawRect(renderer, dst)
+
+    for tex, (texture, alpha) in restore_alpha.items():
+        if current_alpha[tex] != alpha:
+            sdl2.SDL_SetTextureAlphaMod(texture, alpha)
+
+    for texture in _deferred_destroy:
+        sdl2.SDL_DestroyTexture(texture)
+    _deferred_destroy.clear()
+
+    _last_stats['draw_calls'] = len(_commands)
+    _last_stats['texture_switches'] = switches
+    _last_stats['unsorted_texture_switches'] = unsorted_switches
+    _last_stats['layers'] = len(layers)
+    _commands.clear()
+    return _last_stats
+
+
+def stats():
+    """
+    마지막 flush 통계
+
+    Returns:
+        dict: {'draw_calls', 'texture_switches', 'unsorted_texture_switches', 'layers'}
+    """
+    return dict(_last_stats)
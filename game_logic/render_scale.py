@@ -0,0 +1,174 @@
+"""
+렌더 스케일 (해상도 독립 월드 렌더링)
+
+월드 레이어를 창 크기보다 작은 내부 해상도(예: 1280x720 창에서 스케일 0.5 -> 640x360)의
+오프스크린 렌더 타깃에 그린 뒤, 최근접 이웃(nearest-neighbour) 확대로 창 전체에 한 번에 복사합니다.
+칠해야 하는 픽셀 수가 스케일의 제곱만큼 줄어들어 채우기(fill rate)가 부족한 기기에서 프레임이 올라갑니다.
+
+엔티티의 scale 상수나 좌표계는 바꿀 필요가 없습니다.
+렌더 타깃에 SDL_RenderSetScale(스케일)을 걸어 두므로 그리기 코드는 그대로 캔버스 좌표(1280x720)로 그리고,
+SDL이 대상 사각형을 내부 해상도로 줄입니다. UI와 커서는 end() 이후 창 해상도로 그려 글자가 흐려지지 않습니다.
+
+스케일 1.0(기본값)이거나 렌더러가 렌더 타깃을 지원하지 않으면 begin/end는 아무것도 하지 않습니다.
+
+사용법 (play_mode.draw):
+    p2.clear_canvas()
+    render_scale.begin()      # 이후 그리기는 내부 해상도 타깃으로
+    ...                       # 월드 레이어 그리기
+    render_scale.end()        # 창으로 확대 복사
+    ...                       # UI, 커서 그리기
+    p2.update_canvas()
+
+    render_scale.set_scale(0.5)   # main.py에서 설정
+    print(render_scale.stats())
+"""
+import math
+
+import pico2d as p2
+import sdl2
+
+# 허용 스케일 범위 (1.0 = 창 해상도 그대로)
+MIN_SCALE = 0.25
+MAX_SCALE = 1.0
+
+_scale = 1.0
+
+# 내부 해상도 렌더 타깃 (pico2d Image, 소멸 시 텍스처 해제)
+_target = None
+_target_key = None  # (캔버스 크기, 스케일) - 바뀌면 다시 생성
+
+_active = False
+_unsupported = False
+
+# 통계 (이번 실행 기준)
+_stats = {'frames': 0, 'internal_pixels': 0, 'window_pixels': 0}
+
+
+def set_scale(scale):
+    """
+    내부 렌더 스케일 설정
+
+    Args:
+        scale: 창 해상도 대비 비율 (MIN_SCALE ~ 1.0, 1.0이면 끔)
+    """
+    global _scale
+    _scale = min(MAX_SCALE, max(MIN_SCALE, float(scale)))
+    if _scale >= MAX_SCALE:
+        release()
+
+
+def get_scale():
+    return _scale
+
+
+def is_active():
+    """begin()~end() 사이인지"""
+    return _active
+
+
+def internal_size():
+    """
+    현재 설정의 내부 해상도
+
+    Returns:
+        (w, h)
+    """
+    canvas_w, canvas_h = p2.get_canvas_width(), p2.get_canvas_height()
+    return max(1, math.ceil(canvas_w * _scale)), max(1, math.ceil(canvas_h * _scale))
+
+
+def _ensure_target(renderer):
+    global _target, _target_key, _unsupported
+    key = (p2.get_canvas_width(), p2.get_canvas_height(), _scale)
+    if _target is not None and _target_key == key:
+        return True
+
+    release()
+    if not sdl2.SDL_RenderTargetSupported(renderer):
+        print('\033[91m[RenderScale] 렌더 타깃을 지원하지 않는 렌더러 - 창 해상도로 그립니다\033[0m')
+        _unsupported = True
+        return False
+
+    tex_w, tex_h = internal_size()
+    texture = sdl2.SDL_CreateTexture(renderer, sdl2.SDL_PIXELFORMAT_ARGB8888,
+                                     sdl2.SDL_TEXTUREACCESS_TARGET, tex_w, tex_h)
+    if not texture:
+        print(f'\033[91m[RenderScale] 렌더 타깃 생성 실패 ({tex_w}x{tex_h}): {sdl2.SDL_GetError()}\033[0m')
+        _unsupported = True
+        return False
+
+    # 확대 시 픽셀 아트가 번지지 않도록 최근접 이웃 샘플링, 창을 통째로 덮으므로 블렌딩 없음
+    sdl2.SDL_SetTextureScaleMode(texture, sdl2.SDL_ScaleModeNearest)
+    sdl2.SDL_SetTextureBlendMode(texture, sdl2.SDL_BLENDMODE_NONE)
+    _target = p2.Image(texture)
+    _target_key = key
+    print(f'[RenderScale] 내부 해상도 {tex_w}x{tex_h} (스케일 {_scale:.2f})')
+    return True
+
+
+def begin():
+    """
+    월드 그리기 시작 (이후 그리기는 내부 해상도 렌더 타깃에 그려짐)
+
+    Returns:
+        bool: 렌더 타깃으로 전환했으면 True
+    """
+    global _active
+    if _active or _scale >= MAX_SCALE or _unsupported:
+        return False
+
+    renderer = p2.pico2d.renderer
+    if not _ensure_target(renderer):
+        return False
+
+    canvas_w, canvas_h = p2.get_canvas_width(), p2.get_canvas_height()
+    tex_w, tex_h = _target.w, _target.h
+    sdl2.SDL_SetRenderTarget(renderer, _target.texture)
+    # 렌더 타깃 전환 시 SDL이 스케일을 1로 되돌리므로 전환 후에 설정
+    sdl2.SDL_RenderSetScale(renderer, tex_w / canvas_w, tex_h / canvas_h)
+    # clear_canvas()가 설정한 배경색으로 타깃도 지움
+    sdl2.SDL_RenderClear(renderer)
+    _active = True
+    return True
+
+
+def end():
+    """
+    월드 그리기 종료: 창 렌더 타깃으로 돌아가 내부 해상도 이미지를 창 전체로 확대 복사
+    """
+    global _active
+    if not _active:
+        return
+    _active = False
+
+    renderer = p2.pico2d.renderer
+    # 창으로 돌아가면 SDL이 창의 뷰포트/스케일을 복원
+    sdl2.SDL_SetRenderTarget(renderer, None)
+    sdl2.SDL_RenderCopy(renderer, _target.texture, None, None)
+
+    canvas_w, canvas_h = p2.get_canvas_width(), p2.get_canvas_height()
+    _stats['frames'] += 1
+    _stats['internal_pixels'] += _target.w * _target.h
+    _stats['window_pixels'] += canvas_w * canvas_h
+
+
+def release():
+    """렌더 타깃 해제 (다음 begin()에서 다시 생성)"""
+    global _target, _target_key, _unsupported
+    _target = None
+    _target_key = None
+    _unsupported = False
+
+
+def stats():
+    """
+    통계
+
+    Returns:
+        dict: {'scale', 'frames', 'internal_pixels', 'window_pixels', 'fill_ratio'}
+    """
+    result = {'scale': _scale}
+    result.update(_stats)
+    window = _stats['window_pixels']
+    result['fill_ratio'] = _stats['internal_pixels'] / window if window else 1.0
+    return result
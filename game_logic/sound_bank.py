@@ -0,0 +1,237 @@
+"""
+공유 사운드 뱅크
+
+효과음(WAV)을 이름으로 등록해 두고 처음 사용할 때 한 번만 로드합니다.
+사운드는 카테고리(player, enemy, item, jingle)에 속하며 카테고리마다 볼륨과 동시 재생 수(voice) 제한이 있어
+표창 50개를 한 번에 던져도 믹서 채널이 가득 차지 않습니다.
+
+볼륨 계산 (0~128, SDL_mixer 채널 볼륨):
+    사운드 볼륨 * 카테고리 볼륨(0~1) * 마스터 볼륨(0~1)
+
+사용법:
+    from game_logic import sound_bank
+    sound_bank.play('throw_shuriken')
+    sound_bank.play_random(('pick_item_1', 'pick_item_2'))
+    sound_bank.set_category_volume('enemy', 0.5)
+    print(sound_bank.stats())
+"""
+import time
+import random
+
+import pico2d as p2
+from sdl2 import sdlmixer
+
+SOUND_DIR = 'resources/Sounds'
+
+# 카테고리 {이름: {'volume': 0~1, 'max_voices': 동시 재생 수, 'min_interval': 같은 사운드 재시작 최소 간격(초)}}
+CATEGORIES = {
+    'player': {'volume': 1.0, 'max_voices': 3, 'min_interval': 0.0},
+    'enemy':  {'volume': 1.0, 'max_voices': 4, 'min_interval': 0.03},
+    'item':   {'volume': 1.0, 'max_voices': 2, 'min_interval': 0.05},
+    'jingle': {'volume': 1.0, 'max_voices': 1, 'min_interval': 0.0},
+}
+
+# 등록된 사운드 {이름: (파일 이름, 카테고리, 볼륨 0~128)}
+SOUNDS = {
+    'sword_attack_1': ('Sword_Attack_1.wav', 'player', 128),
+    'sword_attack_2': ('Sword_Attack_2.wav', 'player', 128),
+    'sword_attack_3': ('Sword_Attack_3.wav', 'player', 128),
+    'dash_attack_1': ('Dash_Attack_1.wav', 'enemy', 64),
+    'dash_attack_2': ('Dash_Attack_2.wav', 'enemy', 64),
+    'throw_shuriken': ('Throw_Shuriken.wav', 'enemy', 32),
+    'pick_item_1': ('Pick_Item_1.wav', 'item', 64),
+    'pick_item_2': ('Pick_Item_2.wav', 'item', 64),
+    'win': ('Win_Sound.wav', 'jingle', 64),
+}
+
+# 로드된 Wav {이름: Wav} (로드 실패한 사운드는 None으로 기록해 다시 시도하지 않음)
+_loaded = {}
+
+# 카테고리별 재생 중인 voice 리스트 {카테고리: [(channel, 사운드 이름, 볼륨 지정값), ...]}
+_voices = {name: [] for name in CATEGORIES}
+
+# 사운드별 마지막 재생 시각 {이름: time.monotonic()}
+_last_played = {}
+
+_master_volume = 1.0
+
+# 통계 (이번 실행 기준)
+_stats = {'loads': 0, 'load_failures': 0, 'plays': 0, 'dropped_voice_limit': 0,
+          'dropped_interval': 0, 'dropped_no_channel': 0}
+
+
+def register(name, filename, category, volume=128):
+    """
+    사운드 등록 (이미 로드된 같은 이름은 다음 사용 시 다시 로드)
+
+    Args:
+        name: 사운드 이름
+        filename: SOUND_DIR 기준 파일 이름
+        category: CATEGORIES의 카테고리 이름
+        volume: 사운드 기본 볼륨 (0~128)
+    """
+    if category not in CATEGORIES:
+        raise ValueError(f'알 수 없는 사운드 카테고리: {category}')
+    SOUNDS[name] = (filename, category, volume)
+    _loaded.pop(name, None)
+
+
+def get(name):
+    """
+    사운드 가져오기 (최초 호출 시에만 로드)
+
+    Args:
+        name: 등록된 사운드 이름
+
+    Returns:
+        pico2d Wav 또는 None (미등록/로드 실패/오디오 없음)
+    """
+    if name in _loaded:
+        return _loaded[name]
+
+    entry = SOUNDS.get(name)
+    if entry is None:
+        print(f'\033[91m[SoundBank] 등록되지 않은 사운드: {name}\033[0m')
+        _loaded[name] = None
+        return None
+
+    path = f'{SOUND_DIR}/{entry[0]}'
+    try:
+        wav = p2.load_wav(path)
+        # 청크 볼륨은 최대로 두고, 실제 볼륨은 재생 채널에서 적용
+        wav.set_volume(128)
+        _stats['loads'] += 1
+        print(f'[SoundBank] {name} 로드 완료 ({path})')
+    except Exception as e:
+        print(f'\033[91m[SoundBank] {name} 로드 실패 ({path}): {e}\033[0m')
+        _stats['load_failures'] += 1
+        wav = None
+
+    _loaded[name] = wav
+    return wav
+
+
+def preload(names=None):
+    """
+    사운드 미리 로드 (스테이지 로딩 중 호출하면 첫 재생 때 끊김이 없음)
+
+    Args:
+        names: 로드할 사운드 이름 목록 (None이면 등록된 전체)
+
+    Returns:
+        int: 로드된 사운드 수
+    """
+    return sum(1 for name in (names if names is not None else SOUNDS) if get(name) is not None)
+
+
+def _channel_volume(name, volume=None):
+    filename, category, base_volume = SOUNDS[name]
+    v = base_volume if volume is None else volume
+    return max(0, min(128, int(v * CATEGORIES[category]['volume'] * _master_volume)))
+
+
+def _active_voices(category):
+    """재생이 끝난 voice를 정리하고 현재 재생 중인 voice 리스트 반환"""
+    voices = _voices[category]
+    voices[:] = [voice for voice in voices if sdlmixer.Mix_Playing(voice[0])]
+    return voices
+
+
+def play(name, volume=None):
+    """
+    사운드 재생 (카테고리 voice 제한과 재시작 간격을 넘으면 재생하지 않음)
+
+    Args:
+        name: 등록된 사운드 이름
+        volume: 이번 재생에만 쓸 사운드 볼륨 (0~128, None이면 등록 볼륨)
+
+    Returns:
+        int: 재생 채널 번호 (재생하지 않았으면 -1)
+    """
+    wav = get(name)
+    if wav is None:
+        return -1
+
+    category = SOUNDS[name][1]
+    settings = CATEGORIES[category]
+
+    now = time.monotonic()
+    last = _last_played.get(name)
+    if last is not None and now - last < settings['min_interval']:
+        _stats['dropped_interval'] += 1
+        return -1
+
+    if len(_active_voices(category)) >= settings['max_voices']:
+        _stats['dropped_voice_limit'] += 1
+        return -1
+
+    channel = sdlmixer.Mix_PlayChannel(-1, wav.wav, 0)
+    if channel < 0:
+        # 믹서 채널이 모두 사용 중
+        _stats['dropped_no_channel'] += 1
+        return -1
+
+    sdlmixer.Mix_Volume(channel, _channel_volume(name, volume))
+    # 끝난 채널은 다른 카테고리에서 재사용될 수 있으므로 이전 소유 기록 제거
+    for voices in _voices.values():
+        voices[:] = [voice for voice in voices if voice[0] != channel]
+    _voices[category].append((channel, name, volume))
+    _last_played[name] = now
+    _stats['plays'] += 1
+    return channel
+
+
+def play_random(names, volume=None):
+    """
+    여러 사운드 중 하나를 무작위로 재생
+
+    Returns:
+        int: 재생 채널 번호 (재생하지 않았으면 -1)
+    """
+    return play(random.choice(names), volume)
+
+
+def set_category_volume(category, volume):
+    """
+    카테고리 볼륨 설정 (재생 중인 채널에도 즉시 적용)
+
+    Args:
+        category: 카테고리 이름
+        volume: 0~1
+    """
+    CATEGORIES[category]['volume'] = max(0.0, min(1.0, volume))
+    _refresh_channel_volumes()
+
+
+def set_master_volume(volume):
+    """마스터 볼륨 설정 (0~1)"""
+    global _master_volume
+    _master_volume = max(0.0, min(1.0, volume))
+    _refresh_channel_volumes()
+
+
+def _refresh_channel_volumes():
+    for category in _voices:
+        for channel, name, volume in _active_voices(category):
+            sdlmixer.Mix_Volume(channel, _channel_volume(name, volume))
+
+
+def stop_category(category):
+    """카테고리의 재생 중인 사운드 모두 정지"""
+    for channel, _, _ in _active_voices(category):
+        sdlmixer.Mix_HaltChannel(channel)
+    _voices[category].clear()
+
+
+def stats():
+    """
+    통계
+
+    Returns:
+        dict: {'loaded', 'loads', 'load_failures', 'plays', 'dropped_voice_limit',
+               'dropped_interval', 'dropped_no_channel', 'voices': {카테고리: 재생 중 수}}
+    """
+    result = {'loaded': sum(1 for wav in _loaded.values() if wav is not None)}
+    result.update(_stats)
+    result['voices'] = {category: len(_active_voices(category)) for category in CATEGORIES}
+    return result
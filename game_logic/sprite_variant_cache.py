@@ -0,0 +1,219 @@
+"""
+스프라이트 색상 변형 영구 캐시 (디스크)
+
+분신용 어두운 프레임처럼 입력이 바뀌지 않는 색상 변형을 실행할 때마다 다시 만들지 않도록
+결과를 업로드 가능한 RGBA 원시 버퍼로 디스크에 저장합니다.
+
+캐시 키 = SHA-1(원본 파일 내용 해시 + 연산 버전 + 연산 이름 + 파라미터)
+원본 PNG가 수정되면 내용 해시가 바뀌므로 이전 항목은 자동으로 무효가 됩니다.
+image_asset_manager의 색상 연산 결과가 바뀌면 ALGORITHM_VERSION을 올려서 이전 항목을 무효로 만듭니다.
+
+파일 형식 (<key>.rgba):
+    헤더 12바이트: 매직 b'SVC1' + width(uint32 LE) + height(uint32 LE)
+    본문: width * height * 4 바이트 RGBA8888 (행 우선)
+
+미리 생성하기: python tools/build_variant_cache.py
+"""
+import os
+import struct
+import hashlib
+
+from . import asset_pack
+
+CACHE_DIR = os.path.join('resources', 'Variant_Cache')
+CACHE_EXT = '.rgba'
+
+# 색상 연산 버전 (image_asset_manager의 *_array 함수 출력이 바뀌면 1 올림)
+#   2: multiply를 float64로, hue shift를 PIL 8비트 HSV 변환으로 (기존 픽셀 루프와 같은 결과)
+ALGORITHM_VERSION = 2
+
+_MAGIC = b'SVC1'
+_HEADER = struct.Struct('<4sII')
+
+_enabled = True
+
+# 원본 파일 내용 해시 메모 {path: (mtime, size, digest)}
+_source_hash_memo = {}
+
+# 통계 (이번 실행 기준)
+_stats = {'hits': 0, 'misses': 0, 'writes': 0, 'write_errors': 0}
+
+
+def enable(enabled=True):
+    """디스크 캐시 사용 여부 설정"""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def is_enabled():
+    return _enabled
+
+
+def source_hash(path):
+    """
+    원본 이미지 파일의 내용 해시 (같은 실행 안에서는 mtime/size가 같으면 재사용)
+
+    Args:
+        path: 원본 이미지 파일 경로
+
+    Returns:
+        16진수 SHA-1 문자열
+    """
+    try:
+        st = os.stat(path)
+        mtime, size = st.st_mtime, st.st_size
+    except OSError:
+        # 원본이 디스크에 없으면 에셋 팩 항목 (실행 중에는 바뀌지 않음)
+        mtime, size = None, None
+
+    memo = _source_hash_memo.get(path)
+    if memo and memo[0] == mtime and memo[1] == size:
+        return memo[2]
+
+    digest = hashlib.sha1(asset_pack.read_bytes(path)).hexdigest()
+    _source_hash_memo[path] = (mtime, size, digest)
+    return digest
+
+
+def _normalize_param(value):
+    """1과 1.0처럼 같은 값이 다른 키를 만들지 않도록 숫자를 정규화"""
+    if isinstance(value, (int, float)):
+        return repr(float(value))
+    return repr(value)
+
+
+def variant_key(path, operation, params):
+    """
+    변형 캐시 키 생성
+
+    Args:
+        path: 원본 이미지 파일 경로
+        operation: 연산 이름 ('bias', 'multiply', 'hue')
+        params: 연산 파라미터 튜플
+
+    Returns:
+        캐시 키 문자열 (파일 이름으로 사용)
+    """
+    key_string = f"{source_hash(path)}|v{ALGORITHM_VERSION}|{operation}|{','.join(_normalize_param(p) for p in params)}"
+    return hashlib.sha1(key_string.encode()).hexdigest()
+
+
+def _entry_path(key):
+    return os.path.join(CACHE_DIR, key[:2], key + CACHE_EXT)
+
+
+def load(key):
+    """
+    캐시 항목 읽기
+
+    Args:
+        key: variant_key()로 만든 키
+
+    Returns:
+        (width, height, rgba_bytes) 또는 None (없거나 손상된 경우)
+    """
+    if not _enabled:
+        return None
+
+    try:
+        with open(_entry_path(key), 'rb') as f:
+            data = f.read()
+    except OSError:
+        _stats['misses'] += 1
+        return None
+
+    if len(data) < _HEADER.size:
+        _stats['misses'] += 1
+        return None
+
+    magic, width, height = _HEADER.unpack_from(data)
+    body = data[_HEADER.size:]
+    if magic != _MAGIC or len(body) != width * height * 4:
+        print(f'\033[91m[SpriteVariantCache] 손상된 캐시 항목 무시: {key}\033[0m')
+        _stats['misses'] += 1
+        return None
+
+    _stats['hits'] += 1
+    return width, height, body
+
+
+def store(key, width, height, rgba_bytes):
+    """
+    캐시 항목 저장 (임시 파일에 쓴 뒤 교체하므로 중간에 끊겨도 손상된 항목이 남지 않음)
+
+    Args:
+        key: variant_key()로 만든 키
+        width, height: 이미지 크기
+        rgba_bytes: RGBA8888 버퍼
+
+    Returns:
+        bool: 저장 성공 여부 (읽기 전용 위치 등에서는 False)
+    """
+    if not _enabled:
+        return False
+
+    path = _entry_path(key)
+    temp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp_path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, width, height))
+            f.write(rgba_bytes)
+        os.replace(temp_path, path)
+        _stats['writes'] += 1
+        return True
+    except OSError as e:
+        _stats['write_errors'] += 1
+        print(f'\033[91m[SpriteVariantCache] 캐시 저장 실패 ({key}): {e}\033[0m')
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        return False
+
+
+def contains(key):
+    """캐시에 항목이 있는지 확인 (통계에 반영하지 않음)"""
+    return os.path.exists(_entry_path(key))
+
+
+def _iter_entries():
+    if not os.path.isdir(CACHE_DIR):
+        return
+    for root, _, files in os.walk(CACHE_DIR):
+        for name in files:
+            if name.endswith(CACHE_EXT):
+                yield os.path.join(root, name)
+
+
+def report():
+    """
+    캐시 크기 보고
+
+    Returns:
+        dict: {'dir', 'entries', 'bytes', 'hits', 'misses', 'writes', 'write_errors'}
+    """
+    entries = 0
+    total_bytes = 0
+    for path in _iter_entries():
+        entries += 1
+        total_bytes += os.path.getsize(path)
+    result = {'dir': CACHE_DIR, 'entries': entries, 'bytes': total_bytes}
+    result.update(_stats)
+    return result
+
+
+def clear():
+    """모든 캐시 항목 삭제
+
+    Returns:
+        int: 삭제한 항목 수
+    """
+    removed = 0
+    for path in list(_iter_entries()):
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError as e:
+            print(f'\033[91m[SpriteVariantCache] 삭제 실패 ({path}): {e}\033[0m')
+    return removed
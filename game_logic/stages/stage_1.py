@@ -27,6 +27,12 @@ PLAYER_START_POSITION = {
     'y': -700
 }
 
+# 전투 연출 한도 (encounter_director) - CatAssassin 7마리, 공격마다 수리검 5발
+ENCOUNTER_LIMITS = {
+    'max_attackers': 3,
+    'projectile_budget': 30,
+}
+
 # Stage data dictionary
 stage_data = {
     'monsters': [
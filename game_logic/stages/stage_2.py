@@ -34,6 +34,12 @@ PLAYER_START_POSITION = {
     'y': -700
 }
 
+# 전투 연출 한도 (encounter_director) - CatThief 돌진 공격은 동시에 2마리까지
+ENCOUNTER_LIMITS = {
+    'max_attackers': 2,
+    'projectile_budget': 30,
+}
+
 # Stage data dictionary
 stage_data = {
     'monsters': [
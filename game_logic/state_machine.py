@@ -2,11 +2,74 @@ from .event_to_string import event_to_string
 import game_framework
 from .inventory import InventoryData
 
+# 로그 레벨 (LOG_TRANSITIONS 이상이면 상태 전환, LOG_REFUSED 이상이면 거부된 이벤트까지 출력)
+LOG_NONE = 0
+LOG_TRANSITIONS = 1
+LOG_REFUSED = 2
+
+log_level = LOG_TRANSITIONS
+
+
+def set_log_level(level):
+    global log_level
+    log_level = level
+
+
+def event_predicate(kind, event_type=None, key=None):
+    """
+    predicate에 디스패치 키를 붙이는 데코레이터
+
+    키가 붙은 predicate는 StateMachine이 매번 호출하지 않고 (이벤트 종류, SDL 타입, 키 코드) 사전 조회로 처리합니다.
+    키가 없는 predicate(조건이 이벤트 종류만으로 정해지지 않는 경우)는 기존처럼 순서대로 호출합니다.
+    predicate 본문은 그대로 두어 직접 호출해도 같은 결과가 나오게 합니다.
+
+    Args:
+        kind: 상태 이벤트 종류 ('INPUT', 'DIE', 'DETECT_PLAYER' 등 - state_event[0])
+        event_type: 'INPUT'일 때 SDL 이벤트 타입 (SDL_KEYDOWN 등)
+        key: 'INPUT'일 때 키 코드 (None이면 타입만으로 매칭)
+    """
+    def decorate(predicate):
+        predicate.event_key = (kind, event_type, key)
+        return predicate
+    return decorate
+
+
+def _event_keys(state_event):
+    """이벤트가 매칭될 수 있는 디스패치 키 (정확한 키, 타입만 키)"""
+    kind = state_event[0]
+    if kind != 'INPUT':
+        return (kind, None, None), None
+    event = state_event[1]
+    event_type = getattr(event, 'type', None)
+    return (kind, event_type, getattr(event, 'key', None)), (kind, event_type, None)
+
+
+def _compile_rules(transitions):
+    """
+    상태 하나의 {predicate: next_state}를 (키 테이블, 키 없는 predicate 목록)으로 변환
+
+    같은 이벤트에 여러 규칙이 맞으면 기존처럼 먼저 등록된 규칙이 이기도록 등록 순서(index)를 함께 보관합니다.
+    """
+    keyed = {}
+    fallbacks = []
+    for index, (check_event, next_state) in enumerate(transitions.items()):
+        event_key = getattr(check_event, 'event_key', None)
+        if event_key is None:
+            fallbacks.append((index, check_event, next_state))
+        elif event_key not in keyed:
+            keyed[event_key] = (index, next_state)
+    return keyed, fallbacks
+
+
+_NO_RULES = ({}, [])
+
 
 class StateMachine:
     def __init__(self, start_state, rules):
         self.cur_state = start_state
         self.rules = rules
+        # 상태별 디스패치 테이블 (이벤트마다 predicate를 전부 호출하지 않도록 미리 변환)
+        self.tables = {state: _compile_rules(transitions) for state, transitions in rules.items()}
         self.cur_state.enter(('START', None))
 
     def update(self):
@@ -22,38 +85,56 @@ class StateMachine:
         self.cur_state = state
 
     def handle_state_event(self, state_event):
-        processed_event = False
-        for check_event in self.rules[self.cur_state].keys():
+        keyed, fallbacks = self.tables.get(self.cur_state, _NO_RULES)
+
+        match = None
+        if keyed:
+            exact_key, type_key = _event_keys(state_event)
+            match = keyed.get(exact_key)
+            if type_key is not None:
+                by_type = keyed.get(type_key)
+                if by_type is not None and (match is None or by_type[0] < match[0]):
+                    match = by_type
+
+        # 키 없는 predicate는 키 매칭보다 먼저 등록된 것만 우선 검사
+        for index, check_event, next_state in fallbacks:
+            if match is not None and index > match[0]:
+                break
             if check_event(state_event):
-                next_state = self.rules[self.cur_state][check_event]
-
-                # 특수 처리: INVENTORY 상태에서 Tab_down이면 prev_state로 복귀
-                if next_state is None and hasattr(self.cur_state, 'prev_state') and self.cur_state.prev_state is not None:
-                    next_state = self.cur_state.prev_state
-
-                # 특수 처리: DASH 상태에서 DASH_END이면 return_to_idle에 따라 IDLE 또는 RUN으로 복귀
-                if next_state is None and hasattr(self.cur_state, 'return_to_idle'):
-                    # Dash의 return_to_idle 플래그 확인
-                    if self.cur_state.return_to_idle:
-                        # Idle로 복귀
-                        next_state = self.cur_state.player.IDLE
-                    else:
-                        # Run으로 복귀
-                        next_state = self.cur_state.player.RUN
-
-                self.cur_state.exit(state_event)
-                next_state.enter(state_event)
-
-                print(f'{self.cur_state.__class__.__name__}'
-                      f' ======{event_to_string(state_event)}======> '
-                      f'{next_state.__class__.__name__}')
-                self.cur_state = next_state
-                processed_event = True
+                self._change_state(next_state, state_event)
                 return
-        if not processed_event:
+
+        if match is not None:
+            self._change_state(match[1], state_event)
+            return
+
+        if log_level >= LOG_REFUSED:
             event_str = event_to_string(state_event)
             es = event_str.upper() if isinstance(event_str, str) else ''
             is_mouse_motion = ('MOUSE' in es and 'MOTION' in es) or ('MOUSEMOTION' in es)
             if not is_mouse_motion:
-                # print('Refused Event:', self.cur_state.__class__.__name__, 'Input : ', event_to_string(state_event))
-                pass
+                print('Refused Event:', self.cur_state.__class__.__name__, 'Input : ', event_str)
+
+    def _change_state(self, next_state, state_event):
+        # 특수 처리: INVENTORY 상태에서 Tab_down이면 prev_state로 복귀
+        if next_state is None and hasattr(self.cur_state, 'prev_state') and self.cur_state.prev_state is not None:
+            next_state = self.cur_state.prev_state
+
+        # 특수 처리: DASH 상태에서 DASH_END이면 return_to_idle에 따라 IDLE 또는 RUN으로 복귀
+        if next_state is None and hasattr(self.cur_state, 'return_to_idle'):
+            # Dash의 return_to_idle 플래그 확인
+            if self.cur_state.return_to_idle:
+                # Idle로 복귀
+                next_state = self.cur_state.player.IDLE
+            else:
+                # Run으로 복귀
+                next_state = self.cur_state.player.RUN
+
+        self.cur_state.exit(state_event)
+        next_state.enter(state_event)
+
+        if log_level >= LOG_TRANSITIONS:
+            print(f'{self.cur_state.__class__.__name__}'
+                  f' ======{event_to_string(state_event)}======> '
+                  f'{next_state.__class__.__name__}')
+        self.cur_state = next_state
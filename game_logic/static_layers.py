@@ -0,0 +1,359 @@
+"""
+정적 배경 레이어 합성 (static layer compositor)
+
+로비의 하늘 6장 + 바닥처럼 움직이지 않고 같은 카메라 좌표계를 쓰는 배경 이미지들을
+스테이지 로드 시점에 텍스처 한 장으로 미리 합성해 두고, 매 프레임 그 한 장만 그립니다.
+화면을 여러 번 덮어 칠하던 전체 화면 크기 이미지들이 한 번의 그리기로 줄어듭니다.
+
+합성 텍스처는 (키, 스케일)별로 캐시하며 캔버스 크기가 바뀌면 다시 만듭니다.
+(pico2d 좌표 변환이 캔버스 높이에 의존하고, 렌더 타깃 텍스처는 창 크기 변경 시 무효화될 수 있음)
+
+합성 방법:
+    각 객체의 draw(x, y)를 평소처럼 호출하되 draw_hooks.record_copies()로
+    (텍스처, 원본 사각형, 대상 사각형, 회전, 뒤집기, 알파)를 모은 뒤 렌더 타깃 텍스처에 다시 그립니다.
+    객체의 draw 코드는 수정할 필요가 없습니다.
+    합성 결과는 premultiplied alpha이므로 (ONE, ONE_MINUS_SRC_ALPHA) 블렌딩으로 그립니다.
+
+크기 제한:
+    범위가 MAX_TILE_SIZE(또는 렌더러 최대 텍스처 크기)보다 크면 줄이지 않고 여러 타일로 나눠 합성하며,
+    그릴 때는 화면에 걸친 타일만 그립니다 (텍스처 크기 제한이 작은 GPU에서도 원본 해상도 유지).
+    합성 텍스처 전체 메모리가 MAX_COMPOSITE_BYTES를 넘으면 합성하지 않고 draw()가 False를 반환해
+    호출 측이 원본 객체를 그대로 그립니다. 원본 이미지는 그대로 로드되어 있으므로 합성 텍스처는 추가 메모리입니다.
+    (로비 하늘 + 바닥: 5785x4124 범위, 약 91MB - 최대 텍스처 크기가 4096인 GPU에서는 2x2 타일)
+    scale을 1.0보다 낮추면 그만큼 낮은 해상도로 합성해 메모리를 줄일 수 있습니다.
+
+사용법:
+    from game_logic import static_layers
+    layer = static_layers.get_layer('lobby', world['sky'] + world['ground'])
+    if layer.draw(camera):   # 합성 텍스처를 그렸으면 True
+        ...                  # 원본 객체들은 그리지 않음
+    print(static_layers.stats())   # fill_saved_ratio 등 채우기(fill rate) 절감 통계
+"""
+import math
+import ctypes
+
+import pico2d as p2
+import sdl2
+
+from . import draw_hooks
+from .draw_hooks import texture_alpha as _texture_alpha
+
+# 합성 타일 텍스처 한 변의 최대 크기 (렌더러 최대 텍스처 크기가 더 작으면 그 값을 사용)
+MAX_TILE_SIZE = 8192
+
+# 레이어 하나의 합성 텍스처 메모리 상한(바이트) - 넘으면 합성하지 않고 원본 객체를 그림
+MAX_COMPOSITE_BYTES = 128 * 1024 * 1024
+
+# 합성할 가치가 있는 최소 이미지 수 (1장이면 합성해도 그리기 횟수가 같음)
+MIN_SOURCES = 2
+
+# 합성된 레이어 캐시 {(키, 스케일): StaticLayer}
+_layers = {}
+
+# 통계 (이번 실행 기준)
+_stats = {'builds': 0, 'frames': 0, 'draw_calls_saved': 0, 'source_pixels': 0, 'composite_pixels': 0}
+
+
+def _premultiplied_blend_mode():
+    return sdl2.SDL_ComposeCustomBlendMode(
+        sdl2.SDL_BLENDFACTOR_ONE, sdl2.SDL_BLENDFACTOR_ONE_MINUS_SRC_ALPHA, sdl2.SDL_BLENDOPERATION_ADD,
+        sdl2.SDL_BLENDFACTOR_ONE, sdl2.SDL_BLENDFACTOR_ONE_MINUS_SRC_ALPHA, sdl2.SDL_BLENDOPERATION_ADD)
+
+
+def _max_texture_size(renderer):
+    info = sdl2.SDL_RendererInfo()
+    if sdl2.SDL_GetRendererInfo(renderer, ctypes.byref(info)) == 0:
+        limits = [v for v in (info.max_texture_width, info.max_texture_height) if v > 0]
+        if limits:
+            return min(MAX_TILE_SIZE, min(limits))
+    return MAX_TILE_SIZE
+
+
+def _split(length, count):
+    """length를 count개의 정수 구간 [(시작, 길이)]으로 고르게 나눔"""
+    bounds = [length * i // count for i in range(count + 1)]
+    return [(bounds[i], bounds[i + 1] - bounds[i]) for i in range(count)]
+
+
+def _overlaps(a, b):
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    return ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah
+
+
+def _canvas_size():
+    return p2.get_canvas_width(), p2.get_canvas_height()
+
+
+def _visible_area(left, top, w, h, canvas_w, canvas_h):
+    """SDL 좌표 사각형 중 화면 안에 들어오는 픽셀 수"""
+    vis_w = min(left + w, canvas_w) - max(left, 0)
+    vis_h = min(top + h, canvas_h) - max(top, 0)
+    if vis_w <= 0 or vis_h <= 0:
+        return 0
+    return vis_w * vis_h
+
+
+class StaticLayer:
+    """
+    정적 배경 객체 묶음을 합성한 텍스처 한 장
+
+    objects의 모든 객체는 같은 좌표계를 써야 합니다.
+        screen=False: draw(draw_x, draw_y)를 카메라 좌표로 호출하는 월드 객체 (LobbySky, StageMap 등)
+        screen=True: draw()를 인자 없이 호출하는 화면 고정 객체 (FixedBackground)
+    """
+
+    def __init__(self, key, objects, scale=1.0, screen=False, verbose=True):
+        self.key = key
+        self.objects = list(objects)
+        self.scale = scale
+        self.screen = screen
+        self.verbose = verbose      # False면 합성할 때마다 로그를 남기지 않음 (자주 다시 합성하는 UI용)
+        self.tiles = []             # [(pico2d Image, x, y, w, h)] 합성 범위 기준 타일 (화면 픽셀, SDL 좌표)
+        self.canvas_size = None
+        self.center = (0.0, 0.0)    # 합성 범위 중심 (월드 또는 화면 좌표)
+        self.size = (0, 0)          # 합성 범위 크기 (화면 픽셀 기준)
+        self.source_rects = []      # 합성 범위 기준 원본 이미지 사각형 [(left, top, w, h)]
+        self._ids = set()
+
+    def contains(self, obj):
+        """obj가 이 레이어에 합성되어 있는지 (합성 텍스처를 그렸으면 원본 객체는 건너뜀)"""
+        return bool(self.tiles) and id(obj) in self._ids
+
+    def _draw_sources(self):
+        for obj in self.objects:
+            if self.screen:
+                obj.draw()
+            else:
+                # 카메라 없이 월드 좌표 그대로 그린 위치를 기준으로 합성
+                obj.draw(obj.x, obj.y)
+
+    def build(self):
+        """
+        합성 텍스처 생성 (이미 있으면 다시 생성)
+
+        Returns:
+            bool: 합성 텍스처를 만들었으면 True
+                  (이미지가 부족하거나, 렌더 타깃 미지원이거나, 메모리 상한을 넘으면 False)
+        """
+        self.release()
+        self.canvas_size = _canvas_size()
+
+        renderer = p2.pico2d.renderer
+        if not sdl2.SDL_RenderTargetSupported(renderer):
+            print(f'\033[91m[StaticLayers] {self.key}: 렌더 타깃을 지원하지 않는 렌더러 - 합성 생략\033[0m')
+            return False
+
+        commands = draw_hooks.record_copies(self._draw_sources)
+        if len(commands) < MIN_SOURCES:
+            return False
+
+        left = min(dst[0] for _, _, dst, _, _, _ in commands)
+        top = min(dst[1] for _, _, dst, _, _, _ in commands)
+        right = max(dst[0] + dst[2] for _, _, dst, _, _, _ in commands)
+        bottom = max(dst[1] + dst[3] for _, _, dst, _, _, _ in commands)
+        width, height = right - left, bottom - top
+        if width <= 0 or height <= 0:
+            return False
+
+        scale = self.scale
+        tex_w = max(1, math.ceil(width * scale))
+        tex_h = max(1, math.ceil(height * scale))
+        memory_mb = tex_w * tex_h * 4 / (1024 * 1024)
+        if tex_w * tex_h * 4 > MAX_COMPOSITE_BYTES:
+            print(f'\033[91m[StaticLayers] {self.key}: 합성 텍스처 {tex_w}x{tex_h} ({memory_mb:.1f}MB)가 '
+                  f'메모리 상한 {MAX_COMPOSITE_BYTES / (1024 * 1024):.0f}MB 초과 - 원본 이미지로 그림\033[0m')
+            return False
+
+        # 텍스처 크기 제한보다 크면 타일로 나눔 (경계는 원본 픽셀 단위 정수라 타일 사이에 틈이 생기지 않음)
+        limit = _max_texture_size(renderer)
+        columns = _split(width, math.ceil(tex_w / limit))
+        rows = _split(height, math.ceil(tex_h / limit))
+        sources = [((x - left, y - top, w, h), texture, src, angle, flip, alpha)
+                   for texture, src, (x, y, w, h), angle, flip, alpha in commands]
+
+        previous_target = sdl2.SDL_GetRenderTarget(renderer)
+        r, g, b, a = ctypes.c_uint8(), ctypes.c_uint8(), ctypes.c_uint8(), ctypes.c_uint8()
+        sdl2.SDL_GetRenderDrawColor(renderer, ctypes.byref(r), ctypes.byref(g), ctypes.byref(b), ctypes.byref(a))
+        # 렌더 스케일 타깃(render_scale)에 그리는 중이면 타깃 전환 시 초기화되는 스케일도 복원
+        scale_x, scale_y = ctypes.c_float(), ctypes.c_float()
+        sdl2.SDL_RenderGetScale(renderer, ctypes.byref(scale_x), ctypes.byref(scale_y))
+        tiles = []
+        try:
+            for tile_y, tile_h in rows:
+                for tile_x, tile_w in columns:
+                    image = _render_tile(renderer, sources, (tile_x, tile_y, tile_w, tile_h), scale)
+                    if image is None:
+                        print(f'\033[91m[StaticLayers] {self.key}: 합성 텍스처 생성 실패 '
+                              f'({math.ceil(tile_w * scale)}x{math.ceil(tile_h * scale)}): {sdl2.SDL_GetError()}\033[0m')
+                        return False
+                    tiles.append((image, tile_x, tile_y, tile_w, tile_h))
+        finally:
+            sdl2.SDL_SetRenderTarget(renderer, previous_target)
+            if previous_target:
+                sdl2.SDL_RenderSetScale(renderer, scale_x.value, scale_y.value)
+            sdl2.SDL_SetRenderDrawColor(renderer, r.value, g.value, b.value, a.value)
+
+        self.tiles = tiles
+        self.source_rects = [rect for rect, _, _, _, _, _ in sources]
+        self.size = (width, height)
+        # SDL 좌표(y 아래쪽) 중심을 pico2d 좌표(y 위쪽)로 변환
+        canvas_h = self.canvas_size[1]
+        self.center = (left + width / 2, canvas_h - (top + height / 2))
+        self._ids = {id(obj) for obj in self.objects}
+        _stats['builds'] += 1
+
+        if not self.verbose:
+            return True
+        print(f'[StaticLayers] {self.key}: 이미지 {len(commands)}장 -> {tex_w}x{tex_h} 합성 '
+              f'(타일 {len(columns)}x{len(rows)}, 스케일 {scale:.2f}, {memory_mb:.1f}MB)')
+        return True
+
+    def is_valid(self):
+        """합성 텍스처가 있고 캔버스 크기가 그대로인지"""
+        return bool(self.tiles) and self.canvas_size == _canvas_size()
+
+    def draw(self, camera=None):
+        """
+        합성 텍스처 그리기 (캔버스 크기가 바뀌었으면 먼저 다시 합성)
+
+        Args:
+            camera: 월드 레이어용 카메라 (apply(x, y) 제공, None이면 월드 좌표 그대로)
+
+        Returns:
+            bool: 합성 텍스처를 그렸으면 True (False면 호출 측에서 원본 객체를 그려야 함)
+        """
+        if not self.tiles:
+            return False
+        if self.canvas_size != _canvas_size() and not self.build():
+            return False
+
+        cx, cy = self.center
+        if not self.screen and camera is not None:
+            cx, cy = camera.apply(cx, cy)
+        width, height = self.size
+        canvas_w, canvas_h = self.canvas_size
+        # 전체 좌상단만 한 번 정수로 만들고 타일은 정수 오프셋으로 배치 (타일마다 반올림하면 경계가 1픽셀 어긋남)
+        left = int(cx - width / 2)
+        top = int(canvas_h - cy - height / 2)
+
+        drawn = 0
+        for image, x, y, w, h in self.tiles:
+            visible = _visible_area(left + x, top + y, w, h, canvas_w, canvas_h)
+            if not visible:
+                continue
+            image.draw_to_origin(left + x, canvas_h - (top + y) - h, w, h)
+            drawn += 1
+            _stats['composite_pixels'] += visible
+
+        # 채우기 통계: 원본 이미지를 각각 그렸다면 칠했을 화면 픽셀 수와 비교
+        _stats['frames'] += 1
+        _stats['draw_calls_saved'] += len(self.source_rects) - drawn
+        for x, y, w, h in self.source_rects:
+            _stats['source_pixels'] += _visible_area(left + x, top + y, w, h, canvas_w, canvas_h)
+        return True
+
+    def release(self):
+        """합성 텍스처 해제 (Image 소멸 시 텍스처도 해제됨)"""
+        self.tiles = []
+        self._ids = set()
+        self.source_rects = []
+
+
+def _render_tile(renderer, sources, tile, scale):
+    """
+    합성 범위 중 타일 하나를 렌더 타깃 텍스처에 그림 (호출 측에서 렌더 타깃/색상 복원)
+
+    Args:
+        sources: [((x, y, w, h) 합성 범위 기준 대상 사각형, texture, src, angle, flip, alpha)]
+        tile: (x, y, w, h) 합성 범위 기준 타일 사각형
+        scale: 합성 해상도 배율
+
+    Returns:
+        pico2d Image 또는 None (텍스처 생성 실패)
+    """
+    tile_x, tile_y, tile_w, tile_h = tile
+    target = sdl2.SDL_CreateTexture(renderer, sdl2.SDL_PIXELFORMAT_ARGB8888, sdl2.SDL_TEXTUREACCESS_TARGET,
+                                    max(1, math.ceil(tile_w * scale)), max(1, math.ceil(tile_h * scale)))
+    if not target:
+        return None
+
+    sdl2.SDL_SetRenderTarget(renderer, target)
+    sdl2.SDL_SetRenderDrawColor(renderer, 0, 0, 0, 0)
+    sdl2.SDL_RenderClear(renderer)
+
+    for rect, texture, src, angle, flip, alpha in sources:
+        # 회전한 이미지는 대상 사각형 밖으로 나갈 수 있으므로 겹침 검사 생략
+        if not angle and not _overlaps(rect, tile):
+            continue
+        x, y, w, h = rect
+        dst = sdl2.SDL_Rect(int((x - tile_x) * scale), int((y - tile_y) * scale),
+                            math.ceil(w * scale), math.ceil(h * scale))
+        previous_alpha = _texture_alpha(texture)
+        sdl2.SDL_SetTextureAlphaMod(texture, alpha)
+        if angle or flip:
+            sdl2.SDL_RenderCopyEx(renderer, texture, src, dst, angle, None, flip)
+        else:
+            sdl2.SDL_RenderCopy(renderer, texture, src, dst)
+        sdl2.SDL_SetTextureAlphaMod(texture, previous_alpha)
+
+    # 렌더 타깃에 알파 블렌딩으로 쌓은 색은 이미 알파가 곱해져 있음
+    if sdl2.SDL_SetTextureBlendMode(target, _premultiplied_blend_mode()) != 0:
+        sdl2.SDL_SetTextureBlendMode(target, sdl2.SDL_BLENDMODE_BLEND)
+    return p2.Image(target)
+
+
+def get_layer(key, objects, scale=1.0, screen=False):
+    """
+    (키, 스케일)별 합성 레이어 가져오기 (없거나 캔버스 크기가 바뀌었으면 새로 합성)
+
+    Args:
+        key: 스테이지 이름 등 레이어 식별자
+        objects: 합성할 정적 배경 객체 리스트 (그리는 순서대로)
+        scale: 합성 해상도 배율 (1.0 = 원본 해상도)
+        screen: True면 화면 고정 객체 (draw() 인자 없음)
+
+    Returns:
+        StaticLayer (합성에 실패했어도 반환하며, draw()가 False를 반환)
+    """
+    cache_key = (key, scale)
+    layer = _layers.get(cache_key)
+    ids = {id(obj) for obj in objects}
+    if layer is not None and layer.is_valid() and layer._ids == ids:
+        return layer
+
+    if layer is None:
+        layer = StaticLayer(key, objects, scale, screen)
+        _layers[cache_key] = layer
+    else:
+        layer.objects = list(objects)
+        layer.screen = screen
+    layer.build()
+    return layer
+
+
+def clear(key=None):
+    """
+    합성 레이어 해제
+
+    Args:
+        key: 해제할 레이어 키 (None이면 전체)
+    """
+    for cache_key in list(_layers):
+        if key is None or cache_key[0] == key:
+            _layers.pop(cache_key).release()
+
+
+def stats():
+    """
+    통계
+
+    Returns:
+        dict: {'layers', 'builds', 'frames', 'draw_calls_saved', 'source_pixels', 'composite_pixels',
+               'fill_saved_ratio' (원본 대비 줄어든 화면 채우기 비율, 0~1)}
+    """
+    result = {'layers': sum(1 for layer in _layers.values() if layer.tiles)}
+    result.update(_stats)
+    source = _stats['source_pixels']
+    result['fill_saved_ratio'] = (1.0 - _stats['composite_pixels'] / source) if source else 0.0
+    return result
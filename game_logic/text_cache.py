@@ -0,0 +1,225 @@
+"""
+텍스트 렌더링 캐시
+
+pico2d의 Font.draw는 호출할 때마다 SDL_ttf로 문자열을 래스터화하고 새 텍스처를 만듭니다.
+HUD처럼 같은 문자열을 매 프레임(그림자까지 여러 번) 그리는 경우를 위해
+(폰트, 크기, 문자열, 색상)별로 만든 텍스처를 보관해 두고 다음부터는 텍스처 그리기만 합니다.
+
+그림자 텍스트는 그림자 레이어와 본문을 한 장의 텍스처로 미리 합성하므로
+그림자 2겹 + 본문도 그리기 1번입니다.
+
+사용법:
+    from game_logic import text_cache
+    font = text_cache.load_font('resources/Fonts/pixelroborobo.otf', 15)
+    text_cache.draw_text(font, x, y, '100/100', (255, 255, 255))          # font.draw(x, y, ...)와 같은 위치
+    text_cache.draw_shadowed_text(font, x, y, '100/100', (255, 255, 255))  # (-2,-2), (-1,-1) 검은 그림자
+"""
+import ctypes
+from collections import OrderedDict
+
+import pico2d as p2
+import sdl2
+import sdl2.sdlttf as sdlttf
+
+FONT_PATH = 'resources/Fonts/pixelroborobo.otf'
+
+# 기존 HUD 그림자와 동일한 기본값 (font.draw(x-2, y-2), font.draw(x-1, y-1))
+DEFAULT_SHADOW_OFFSETS = ((-2, -2), (-1, -1))
+DEFAULT_SHADOW_COLOR = (0, 0, 0)
+
+# 캐시 최대 항목 수 (체력/시간 문자열처럼 값이 바뀌는 텍스트가 계속 쌓이지 않도록 LRU로 제거)
+MAX_ENTRIES = 512
+
+# 공유 폰트 {(경로, 크기): Font}
+_fonts = {}
+# Font 객체 -> (경로, 크기) (load_font로 만든 폰트의 캐시 키용)
+_font_keys = {}
+
+# 텍스트 캐시 {키: (Image, 그리기 오프셋 x, 그리기 오프셋 y)}
+_entries = OrderedDict()
+
+# 통계 (이번 실행 기준)
+_stats = {'hits': 0, 'renders': 0, 'evictions': 0}
+
+
+def load_font(path=FONT_PATH, size=20):
+    """
+    폰트 로드 ((경로, 크기)별로 한 번만 로드해 공유)
+
+    Args:
+        path: 폰트 파일 경로
+        size: 폰트 크기
+
+    Returns:
+        pico2d Font
+    """
+    key = (path, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = p2.load_font(path, size)
+        _fonts[key] = font
+        _font_keys[id(font)] = key
+    return font
+
+
+def _font_key(font):
+    # load_font로 만든 폰트는 (경로, 크기), 그 외 폰트는 객체 자체 (캐시 항목이 참조를 유지)
+    return _font_keys.get(id(font), font)
+
+
+def _render_surface(font, text, color):
+    sdl_color = sdl2.SDL_Color(color[0], color[1], color[2])
+    surface = sdlttf.TTF_RenderUTF8_Blended(font.font, text.encode('utf-8'), sdl_color)
+    if not surface:
+        raise RuntimeError(f'TTF 렌더링 실패: {text!r}')
+    return surface
+
+
+def _create_image(surface):
+    texture = sdl2.SDL_CreateTextureFromSurface(p2.pico2d.renderer, surface)
+    if not texture:
+        raise RuntimeError(f'텍스처 생성 실패: {sdl2.SDL_GetError()}')
+    return p2.Image(texture)
+
+
+def _store(key, entry):
+    _entries[key] = entry
+    if len(_entries) > MAX_ENTRIES:
+        _entries.popitem(last=False)
+        _stats['evictions'] += 1
+
+
+def _lookup(key):
+    entry = _entries.get(key)
+    if entry is not None:
+        _entries.move_to_end(key)
+        _stats['hits'] += 1
+    return entry
+
+
+def get_text_image(font, text, color=(0, 0, 0)):
+    """
+    텍스트 텍스처 가져오기 (없으면 한 번 래스터화해서 캐시)
+
+    Args:
+        font: pico2d Font
+        text: 문자열
+        color: (r, g, b)
+
+    Returns:
+        pico2d Image
+    """
+    key = ('text', _font_key(font), text, tuple(color))
+    entry = _lookup(key)
+    if entry is None:
+        surface = _render_surface(font, text, color)
+        try:
+            image = _create_image(surface)
+        finally:
+            sdl2.SDL_FreeSurface(surface)
+        entry = (image, image.w / 2, 0)
+        _store(key, entry)
+        _stats['renders'] += 1
+    return entry[0]
+
+
+def draw_text(font, x, y, text, color=(0, 0, 0)):
+    """
+    캐시된 텍스트 그리기 (font.draw(x, y, text, color)와 같은 위치: x는 왼쪽, y는 세로 중앙)
+
+    Args:
+        font: pico2d Font
+        x, y: 그리기 위치
+        text: 문자열
+        color: (r, g, b)
+    """
+    if not text:
+        return
+    image = get_text_image(font, text, color)
+    image.draw(x + image.w / 2, y)
+
+
+def _build_shadowed(font, text, color, shadow_color, offsets):
+    main = _render_surface(font, text, color)
+    shadow = _render_surface(font, text, shadow_color)
+    try:
+        w, h = main.contents.w, main.contents.h
+        dxs = [dx for dx, _ in offsets] + [0]
+        dys = [dy for _, dy in offsets] + [0]
+        min_dx, max_dx = min(dxs), max(dxs)
+        min_dy, max_dy = min(dys), max(dys)
+        total_w = w + (max_dx - min_dx)
+        total_h = h + (max_dy - min_dy)
+
+        target = sdl2.SDL_CreateRGBSurfaceWithFormat(0, total_w, total_h, 32, sdl2.SDL_PIXELFORMAT_ARGB8888)
+        if not target:
+            raise RuntimeError(f'서피스 생성 실패: {sdl2.SDL_GetError()}')
+        try:
+            # 투명 배경 위에 그림자 -> 본문 순서로 알파 블렌딩
+            sdl2.SDL_SetSurfaceBlendMode(shadow, sdl2.SDL_BLENDMODE_BLEND)
+            sdl2.SDL_SetSurfaceBlendMode(main, sdl2.SDL_BLENDMODE_BLEND)
+            for dx, dy in offsets:
+                # pico2d 좌표(y 위쪽)의 오프셋을 서피스 좌표(y 아래쪽)로 변환
+                rect = sdl2.SDL_Rect(dx - min_dx, max_dy - dy, w, h)
+                sdl2.SDL_BlitSurface(shadow, None, target, ctypes.byref(rect))
+            rect = sdl2.SDL_Rect(-min_dx, max_dy, w, h)
+            sdl2.SDL_BlitSurface(main, None, target, ctypes.byref(rect))
+            image = _create_image(target)
+        finally:
+            sdl2.SDL_FreeSurface(target)
+    finally:
+        sdl2.SDL_FreeSurface(main)
+        sdl2.SDL_FreeSurface(shadow)
+
+    # 본문이 font.draw(x, y)와 같은 위치에 오도록 합성 이미지 중심 오프셋 계산
+    anchor_x = w / 2 + (total_w / 2 - (-min_dx + w / 2))
+    anchor_y = -(total_h / 2 - (max_dy + h / 2))
+    return image, anchor_x, anchor_y
+
+
+def draw_shadowed_text(font, x, y, text, color=(255, 255, 255),
+                       shadow_color=DEFAULT_SHADOW_COLOR, offsets=DEFAULT_SHADOW_OFFSETS):
+    """
+    그림자 텍스트 그리기 (그림자 + 본문을 미리 합성한 텍스처 1장)
+
+    아래 코드와 같은 결과를 그리기 1번으로 처리합니다:
+        font.draw(x - 2, y - 2, text, shadow_color)
+        font.draw(x - 1, y - 1, text, shadow_color)
+        font.draw(x, y, text, color)
+
+    Args:
+        font: pico2d Font
+        x, y: 본문 위치 (font.draw와 동일)
+        text: 문자열
+        color: 본문 색상
+        shadow_color: 그림자 색상
+        offsets: 그림자 오프셋 튜플 ((dx, dy), ...)
+    """
+    if not text:
+        return
+    key = ('shadow', _font_key(font), text, tuple(color), tuple(shadow_color), tuple(offsets))
+    entry = _lookup(key)
+    if entry is None:
+        entry = _build_shadowed(font, text, color, shadow_color, offsets)
+        _store(key, entry)
+        _stats['renders'] += 1
+
+    image, anchor_x, anchor_y = entry
+    image.draw(x + anchor_x, y + anchor_y)
+
+
+def clear():
+    """캐시된 텍스트 텍스처 모두 해제 (폰트는 유지)"""
+    _entries.clear()
+
+
+def stats():
+    """
+    통계
+
+    Returns:
+        dict: {'entries', 'fonts', 'hits', 'renders', 'evictions'}
+    """
+    result = {'entries': len(_entries), 'fonts': len(_fonts)}
+    result.update(_stats)
+    return result
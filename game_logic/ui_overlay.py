@@ -3,6 +3,10 @@ import ctypes
 from pico2d import load_image, get_canvas_width, get_canvas_height, load_font
 from sdl2 import SDL_MOUSEBUTTONDOWN, SDL_BUTTON_LEFT, SDL_BUTTON_RIGHT, SDL_MOUSEMOTION, SDL_MOUSEBUTTONUP, SDL_GetMouseState, SDL_KEYDOWN, SDLK_F5, SDLK_F6
 from .inventory import Item
+from . import text_cache
+from . import static_layers
+from .animation_clips import Animator, make_clip
+import game_framework as framework
 
 class InventoryOverlay:
     """UI 레이어에서 그려지는 인벤토리 오버레이 (배경 + 슬롯 그리드 + 아이템 아이콘 + 드래그)
@@ -108,7 +112,14 @@ class InventoryOverlay:
         self.tooltip_item_desc_offset_y = -17.5
 
         # 계산 캐시
-        self._last_layout = None  # (canvas_w, canvas_h, scale) -> layout dict
+        self._last_layout = None  # ((canvas_w, canvas_h, cols, rows), layout dict)
+
+        # 배경 + 슬롯 + 아이콘 + 수량 합성 텍스처 (인벤토리 version/레이아웃/숨김 슬롯이 바뀔 때만 다시 합성)
+        self._grid_layer = static_layers.StaticLayer('inventory', [_InventoryGridPainter(self)],
+                                                     screen=True, verbose=False)
+        self._grid_key = None
+        self._grid_layout = None
+        self._grid_hidden = ()
 
     def _ensure_font(self, slot_h):
         """슬롯 높이에 맞춰 폰트를 로드/캐시한다. 실패 시 _font=None 유지."""
@@ -123,7 +134,7 @@ class InventoryOverlay:
         ]
         for path in candidates:
             try:
-                self._font = load_font(path, target_size)
+                self._font = text_cache.load_font(path, target_size)
                 self._font_size = target_size
                 self._font_loaded = True
                 return
@@ -353,6 +364,13 @@ class InventoryOverlay:
             'slot_draw_h': slot_draw_h,
         }
 
+    def _get_layout(self, canvas_w, canvas_h):
+        """캔버스 크기와 그리드 크기가 그대로면 이전 레이아웃을 재사용"""
+        key = (canvas_w, canvas_h, self.cols, self.rows)
+        if self._last_layout is None or self._last_layout[0] != key:
+            self._last_layout = (key, self._compute_layout(canvas_w, canvas_h))
+        return self._last_layout[1]
+
     def _hit_test(self, mx, my):
         """윈도우 좌표(mx,my)를 게임 좌표로 변환 후 슬롯 인덱스(r,c)를 반환. 없으면 None"""
         if self.image is None:
@@ -361,7 +379,7 @@ class InventoryOverlay:
         canvas_h = get_canvas_height()
         # y 뒤집기
         gy = canvas_h - my
-        layout = self._compute_layout(canvas_w, canvas_h)
+        layout = self._get_layout(canvas_w, canvas_h)
         left = layout['grid_left_centered']
         bottom = layout['grid_bottom_centered']
         w = layout['slot_draw_w']
@@ -395,9 +413,77 @@ class InventoryOverlay:
         canvas_w = get_canvas_width()
         canvas_h = get_canvas_height()
 
-        # 레이아웃 계산
-        layout = self._compute_layout(canvas_w, canvas_h)
+        # 레이아웃 계산 (캔버스 크기별 캐시)
+        layout = self._get_layout(canvas_w, canvas_h)
         self.scale = layout['scale']
+        slot_draw_w = layout['slot_draw_w']
+        slot_draw_h = layout['slot_draw_h']
+        margin_ratio = 0.18
+        icon_box_w = slot_draw_w * (1.0 - margin_ratio)
+        icon_box_h = slot_draw_h * (1.0 - margin_ratio)
+        self._ensure_font(slot_draw_h)
+
+        # 드래그 중이면 원본 슬롯과 현재 마우스가 가리키는 슬롯(호버)은 임시 비표시 처리
+        hidden = ()
+        if self.dragging:
+            mx, my = self._get_mouse_pos()
+            hidden = (self.drag_from, self._hit_test(mx, my))
+
+        # 배경 + 슬롯 + 아이콘 + 수량: 바뀐 것이 없으면 합성해 둔 텍스처 한 장만 그림
+        inv = getattr(self.player, 'inventory', None)
+        version = getattr(inv, 'version', None)
+        key = (self._last_layout[0], id(inv), version, hidden, self._font_size)
+        if version is not None and key != self._grid_key:
+            self._grid_layout = layout
+            self._grid_hidden = hidden
+            self._grid_key = key
+            self._grid_layer.build()
+        # version이 없는 인벤토리(변경 감지 불가)이거나 합성에 실패하면 매 프레임 직접 그림
+        if version is None or not self._grid_layer.draw():
+            self._grid_layout = layout
+            self._grid_hidden = hidden
+            self._draw_grid()
+
+        if self.slot_image is None or inv is None:
+            return
+
+        # 드래그 고스트 아이콘 (최상단)
+        if self.dragging and self.drag_icon is not None:
+            mx, my = self._get_mouse_pos()
+            scale = min(icon_box_w / self.drag_icon.w, icon_box_h / self.drag_icon.h) * 0.85
+            dw = self.drag_icon.w * scale
+            dh = self.drag_icon.h * scale
+            # 오프셋: x는 -, y는 + 방향으로 슬롯 크기 비율만큼 이동 (되돌림: 0.2)
+            offset_x = -slot_draw_w * 0.2
+            offset_y =  slot_draw_h * 0.2
+            try:
+                self.drag_icon.opacify(0.7)
+                gy = get_canvas_height() - my
+                self.drag_icon.draw(mx + offset_x, gy + offset_y, dw, dh)
+            finally:
+                try:
+                    self.drag_icon.opacify(1.0)
+                except Exception:
+                    pass
+            # 수량 표시
+            if self.drag_qty > 1 and self._font is not None:
+                tx = (mx + offset_x) + (dw * 0.5) - 4
+                ty = (get_canvas_height() - my + offset_y) - (dh * 0.5) + 4
+                try:
+                    self._font.draw(tx - 1, ty - 1, str(self.drag_qty), (0, 0, 0))
+                    self._font.draw(tx, ty, str(self.drag_qty), (255, 255, 255))
+                except Exception:
+                    pass
+
+        # 툴팁 그리기 (드래그 중이 아니고, 호버 슬롯이 있을 때)
+        if not self.dragging and self.hover_slot is not None:
+            self._draw_tooltip()
+
+    def _draw_grid(self):
+        """배경, 슬롯 그리드, 아이템 아이콘, 수량 텍스트 그리기 (합성 텍스처 생성 시 호출)"""
+        layout = self._grid_layout
+        if layout is None:
+            return
 
         # 배경 그리기
         self.image.clip_composite_draw(
@@ -428,13 +514,6 @@ class InventoryOverlay:
         margin_ratio = 0.18
         icon_box_w = slot_draw_w * (1.0 - margin_ratio)
         icon_box_h = slot_draw_h * (1.0 - margin_ratio)
-        self._ensure_font(slot_draw_h)
-
-        # 드래그 중이면 현재 마우스가 가리키는 슬롯(호버)을 계산하여 임시 비표시 처리
-        hover_rc = None
-        if self.dragging:
-            mx, my = self._get_mouse_pos()
-            hover_rc = self._hit_test(mx, my)
 
         for r in range(self.rows):
             for c in range(self.cols):
@@ -443,7 +522,7 @@ class InventoryOverlay:
                 except Exception:
                     continue
                 # 드래그 중 원본 또는 호버 슬롯은 표시하지 않음(고스트가 더 잘 보이도록)
-                if self.dragging and (self.drag_from == (r, c) or (hover_rc is not None and hover_rc == (r, c))):
+                if (r, c) in self._grid_hidden:
                     continue
                 if slot.is_empty():
                     continue
@@ -463,45 +542,13 @@ class InventoryOverlay:
                     # 우하단 여백 약간 띄워서 그림
                     tx = cx + (slot_draw_w * 0.3) - 4
                     ty = cy - (slot_draw_h * 0.5) + 4
-                    # 그림자
+                    # 그림자 (텍스트 텍스처가 합성 시점까지 유지되도록 text_cache 사용)
                     try:
-                        self._font.draw(tx - 1, ty - 1, txt, (0, 0, 0))
-                        self._font.draw(tx, ty, txt, (255, 255, 255))
+                        text_cache.draw_shadowed_text(self._font, tx, ty, txt, (255, 255, 255),
+                                                      offsets=((-1, -1),))
                     except Exception:
                         pass
 
-        # 드래그 고스트 아이콘 (최상단)
-        if self.dragging and self.drag_icon is not None:
-            mx, my = self._get_mouse_pos()
-            scale = min(icon_box_w / self.drag_icon.w, icon_box_h / self.drag_icon.h) * 0.85
-            dw = self.drag_icon.w * scale
-            dh = self.drag_icon.h * scale
-            # 오프셋: x는 -, y는 + 방향으로 슬롯 크기 비율만큼 이동 (되돌림: 0.2)
-            offset_x = -slot_draw_w * 0.2
-            offset_y =  slot_draw_h * 0.2
-            try:
-                self.drag_icon.opacify(0.7)
-                gy = get_canvas_height() - my
-                self.drag_icon.draw(mx + offset_x, gy + offset_y, dw, dh)
-            finally:
-                try:
-                    self.drag_icon.opacify(1.0)
-                except Exception:
-                    pass
-            # 수량 표시
-            if self.drag_qty > 1 and self._font is not None:
-                tx = (mx + offset_x) + (dw * 0.5) - 4
-                ty = (get_canvas_height() - my + offset_y) - (dh * 0.5) + 4
-                try:
-                    self._font.draw(tx - 1, ty - 1, str(self.drag_qty), (0, 0, 0))
-                    self._font.draw(tx, ty, str(self.drag_qty), (255, 255, 255))
-                except Exception:
-                    pass
-
-        # 툴팁 그리기 (드래그 중이 아니고, 호버 슬롯이 있을 때)
-        if not self.dragging and self.hover_slot is not None:
-            self._draw_tooltip()
-
     def _draw_tooltip(self):
         """호버 중인 아이템의 툴팁을 그린다"""
         if self.tooltip_image is None or self.hover_slot is None:
@@ -580,6 +627,15 @@ class InventoryOverlay:
             print(f"\033[91m[InventoryOverlay] 툴팁 그리기 실패: {ex}\033[0m")
 
 
+class _InventoryGridPainter:
+    """StaticLayer가 draw()로 호출하는 인벤토리 그리드 그리기 어댑터"""
+    def __init__(self, overlay):
+        self.overlay = overlay
+
+    def draw(self):
+        self.overlay._draw_grid()
+
+
 class HealthBar:
     """화면 왼쪽 상단에 표시되는 체력 바 UI"""
     _hp_images = None  # 클래스 변수로 이미지 공유
@@ -607,10 +663,10 @@ class HealthBar:
         self.width_scale = 5.0  # 가로 방향으로 5배 확대
         self.height_scale = 2.0  # 세로 방향으로 2배 확대
 
-        # 애니메이션 관련 변수
-        self.frame_time = 0.0  # 현재 프레임 경과 시간
-        self.frame_index = 0  # 현재 애니메이션 프레임 인덱스
+        # 애니메이션 (상시 재생, 일시정지 중에도 UI 시계로 재생)
         self.frame_duration = 0.1  # 각 프레임 지속 시간 (초) - 조정 가능
+        self.animator = Animator(make_clip('hp_bar', HealthBar._hp_images, self.frame_duration),
+                                 clock=framework.get_ui_time)
 
         # 폰트 로드
         self.font = None
@@ -622,7 +678,7 @@ class HealthBar:
             ]
             for font_path in font_candidates:
                 try:
-                    self.font = load_font(font_path, 15)  # 폰트 크기 20으로 조정
+                    self.font = text_cache.load_font(font_path, 15)  # 폰트 크기 20으로 조정
                     print(f"[HealthBar] 폰트 로드 성공: {font_path}")
                     break
                 except Exception:
@@ -631,25 +687,8 @@ class HealthBar:
             print(f"[HealthBar] 폰트 로드 실패: {ex}")
 
     def update(self):
-        """애니메이션 프레임 업데이트"""
-        if not HealthBar._hp_images or len(HealthBar._hp_images) == 0:
-            return
-
-        # 시간 기반 애니메이션 진행
-        import time
-        current_time = time.time()
-        if not hasattr(self, '_last_update_time'):
-            self._last_update_time = current_time
-
-        delta_time = current_time - self._last_update_time
-        self._last_update_time = current_time
-
-        self.frame_time += delta_time
-
-        # 프레임 전환
-        if self.frame_time >= self.frame_duration:
-            self.frame_time -= self.frame_duration
-            self.frame_index = (self.frame_index + 1) % len(HealthBar._hp_images)
+        # 애니메이션 프레임은 draw에서 Animator가 계산
+        pass
 
     def draw(self):
         """플레이어의 현재 체력에 따라 적절한 체력 바를 표시"""
@@ -667,11 +706,7 @@ class HealthBar:
             health_ratio = 1.0  # 기본값
 
         # 애니메이션 프레임 사용 (상시 재생)
-        image_index = self.frame_index
-        if image_index < 0 or image_index >= len(HealthBar._hp_images):
-            image_index = 0
-
-        hp_image = HealthBar._hp_images[image_index]
+        hp_image = self.animator.image
 
         # 화면 좌표 계산 (pico2d는 하단이 0)
         canvas_h = get_canvas_height()
@@ -691,11 +726,8 @@ class HealthBar:
             # 체력 텍스트 (현재/최대)
             health_text = f"{int(current_health)}/{int(max_health)}"
 
-            # 그림자 효과 (가독성 향상)
-            self.font.draw(text_x - 2, text_y - 2, health_text, (0, 0, 0))
-            self.font.draw(text_x - 1, text_y - 1, health_text, (0, 0, 0))
-            # 실제 텍스트 (흰색)
-            self.font.draw(text_x, text_y, health_text, (255, 255, 255))
+            # 그림자 효과 (가독성 향상) + 실제 텍스트 (흰색), 캐시된 합성 텍스처 1장
+            text_cache.draw_shadowed_text(self.font, text_x, text_y, health_text, (255, 255, 255))
 
 
 class ManaBar:
@@ -725,10 +757,10 @@ class ManaBar:
         self.width_scale = 5.0
         self.height_scale = 2.0
 
-        # 애니메이션 관련 변수
-        self.frame_time = 0.0
-        self.frame_index = 0
+        # 애니메이션 (HealthBar와 동일)
         self.frame_duration = 0.1
+        self.animator = Animator(make_clip('mp_bar', ManaBar._mp_images, self.frame_duration),
+                                 clock=framework.get_ui_time)
 
         # 폰트 로드
         self.font = None
@@ -739,7 +771,7 @@ class ManaBar:
             ]
             for font_path in font_candidates:
                 try:
-                    self.font = load_font(font_path, 15)
+                    self.font = text_cache.load_font(font_path, 15)
                     print(f"[ManaBar] 폰트 로드 성공: {font_path}")
                     break
                 except Exception:
@@ -748,18 +780,7 @@ class ManaBar:
             print(f"[ManaBar] 폰트 로드 실패: {ex}")
 
     def update(self):
-        if not ManaBar._mp_images or len(ManaBar._mp_images) == 0:
-            return
-        import time
-        current_time = time.time()
-        if not hasattr(self, '_last_update_time'):
-            self._last_update_time = current_time
-        delta_time = current_time - self._last_update_time
-        self._last_update_time = current_time
-        self.frame_time += delta_time
-        if self.frame_time >= self.frame_duration:
-            self.frame_time -= self.frame_duration
-            self.frame_index = (self.frame_index + 1) % len(ManaBar._mp_images)
+        pass
 
     def draw(self):
         if not ManaBar._mp_images or len(ManaBar._mp_images) == 0:
@@ -772,10 +793,7 @@ class ManaBar:
             current_mana = 100
             max_mana = 100
             mana_ratio = 1.0
-        image_index = self.frame_index
-        if image_index < 0 or image_index >= len(ManaBar._mp_images):
-            image_index = 0
-        mp_image = ManaBar._mp_images[image_index]
+        mp_image = self.animator.image
         canvas_h = get_canvas_height()
         draw_y = canvas_h - self.y_from_top
         draw_width = mp_image.w * self.width_scale
@@ -785,9 +803,7 @@ class ManaBar:
             text_x = self.x * 0.8
             text_y = draw_y
             mana_text = f"{int(current_mana)}/{int(max_mana)}"
-            self.font.draw(text_x - 2, text_y - 2, mana_text, (0, 0, 0))
-            self.font.draw(text_x - 1, text_y - 1, mana_text, (0, 0, 0))
-            self.font.draw(text_x, text_y, mana_text, (255, 255, 255))
+            text_cache.draw_shadowed_text(self.font, text_x, text_y, mana_text, (255, 255, 255))
 
 class DashBar:
     """화면 왼쪽 상단에 표시되는 대시 바 UI"""
@@ -927,7 +943,7 @@ class BuffIndicatorUI:
             ]
             for font_path in font_candidates:
                 try:
-                    self.font = load_font(font_path, 14)
+                    self.font = text_cache.load_font(font_path, 14)
                     print(f"[BuffIndicatorUI] 폰트 로드 성공: {font_path}")
                     break
                 except Exception:
@@ -1004,8 +1020,8 @@ class BuffIndicatorUI:
 
                 # 그림자 효과
                 try:
-                    self.font.draw(text_x - 1, text_y - 1, time_text, (0, 0, 0))
-                    self.font.draw(text_x, text_y, time_text, (255, 255, 100))
+                    text_cache.draw_shadowed_text(self.font, text_x, text_y, time_text, (255, 255, 100),
+                                                  offsets=((-1, -1),))
                 except Exception as ex:
                     print(f"[BuffIndicatorUI] 텍스트 그리기 오류: {ex}")
 
@@ -0,0 +1,391 @@
+"""
+걷기 가능 셀 인덱스 (스폰/텔레포트 위치 샘플링)
+
+스테이지 로드 시 벽 블록(PlayModeWall) 목록을 한 번 격자로 래스터화해 두고,
+"이 위치가 벽과 겹치는가", "(x, y) 주변 고리(annulus) 안의 여유 공간 r이 확보된 랜덤 위치" 같은 질의를
+매번 모든 벽을 훑지 않고 격자 조회만으로 처리합니다.
+
+격자:
+    blocked[row, col]: 벽이 한 칸이라도 겹치는 셀 (맵 범위 밖도 벽으로 취급)
+    distance[row, col]: 가장 가까운 벽 셀까지의 체비셰프 거리(셀 단위, 벽 셀 = 0, 이웃 = 1)
+                        MAX_DISTANCE를 넘는 셀은 MAX_DISTANCE + 1
+
+    distance > k인 셀 안의 모든 점은 벽에서 k * cell_size 이상 떨어져 있으므로
+    여유 공간 r 질의는 k = ceil(r / cell_size)로 바꿔 distance 비교 한 번으로 끝납니다.
+
+고리 샘플링:
+    (셀 반지름 최소, 최대)별로 고리 안의 셀 오프셋 표를 캐시해 두고 표에서 무작위로 골라 distance를 확인합니다.
+    몇 번 안에 찾지 못하면(고리 대부분이 벽) 고리 전체를 numpy로 한 번에 걸러 남은 셀 중에서 고릅니다.
+
+사용법:
+    from game_logic import walkable_grid
+    walkable_grid.build(world['walls'], bounds=(left, bottom, right, top))   # 스테이지 로드 시 1회
+    grid = walkable_grid.get_current()
+    if grid is not None:
+        grid.is_walkable(x, y, clearance=20)
+        grid.random_point_in_annulus(boss.x, boss.y, 200, 300, clearance=20)   # 없으면 None
+        grid.nearest_walkable_point(x, y, clearance=20)
+"""
+import math
+import random
+
+import numpy as np
+
+# 거리 필드 최대값 (셀 단위, 이보다 먼 셀은 MAX_DISTANCE + 1)
+MAX_DISTANCE = 16
+
+# 고리 샘플링에서 오프셋 표를 무작위로 뽑아볼 횟수 (실패하면 고리 전체를 걸러서 선택)
+SAMPLE_ATTEMPTS = 24
+
+# 현재 스테이지 격자
+_current = None
+
+
+def _chebyshev_distance(blocked, max_distance=MAX_DISTANCE):
+    """벽 셀에서 퍼져 나가는 체비셰프 거리 필드 (3x3 팽창 반복)"""
+    rows, cols = blocked.shape
+    distance = np.full(blocked.shape, max_distance + 1, dtype=np.int16)
+    distance[blocked] = 0
+    reached = blocked.copy()
+    for step in range(1, max_distance + 1):
+        grown = reached.copy()
+        grown[1:, :] |= reached[:-1, :]
+        grown[:-1, :] |= reached[1:, :]
+        grown[:, 1:] |= grown[:, :-1].copy()
+        grown[:, :-1] |= grown[:, 1:].copy()
+        # 맵 범위 밖은 벽이므로 가장자리 셀은 거리 1에서 멈춤
+        grown[0, :] = True
+        grown[-1, :] = True
+        grown[:, 0] = True
+        grown[:, -1] = True
+        new = grown & ~reached
+        if not new.any():
+            break
+        distance[new] = step
+        reached = grown
+    return distance
+
+
+class WalkableGrid:
+    """
+    벽 격자 + 거리 필드
+
+    Args:
+        blocked: bool 배열 [rows, cols] (row 0 = 가장 아래)
+        origin_x, origin_y: 격자 왼쪽 아래 모서리의 월드 좌표
+        cell_size: 셀 한 변 길이 (월드 픽셀)
+    """
+
+    def __init__(self, blocked, origin_x, origin_y, cell_size):
+        self.blocked = blocked
+        self.origin_x = origin_x
+        self.origin_y = origin_y
+        self.cell_size = float(cell_size)
+        self.rows, self.cols = blocked.shape
+        self.distance = _chebyshev_distance(blocked)
+        self._ring_cache = {}
+        self.free_count = int((~blocked).sum())
+        self._blocked_rows = None
+
+    @classmethod
+    def from_walls(cls, walls, bounds=None, cell_size=None):
+        """
+        벽 사각형 목록으로 격자 만들기
+
+        Args:
+            walls: x, y(중심), w, h 속성을 가진 벽 객체 리스트
+            bounds: (left, bottom, right, top) 맵 범위 (None이면 벽들의 범위)
+            cell_size: 셀 크기 (None이면 가장 작은 벽 크기 - PNG 벽 블록과 격자가 일치)
+
+        Returns:
+            WalkableGrid 또는 None (벽이 없고 범위도 없으면)
+        """
+        rects = [(w.x - w.w / 2, w.y - w.h / 2, w.x + w.w / 2, w.y + w.h / 2) for w in walls]
+        if not rects and bounds is None:
+            return None
+        if cell_size is None:
+            cell_size = min(min(r[2] - r[0], r[3] - r[1]) for r in rects) if rects else 32.0
+
+        if rects:
+            # 격자 원점을 벽 블록 모서리에 맞춤
+            origin_x = min(r[0] for r in rects)
+            origin_y = min(r[1] for r in rects)
+            right = max(r[2] for r in rects)
+            top = max(r[3] for r in rects)
+        else:
+            origin_x, origin_y, right, top = bounds
+        if bounds is not None:
+            left, bottom, b_right, b_top = bounds
+            origin_x -= math.ceil(max(0.0, origin_x - left) / cell_size) * cell_size
+            origin_y -= math.ceil(max(0.0, origin_y - bottom) / cell_size) * cell_size
+            right, top = max(right, b_right), max(top, b_top)
+
+        cols = max(1, math.ceil((right - origin_x) / cell_size - 1e-6))
+        rows = max(1, math.ceil((top - origin_y) / cell_size - 1e-6))
+        blocked = np.zeros((rows, cols), dtype=bool)
+        eps = 1e-6
+        for x0, y0, x1, y1 in rects:
+            c0 = max(0, int((x0 - origin_x) / cell_size + eps))
+            c1 = min(cols, math.ceil((x1 - origin_x) / cell_size - eps))
+            r0 = max(0, int((y0 - origin_y) / cell_size + eps))
+            r1 = min(rows, math.ceil((y1 - origin_y) / cell_size - eps))
+            blocked[r0:r1, c0:c1] = True
+        return cls(blocked, origin_x, origin_y, cell_size)
+
+    # ==================== 좌표 변환 ====================
+
+    def cell_of(self, x, y):
+        """월드 좌표 -> (col, row) (범위 밖일 수 있음)"""
+        return (math.floor((x - self.origin_x) / self.cell_size),
+                math.floor((y - self.origin_y) / self.cell_size))
+
+    def cell_center(self, col, row):
+        return (self.origin_x + (col + 0.5) * self.cell_size,
+                self.origin_y + (row + 0.5) * self.cell_size)
+
+    def in_bounds(self, col, row):
+        return 0 <= col < self.cols and 0 <= row < self.rows
+
+    def _clearance_cells(self, clearance):
+        return max(0, math.ceil(clearance / self.cell_size - 1e-6))
+
+    # ==================== 질의 ====================
+
+    def is_walkable(self, x, y, clearance=0.0):
+        """
+        (x, y)를 중심으로 한 변 2 * clearance인 정사각형이 벽과 겹치지 않는지
+        (기존 _is_position_on_wall의 check_radius 판정과 같은 기준)
+
+        Returns:
+            bool
+        """
+        cs = self.cell_size
+        gx = (x - self.origin_x) / cs
+        gy = (y - self.origin_y) / cs
+        col, row = math.floor(gx), math.floor(gy)
+        if not self.in_bounds(col, row):
+            return False
+        # 거리 필드로 바로 통과 (셀 안 어디든 여유 공간 확보)
+        if self.distance[row, col] > self._clearance_cells(clearance):
+            return True
+        r = clearance / cs
+        c0, c1 = math.floor(gx - r), math.floor(gx + r)
+        r0, r1 = math.floor(gy - r), math.floor(gy + r)
+        if c0 < 0 or r0 < 0 or c1 >= self.cols or r1 >= self.rows:
+            return False
+        return not self.blocked[r0:r1 + 1, c0:c1 + 1].any()
+
+    def is_rect_free(self, x, y, half_w, half_h):
+        """
+        (x, y) 중심, 반폭 half_w, 반높이 half_h인 사각형이 벽 셀과 겹치지 않는지 (이동 충돌 검사용)
+
+        Returns:
+            bool (맵 범위를 벗어나도 False)
+        """
+        cs = self.cell_size
+        gx = (x - self.origin_x) / cs
+        gy = (y - self.origin_y) / cs
+        c0, c1 = math.floor(gx - half_w / cs), math.ceil(gx + half_w / cs) - 1
+        r0, r1 = math.floor(gy - half_h / cs), math.ceil(gy + half_h / cs) - 1
+        if c0 < 0 or r0 < 0 or c1 >= self.cols or r1 >= self.rows:
+            return False
+        return not self.blocked[r0:r1 + 1, c0:c1 + 1].any()
+
+    def blocked_rows(self):
+        """
+        blocked의 중첩 리스트 사본 (셀을 하나씩 따라가는 반복 조회용 - numpy 원소 접근보다 빠름)
+
+        Returns:
+            list[list[bool]] (blocked_rows()[row][col])
+        """
+        if self._blocked_rows is None:
+            self._blocked_rows = self.blocked.tolist()
+        return self._blocked_rows
+
+    def clearance_at(self, x, y):
+        """
+        (x, y)가 속한 셀에서 보장되는 벽까지의 최소 거리 (월드 픽셀, 근사값)
+
+        Returns:
+            float (벽 셀 또는 범위 밖이면 0)
+        """
+        col, row = self.cell_of(x, y)
+        if not self.in_bounds(col, row):
+            return 0.0
+        return max(0, int(self.distance[row, col]) - 1) * self.cell_size
+
+    def _ring_offsets(self, k_min, k_max):
+        key = (k_min, k_max)
+        offsets = self._ring_cache.get(key)
+        if offsets is None:
+            span = np.arange(-k_max, k_max + 1)
+            dc, dr = np.meshgrid(span, span)
+            dist = np.hypot(dc, dr)
+            mask = (dist >= k_min) & (dist <= k_max)
+            offsets = np.stack([dc[mask], dr[mask]], axis=1).astype(np.int32)
+            self._ring_cache[key] = offsets
+        return offsets
+
+    def _point_in_cell(self, col, row, rng):
+        cs = self.cell_size
+        return (self.origin_x + (col + rng.random()) * cs,
+                self.origin_y + (row + rng.random()) * cs)
+
+    def random_point_in_annulus(self, x, y, r_min, r_max, clearance=0.0, rng=random):
+        """
+        (x, y)에서 거리 r_min ~ r_max 사이, 벽에서 clearance 이상 떨어진 랜덤 위치
+
+        Args:
+            x, y: 중심 (월드 좌표)
+            r_min, r_max: 거리 범위 (월드 픽셀)
+            clearance: 벽과의 여유 공간
+            rng: random 모듈 호환 난수 생성기
+
+        Returns:
+            (x, y) 또는 None (조건을 만족하는 셀이 없으면)
+        """
+        cs = self.cell_size
+        k = self._clearance_cells(clearance)
+        cx, cy = self.cell_of(x, y)
+        # 셀 중심 기준 오프셋이므로 셀 대각선 절반만큼 고리를 넓혀서 후보를 모음
+        pad = 0.7072
+        k_min = max(0, math.floor(r_min / cs - pad))
+        k_max = math.ceil(r_max / cs + pad)
+        offsets = self._ring_offsets(k_min, k_max)
+        if len(offsets) == 0:
+            return None
+
+        r_min_sq, r_max_sq = r_min * r_min, r_max * r_max
+        for _ in range(SAMPLE_ATTEMPTS):
+            dc, dr = offsets[rng.randrange(len(offsets))]
+            col, row = cx + int(dc), cy + int(dr)
+            if not self.in_bounds(col, row) or self.distance[row, col] <= k:
+                continue
+            px, py = self._point_in_cell(col, row, rng)
+            d_sq = (px - x) ** 2 + (py - y) ** 2
+            if r_min_sq <= d_sq <= r_max_sq:
+                return (px, py)
+
+        # 고리 대부분이 막혀 있으면 고리 전체를 한 번에 걸러서 선택
+        cols = offsets[:, 0] + cx
+        rows = offsets[:, 1] + cy
+        inside = (cols >= 0) & (cols < self.cols) & (rows >= 0) & (rows < self.rows)
+        cols, rows = cols[inside], rows[inside]
+        ok = self.distance[rows, cols] > k
+        centers_x = self.origin_x + (cols + 0.5) * cs - x
+        centers_y = self.origin_y + (rows + 0.5) * cs - y
+        d_sq = centers_x * centers_x + centers_y * centers_y
+        ok &= (d_sq >= r_min_sq) & (d_sq <= r_max_sq)
+        candidates = np.flatnonzero(ok)
+        if len(candidates) == 0:
+            return None
+        index = candidates[rng.randrange(len(candidates))]
+        return self.cell_center(int(cols[index]), int(rows[index]))
+
+    def nearest_walkable_point(self, x, y, clearance=0.0, max_radius=None):
+        """
+        (x, y)에서 가장 가까운, 벽에서 clearance 이상 떨어진 위치 (이미 그렇다면 (x, y) 그대로)
+
+        Args:
+            max_radius: 탐색 반경 (월드 픽셀, None이면 격자 전체)
+
+        Returns:
+            (x, y) 또는 None
+        """
+        if self.is_walkable(x, y, clearance):
+            return (x, y)
+        k = self._clearance_cells(clearance)
+        cx, cy = self.cell_of(x, y)
+        if max_radius is None:
+            c0, c1, r0, r1 = 0, self.cols, 0, self.rows
+        else:
+            span = math.ceil(max_radius / self.cell_size)
+            c0, c1 = max(0, cx - span), min(self.cols, cx + span + 1)
+            r0, r1 = max(0, cy - span), min(self.rows, cy + span + 1)
+        if c0 >= c1 or r0 >= r1:
+            return None
+        window = self.distance[r0:r1, c0:c1] > k
+        rows, cols = np.nonzero(window)
+        if len(rows) == 0:
+            return None
+        rows += r0
+        cols += c0
+        d_sq = (cols - cx) ** 2 + (rows - cy) ** 2
+        index = int(np.argmin(d_sq))
+        px, py = self.cell_center(int(cols[index]), int(rows[index]))
+        if max_radius is not None and (px - x) ** 2 + (py - y) ** 2 > max_radius * max_radius:
+            return None
+        return (px, py)
+
+
+# ==================== 현재 스테이지 격자 ====================
+
+def build(walls, bounds=None):
+    """
+    현재 스테이지 격자 만들기 (스테이지 로드 시 1회)
+
+    Args:
+        walls: 벽 객체 리스트 (world['walls'])
+        bounds: (left, bottom, right, top) 맵 범위
+
+    Returns:
+        WalkableGrid 또는 None
+    """
+    global _current
+    try:
+        _current = WalkableGrid.from_walls(walls, bounds)
+    except Exception as ex:
+        print(f'\033[91m[WalkableGrid] 격자 생성 실패: {ex}\033[0m')
+        _current = None
+        return None
+    if _current is not None:
+        print(f'[WalkableGrid] {_current.cols}x{_current.rows} 셀 (셀 크기 {_current.cell_size:.0f}), '
+              f'걷기 가능 {_current.free_count}개')
+    return _current
+
+
+def resolve_move(world, x, y, new_x, new_y, width, height):
+    """
+    벽 충돌을 고려한 이동 결과 위치 (몬스터 이동 공용)
+
+    격자가 있으면 격자로 검사하고, 대각선 이동이 막히면 막히지 않은 축으로만 미끄러집니다.
+    격자가 없으면 기존처럼 world['walls']의 check_collision으로 검사하고 막히면 움직이지 않습니다.
+
+    Args:
+        world: 게임 월드 딕셔너리
+        x, y: 현재 위치
+        new_x, new_y: 이동하려는 위치
+        width, height: 충돌 박스 크기
+
+    Returns:
+        (x, y)
+    """
+    grid = _current
+    if grid is None:
+        for wall in world.get('walls', ()) if world else ():
+            if hasattr(wall, 'check_collision') and wall.check_collision(
+                    new_x - width // 2, new_y - height // 2, width, height):
+                return x, y
+        return new_x, new_y
+
+    half_w, half_h = width / 2, height / 2
+    if grid.is_rect_free(new_x, new_y, half_w, half_h):
+        return new_x, new_y
+    # 이미 벽에 겹친 상태(스폰 직후 등)면 빠져나갈 수 있도록 이동은 허용
+    if not grid.is_rect_free(x, y, half_w, half_h):
+        return new_x, new_y
+    if new_x != x and grid.is_rect_free(new_x, y, half_w, half_h):
+        return new_x, y
+    if new_y != y and grid.is_rect_free(x, new_y, half_w, half_h):
+        return x, new_y
+    return x, y
+
+
+def get_current():
+    """현재 스테이지 격자 (없으면 None - 호출 측은 기존 방식으로 폴백)"""
+    return _current
+
+
+def clear():
+    global _current
+    _current = None
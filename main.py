@@ -3,14 +3,23 @@ Minimal launcher: open pico2d canvas, run framework with title_mode, close canva
 """
 from pico2d import open_canvas, close_canvas
 import game_framework
+from game_logic import asset_pack
+from game_logic import render_scale
 import game_logic.title_mode as init_mode
 
 window_scale = 8
 window_width, window_height = 160 * window_scale, 90 * window_scale
 
+# 월드 내부 렌더 해상도 비율 (1.0 = 창 해상도, 0.5 = 640x360에 그린 뒤 최근접 이웃 확대)
+# 채우기 성능이 부족한 기기에서 낮추면 엔티티 scale 상수를 바꾸지 않고 프레임을 올릴 수 있음
+world_render_scale = 1.0
+
 print(f"[main] Opening canvas {window_width}x{window_height}...")
 open_canvas(window_width, window_height)
 print("[main] Canvas opened successfully")
+# resources/assets.pack이 있으면 이미지를 팩에서 로드 (없으면 기존처럼 개별 파일)
+asset_pack.install()
+render_scale.set_scale(world_render_scale)
 try:
     print("[main] Starting game_framework.run()...")
     game_framework.run(init_mode)
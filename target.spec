@@ -79,9 +79,31 @@ pillow_submodules = collect_submodules('PIL')
 sdl2_submodules = collect_submodules('sdl2')
 
 # 게임 실행을 위해 필요한 데이터 파일들 수집 (먼저 초기화)
-datas = [
-    ('resources', 'resources'),  # resources 폴더 전체 포함
-]
+# resources/assets.pack(tools/build_asset_pack.py로 생성)이 있으면 Texture_organize의 개별 PNG 대신 팩만 포함
+# Variant_Cache(tools/build_variant_cache.py로 생성)는 팩과 별도로 항상 포함 (없으면 실행 중 변형을 다시 만듦)
+resources_dir = os.path.join(project_dir, 'resources')
+asset_pack_path = os.path.join(resources_dir, 'assets.pack')
+variant_cache_dir = os.path.join(resources_dir, 'Variant_Cache')
+if os.path.exists(asset_pack_path):
+    datas = []
+    for entry in os.listdir(resources_dir):
+        if entry == 'Texture_organize':
+            continue
+        entry_path = os.path.join(resources_dir, entry)
+        if os.path.isdir(entry_path):
+            datas.append((entry_path, os.path.join('resources', entry)))
+        else:
+            datas.append((entry_path, 'resources'))
+    print(f"[에셋 팩] {asset_pack_path} 포함 (Texture_organize 개별 파일 제외)")
+else:
+    datas = [
+        ('resources', 'resources'),  # resources 폴더 전체 포함
+    ]
+    print("[에셋 팩] assets.pack 없음 - resources 폴더 전체 포함 (python tools/build_asset_pack.py로 생성 가능)")
+
+if not os.path.isdir(variant_cache_dir) or not any(files for _, _, files in os.walk(variant_cache_dir)):
+    print("[변형 캐시] 경고: Variant_Cache가 비어 있습니다 - 보스 초기화 중 분신 프레임을 다시 만듭니다")
+    print("[변형 캐시]   python tools/build_variant_cache.py 로 미리 생성하세요\n")
 
 # pico2d, SDL2 데이터 추가
 datas += pico2d_datas
@@ -116,6 +138,7 @@ hiddenimports = [
     'PIL._imaging',
     'PIL.ImageDraw',
     'PIL.ImageFont',
+    'numpy',
     'sdl2',
     'sdl2.ext',
     'sdl2.dll',
@@ -145,6 +168,25 @@ hiddenimports = [
     'game_logic.equipment',
     'game_logic.event_to_string',
     'game_logic.image_asset_manager',
+    'game_logic.sprite_variant_cache',
+    'game_logic.animation_clips',
+    'game_logic.asset_pack',
+    'game_logic.sound_bank',
+    'game_logic.text_cache',
+    'game_logic.draw_hooks',
+    'game_logic.render_queue',
+    'game_logic.depth_sort',
+    'game_logic.static_layers',
+    'game_logic.particles',
+    'game_logic.render_scale',
+    'game_logic.walkable_grid',
+    'game_logic.flow_field',
+    'game_logic.line_of_sight',
+    'game_logic.ai_scheduler',
+    'game_logic.coroutine',
+    'game_logic.bullet_patterns',
+    'game_logic.encounter_director',
+    'mmap',
     'game_logic.item_entity',
     'game_logic.items',
     'game_logic.loading_screen',
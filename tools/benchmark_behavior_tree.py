@@ -0,0 +1,130 @@
+# 행동 트리 실행 벤치마크
+# 같은 구조의 트리를 가진 에이전트 N마리를 틱하면서 노드 재귀 실행(BehaviorTree(compiled=False))과
+# 평탄화 명령 배열 실행(CompiledTree)의 틱 시간을 비교하고, 두 방식의 결과가 같은지 확인합니다.
+#
+# 사용법:
+#   python tools/benchmark_behavior_tree.py [--agents 1000] [--ticks 300] [--trace]
+# 트리는 PantherAssassin과 같은 모양입니다 (쿨타임/범위 조건 -> 랜덤 패턴 6개, 아니면 대기).
+import os
+import sys
+import time
+import random
+import argparse
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from game_logic.behavior_tree import BehaviorTree, Selector, Sequence, Action, Condition, RandomSelector
+
+DT = 1.0 / 60.0
+
+
+class Agent:
+    """벤치마크용 에이전트 (보스 AI의 쿨타임/거리/패턴 진행만 흉내)"""
+
+    def __init__(self, seed):
+        rng = random.Random(seed)
+        self.attack_timer = rng.uniform(0.0, 2.0)
+        self.distance = rng.uniform(100.0, 1200.0)
+        self.attack_range = 800.0
+        self.pattern_ticks = 0
+        self.log = []
+
+    def step(self):
+        if self.attack_timer > 0:
+            self.attack_timer -= DT
+        # 거리는 조금씩 흔들림 (결정적)
+        self.distance = 100.0 + (self.distance * 1.013) % 1100.0
+
+    def is_attack_ready(self):
+        return self.attack_timer <= 0.0
+
+    def is_in_attack_range(self):
+        return self.distance <= self.attack_range
+
+    def pattern(self, number, length):
+        # 패턴은 length 틱 동안 RUNNING, 끝나면 쿨타임 후 SUCCESS (3번 패턴은 가끔 실패)
+        self.pattern_ticks += 1
+        if number == 3 and self.pattern_ticks == 1 and self.distance > 700.0:
+            self.pattern_ticks = 0
+            self.log.append((number, 'FAIL'))
+            return BehaviorTree.FAIL
+        if self.pattern_ticks < length:
+            return BehaviorTree.RUNNING
+        self.pattern_ticks = 0
+        self.attack_timer = 2.0
+        self.log.append((number, 'SUCCESS'))
+        return BehaviorTree.SUCCESS
+
+    def idle(self):
+        return BehaviorTree.SUCCESS
+
+
+def build_tree(agent, compiled, trace=False):
+    patterns = [Action(f'Pattern{n}', agent.pattern, n, 20 + n * 10) for n in range(1, 7)]
+    root = Selector(
+        'Root',
+        Sequence(
+            'Try Attack',
+            Condition('Attack Ready', agent.is_attack_ready),
+            Condition('In Attack Range', agent.is_in_attack_range),
+            RandomSelector('Random Attack Pattern', *patterns),
+        ),
+        Action('Idle or Patrol', agent.idle),
+    )
+    return BehaviorTree(root, compiled=compiled, trace=trace)
+
+
+def run(count, ticks, compiled, seed):
+    random.seed(seed)
+    agents = [Agent(i) for i in range(count)]
+    trees = [build_tree(agent, compiled) for agent in agents]
+    start = time.perf_counter()
+    for _ in range(ticks):
+        for agent, tree in zip(agents, trees):
+            agent.step()
+            tree.run()
+    elapsed = time.perf_counter() - start
+    return elapsed, [agent.log for agent in agents]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='행동 트리 실행 벤치마크')
+    parser.add_argument('--agents', type=int, default=1000, help='에이전트 수')
+    parser.add_argument('--ticks', type=int, default=300, help='틱 수')
+    parser.add_argument('--seed', type=int, default=7, help='난수 시드')
+    parser.add_argument('--trace', action='store_true', help='추적 버전으로 에이전트 1마리를 몇 틱 실행해 출력')
+    args = parser.parse_args()
+
+    if args.trace:
+        random.seed(args.seed)
+        agent = Agent(0)
+        agent.attack_timer = 0.0
+        agent.distance = 300.0
+        tree = build_tree(agent, compiled=True, trace=True)
+        for tick in range(2):
+            print(f'--- tick {tick} ---')
+            tree.run()
+        return
+
+    interpreted_time, interpreted_log = run(args.agents, args.ticks, False, args.seed)
+    compiled_time, compiled_log = run(args.agents, args.ticks, True, args.seed)
+
+    agent_ticks = args.agents * args.ticks
+    patterns = sum(len(log) for log in compiled_log)
+    print(f'[benchmark] 에이전트 {args.agents}마리 x {args.ticks}틱 (패턴 완료/실패 {patterns}회)')
+    print(f'{"실행 방식":<16}{"전체":>12}{"틱당(전체)":>14}{"에이전트당":>14}')
+    for name, elapsed in (('노드 재귀', interpreted_time), ('컴파일', compiled_time)):
+        print(f'{name:<16}{elapsed * 1000:>10.1f}ms{elapsed / args.ticks * 1000:>12.2f}ms'
+              f'{elapsed / agent_ticks * 1e6:>12.2f}us')
+    print(f'속도 향상: {interpreted_time / compiled_time:.2f}x')
+
+    if interpreted_log != compiled_log:
+        print('\033[91m[benchmark] 두 실행 방식의 결과가 다릅니다\033[0m')
+    else:
+        print('두 실행 방식의 결과 일치')
+
+
+if __name__ == '__main__':
+    main()
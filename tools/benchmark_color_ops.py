@@ -0,0 +1,152 @@
+# image_asset_manager 색상 연산 벤치마크
+# 기존 픽셀 루프 구현(pixels[x, y])과 NumPy 배열 연산 구현의 처리 시간을 비교합니다.
+# 시간 측정 전에 두 구현의 결과가 모든 프레임에서 바이트 단위로 같은지 확인합니다.
+#
+# 사용법:
+#   python tools/benchmark_color_ops.py [이미지 폴더] [--repeat N]
+#   python tools/benchmark_color_ops.py --check-only   # 결과 비교만 (불일치가 있으면 종료 코드 1)
+# 기본 폴더는 보스 분신 프레임이 있는 Panther_Assassin/Character 입니다.
+import os
+import sys
+import time
+import argparse
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import numpy as np
+from PIL import Image
+
+from game_logic import image_asset_manager as iam
+
+DEFAULT_DIR = os.path.join(project_root, 'resources', 'Texture_organize', 'Entity',
+                           'Stage2_Forest_Boss', 'Panther_Assassin', 'Character')
+
+
+# ==================== 기존(픽셀 루프) 구현 ====================
+# 변경 전 apply_* 함수들의 변환 루프를 그대로 옮긴 참조 구현 (비교용)
+
+def legacy_bias(pil_image, r_bias, g_bias, b_bias):
+    pixels = pil_image.load()
+    width, height = pil_image.size
+    for y in range(height):
+        for x in range(width):
+            r, g, b, a = pixels[x, y]
+            pixels[x, y] = (max(0, min(255, r + r_bias)),
+                            max(0, min(255, g + g_bias)),
+                            max(0, min(255, b + b_bias)), a)
+    return pil_image
+
+
+def legacy_multiply(pil_image, r_mult, g_mult, b_mult):
+    pixels = pil_image.load()
+    width, height = pil_image.size
+    for y in range(height):
+        for x in range(width):
+            r, g, b, a = pixels[x, y]
+            pixels[x, y] = (max(0, min(255, int(r * r_mult))),
+                            max(0, min(255, int(g * g_mult))),
+                            max(0, min(255, int(b * b_mult))), a)
+    return pil_image
+
+
+def legacy_hue(pil_image, hue_shift):
+    hsv_image = pil_image.convert('RGB').convert('HSV')
+    pixels = hsv_image.load()
+    width, height = hsv_image.size
+    for y in range(height):
+        for x in range(width):
+            h, s, v = pixels[x, y]
+            pixels[x, y] = ((h + int(hue_shift * 255 / 360)) % 256, s, v)
+    rgb_converted = hsv_image.convert('RGB')
+    rgb_converted.putalpha(pil_image.split()[3])
+    return rgb_converted
+
+
+CASES = [
+    # (이름, 기존 구현, 배열 연산 이름, 파라미터)
+    ('bias (damaged)', legacy_bias, 'bias', (100, -30, -30)),
+    ('bias (frozen)', legacy_bias, 'bias', (-40, -20, 80)),
+    ('multiply (make_dark 0.25)', legacy_multiply, 'multiply', (0.25, 0.25, 0.25)),
+    ('multiply (invincible 1.5)', legacy_multiply, 'multiply', (1.5, 1.5, 1.5)),
+    ('multiply (0.7, 1.3, 0.45)', legacy_multiply, 'multiply', (0.7, 1.3, 0.45)),
+    ('hue shift 60', legacy_hue, 'hue', (60,)),
+    ('hue shift 200', legacy_hue, 'hue', (200,)),
+    ('hue shift -45', legacy_hue, 'hue', (-45,)),
+]
+
+
+def check_case(pil_frames, arrays, legacy_func, operation, params):
+    """
+    기존 구현과 배열 구현(개별, 배치) 결과 비교
+
+    Returns:
+        (다른 픽셀 수, 채널 최대 차이)
+    """
+    array_op = iam._ARRAY_OPERATIONS[operation][0]
+    batch = iam.batch_process_arrays(arrays, operation, *params)
+    mismatched = 0
+    max_diff = 0
+    for img, array, batched in zip(pil_frames, arrays, batch):
+        expected = np.array(legacy_func(img.copy(), *params).convert('RGBA'), dtype=np.int16)
+        for actual in (array_op(array, *params), batched):
+            diff = np.abs(actual.astype(np.int16) - expected)
+            mismatched += int(np.count_nonzero(diff.max(axis=-1)))
+            max_diff = max(max_diff, int(diff.max()))
+    return mismatched, max_diff
+
+
+def _timed(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='image_asset_manager 색상 연산 벤치마크')
+    parser.add_argument('directory', nargs='?', default=DEFAULT_DIR, help='PNG 프레임 폴더')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (최소 시간 사용)')
+    parser.add_argument('--limit', type=int, default=40, help='사용할 최대 프레임 수')
+    parser.add_argument('--check-only', action='store_true', help='결과 비교만 하고 시간 측정은 생략')
+    args = parser.parse_args()
+
+    paths = sorted(os.path.join(args.directory, f) for f in os.listdir(args.directory)
+                   if f.lower().endswith('.png'))[:args.limit]
+    if not paths:
+        print(f'\033[91m[benchmark] PNG 파일이 없습니다: {args.directory}\033[0m')
+        return
+
+    pil_frames = [Image.open(p).convert('RGBA') for p in paths]
+    arrays = [np.array(img, dtype=np.uint8) for img in pil_frames]
+    total_pixels = sum(a.shape[0] * a.shape[1] for a in arrays)
+    print(f'[benchmark] {len(paths)}개 프레임, 총 {total_pixels:,} 픽셀 ({args.directory})')
+
+    failed = False
+    for name, legacy_func, operation, params in CASES:
+        mismatched, max_diff = check_case(pil_frames, arrays, legacy_func, operation, params)
+        if mismatched:
+            failed = True
+            print(f'\033[91m[benchmark] {name}: 기존 구현과 다른 픽셀 {mismatched:,}개 (최대 차이 {max_diff})\033[0m')
+        else:
+            print(f'[benchmark] {name}: 기존 구현과 일치')
+    if args.check_only or failed:
+        sys.exit(1 if failed else 0)
+
+    print(f'{"연산":<28}{"픽셀 루프":>12}{"배열(개별)":>12}{"배열(배치)":>12}{"배속":>10}')
+
+    for name, legacy_func, operation, params in CASES:
+        legacy_time = _timed(lambda: [legacy_func(img.copy(), *params) for img in pil_frames], args.repeat)
+        array_op = iam._ARRAY_OPERATIONS[operation][0]
+        single_time = _timed(lambda: [array_op(a, *params) for a in arrays], args.repeat)
+        batch_time = _timed(lambda: iam.batch_process_arrays(arrays, operation, *params), args.repeat)
+        speedup = legacy_time / batch_time if batch_time > 0 else float('inf')
+        print(f'{name:<28}{legacy_time * 1000:>10.1f}ms{single_time * 1000:>10.1f}ms'
+              f'{batch_time * 1000:>10.1f}ms{speedup:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
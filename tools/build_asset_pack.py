@@ -0,0 +1,112 @@
+# 에셋 팩 생성 도구
+# resources/Texture_organize의 PNG를 하나의 팩 파일(resources/assets.pack)로 묶습니다.
+# 팩이 있으면 게임은 수천 개의 PNG를 개별로 여는 대신 팩 하나를 mmap으로 열어 사용합니다.
+#
+# 사용법:
+#   python tools/build_asset_pack.py             # 팩 생성
+#   python tools/build_asset_pack.py --compress  # zlib 압축이 이득인 항목은 압축 저장
+#   python tools/build_asset_pack.py --verify    # 기존 팩 내용을 원본 파일과 비교
+#   python tools/build_asset_pack.py --bench     # 개별 open() vs 팩 읽기 시간 비교
+import os
+import sys
+import time
+import argparse
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# 팩 인덱스 경로는 프로젝트 루트 기준 상대 경로이므로 게임과 동일하게 프로젝트 루트에서 실행
+os.chdir(project_root)
+
+from game_logic import asset_pack
+
+
+def _format_bytes(n):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if n < 1024 or unit == 'GB':
+            return f'{n:.1f}{unit}' if unit != 'B' else f'{n}{unit}'
+        n /= 1024.0
+
+
+def build(source, out_path, compress):
+    paths = asset_pack.collect_files(source)
+    if not paths:
+        print(f'\033[91m[build_asset_pack] {source}에서 파일을 찾지 못했습니다\033[0m')
+        return False
+
+    start = time.perf_counter()
+    info = asset_pack.write_pack(paths, out_path, compress=compress)
+    elapsed = time.perf_counter() - start
+
+    print(f"[build_asset_pack] {out_path}: 항목 {info['entries']}개, "
+          f"원본 {_format_bytes(info['raw_bytes'])} -> 저장 {_format_bytes(info['stored_bytes'])} "
+          f"(압축 항목 {info['compressed']}개, {elapsed:.2f}초)")
+    return True
+
+
+def verify(out_path):
+    pack = asset_pack.AssetPack(out_path)
+    mismatched = 0
+    missing = 0
+    try:
+        for name in pack.names():
+            if not os.path.exists(name):
+                missing += 1
+                continue
+            with open(name, 'rb') as f:
+                if f.read() != pack.read_bytes(name):
+                    mismatched += 1
+                    print(f'\033[91m[build_asset_pack] 내용 불일치: {name}\033[0m')
+        print(f'[build_asset_pack] 검증: 항목 {len(pack)}개, 불일치 {mismatched}개, 원본 없음 {missing}개')
+    finally:
+        pack.close()
+    return mismatched == 0
+
+
+def bench(source, out_path):
+    paths = asset_pack.collect_files(source)
+
+    start = time.perf_counter()
+    total = 0
+    for path in paths:
+        with open(path, 'rb') as f:
+            total += len(f.read())
+    loose_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pack = asset_pack.AssetPack(out_path)
+    pack.prefetch()
+    packed_total = 0
+    for path in paths:
+        data = pack.read_bytes(path)
+        packed_total += len(data) if data is not None else 0
+    pack_time = time.perf_counter() - start
+    pack.close()
+
+    print(f'[build_asset_pack] 개별 파일 {len(paths)}개 open(): {loose_time * 1000:.1f}ms ({_format_bytes(total)})')
+    print(f'[build_asset_pack] 팩 mmap 읽기:            {pack_time * 1000:.1f}ms ({_format_bytes(packed_total)})')
+    print('[build_asset_pack] (OS 파일 캐시가 데워진 상태의 값이므로 콜드 스타트에서는 차이가 더 커집니다)')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='에셋 팩 생성 도구')
+    parser.add_argument('--source', default=asset_pack.SOURCE_DIR, help='묶을 폴더')
+    parser.add_argument('--out', default=asset_pack.PACK_PATH, help='출력 팩 경로')
+    parser.add_argument('--compress', action='store_true', help='zlib 압축이 이득인 항목은 압축 저장')
+    parser.add_argument('--verify', action='store_true', help='기존 팩 내용 검증만 수행')
+    parser.add_argument('--bench', action='store_true', help='개별 파일 vs 팩 읽기 시간 비교')
+    args = parser.parse_args()
+
+    if args.verify:
+        sys.exit(0 if verify(args.out) else 1)
+    if args.bench:
+        bench(args.source, args.out)
+        return
+
+    if not build(args.source, args.out, args.compress):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
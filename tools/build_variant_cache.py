@@ -0,0 +1,87 @@
+# 스프라이트 색상 변형 디스크 캐시 미리 생성 도구
+# 보스 패턴에서 사용하는 분신(어두운) 프레임을 미리 만들어 두어
+# 보스 초기화 중에는 이미지 처리 없이 캐시된 RGBA를 업로드만 하도록 합니다.
+#
+# 사용법:
+#   python tools/build_variant_cache.py            # 미리 생성 + 크기 보고
+#   python tools/build_variant_cache.py --report   # 캐시 크기 보고만
+#   python tools/build_variant_cache.py --clear    # 캐시 비우기
+import os
+import sys
+import argparse
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# 캐시 경로(resources/Variant_Cache)가 실행 위치 기준 상대 경로이므로 게임과 동일하게 프로젝트 루트에서 실행
+os.chdir(project_root)
+
+from game_logic import image_asset_manager as iam
+from game_logic import sprite_variant_cache as variant_cache
+
+PANTHER_DIR = 'resources/Texture_organize/Entity/Stage2_Forest_Boss/Panther_Assassin/Character'
+CLONE_DARKNESS = 0.25  # iam.make_dark(img, darkness=0.25)와 동일
+
+# (설명, 파일 이름 접두어, 프레임 범위, 연산, 파라미터)
+BOSS_VARIANTS = [
+    ('PantherAssassin 분신 Idle', 'PantherAssassin_Idle', range(11), 'brightness', (CLONE_DARKNESS,)),
+    ('Pattern4 분신 Throw_1st', 'PantherAssassin_Throw_1st', range(6), 'brightness', (CLONE_DARKNESS,)),
+    ('Pattern4 분신 Throw_2nd', 'PantherAssassin_Throw_2nd', range(6), 'brightness', (CLONE_DARKNESS,)),
+    ('Pattern5 분신 Whirlwind', 'PantherAssassin_Whirlwind', range(6), 'brightness', (CLONE_DARKNESS,)),
+    ('Pattern5 분신 Withdraw', 'PantherAssassin_Throw_All_Withdraw', range(10), 'brightness', (CLONE_DARKNESS,)),
+    ('Pattern6 분신 Ready', 'PantherAssassin_Throw_All_Ready', range(5), 'brightness', (CLONE_DARKNESS,)),
+    ('Pattern6 분신 Attack', 'PantherAssassin_Throw_All_Attack', range(10), 'brightness', (CLONE_DARKNESS,)),
+    ('Pattern4~6 분신 Move', 'PantherAssassin_Move', range(8), 'brightness', (CLONE_DARKNESS,)),
+    ('Pattern4~6 분신 Die', 'PantherAssassin_Die', range(11), 'brightness', (CLONE_DARKNESS,)),
+]
+
+
+def _format_bytes(n):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if n < 1024 or unit == 'GB':
+            return f'{n:.1f}{unit}' if unit != 'B' else f'{n}{unit}'
+        n /= 1024.0
+
+
+def print_report():
+    info = variant_cache.report()
+    print(f"[build_variant_cache] 캐시 위치: {info['dir']}")
+    print(f"[build_variant_cache] 항목 수: {info['entries']}, 전체 크기: {_format_bytes(info['bytes'])}")
+
+
+def build():
+    total_built = 0
+    total_skipped = 0
+    for label, prefix, frames, operation, params in BOSS_VARIANTS:
+        paths = [f'{PANTHER_DIR}/{prefix}{i:02d}.png' for i in frames]
+        missing = [p for p in paths if not os.path.exists(p)]
+        if missing:
+            print(f'\033[91m[build_variant_cache] {label}: 원본 없음 {len(missing)}개 (예: {missing[0]})\033[0m')
+            paths = [p for p in paths if p not in missing]
+
+        built, skipped = iam.prebuild_variants(paths, operation, *params)
+        total_built += built
+        total_skipped += skipped
+        print(f'[build_variant_cache] {label}: 생성 {built}개, 기존 {skipped}개')
+
+    print(f'[build_variant_cache] 완료 - 새로 생성 {total_built}개, 이미 있음 {total_skipped}개')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='스프라이트 색상 변형 디스크 캐시 도구')
+    parser.add_argument('--report', action='store_true', help='캐시 크기만 보고')
+    parser.add_argument('--clear', action='store_true', help='캐시 비우기')
+    args = parser.parse_args()
+
+    if args.clear:
+        removed = variant_cache.clear()
+        print(f'[build_variant_cache] {removed}개 항목 삭제')
+    elif not args.report:
+        build()
+
+    print_report()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+# 애니메이션 매니페스트 검증 도구
+# resources/Animations/*.json 매니페스트의 구조, 타이밍, 프레임 파일 존재 여부를 검사합니다.
+#
+# 사용법:
+#   python tools/validate_animations.py              # 모든 매니페스트 검사
+#   python tools/validate_animations.py cat_assassin # 특정 캐릭터만 검사
+# 오류가 있으면 종료 코드 1을 반환합니다.
+import os
+import sys
+import argparse
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# 매니페스트의 base_path는 프로젝트 루트 기준 상대 경로
+os.chdir(project_root)
+
+from game_logic import animation_clips
+
+
+def main():
+    parser = argparse.ArgumentParser(description='애니메이션 매니페스트 검증')
+    parser.add_argument('characters', nargs='*', help='검사할 캐릭터 이름 (생략 시 전체)')
+    args = parser.parse_args()
+
+    characters = args.characters or sorted(
+        os.path.splitext(f)[0] for f in os.listdir(animation_clips.MANIFEST_DIR) if f.endswith('.json'))
+
+    total_errors = 0
+    for character in characters:
+        try:
+            data = animation_clips.load_manifest(character)
+        except Exception as e:
+            print(f'\033[91m[validate_animations] {character}: 매니페스트 읽기 실패: {e}\033[0m')
+            total_errors += 1
+            continue
+
+        errors = animation_clips.validate_manifest(data, check_files=True)
+        clip_count = len(data.get('clips', {})) if isinstance(data, dict) else 0
+        if errors:
+            print(f'\033[91m[validate_animations] {character}: 오류 {len(errors)}개 (클립 {clip_count}개)\033[0m')
+            for err in errors:
+                print(f'    - {err}')
+        else:
+            print(f'[validate_animations] {character}: OK (클립 {clip_count}개)')
+        total_errors += len(errors)
+
+    print(f'[validate_animations] 매니페스트 {len(characters)}개 검사, 오류 {total_errors}개')
+    sys.exit(1 if total_errors else 0)
+
+
+if __name__ == '__main__':
+    main()